@@ -13,8 +13,15 @@ from typing import Any, cast
 from fastmcp import FastMCP
 
 from src.config import TaigaConfig
+from src.infrastructure.cache import CacheBackend
+from src.infrastructure.client_factory import (
+    create_cached_client,
+    create_taiga_client,
+    get_global_cache,
+    get_global_session_pool,
+)
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
-from src.taiga_client import TaigaAPIClient
 
 
 class TaigaResources:
@@ -36,15 +43,24 @@ class TaigaResources:
         client: Cliente de API para tests (inyectable)
     """
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(
+        self,
+        mcp: FastMCP,
+        session_pool: HTTPSessionPool | None = None,
+        cache: CacheBackend | None = None,
+    ) -> None:
         """
         Inicializa TaigaResources.
 
         Args:
             mcp: Instancia de FastMCP
+            session_pool: Pool de sesiones HTTP compartido. Si es None, usa el pool global
+            cache: Caché de metadatos compartido. Si es None, usa el caché global
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
+        self.cache = cache or get_global_cache()
         self._logger = get_logger("taiga_resources")
         self.client: Any = None  # Injectable client for testing
 
@@ -86,8 +102,11 @@ class TaigaResources:
             if self.client:
                 result = await self.client.get(f"/projects/{project_id}/stats")
             else:
-                async with TaigaAPIClient(self.config) as client:
-                    result = await client.get(f"/projects/{project_id}/stats")
+                async with create_taiga_client(
+                    self.config, session_pool=self.session_pool
+                ) as client:
+                    cached = create_cached_client(self.config, client, cache=self.cache)
+                    result = await cached.get_project_stats(project_id)
 
             self._logger.info(f"[resource:project_stats] Retrieved stats for project {project_id}")
             return cast("dict[str, Any]", result)
@@ -126,7 +145,9 @@ class TaigaResources:
             if self.client:
                 raw_result = await self.client.get(f"/projects/{project_id}")
             else:
-                async with TaigaAPIClient(self.config) as client:
+                async with create_taiga_client(
+                    self.config, session_pool=self.session_pool
+                ) as client:
                     raw_result = await client.get(f"/projects/{project_id}")
 
             result = cast("dict[str, Any]", raw_result)
@@ -180,7 +201,9 @@ class TaigaResources:
             if self.client:
                 result = await self.client.get(f"/timeline/project/{project_id}")
             else:
-                async with TaigaAPIClient(self.config) as client:
+                async with create_taiga_client(
+                    self.config, session_pool=self.session_pool
+                ) as client:
                     result = await client.get(f"/timeline/project/{project_id}")
 
             # Process timeline events
@@ -236,7 +259,9 @@ class TaigaResources:
             if self.client:
                 result = await self.client.get("/memberships", params={"project": project_id})
             else:
-                async with TaigaAPIClient(self.config) as client:
+                async with create_taiga_client(
+                    self.config, session_pool=self.session_pool
+                ) as client:
                     result = await client.get("/memberships", params={"project": project_id})
 
             if isinstance(result, list):
@@ -289,7 +314,9 @@ class TaigaResources:
             if self.client:
                 raw_result = await self.client.get("/users/me")
             else:
-                async with TaigaAPIClient(self.config) as client:
+                async with create_taiga_client(
+                    self.config, session_pool=self.session_pool
+                ) as client:
                     raw_result = await client.get("/users/me")
 
             result = cast("dict[str, Any]", raw_result)
@@ -343,7 +370,9 @@ class TaigaResources:
             if self.client:
                 result = await self.client.get(f"/users/{user_id}/stats")
             else:
-                async with TaigaAPIClient(self.config) as client:
+                async with create_taiga_client(
+                    self.config, session_pool=self.session_pool
+                ) as client:
                     result = await client.get(f"/users/{user_id}/stats")
 
             self._logger.info(f"[resource:user_stats] Retrieved stats for user {user_id}")
@@ -9,8 +9,9 @@ from fastmcp.exceptions import ToolError as MCPError
 
 from src.config import TaigaConfig
 from src.domain.exceptions import AuthenticationError, TaigaAPIError
+from src.infrastructure.client_factory import create_taiga_client, get_global_session_pool
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
-from src.taiga_client import TaigaAPIClient
 
 
 class AuthTools:
@@ -20,15 +21,17 @@ class AuthTools:
     Provides MCP tools for authenticating with Taiga API.
     """
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(self, mcp: FastMCP, session_pool: HTTPSessionPool | None = None) -> None:
         """
         Initialize authentication tools.
 
         Args:
             mcp: FastMCP server instance
+            session_pool: Shared HTTP session pool. Uses the global pool if None
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
         self._auth_token: str | None = None
         self._refresh_token: str | None = None
         self._user_data: dict[str, Any] | None = None
@@ -63,9 +66,9 @@ class AuthTools:
         if hasattr(self, "client") and self.client:
             return await self.client.authenticate(final_username, final_password)
 
-        # Production path - use TaigaAPIClient (imported at top of module)
+        # Production path - use a client from the shared pool
         try:
-            async with TaigaAPIClient(self.config) as client:
+            async with create_taiga_client(self.config, session_pool=self.session_pool) as client:
                 result = await client.authenticate(final_username, final_password)
                 # Store tokens for reuse
                 self._auth_token = result.get("auth_token")
@@ -148,7 +151,9 @@ class AuthTools:
                         "and TAIGA_PASSWORD environment variables."
                     )
 
-                async with TaigaAPIClient(self.config) as client:
+                async with create_taiga_client(
+                    self.config, session_pool=self.session_pool
+                ) as client:
                     result = await client.authenticate(final_username, final_password)
 
                     # Store tokens for future use
@@ -252,7 +257,9 @@ class AuthTools:
                     self._logger.error("[taiga_refresh_token] No refresh token available")
                     raise MCPError("No refresh token available. Please authenticate first")
 
-                async with TaigaAPIClient(self.config) as client:
+                async with create_taiga_client(
+                    self.config, session_pool=self.session_pool
+                ) as client:
                     # Set the current tokens
                     client.refresh_token = token_to_use
 
@@ -353,8 +360,9 @@ class AuthTools:
                     self._logger.error("[taiga_get_current_user] No auth token available")
                     raise MCPError("Not authenticated. Please authenticate first")
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = token
+                async with create_taiga_client(
+                    self.config, token, session_pool=self.session_pool
+                ) as client:
                     result = await client.get("/users/me")
 
                     self._logger.info(
@@ -8,13 +8,19 @@ from typing import Any
 
 from fastmcp import FastMCP
 
+from src.infrastructure.adaptive_rate_limiter import get_rate_limiter
+from src.infrastructure.circuit_breaker import get_circuit_breakers
 from src.infrastructure.client_factory import (
     clear_all_cache,
     get_global_cache,
+    get_global_session_pool,
     invalidate_cache_by_pattern,
     invalidate_project_cache,
 )
+from src.infrastructure.hedging import get_hedging_policy
 from src.infrastructure.logging import get_logger
+from src.infrastructure.negative_cache import get_negative_cache
+from src.infrastructure.single_flight import get_single_flight
 
 
 class CacheTools:
@@ -60,10 +66,25 @@ class CacheTools:
             - Hit and miss counts
             - Hit rate (percentage of requests served from cache)
             - Eviction and invalidation counts
+            - Conditional revalidations answered 304 Not Modified vs 200
+            - Identical concurrent GETs coalesced into one API call
+            - Adaptive HTTP rate limiter state (current rate, pause, 429s seen)
+            - Circuit breaker state per endpoint family (closed, open, half_open)
+            - Hedged GETs sent and won, and the remaining hedge budget
+            - HTTP connection pool: active/idle connections, requests waiting
+              for a connection, acquisition wait and connect time histograms,
+              and the connection reuse ratio
+            - Negative cache: 404/403 lookups answered without an API call
             """
             self._logger.info("Getting cache statistics")
             cache = get_global_cache()
             stats = await cache.get_stats()
+            stats["single_flight"] = get_single_flight().get_stats()
+            stats["rate_limiter"] = get_rate_limiter().get_stats()
+            stats["circuit_breakers"] = get_circuit_breakers().get_stats()
+            stats["hedging"] = get_hedging_policy().get_stats()
+            stats["negative_cache"] = get_negative_cache().get_stats()
+            stats["session_pool"] = get_global_session_pool().get_stats()
             self._logger.debug(f"Cache stats: {stats}")
             return stats
 
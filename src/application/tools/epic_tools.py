@@ -14,7 +14,6 @@ from src.application.responses.epic_responses import (
     EpicCustomAttributeResponse,
     EpicCustomAttributeValuesResponse,
     EpicFiltersResponse,
-    EpicListResponse,
     EpicRelatedUserstoryResponse,
     EpicResponse,
     EpicVoterResponse,
@@ -23,18 +22,32 @@ from src.application.responses.epic_responses import (
 from src.config import TaigaConfig
 from src.domain.exceptions import ValidationError
 from src.domain.validators import EpicCreateValidator, EpicUpdateValidator, validate_input
+from src.infrastructure.cache import CacheBackend
+from src.infrastructure.client_factory import (
+    create_cached_client,
+    create_taiga_client,
+    get_global_cache,
+    get_global_session_pool,
+)
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
-from src.infrastructure.pagination import AutoPaginator, PaginationConfig
-from src.taiga_client import TaigaAPIClient
+from src.infrastructure.pagination import CONCURRENT_PAGINATION_CONFIG, AutoPaginator
 
 
 class EpicTools:
     """Herramientas para gestión de Epics en Taiga."""
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(
+        self,
+        mcp: FastMCP,
+        session_pool: HTTPSessionPool | None = None,
+        cache: CacheBackend | None = None,
+    ) -> None:
         """Inicializa las herramientas de epics."""
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
+        self.cache = cache or get_global_cache()
         self._logger = get_logger("epic_tools")
         self._register_tools()
 
@@ -53,6 +66,7 @@ class EpicTools:
             status: int | None = None,
             assigned_to: int | None = None,
             auto_paginate: bool = True,
+            limit: int | None = None,
         ) -> list[dict[str, Any]]:
             """
             List epics in a project.
@@ -68,6 +82,8 @@ class EpicTools:
                 assigned_to: ID del usuario asignado para filtrar (opcional)
                 auto_paginate: Si True, obtiene automáticamente todas las páginas.
                     Si False, solo retorna la primera página. Default: True.
+                limit: Número máximo de épicas a devolver, mayor que 0. La
+                    paginación se detiene en cuanto se alcanza (opcional)
 
             Returns:
                 Lista de diccionarios con información de épicas, cada uno
@@ -84,8 +100,8 @@ class EpicTools:
                 - user_stories_counts: Contador de historias por estado
 
             Raises:
-                ToolError: Si la autenticación falla, no hay permisos,
-                    o hay error en la API
+                ToolError: Si limit es menor que 1, la autenticación falla,
+                    no hay permisos, o hay error en la API
 
             Example:
                 >>> epics = await taiga_list_epics(
@@ -112,7 +128,7 @@ class EpicTools:
             if assigned_to is not None:
                 kwargs["assigned_to"] = assigned_to
             return await self.list_epics(
-                auth_token=auth_token, auto_paginate=auto_paginate, **kwargs
+                auth_token=auth_token, auto_paginate=auto_paginate, limit=limit, **kwargs
             )
 
         # EPIC-002: Create epic
@@ -1118,7 +1134,11 @@ class EpicTools:
         # EPIC-022: Create epic attachment
         @self.mcp.tool(name="taiga_create_epic_attachment")
         async def create_epic_attachment_tool(
-            auth_token: str, epic_id: int, file: str, description: str | None = None
+            auth_token: str,
+            epic_id: int,
+            project_id: int,
+            attached_file: str,
+            description: str | None = None,
         ) -> dict[str, Any]:
             """
             Create an attachment for an epic.
@@ -1130,7 +1150,8 @@ class EpicTools:
             Args:
                 auth_token: Token de autenticación obtenido de taiga_authenticate
                 epic_id: ID de la épica
-                file: Ruta al archivo a adjuntar o contenido codificado
+                project_id: ID del proyecto de la épica
+                attached_file: Ruta al archivo a adjuntar
                 description: Descripción del adjunto (opcional)
 
             Returns:
@@ -1150,7 +1171,8 @@ class EpicTools:
                 >>> attachment = await taiga_create_epic_attachment(
                 ...     auth_token="eyJ0eXAiOi...",
                 ...     epic_id=456,
-                ...     file="/path/to/document.pdf",
+                ...     project_id=123,
+                ...     attached_file="/path/to/document.pdf",
                 ...     description="Documento de requisitos"
                 ... )
                 >>> print(attachment)
@@ -1161,7 +1183,7 @@ class EpicTools:
                     "description": "Documento de requisitos"
                 }
             """
-            kwargs = {"epic_id": epic_id, "file": file}
+            kwargs = {"epic_id": epic_id, "project_id": project_id, "attached_file": attached_file}
             if description is not None:
                 kwargs["description"] = description
             return await self.create_epic_attachment(auth_token=auth_token, **kwargs)
@@ -1596,9 +1618,15 @@ class EpicTools:
 
     # EPIC-001: List epics
     async def list_epics(
-        self, auth_token: str, auto_paginate: bool = True, **kwargs: Any
+        self,
+        auth_token: str,
+        auto_paginate: bool = True,
+        limit: int | None = None,
+        **kwargs: Any,
     ) -> list[dict[str, Any]]:
         """List epics in a project."""
+        if limit is not None and limit < 1:
+            raise ToolError("limit must be greater than 0")
         self._logger.debug(f"[list_epics] Starting | params={kwargs}")
         try:
             from src.domain.exceptions import (
@@ -1608,9 +1636,10 @@ class EpicTools:
             )
 
             kwargs.pop("auth_token", None)
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
-                paginator = AutoPaginator(client, PaginationConfig())
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
+                paginator = AutoPaginator(client, CONCURRENT_PAGINATION_CONFIG)
                 params = {}
                 if kwargs.get("project"):
                     params["project"] = kwargs["project"]
@@ -1619,14 +1648,19 @@ class EpicTools:
                 if kwargs.get("assigned_to"):
                     params["assigned_to"] = kwargs["assigned_to"]
 
+                # Validate each epic with Pydantic as its page arrives
+                def validate(epic: dict[str, Any]) -> dict[str, Any]:
+                    return EpicResponse.model_validate(epic).model_dump(exclude_none=True)
+
                 if auto_paginate:
-                    epics = await paginator.paginate("/epics", params=params)
+                    epics = await paginator.collect(
+                        "/epics", params=params, transform=validate, limit=limit
+                    )
                 else:
-                    epics = await paginator.paginate_first_page("/epics", params=params)
-                # Validate response with Pydantic
-                validated = EpicListResponse.from_api_response(epics).model_dump(exclude_none=True)
-                self._logger.info(f"[list_epics] Success | count={len(validated['epics'])}")
-                return validated["epics"]
+                    first_page = await paginator.paginate_first_page("/epics", params=params)
+                    epics = [validate(epic) for epic in first_page[:limit]]
+                self._logger.info(f"[list_epics] Success | count={len(epics)}")
+                return epics
         except AuthenticationError as e:
             self._logger.error(f"[list_epics] Authentication failed: {e!s}")
             raise ToolError(f"Authentication failed: {e!s}") from e
@@ -1676,8 +1710,9 @@ class EpicTools:
         validate_input(EpicCreateValidator, epic_data)
 
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 epic = await client.create_epic(
                     project=project,
                     subject=subject,
@@ -1715,8 +1750,9 @@ class EpicTools:
                 ResourceNotFoundError,
             )
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 epic = await client.get_epic(epic_id)
                 # Validate response with Pydantic
                 result = EpicResponse.model_validate(epic).model_dump(exclude_none=True)
@@ -1756,8 +1792,9 @@ class EpicTools:
                 ResourceNotFoundError,
             )
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 epic = await client.get_epic_by_ref(project_id=project_id, ref=ref)
                 # Validate response with Pydantic
                 result = EpicResponse.model_validate(epic).model_dump(exclude_none=True)
@@ -1827,8 +1864,9 @@ class EpicTools:
             }
             validate_input(EpicUpdateValidator, update_data)
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 epic = await client.update_epic_full(
                     epic_id=epic_id,
                     project=project,
@@ -1906,8 +1944,9 @@ class EpicTools:
             }
             validate_input(EpicUpdateValidator, update_data)
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 # If subject, project and version are present, use full update (PUT)
                 if is_full_update:
                     result = await client.update_epic_full(
@@ -2032,8 +2071,9 @@ class EpicTools:
                 ResourceNotFoundError,
             )
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 await client.delete_epic(epic_id)
                 self._logger.info(f"[delete_epic] Success | epic_id={epic_id}")
                 # Validate response with Pydantic
@@ -2059,8 +2099,9 @@ class EpicTools:
     ) -> list[dict[str, Any]]:
         """List user stories related to an epic."""
         self._logger.debug(f"[list_epic_related_userstories] Starting | epic_id={epic_id}")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             stories = await client.list_epic_related_userstories(epic_id)
             # Validate response with Pydantic
             result = [
@@ -2111,8 +2152,9 @@ class EpicTools:
         self._logger.debug(
             f"[create_epic_related_userstory] Starting | epic_id={epic_id}, user_story={user_story}"
         )
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             story = await client.create_epic_related_userstory(
                 epic_id=epic_id, user_story=user_story, order=order
             )
@@ -2172,8 +2214,9 @@ class EpicTools:
         self._logger.debug(
             f"[get_epic_related_userstory] Starting | epic_id={epic_id}, userstory_id={userstory_id}"
         )
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             story = await client.get_epic_related_userstory(
                 epic_id=epic_id, userstory_id=userstory_id
             )
@@ -2205,8 +2248,9 @@ class EpicTools:
         self._logger.debug(
             f"[update_epic_related_userstory] Starting | epic_id={epic_id}, userstory_id={userstory_id}"
         )
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             story = await client.update_epic_related_userstory(
                 epic_id=epic_id, userstory_id=userstory_id, order=order
             )
@@ -2230,8 +2274,9 @@ class EpicTools:
         self._logger.debug(
             f"[delete_epic_related_userstory] Starting | epic_id={epic_id}, userstory_id={userstory_id}"
         )
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             await client.delete_epic_related_userstory(epic_id=epic_id, userstory_id=userstory_id)
             self._logger.info(
                 f"[delete_epic_related_userstory] Success | epic_id={epic_id}, userstory_id={userstory_id}"
@@ -2254,8 +2299,9 @@ class EpicTools:
         try:
             from src.domain.exceptions import AuthenticationError, PermissionDeniedError
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 # Handle both epics_data and bulk_epics parameters
                 if bulk_epics:
                     result = await client.bulk_create_epics(
@@ -2303,8 +2349,9 @@ class EpicTools:
                 ResourceNotFoundError,
             )
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 # Check if client has the non-epic version (for tests)
                 if hasattr(client, "bulk_create_related_userstories"):
                     if bulk_userstories:
@@ -2373,9 +2420,11 @@ class EpicTools:
                 ResourceNotFoundError,
             )
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
-                filters = await client.get_epic_filters(project=project_id)
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
+                cached = create_cached_client(self.config, client, cache=self.cache)
+                filters = await cached.get_epic_filters(project_id)
                 # Validate response with Pydantic
                 result = EpicFiltersResponse.model_validate(filters).model_dump(exclude_none=True)
                 self._logger.info(f"[get_epic_filters] Success | project_id={project_id}")
@@ -2406,8 +2455,9 @@ class EpicTools:
                 ResourceNotFoundError,
             )
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 await client.upvote_epic(epic_id)
                 self._logger.info(f"[upvote_epic] Success | epic_id={epic_id}")
                 # Validate response with Pydantic
@@ -2438,8 +2488,9 @@ class EpicTools:
                 ResourceNotFoundError,
             )
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 await client.downvote_epic(epic_id)
                 self._logger.info(f"[downvote_epic] Success | epic_id={epic_id}")
                 # Validate response with Pydantic
@@ -2470,8 +2521,9 @@ class EpicTools:
                 ResourceNotFoundError,
             )
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 voters = await client.get_epic_voters(epic_id)
                 # Validate response with Pydantic
                 validated = [
@@ -2506,8 +2558,9 @@ class EpicTools:
                 ResourceNotFoundError,
             )
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 await client.watch_epic(epic_id)
                 self._logger.info(f"[watch_epic] Success | epic_id={epic_id}")
                 # Validate response with Pydantic
@@ -2538,8 +2591,9 @@ class EpicTools:
                 ResourceNotFoundError,
             )
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 await client.unwatch_epic(epic_id)
                 self._logger.info(f"[unwatch_epic] Success | epic_id={epic_id}")
                 # Validate response with Pydantic
@@ -2570,8 +2624,9 @@ class EpicTools:
                 ResourceNotFoundError,
             )
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 watchers = await client.get_epic_watchers(epic_id)
                 # Validate response with Pydantic
                 validated = [
@@ -2611,8 +2666,9 @@ class EpicTools:
             # Handle alias: epic_id -> object_id
             if "epic_id" in kwargs:
                 kwargs["object_id"] = kwargs.pop("epic_id")
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 attachments = await client.list_epic_attachments(**kwargs)
                 # Validate response with Pydantic
                 validated = [
@@ -2649,11 +2705,14 @@ class EpicTools:
             )
 
             kwargs.pop("auth_token", None)
-            # Handle alias: epic_id -> object_id
-            if "epic_id" in kwargs:
-                kwargs["object_id"] = kwargs.pop("epic_id")
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            # Handle aliases: object_id -> epic_id, project -> project_id
+            if "object_id" in kwargs:
+                kwargs["epic_id"] = kwargs.pop("object_id")
+            if "project" in kwargs:
+                kwargs["project_id"] = kwargs.pop("project")
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 attachment = await client.create_epic_attachment(**kwargs)
                 # Validate response with Pydantic
                 result = EpicAttachmentResponse.model_validate(attachment).model_dump(
@@ -2682,8 +2741,9 @@ class EpicTools:
     async def get_epic_attachment(self, auth_token: str, attachment_id: int) -> dict[str, Any]:
         """Get a specific attachment of an epic."""
         self._logger.debug(f"[get_epic_attachment] Starting | attachment_id={attachment_id}")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             attachment = await client.get_epic_attachment(attachment_id=attachment_id)
             # Validate response with Pydantic
             result = EpicAttachmentResponse.model_validate(attachment).model_dump(exclude_none=True)
@@ -2698,8 +2758,9 @@ class EpicTools:
         self._logger.debug(f"[update_epic_attachment] Starting | attachment_id={attachment_id}")
         kwargs.pop("auth_token", None)
         kwargs.pop("attachment_id", None)
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             attachment = await client.update_epic_attachment(attachment_id=attachment_id, **kwargs)
             # Validate response with Pydantic
             result = EpicAttachmentResponse.model_validate(attachment).model_dump(exclude_none=True)
@@ -2710,8 +2771,9 @@ class EpicTools:
     async def delete_epic_attachment(self, auth_token: str, attachment_id: int) -> dict[str, Any]:
         """Delete an attachment of an epic."""
         self._logger.debug(f"[delete_epic_attachment] Starting | attachment_id={attachment_id}")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             await client.delete_epic_attachment(attachment_id=attachment_id)
             self._logger.info(f"[delete_epic_attachment] Success | attachment_id={attachment_id}")
             # Validate response with Pydantic
@@ -2725,8 +2787,9 @@ class EpicTools:
     ) -> list[dict[str, Any]]:
         """List custom attributes for epics in a project."""
         self._logger.debug(f"[list_epic_custom_attributes] Starting | project_id={project_id}")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             attrs = await client.list_epic_custom_attributes(project=project_id)
             # Validate response with Pydantic
             result = [
@@ -2749,8 +2812,9 @@ class EpicTools:
         kwargs.pop("auth_token", None)
         kwargs.pop("project", None)
         kwargs.pop("project_id", None)
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             attr = await client.create_epic_custom_attribute(
                 project_id=project_id, name=name, **kwargs
             )
@@ -2767,8 +2831,9 @@ class EpicTools:
     ) -> dict[str, Any]:
         """Get custom attribute values of an epic."""
         self._logger.debug(f"[get_epic_custom_attribute_values] Starting | epic_id={epic_id}")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             values = await client.get_epic_custom_attribute_values(epic_id=epic_id)
             # Validate response with Pydantic
             result = EpicCustomAttributeValuesResponse.model_validate(values).model_dump(
@@ -2790,17 +2855,18 @@ class EpicTools:
             f"[update_epic_custom_attribute_values] Starting | epic_id={epic_id}, "
             f"attributes_count={len(attributes_values)}"
         )
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             result = await client.update_epic_custom_attribute_values(
                 epic_id=epic_id,
                 attributes_values=attributes_values,
                 version=version,
             )
             # Validate response with Pydantic
-            validated_result = EpicCustomAttributeValuesResponse.model_validate(
-                result
-            ).model_dump(exclude_none=True)
+            validated_result = EpicCustomAttributeValuesResponse.model_validate(result).model_dump(
+                exclude_none=True
+            )
             self._logger.info(
                 f"[update_epic_custom_attribute_values] Success | epic_id={epic_id}, "
                 f"new_version={validated_result.get('version')}"
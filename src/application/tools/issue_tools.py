@@ -11,23 +11,39 @@ from fastmcp.exceptions import ToolError as MCPError
 from src.config import TaigaConfig
 from src.domain.exceptions import ValidationError
 from src.domain.validators import IssueCreateValidator, IssueUpdateValidator, validate_input
+from src.infrastructure.cache import CacheBackend
+from src.infrastructure.client_factory import (
+    create_cached_client,
+    create_taiga_client,
+    get_global_cache,
+    get_global_session_pool,
+)
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
-from src.infrastructure.pagination import AutoPaginator, PaginationConfig
-from src.taiga_client import TaigaAPIClient
+from src.infrastructure.pagination import CONCURRENT_PAGINATION_CONFIG, AutoPaginator
 
 
 class IssueTools:
     """Herramientas para gestión de Issues en Taiga."""
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(
+        self,
+        mcp: FastMCP,
+        session_pool: HTTPSessionPool | None = None,
+        cache: CacheBackend | None = None,
+    ) -> None:
         """
         Inicializa las herramientas de Issues.
 
         Args:
             mcp: Instancia del servidor FastMCP
+            session_pool: Pool de sesiones HTTP compartido. Si es None, usa el pool global
+            cache: Caché de metadatos compartido. Si es None, usa el caché global
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
+        self.cache = cache or get_global_cache()
         self._logger = get_logger(__name__)
 
     def register_tools(self) -> None:
@@ -52,6 +68,7 @@ class IssueTools:
             exclude_assigned_to: int | None = None,
             exclude_tags: list[str] | None = None,
             auto_paginate: bool = True,
+            limit: int | None = None,
         ) -> list[dict[str, Any]]:
             """
             ISSUE-001: Lista issues con filtros opcionales.
@@ -78,6 +95,8 @@ class IssueTools:
                 exclude_tags: Lista de tags a excluir
                 auto_paginate: Si True (default), obtiene todos los resultados
                     automáticamente. Si False, retorna solo la primera página.
+                limit: Número máximo de issues a devolver, mayor que 0. La
+                    paginación se detiene en cuanto se alcanza.
 
             Returns:
                 Lista de diccionarios con información de issues, cada uno conteniendo:
@@ -92,7 +111,8 @@ class IssueTools:
                 - is_closed: Si está cerrado
 
             Raises:
-                ToolError: Si la autenticación falla o hay error en la API
+                ToolError: Si limit es menor que 1, la autenticación falla o hay
+                    error en la API
 
             Example:
                 >>> issues = await taiga_list_issues(
@@ -104,21 +124,26 @@ class IssueTools:
                 >>> for issue in issues:
                 ...     print(f"#{issue['ref']}: {issue['subject']}")
             """
+            if limit is not None and limit < 1:
+                raise MCPError("limit must be greater than 0")
             kwargs = {
                 k: v
                 for k, v in locals().items()
-                if k not in ["self", "auth_token", "project_id", "auto_paginate"] and v is not None
+                if k not in ["self", "auth_token", "project_id", "auto_paginate", "limit"]
+                and v is not None
             }
             if project_id is not None:
                 kwargs["project"] = project_id  # API expects 'project'
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
-                paginator = AutoPaginator(client, PaginationConfig())
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
+                paginator = AutoPaginator(client, CONCURRENT_PAGINATION_CONFIG)
 
                 if auto_paginate:
-                    return await paginator.paginate("/issues", params=kwargs)
-                return await paginator.paginate_first_page("/issues", params=kwargs)
+                    return await paginator.collect("/issues", params=kwargs, limit=limit)
+                issues = await paginator.paginate_first_page("/issues", params=kwargs)
+                return issues[:limit]
 
         @self.mcp.tool(name="taiga_create_issue")
         async def create_issue(
@@ -229,8 +254,9 @@ class IssueTools:
                 if type is not None:
                     data["issue_type"] = type  # Client expects 'issue_type', not 'type'
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     return await client.create_issue(**data)
 
             except ValidationError as e:
@@ -276,8 +302,9 @@ class IssueTools:
                 >>> print(f"Issue: {issue['subject']}")
                 >>> print(f"Status: {issue['status']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.get_issue(issue_id)
 
         @self.mcp.tool(name="taiga_get_issue_by_ref", annotations={"readOnlyHint": True})
@@ -318,8 +345,9 @@ class IssueTools:
                 ... )
                 >>> print(f"Found: #{issue['ref']} - {issue['subject']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.get_issue_by_ref(
                     project=project_id, ref=ref
                 )  # API expects 'project'
@@ -415,8 +443,9 @@ class IssueTools:
                 if milestone_id is not None:
                     data["milestone"] = milestone_id  # API expects 'milestone'
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     return await client.update_issue(issue_id, **data)
             except ValidationError as e:
                 self._logger.warning(f"[update_issue] Validation error | error={e!s}")
@@ -449,8 +478,9 @@ class IssueTools:
                 >>> if result:
                 ...     print("Issue deleted successfully")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.delete_issue(issue_id)
 
         # Operaciones en Lote (ISSUE-008)
@@ -523,8 +553,9 @@ class IssueTools:
                     except ValidationError as e:
                         raise ValidationError(f"Issue {idx + 1}: {e!s}") from e
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     return await client.bulk_create_issues(
                         project=project_id, issues=issues
                     )  # API expects 'project'
@@ -568,9 +599,11 @@ class IssueTools:
                 >>> for status in filters['statuses']:
                 ...     print(f"  {status['id']}: {status['name']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
-                return await client.get_issue_filters(project=project_id)  # API expects 'project'
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
+                cached = create_cached_client(self.config, client, cache=self.cache)
+                return await cached.get_issue_filters(project_id)
 
         # Votación (ISSUE-014 a ISSUE-016)
         @self.mcp.tool(name="taiga_upvote_issue", annotations={"idempotentHint": True})
@@ -603,8 +636,9 @@ class IssueTools:
                 ... )
                 >>> print(f"Total votes: {result['total_voters']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.upvote_issue(issue_id)
 
         @self.mcp.tool(name="taiga_downvote_issue", annotations={"idempotentHint": True})
@@ -636,8 +670,9 @@ class IssueTools:
                 ... )
                 >>> print(f"Vote removed. Total: {result['total_voters']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.downvote_issue(issue_id)
 
         @self.mcp.tool(name="taiga_get_issue_voters", annotations={"readOnlyHint": True})
@@ -671,8 +706,9 @@ class IssueTools:
                 >>> for voter in voters:
                 ...     print(f"  - {voter['full_name']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.get_issue_voters(issue_id)
 
         # Watchers (ISSUE-017 a ISSUE-019)
@@ -706,8 +742,9 @@ class IssueTools:
                 ... )
                 >>> print(f"Now watching. Total watchers: {result['total_watchers']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.watch_issue(issue_id)
 
         @self.mcp.tool(name="taiga_unwatch_issue", annotations={"idempotentHint": True})
@@ -739,8 +776,9 @@ class IssueTools:
                 ... )
                 >>> print("Stopped watching issue")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.unwatch_issue(issue_id)
 
         @self.mcp.tool(name="taiga_get_issue_watchers", annotations={"readOnlyHint": True})
@@ -775,8 +813,9 @@ class IssueTools:
                 >>> for w in watchers:
                 ...     print(f"  - {w['full_name']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.get_issue_watchers(issue_id)
 
         # Adjuntos (ISSUE-020 a ISSUE-024)
@@ -814,16 +853,17 @@ class IssueTools:
                 >>> for att in attachments:
                 ...     print(f"  {att['name']} ({att['size']} bytes)")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.get_issue_attachments(issue_id)
 
         @self.mcp.tool(name="taiga_create_issue_attachment")
         async def create_issue_attachment(
             auth_token: str,
             issue_id: int,
-            file: bytes,
-            filename: str,
+            project_id: int,
+            attached_file: str,
             description: str | None = None,
         ) -> dict[str, Any]:
             """
@@ -831,13 +871,14 @@ class IssueTools:
 
             Esta herramienta permite subir un archivo adjunto a un issue
             existente. Útil para evidencias, logs, capturas de pantalla
-            o documentación relacionada.
+            o documentación relacionada. El archivo se envía desde disco
+            sin cargarlo entero en memoria.
 
             Args:
                 auth_token: Token de autenticación obtenido de taiga_authenticate
                 issue_id: ID del issue al que adjuntar el archivo
-                file: Contenido binario del archivo
-                filename: Nombre del archivo con extensión
+                project_id: ID del proyecto del issue
+                attached_file: Ruta al archivo a adjuntar
                 description: Descripción opcional del adjunto
 
             Returns:
@@ -854,21 +895,23 @@ class IssueTools:
                     o la autenticación falla
 
             Example:
-                >>> with open("screenshot.png", "rb") as f:
-                ...     content = f.read()
                 >>> attachment = await taiga_create_issue_attachment(
                 ...     auth_token="eyJ0eXAiOi...",
                 ...     issue_id=456,
-                ...     file=content,
-                ...     filename="screenshot.png",
+                ...     project_id=123,
+                ...     attached_file="/path/to/screenshot.png",
                 ...     description="Error screenshot"
                 ... )
                 >>> print(f"Uploaded: {attachment['url']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.create_issue_attachment(
-                    issue_id=issue_id, file=file, filename=filename, description=description
+                    object_id=issue_id,
+                    project=project_id,
+                    attached_file=attached_file,
+                    description=description,
                 )
 
         @self.mcp.tool(name="taiga_get_issue_attachment", annotations={"readOnlyHint": True})
@@ -906,8 +949,9 @@ class IssueTools:
                 >>> print(f"File: {attachment['name']}")
                 >>> print(f"Download: {attachment['url']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.get_issue_attachment(attachment_id)
 
         @self.mcp.tool(name="taiga_update_issue_attachment", annotations={"idempotentHint": True})
@@ -958,8 +1002,9 @@ class IssueTools:
                 if k not in ["self", "auth_token", "attachment_id"] and v is not None
             }
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.update_issue_attachment(attachment_id, **data)
 
         @self.mcp.tool(name="taiga_delete_issue_attachment", annotations={"destructiveHint": True})
@@ -989,8 +1034,9 @@ class IssueTools:
                 >>> if result:
                 ...     print("Attachment deleted")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.delete_issue_attachment(attachment_id)
 
         # Historial (ISSUE-025 a ISSUE-029)
@@ -1028,8 +1074,9 @@ class IssueTools:
                 >>> for entry in history:
                 ...     print(f"{entry['created_at']}: {entry['user']['username']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.get_issue_history(issue_id)
 
         @self.mcp.tool(name="taiga_get_issue_comment_versions", annotations={"readOnlyHint": True})
@@ -1067,8 +1114,9 @@ class IssueTools:
                 >>> for v in versions:
                 ...     print(f"Version from {v['created_at']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.get_issue_comment_versions(issue_id, comment_id)
 
         @self.mcp.tool(name="taiga_edit_issue_comment")
@@ -1108,8 +1156,9 @@ class IssueTools:
                 ... )
                 >>> print(f"Comment edited at {edited['modified_at']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.edit_issue_comment(
                     issue_id=issue_id, comment_id=comment_id, comment=comment
                 )
@@ -1143,8 +1192,9 @@ class IssueTools:
                 >>> if result:
                 ...     print("Comment deleted (can be restored)")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.delete_issue_comment(issue_id, comment_id)
 
         @self.mcp.tool(name="taiga_undelete_issue_comment")
@@ -1182,8 +1232,9 @@ class IssueTools:
                 ... )
                 >>> print(f"Comment restored: {restored['comment'][:50]}...")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.undelete_issue_comment(issue_id, comment_id)
 
         # Atributos Personalizados (ISSUE-030)
@@ -1224,8 +1275,9 @@ class IssueTools:
                 >>> for attr in attributes:
                 ...     print(f"{attr['name']}: {attr['type']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.list_issue_custom_attributes(project=project_id)
 
         @self.mcp.tool(name="taiga_create_issue_custom_attribute")
@@ -1282,8 +1334,9 @@ class IssueTools:
                 ... )
                 >>> print(f"Created attribute '{attr['name']}' with ID {attr['id']}")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.create_issue_custom_attribute(
                     project=project_id,
                     name=name,
@@ -1345,8 +1398,9 @@ class IssueTools:
                 if k not in ["self", "auth_token", "attribute_id"] and v is not None
             }
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.update_issue_custom_attribute(attribute_id, **data)
 
         @self.mcp.tool(
@@ -1379,8 +1433,9 @@ class IssueTools:
                 >>> if result:
                 ...     print("Custom attribute deleted permanently")
             """
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 return await client.delete_issue_custom_attribute(attribute_id)
 
     # Métodos de las herramientas (para facilitar testing)
@@ -1390,9 +1445,9 @@ class IssueTools:
         project = kwargs.get("project")
         self._logger.debug(f"[list_issues] Starting | project={project}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.list_issues(**kwargs)
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(f"[list_issues] Success | project={project}, count={count}")
@@ -1413,9 +1468,9 @@ class IssueTools:
         subject = kwargs.get("subject")
         self._logger.debug(f"[create_issue] Starting | project={project}, subject={subject}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.create_issue(**kwargs)
             issue_id = result.get("id") if isinstance(result, dict) else None
             self._logger.info(f"[create_issue] Success | project={project}, issue_id={issue_id}")
@@ -1428,9 +1483,9 @@ class IssueTools:
         """Implementación directa del método get_issue."""
         self._logger.debug(f"[get_issue] Starting | issue_id={issue_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_issue(issue_id=issue_id)
             self._logger.info(f"[get_issue] Success | issue_id={issue_id}")
             return result
@@ -1457,9 +1512,9 @@ class IssueTools:
             }
             validate_input(IssueUpdateValidator, validation_data)
 
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.update_issue(issue_id, **kwargs)
             self._logger.info(f"[update_issue] Success | issue_id={issue_id}")
             return result
@@ -1489,9 +1544,9 @@ class IssueTools:
             }
             validate_input(IssueUpdateValidator, validation_data)
 
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.update_issue_full(issue_id, **kwargs)
             self._logger.info(f"[update_issue_full] Success | issue_id={issue_id}")
             return result
@@ -1506,9 +1561,9 @@ class IssueTools:
         """Implementación directa del método delete_issue."""
         self._logger.debug(f"[delete_issue] Starting | issue_id={issue_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.delete_issue(issue_id=issue_id)
             self._logger.info(f"[delete_issue] Success | issue_id={issue_id}")
             return result
@@ -1522,9 +1577,9 @@ class IssueTools:
         project = kwargs.get("project_id")
         self._logger.debug(f"[bulk_create_issues] Starting | project={project}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.bulk_create_issues(**kwargs)
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(f"[bulk_create_issues] Success | project={project}, count={count}")
@@ -1537,9 +1592,9 @@ class IssueTools:
         """Implementación directa del método get_issue_filters."""
         self._logger.debug(f"[get_issue_filters] Starting | project={project}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_issue_filters(project=project)
             self._logger.info(f"[get_issue_filters] Success | project={project}")
             return result
@@ -1551,9 +1606,9 @@ class IssueTools:
         """Implementación directa del método upvote_issue."""
         self._logger.debug(f"[upvote_issue] Starting | issue_id={issue_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.upvote_issue(issue_id=issue_id)
             self._logger.info(f"[upvote_issue] Success | issue_id={issue_id}")
             return result
@@ -1565,9 +1620,9 @@ class IssueTools:
         """Implementación directa del método downvote_issue."""
         self._logger.debug(f"[downvote_issue] Starting | issue_id={issue_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.downvote_issue(issue_id=issue_id)
             self._logger.info(f"[downvote_issue] Success | issue_id={issue_id}")
             return result
@@ -1579,9 +1634,9 @@ class IssueTools:
         """Implementación directa del método get_issue_voters."""
         self._logger.debug(f"[get_issue_voters] Starting | issue_id={issue_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_issue_voters(issue_id=issue_id)
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(f"[get_issue_voters] Success | issue_id={issue_id}, count={count}")
@@ -1594,9 +1649,9 @@ class IssueTools:
         """Implementación directa del método watch_issue."""
         self._logger.debug(f"[watch_issue] Starting | issue_id={issue_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.watch_issue(issue_id=issue_id)
             self._logger.info(f"[watch_issue] Success | issue_id={issue_id}")
             return result
@@ -1608,9 +1663,9 @@ class IssueTools:
         """Implementación directa del método unwatch_issue."""
         self._logger.debug(f"[unwatch_issue] Starting | issue_id={issue_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.unwatch_issue(issue_id=issue_id)
             self._logger.info(f"[unwatch_issue] Success | issue_id={issue_id}")
             return result
@@ -1622,9 +1677,9 @@ class IssueTools:
         """Implementación directa del método get_issue_watchers."""
         self._logger.debug(f"[get_issue_watchers] Starting | issue_id={issue_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_issue_watchers(issue_id=issue_id)
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(f"[get_issue_watchers] Success | issue_id={issue_id}, count={count}")
@@ -1637,9 +1692,9 @@ class IssueTools:
         """Implementación directa del método get_issue_attachments."""
         self._logger.debug(f"[get_issue_attachments] Starting | issue_id={issue_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_issue_attachments(issue_id)
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(
@@ -1657,9 +1712,9 @@ class IssueTools:
         """Lista los attachments de un issue."""
         self._logger.debug(f"[list_issue_attachments] Starting | issue_id={issue_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 # Check if client has list_issue_attachments method (for tests)
                 if hasattr(client, "list_issue_attachments"):
                     result = await client.list_issue_attachments(issue_id=issue_id)
@@ -1678,12 +1733,17 @@ class IssueTools:
     async def create_issue_attachment(self, **kwargs: Any):
         """Implementación directa del método create_issue_attachment."""
         auth_token = kwargs.pop("auth_token", None)
-        issue_id = kwargs.get("issue_id")
+        # Alias de la herramienta MCP -> nombres de TaigaAPIClient
+        if "issue_id" in kwargs:
+            kwargs["object_id"] = kwargs.pop("issue_id")
+        if "project_id" in kwargs:
+            kwargs["project"] = kwargs.pop("project_id")
+        issue_id = kwargs.get("object_id")
         self._logger.debug(f"[create_issue_attachment] Starting | issue_id={issue_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.create_issue_attachment(**kwargs)
             attachment_id = result.get("id") if isinstance(result, dict) else None
             self._logger.info(
@@ -1702,9 +1762,9 @@ class IssueTools:
         """Implementación directa del método get_issue_attachment."""
         self._logger.debug(f"[get_issue_attachment] Starting | attachment_id={attachment_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_issue_attachment(attachment_id=attachment_id)
             self._logger.info(f"[get_issue_attachment] Success | attachment_id={attachment_id}")
             return result
@@ -1719,9 +1779,9 @@ class IssueTools:
         auth_token = kwargs.pop("auth_token", None)
         self._logger.debug(f"[update_issue_attachment] Starting | attachment_id={attachment_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.update_issue_attachment(attachment_id, **kwargs)
             self._logger.info(f"[update_issue_attachment] Success | attachment_id={attachment_id}")
             return result
@@ -1737,9 +1797,9 @@ class IssueTools:
         """Implementación directa del método delete_issue_attachment."""
         self._logger.debug(f"[delete_issue_attachment] Starting | attachment_id={attachment_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.delete_issue_attachment(attachment_id=attachment_id)
             self._logger.info(f"[delete_issue_attachment] Success | attachment_id={attachment_id}")
             return result
@@ -1753,9 +1813,9 @@ class IssueTools:
         """Implementación directa del método get_issue_history."""
         self._logger.debug(f"[get_issue_history] Starting | issue_id={issue_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_issue_history(issue_id=issue_id)
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(f"[get_issue_history] Success | issue_id={issue_id}, count={count}")
@@ -1775,9 +1835,9 @@ class IssueTools:
             f"[get_issue_comment_versions] Starting | issue_id={issue_id}, comment_id={comment_id}"
         )
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_issue_comment_versions(
                     issue_id=issue_id, comment_id=comment_id
                 )
@@ -1801,9 +1861,9 @@ class IssueTools:
             f"[edit_issue_comment] Starting | issue_id={issue_id}, comment_id={comment_id}"
         )
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.edit_issue_comment(**kwargs)
             self._logger.info(
                 f"[edit_issue_comment] Success | issue_id={issue_id}, comment_id={comment_id}"
@@ -1826,9 +1886,9 @@ class IssueTools:
             f"[delete_issue_comment] Starting | issue_id={issue_id}, comment_id={comment_id}"
         )
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.delete_issue_comment(issue_id=issue_id, comment_id=comment_id)
             self._logger.info(
                 f"[delete_issue_comment] Success | issue_id={issue_id}, comment_id={comment_id}"
@@ -1851,9 +1911,9 @@ class IssueTools:
             f"[undelete_issue_comment] Starting | issue_id={issue_id}, comment_id={comment_id}"
         )
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.undelete_issue_comment(
                     issue_id=issue_id, comment_id=comment_id
                 )
@@ -1871,9 +1931,9 @@ class IssueTools:
         """Implementación directa del método get_issue_custom_attributes."""
         self._logger.debug(f"[get_issue_custom_attributes] Starting | project={project}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.list_issue_custom_attributes(project=project)
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(
@@ -1895,9 +1955,9 @@ class IssueTools:
             f"[create_issue_custom_attribute] Starting | project={project}, name={name}"
         )
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.create_issue_custom_attribute(**kwargs)
             attr_id = result.get("id") if isinstance(result, dict) else None
             self._logger.info(
@@ -1917,9 +1977,9 @@ class IssueTools:
             f"[update_issue_custom_attribute] Starting | attribute_id={attribute_id}"
         )
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.update_issue_custom_attribute(attribute_id, **kwargs)
             self._logger.info(
                 f"[update_issue_custom_attribute] Success | attribute_id={attribute_id}"
@@ -1938,9 +1998,9 @@ class IssueTools:
         """Lista los atributos personalizados de issues."""
         self._logger.debug(f"[list_issue_custom_attributes] Starting | project={project}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.list_issue_custom_attributes(project=project)
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(
@@ -1960,9 +2020,9 @@ class IssueTools:
         """Obtiene un atributo personalizado específico."""
         self._logger.debug(f"[get_issue_custom_attribute] Starting | attribute_id={attribute_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 # El cliente puede no tener un método específico para un solo atributo
                 # pero se puede simular obteniendo todos y filtrando
                 result = await client.get_issue_custom_attribute(attribute_id=attribute_id)
@@ -1982,9 +2042,9 @@ class IssueTools:
             f"[delete_issue_custom_attribute] Starting | attribute_id={attribute_id}"
         )
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.delete_issue_custom_attribute(attribute_id=attribute_id)
             self._logger.info(
                 f"[delete_issue_custom_attribute] Success | attribute_id={attribute_id}"
@@ -2002,9 +2062,9 @@ class IssueTools:
         """Implementación directa del método get_issue_by_ref."""
         self._logger.debug(f"[get_issue_by_ref] Starting | project={project}, ref={ref}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                if auth_token:
-                    client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_issue_by_ref(project=project, ref=ref)
             self._logger.info(f"[get_issue_by_ref] Success | project={project}, ref={ref}")
             return result
@@ -20,9 +20,10 @@ from src.domain.validators import (
     MembershipUpdateValidator,
     validate_input,
 )
+from src.infrastructure.client_factory import create_taiga_client, get_global_session_pool
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
 from src.infrastructure.pagination import AutoPaginator, PaginationConfig
-from src.taiga_client import TaigaAPIClient
 
 
 class MembershipTools:
@@ -32,15 +33,17 @@ class MembershipTools:
     Provides MCP tools for managing project memberships in Taiga.
     """
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(self, mcp: FastMCP, session_pool: HTTPSessionPool | None = None) -> None:
         """
         Initialize membership tools.
 
         Args:
             mcp: FastMCP server instance
+            session_pool: Shared HTTP session pool. Uses the global pool if None
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
         self.client = None  # For backward compatibility
         self._logger = get_logger("membership_tools")
 
@@ -113,8 +116,9 @@ class MembershipTools:
             """
             self._logger.debug(f"[list_memberships] Starting | project_id={project_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     paginator = AutoPaginator(client, PaginationConfig())
                     params = {"project": project_id}
 
@@ -239,9 +243,9 @@ class MembershipTools:
                 if not username and not email:
                     raise MCPError("Either username or email is required")
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
-
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     membership_data: dict[str, Any] = {
                         "project": project_id,
                         "role": role,
@@ -358,8 +362,9 @@ class MembershipTools:
             """
             self._logger.debug(f"[get_membership] Starting | membership_id={membership_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     membership = await client.get(f"/memberships/{membership_id}")
 
                     result = {
@@ -473,8 +478,9 @@ class MembershipTools:
                 if not update_data:
                     raise MCPError("No update data provided")
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     membership = await client.patch(
                         f"/memberships/{membership_id}", data=update_data
                     )
@@ -560,8 +566,9 @@ class MembershipTools:
             """
             self._logger.debug(f"[delete_membership] Starting | membership_id={membership_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.delete(f"/memberships/{membership_id}")
                     self._logger.info(
                         f"[delete_membership] Success | membership_id={membership_id}"
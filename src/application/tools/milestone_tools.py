@@ -25,9 +25,16 @@ from fastmcp.exceptions import ToolError as MCPError
 from src.config import TaigaConfig
 from src.domain.exceptions import ValidationError
 from src.domain.validators import MilestoneCreateValidator, MilestoneUpdateValidator, validate_input
+from src.infrastructure.cache import CacheBackend
+from src.infrastructure.client_factory import (
+    create_cached_client,
+    create_taiga_client,
+    get_global_cache,
+    get_global_session_pool,
+)
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
 from src.infrastructure.pagination import AutoPaginator, PaginationConfig
-from src.taiga_client import TaigaAPIClient
 
 
 class MilestoneTools:
@@ -39,15 +46,24 @@ class MilestoneTools:
     de dominio de Taiga.
     """
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(
+        self,
+        mcp: FastMCP,
+        session_pool: HTTPSessionPool | None = None,
+        cache: CacheBackend | None = None,
+    ) -> None:
         """
         Inicializa las herramientas de milestones.
 
         Args:
             mcp: Instancia del servidor MCP para registro de herramientas
+            session_pool: Pool de sesiones HTTP compartido. Si es None, usa el pool global
+            cache: Caché de metadatos compartido. Si es None, usa el caché global
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
+        self.cache = cache or get_global_cache()
         self._logger = get_logger("milestone_tools")
         self._register_tools()
 
@@ -706,8 +722,9 @@ class MilestoneTools:
         # Remove None values from kwargs
         params = {k: v for k, v in kwargs.items() if v is not None}
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             paginator = AutoPaginator(client, PaginationConfig())
 
             if auto_paginate:
@@ -730,8 +747,9 @@ class MilestoneTools:
             raise ValueError("project and name are required")
         if "estimated_start" not in kwargs or "estimated_finish" not in kwargs:
             raise ValueError("estimated_start and estimated_finish are required")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             result = await client.create_milestone(**kwargs)
         self._logger.info(
             f"[create_milestone] Success | project_id={project_id}, milestone_id={result.get('id')}"
@@ -741,8 +759,9 @@ class MilestoneTools:
     async def get_milestone(self, auth_token: str, milestone_id: int) -> dict[str, Any]:
         """Obtiene un milestone por ID."""
         self._logger.debug(f"[get_milestone] Starting | milestone_id={milestone_id}")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             result = await client.get_milestone(milestone_id=milestone_id)
         self._logger.info(f"[get_milestone] Success | milestone_id={milestone_id}")
         return result
@@ -759,8 +778,9 @@ class MilestoneTools:
             raise ValueError("name is required for full update")
         if "estimated_start" not in kwargs or "estimated_finish" not in kwargs:
             raise ValueError("estimated_start and estimated_finish are required for full update")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             result = await client.update_milestone_full(milestone_id=milestone_id, **kwargs)
         self._logger.info(f"[update_milestone_full] Success | milestone_id={milestone_id}")
         return result
@@ -774,8 +794,9 @@ class MilestoneTools:
         kwargs.pop("milestone_id", None)
         # Remove None values for partial update
         update_data = {k: v for k, v in kwargs.items() if v is not None}
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             result = await client.update_milestone(milestone_id=milestone_id, **update_data)
         self._logger.info(f"[update_milestone_partial] Success | milestone_id={milestone_id}")
         return result
@@ -791,8 +812,9 @@ class MilestoneTools:
     async def delete_milestone(self, auth_token: str, milestone_id: int) -> dict[str, Any]:
         """Elimina un milestone."""
         self._logger.debug(f"[delete_milestone] Starting | milestone_id={milestone_id}")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             result = await client.delete_milestone(milestone_id=milestone_id)
         self._logger.info(f"[delete_milestone] Success | milestone_id={milestone_id}")
         # Si el cliente devuelve un dict, retornarlo; si no, devolver un dict de confirmación
@@ -803,17 +825,20 @@ class MilestoneTools:
     async def get_milestone_stats(self, auth_token: str, milestone_id: int) -> dict[str, Any]:
         """Obtiene las estadísticas de un milestone."""
         self._logger.debug(f"[get_milestone_stats] Starting | milestone_id={milestone_id}")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
-            result = await client.get_milestone_stats(milestone_id=milestone_id)
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
+            cached = create_cached_client(self.config, client, cache=self.cache)
+            result = await cached.get_milestone_stats(milestone_id)
         self._logger.info(f"[get_milestone_stats] Success | milestone_id={milestone_id}")
         return result
 
     async def watch_milestone(self, auth_token: str, milestone_id: int) -> dict[str, Any]:
         """Comienza a seguir un milestone."""
         self._logger.debug(f"[watch_milestone] Starting | milestone_id={milestone_id}")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             result = await client.watch_milestone(milestone_id=milestone_id)
         self._logger.info(f"[watch_milestone] Success | milestone_id={milestone_id}")
         return result
@@ -821,8 +846,9 @@ class MilestoneTools:
     async def unwatch_milestone(self, auth_token: str, milestone_id: int) -> dict[str, Any]:
         """Deja de seguir un milestone."""
         self._logger.debug(f"[unwatch_milestone] Starting | milestone_id={milestone_id}")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             result = await client.unwatch_milestone(milestone_id=milestone_id)
         self._logger.info(f"[unwatch_milestone] Success | milestone_id={milestone_id}")
         return result
@@ -832,8 +858,9 @@ class MilestoneTools:
     ) -> list[dict[str, Any]]:
         """Obtiene la lista de observadores de un milestone."""
         self._logger.debug(f"[get_milestone_watchers] Starting | milestone_id={milestone_id}")
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             result = await client.get_milestone_watchers(milestone_id=milestone_id)
         self._logger.info(
             f"[get_milestone_watchers] Success | milestone_id={milestone_id}, count={len(result) if result else 0}"
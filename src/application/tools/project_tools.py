@@ -2,6 +2,8 @@
 Project management tools for Taiga MCP Server - Application layer.
 """
 
+import asyncio
+from pathlib import Path
 from typing import Any
 
 from fastmcp import FastMCP
@@ -28,10 +30,18 @@ from src.domain.validators import (
     ProjectUpdateValidator,
     validate_input,
 )
-from src.infrastructure.client_factory import get_taiga_client
+from src.infrastructure.cache import CacheBackend
+from src.infrastructure.client_factory import (
+    create_cached_client,
+    create_taiga_client,
+    get_global_cache,
+    get_global_session_pool,
+    get_taiga_client,
+)
+from src.infrastructure.export_parser import summarize_export
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
 from src.infrastructure.pagination import AutoPaginator, PaginationConfig
-from src.taiga_client import TaigaAPIClient
 
 
 class ProjectTools:
@@ -41,15 +51,24 @@ class ProjectTools:
     Provides MCP tools for managing projects in Taiga.
     """
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(
+        self,
+        mcp: FastMCP,
+        session_pool: HTTPSessionPool | None = None,
+        cache: CacheBackend | None = None,
+    ) -> None:
         """
         Initialize project tools.
 
         Args:
             mcp: FastMCP server instance
+            session_pool: Shared HTTP session pool. Uses the global pool if None
+            cache: Shared metadata cache. Uses the global cache if None
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
+        self.cache = cache or get_global_cache()
         self._client = None
         self.client = None  # For testing
         self._logger = get_logger("project_tools")
@@ -86,6 +105,33 @@ class ProjectTools:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _export_target(self, output_path: str) -> Path:
+        """
+        Resolve an export output_path inside the configured export directory.
+
+        Relative paths are taken from TAIGA_EXPORT_DIR; symlinks and ``..``
+        are resolved before checking that the file stays inside it.
+
+        Args:
+            output_path: Destination requested by the caller
+
+        Returns:
+            Resolved destination file
+
+        Raises:
+            MCPError: If writing exports is disabled, the path leaves the
+                export directory or the file already exists
+        """
+        if not self.config.export_dir:
+            raise MCPError("Writing exports to disk is disabled (TAIGA_EXPORT_DIR is not set)")
+        export_dir = Path(self.config.export_dir).resolve()
+        target = (export_dir / output_path).resolve()
+        if target == export_dir or not target.is_relative_to(export_dir):
+            raise MCPError(f"output_path must be a file inside {export_dir}")
+        if target.exists() or target.with_name(f"{target.name}.part").exists():
+            raise MCPError(f"output_path already exists: {target}")
+        return target
+
     def register_tools(self) -> None:
         """Register project tools with the MCP server."""
 
@@ -181,8 +227,9 @@ class ProjectTools:
                 if order_by:
                     params["order_by"] = order_by
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     paginator = AutoPaginator(client, PaginationConfig())
 
                     if auto_paginate:
@@ -338,8 +385,9 @@ class ProjectTools:
                 # Validar datos de entrada ANTES de llamar a la API
                 validate_input(ProjectCreateValidator, project_data)
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     project = await client.post("/projects", data=project_data)
 
                     # Validate response with Pydantic
@@ -452,9 +500,9 @@ class ProjectTools:
                 identifier = f"id={project_id}" if project_id else f"slug={slug}"
                 self._logger.debug(f"[get_project] Starting | {identifier}")
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
-
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     if project_id:
                         project = await client.get(f"/projects/{project_id}")
                     elif slug:
@@ -598,8 +646,9 @@ class ProjectTools:
                 validation_data = {"project_id": project_id, **update_data}
                 validate_input(ProjectUpdateValidator, validation_data)
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     project = await client.patch(f"/projects/{project_id}", data=update_data)
 
                     # Validate response with Pydantic
@@ -687,8 +736,9 @@ class ProjectTools:
             try:
                 self._logger.debug(f"[delete_project] Starting | project_id={project_id}")
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.delete(f"/projects/{project_id}")
                     self._logger.info(f"[delete_project] Success | project_id={project_id}")
                     return result
@@ -785,9 +835,11 @@ class ProjectTools:
             try:
                 self._logger.debug(f"[get_project_stats] Starting | project_id={project_id}")
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
-                    stats = await client.get(f"/projects/{project_id}/stats")
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
+                    cached = create_cached_client(self.config, client, cache=self.cache)
+                    stats = await cached.get_project_stats(project_id)
 
                     # Validate response with Pydantic
                     result = ProjectStatsResponse.model_validate(stats).model_dump(
@@ -894,8 +946,9 @@ class ProjectTools:
                 validation_data = {"project_id": project_id, **duplicate_data}
                 validate_input(ProjectDuplicateValidator, validation_data)
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     project = await client.post(
                         f"/projects/{project_id}/duplicate", data=duplicate_data
                     )
@@ -982,8 +1035,9 @@ class ProjectTools:
             try:
                 self._logger.debug(f"[like_project] Starting | project_id={project_id}")
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.post(f"/projects/{project_id}/like")
 
                     self._logger.info(
@@ -1062,8 +1116,9 @@ class ProjectTools:
             try:
                 self._logger.debug(f"[unlike_project] Starting | project_id={project_id}")
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.post(f"/projects/{project_id}/unlike")
 
                     self._logger.info(
@@ -1142,8 +1197,9 @@ class ProjectTools:
             try:
                 self._logger.debug(f"[watch_project] Starting | project_id={project_id}")
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.post(f"/projects/{project_id}/watch")
 
                     self._logger.info(
@@ -1222,8 +1278,9 @@ class ProjectTools:
             try:
                 self._logger.debug(f"[unwatch_project] Starting | project_id={project_id}")
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.post(f"/projects/{project_id}/unwatch")
 
                     self._logger.info(
@@ -1304,9 +1361,11 @@ class ProjectTools:
             """
             try:
                 self._logger.debug(f"[get_project_modules] Starting | project_id={project_id}")
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
-                    modules = await client.get(f"/projects/{project_id}/modules")
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
+                    cached = create_cached_client(self.config, client, cache=self.cache)
+                    modules = await cached.get_project_modules(project_id)
 
                     result = {
                         "is_backlog_activated": modules.get("backlog", False),
@@ -1422,8 +1481,9 @@ class ProjectTools:
                 if videoconferences_extra_data is not None:
                     modules_data["videoconferences_extra_data"] = videoconferences_extra_data
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.patch(
                         f"/projects/{project_id}/modules", data=modules_data
                     )
@@ -1526,8 +1586,9 @@ class ProjectTools:
             """
             try:
                 self._logger.debug(f"[get_project_by_slug] Starting | slug={slug}")
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     project = await client.get(f"/projects/by_slug?slug={slug}")
 
                     # Validate response with Pydantic
@@ -1605,8 +1666,9 @@ class ProjectTools:
             """
             try:
                 self._logger.debug(f"[get_project_issues_stats] Starting | project_id={project_id}")
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     stats = await client.get(f"/projects/{project_id}/issues_stats")
 
                     # Validate response with Pydantic
@@ -1687,8 +1749,9 @@ class ProjectTools:
             """
             try:
                 self._logger.debug(f"[get_project_tags] Starting | project_id={project_id}")
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     # Get project details which includes tags_colors
                     project = await client.get(f"/projects/{project_id}")
 
@@ -1776,8 +1839,9 @@ class ProjectTools:
                 validation_data = {"project_id": project_id, **tag_data}
                 validate_input(ProjectTagValidator, validation_data)
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.post(f"/projects/{project_id}/create_tag", data=tag_data)
 
                     # Return as [tag, color] list
@@ -1868,8 +1932,9 @@ class ProjectTools:
                 # Validar datos de entrada ANTES de llamar a la API
                 validate_input(ProjectTagEditValidator, tag_data)
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.post(f"/projects/{project_id}/edit_tag", data=tag_data)
 
                     # Return as [tag, color] list
@@ -1954,9 +2019,9 @@ class ProjectTools:
                 self._logger.debug(
                     f"[delete_project_tag] Starting | project_id={project_id}, tag={tag}"
                 )
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
-
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     tag_data = {"tag": tag}
 
                     await client.post(f"/projects/{project_id}/delete_tag", data=tag_data)
@@ -2032,9 +2097,9 @@ class ProjectTools:
                 self._logger.debug(
                     f"[mix_project_tags] Starting | project_id={project_id}, from_tags_count={len(from_tags)}, to_tag={to_tag}"
                 )
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
-
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     # Send mix request
                     mix_data = {"from_tags": from_tags, "to_tag": to_tag}
 
@@ -2084,7 +2149,12 @@ class ProjectTools:
             tags={"projects", "read", "export"},
             annotations={"readOnlyHint": True, "openWorldHint": True},
         )
-        async def export_project(auth_token: str, project_id: int) -> bytes:
+        async def export_project(
+            auth_token: str,
+            project_id: int,
+            output_path: str | None = None,
+            summarize: bool = False,
+        ) -> bytes | dict[str, Any]:
             """
             Export project data.
 
@@ -2092,15 +2162,25 @@ class ProjectTools:
             JSON comprimido. Incluye historias de usuario, tareas, issues,
             milestones, wiki y configuración del proyecto.
 
+            Con output_path el export se escribe en disco por bloques mientras
+            se descarga, sin mantenerlo entero en memoria. Solo se escribe
+            dentro de TAIGA_EXPORT_DIR y nunca sobre un fichero existente.
+
             Args:
                 auth_token: Token de autenticación obtenido de taiga_authenticate
                 project_id: ID del proyecto a exportar
+                output_path: Fichero destino, relativo a TAIGA_EXPORT_DIR o
+                    absoluto dentro de él; activa el modo streaming
+                summarize: Con output_path, añade un resumen (nombre, slug y
+                    número de elementos por sección) leído de forma incremental
 
             Returns:
-                Datos del proyecto exportado en bytes (JSON comprimido)
+                Datos del proyecto exportado en bytes (JSON comprimido), o con
+                output_path un dict con path, size_bytes y sha256 (y summary)
 
             Raises:
-                MCPError: Si el proyecto no existe, no hay permisos, o falla la API
+                MCPError: Si el proyecto no existe, no hay permisos, falla la API,
+                    o output_path sale de TAIGA_EXPORT_DIR o ya existe
 
             Example:
                 >>> data = await taiga_export_project(
@@ -2110,11 +2190,33 @@ class ProjectTools:
                 >>> # Guardar a archivo
                 >>> with open("project_backup.json", "wb") as f:
                 ...     f.write(data)
+                >>> # Exportar directamente a disco
+                >>> info = await taiga_export_project(
+                ...     auth_token="eyJ0eXAiOi...",
+                ...     project_id=123,
+                ...     output_path="project_123.json",
+                ...     summarize=True,
+                ... )
+                >>> print(info["summary"]["counts"]["user_stories"])
+                1532
             """
+            target = self._export_target(output_path) if output_path is not None else None
             try:
                 self._logger.debug(f"[export_project] Starting | project_id={project_id}")
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
+                    if target is not None:
+                        info = await client.download(f"/exporter/{project_id}", str(target))
+                        if summarize:
+                            info["summary"] = await asyncio.to_thread(
+                                summarize_export, info["path"]
+                            )
+                        self._logger.info(
+                            f"[export_project] Success | project_id={project_id}, "
+                            f"size_bytes={info['size_bytes']}, path={info['path']}"
+                        )
+                        return info
 
                     # Get export data
                     result = await client.get_raw(f"/exporter/{project_id}")
@@ -2190,9 +2292,9 @@ class ProjectTools:
                 self._logger.debug(
                     f"[bulk_update_projects_order] Starting | projects_count={len(projects_order)}"
                 )
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
-
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     # Send bulk update request
                     order_data = {"bulk_projects": projects_order}
 
@@ -12,8 +12,9 @@ from fastmcp.exceptions import ToolError as MCPError
 
 from src.config import TaigaConfig
 from src.domain.exceptions import AuthenticationError, ResourceNotFoundError, TaigaAPIError
+from src.infrastructure.client_factory import create_taiga_client, get_global_session_pool
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
-from src.taiga_client import TaigaAPIClient
 
 
 class SearchTools:
@@ -31,15 +32,17 @@ class SearchTools:
         client: Cliente de API para tests (inyectable)
     """
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(self, mcp: FastMCP, session_pool: HTTPSessionPool | None = None) -> None:
         """
         Inicializa SearchTools.
 
         Args:
             mcp: Instancia de FastMCP
+            session_pool: Pool de sesiones HTTP compartido. Si es None, usa el pool global
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
         self._logger = get_logger("search_tools")
         self.client = None
 
@@ -113,8 +116,9 @@ class SearchTools:
                 if self.client:
                     result = await self.client.get("/search", params=params)
                 else:
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.get("/search", params=params)
 
                 # Limitar resultados por categoría
@@ -203,8 +207,9 @@ class SearchTools:
                         f"/timeline/user/{user_id}", params={"page": page}
                     )
                 else:
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.get(
                             f"/timeline/user/{user_id}", params={"page": page}
                         )
@@ -309,8 +314,9 @@ class SearchTools:
                         f"/timeline/project/{project_id}", params={"page": page}
                     )
                 else:
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.get(
                             f"/timeline/project/{project_id}", params={"page": page}
                         )
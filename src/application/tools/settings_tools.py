@@ -22,8 +22,16 @@ from src.domain.exceptions import (
     TaigaAPIError,
     ValidationError,
 )
+from src.infrastructure.cache import CacheBackend
+from src.infrastructure.cached_client import CachedTaigaClient
+from src.infrastructure.client_factory import (
+    create_cached_client,
+    create_taiga_client,
+    get_global_cache,
+    get_global_session_pool,
+)
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
-from src.taiga_client import TaigaAPIClient
 
 
 class SettingsTools:
@@ -34,15 +42,24 @@ class SettingsTools:
     points, statuses, priorities, severities, issue types, and roles.
     """
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(
+        self,
+        mcp: FastMCP,
+        session_pool: HTTPSessionPool | None = None,
+        cache: CacheBackend | None = None,
+    ) -> None:
         """
         Initialize settings tools.
 
         Args:
             mcp: FastMCP server instance
+            session_pool: Shared HTTP session pool. Uses the global pool if None
+            cache: Shared metadata cache. Uses the global cache if None
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
+        self.cache = cache or get_global_cache()
         self._logger = get_logger("settings_tools")
         self.client = None
 
@@ -87,8 +104,9 @@ class SettingsTools:
                 return await self.client.delete(endpoint, **kwargs)
 
         # Production path
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = token
+        async with create_taiga_client(
+            self.config, token, session_pool=self.session_pool
+        ) as client:
             if method == "GET":
                 return await client.get(endpoint, **kwargs)
             if method == "POST":
@@ -101,6 +119,26 @@ class SettingsTools:
                 return await client.delete(endpoint, **kwargs)
         return None  # Explicit return for unsupported methods
 
+    async def _list_project_settings(
+        self, endpoint_type: str, auth_token: str | None, project_id: int
+    ) -> Any:
+        """List a project setting (statuses, priorities, roles...) through the cache.
+
+        Entries are keyed per project and per auth token, and are evicted by
+        the write-through invalidation when the setting is modified.
+        """
+        if self.client:
+            # Testing path
+            endpoint = CachedTaigaClient.PROJECT_SETTINGS_ENDPOINTS[endpoint_type]
+            return await self.client.get(endpoint, params={"project": project_id})
+
+        token = auth_token or self._get_auth_token()
+        async with create_taiga_client(
+            self.config, token, session_pool=self.session_pool
+        ) as client:
+            cached = create_cached_client(self.config, client, cache=self.cache)
+            return await cached.list_project_settings(endpoint_type, project_id)
+
     def register_tools(self) -> None:
         """Register all settings tools with the MCP server."""
         self._register_points_tools()
@@ -144,12 +182,7 @@ class SettingsTools:
             """
             self._logger.debug(f"[list_points] project={project_id}")
             try:
-                result = await self._make_request(
-                    "GET",
-                    "/points",
-                    auth_token=auth_token,
-                    params={"project": project_id},
-                )
+                result = await self._list_project_settings("points", auth_token, project_id)
                 self._logger.info(f"[list_points] Found {len(result)} points")
                 return result
             except AuthenticationError as e:
@@ -399,11 +432,8 @@ class SettingsTools:
             """
             self._logger.debug(f"[list_userstory_statuses] project={project_id}")
             try:
-                return await self._make_request(
-                    "GET",
-                    "/userstory-statuses",
-                    auth_token=auth_token,
-                    params={"project": project_id},
+                return await self._list_project_settings(
+                    "userstory_statuses", auth_token, project_id
                 )
             except TaigaAPIError as e:
                 raise MCPError(f"API error listing user story statuses: {e}") from e
@@ -568,12 +598,7 @@ class SettingsTools:
         ) -> list[dict[str, Any]]:
             """List all task statuses for a project."""
             try:
-                return await self._make_request(
-                    "GET",
-                    "/task-statuses",
-                    auth_token=auth_token,
-                    params={"project": project_id},
-                )
+                return await self._list_project_settings("task_statuses", auth_token, project_id)
             except TaigaAPIError as e:
                 raise MCPError(f"API error listing task statuses: {e}") from e
 
@@ -706,12 +731,7 @@ class SettingsTools:
         ) -> list[dict[str, Any]]:
             """List all issue statuses for a project."""
             try:
-                return await self._make_request(
-                    "GET",
-                    "/issue-statuses",
-                    auth_token=auth_token,
-                    params={"project": project_id},
-                )
+                return await self._list_project_settings("issue_statuses", auth_token, project_id)
             except TaigaAPIError as e:
                 raise MCPError(f"API error listing issue statuses: {e}") from e
 
@@ -844,12 +864,7 @@ class SettingsTools:
         ) -> list[dict[str, Any]]:
             """List all epic statuses for a project."""
             try:
-                return await self._make_request(
-                    "GET",
-                    "/epic-statuses",
-                    auth_token=auth_token,
-                    params={"project": project_id},
-                )
+                return await self._list_project_settings("epic_statuses", auth_token, project_id)
             except TaigaAPIError as e:
                 raise MCPError(f"API error listing epic statuses: {e}") from e
 
@@ -982,12 +997,7 @@ class SettingsTools:
         ) -> list[dict[str, Any]]:
             """List all priorities for a project."""
             try:
-                return await self._make_request(
-                    "GET",
-                    "/priorities",
-                    auth_token=auth_token,
-                    params={"project": project_id},
-                )
+                return await self._list_project_settings("priorities", auth_token, project_id)
             except TaigaAPIError as e:
                 raise MCPError(f"API error listing priorities: {e}") from e
 
@@ -1115,12 +1125,7 @@ class SettingsTools:
         ) -> list[dict[str, Any]]:
             """List all severities for a project."""
             try:
-                return await self._make_request(
-                    "GET",
-                    "/severities",
-                    auth_token=auth_token,
-                    params={"project": project_id},
-                )
+                return await self._list_project_settings("severities", auth_token, project_id)
             except TaigaAPIError as e:
                 raise MCPError(f"API error listing severities: {e}") from e
 
@@ -1248,12 +1253,7 @@ class SettingsTools:
         ) -> list[dict[str, Any]]:
             """List all issue types for a project."""
             try:
-                return await self._make_request(
-                    "GET",
-                    "/issue-types",
-                    auth_token=auth_token,
-                    params={"project": project_id},
-                )
+                return await self._list_project_settings("issue_types", auth_token, project_id)
             except TaigaAPIError as e:
                 raise MCPError(f"API error listing issue types: {e}") from e
 
@@ -1381,12 +1381,7 @@ class SettingsTools:
         ) -> list[dict[str, Any]]:
             """List all roles for a project."""
             try:
-                return await self._make_request(
-                    "GET",
-                    "/roles",
-                    auth_token=auth_token,
-                    params={"project": project_id},
-                )
+                return await self._list_project_settings("roles", auth_token, project_id)
             except TaigaAPIError as e:
                 raise MCPError(f"API error listing roles: {e}") from e
 
@@ -44,9 +44,10 @@ from fastmcp.exceptions import ToolError as MCPError
 from src.config import TaigaConfig
 from src.domain.exceptions import ValidationError
 from src.domain.validators import TaskCreateValidator, TaskUpdateValidator, validate_input
+from src.infrastructure.client_factory import create_taiga_client, get_global_session_pool
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
-from src.infrastructure.pagination import AutoPaginator, PaginationConfig
-from src.taiga_client import TaigaAPIClient
+from src.infrastructure.pagination import CONCURRENT_PAGINATION_CONFIG, AutoPaginator
 
 
 class TaskTools:
@@ -58,15 +59,17 @@ class TaskTools:
     de dominio de Taiga.
     """
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(self, mcp: FastMCP, session_pool: HTTPSessionPool | None = None) -> None:
         """
         Inicializa las herramientas de tareas.
 
         Args:
             mcp: Instancia del servidor MCP para registro de herramientas
+            session_pool: Pool de sesiones HTTP compartido. Si es None, usa el pool global
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
         self._logger = get_logger("task_tools")
         self._register_tools()
 
@@ -92,6 +95,7 @@ class TaskTools:
             exclude_assigned_to: int | None = None,
             exclude_tags: list[str] | None = None,
             auto_paginate: bool = True,
+            limit: int | None = None,
         ) -> list[dict[str, Any]]:
             """
             List all tasks in a Taiga project with optional filters.
@@ -114,6 +118,8 @@ class TaskTools:
                 exclude_tags: Lista de etiquetas a excluir (opcional)
                 auto_paginate: Si True (default), obtiene todos los resultados
                     automáticamente. Si False, retorna solo la primera página.
+                limit: Número máximo de tareas a devolver, mayor que 0. La
+                    paginación se detiene en cuanto se alcanza (opcional)
 
             Returns:
                 Lista de diccionarios con información de tareas, cada uno conteniendo:
@@ -129,7 +135,8 @@ class TaskTools:
                 - tags: Lista de etiquetas
 
             Raises:
-                ToolError: Si la autenticación falla o hay error en la API
+                ToolError: Si limit es menor que 1, la autenticación falla o hay
+                    error en la API
 
             Example:
                 >>> tasks = await taiga_list_tasks(
@@ -153,6 +160,7 @@ class TaskTools:
                 exclude_assigned_to=exclude_assigned_to,
                 exclude_tags=exclude_tags,
                 auto_paginate=auto_paginate,
+                limit=limit,
             )
 
         # TASK-002: Crear tarea
@@ -1549,20 +1557,25 @@ class TaskTools:
         """Lista todas las tareas con filtros opcionales."""
         kwargs.pop("auth_token", None)
         auto_paginate = kwargs.pop("auto_paginate", True)
+        limit = kwargs.pop("limit", None)
+        if limit is not None and limit < 1:
+            raise MCPError("limit must be greater than 0")
         project = kwargs.get("project")
         self._logger.debug(f"[list_tasks] Starting | project={project}")
         try:
             # Remove None values from kwargs
             params = {k: v for k, v in kwargs.items() if v is not None}
 
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
-                paginator = AutoPaginator(client, PaginationConfig())
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
+                paginator = AutoPaginator(client, CONCURRENT_PAGINATION_CONFIG)
 
                 if auto_paginate:
-                    result = await paginator.paginate("/tasks", params=params)
+                    result = await paginator.collect("/tasks", params=params, limit=limit)
                 else:
                     result = await paginator.paginate_first_page("/tasks", params=params)
+                    result = result[:limit]
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(f"[list_tasks] Success | project={project}, count={count}")
             return result
@@ -1581,8 +1594,9 @@ class TaskTools:
             self._logger.warning("[create_task] Missing required fields")
             raise ValueError("project, user_story and subject are required")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.create_task(**kwargs)
             task_id = result.get("id") if isinstance(result, dict) else None
             self._logger.info(f"[create_task] Success | project={project}, task_id={task_id}")
@@ -1595,8 +1609,9 @@ class TaskTools:
         """Obtiene una tarea por ID."""
         self._logger.debug(f"[get_task] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_task(task_id=task_id)
             self._logger.info(f"[get_task] Success | task_id={task_id}")
             return result
@@ -1608,8 +1623,9 @@ class TaskTools:
         """Obtiene una tarea por referencia y proyecto."""
         self._logger.debug(f"[get_task_by_ref] Starting | project={project}, ref={ref}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_task_by_ref(ref=ref, project=project)
             self._logger.info(f"[get_task_by_ref] Success | project={project}, ref={ref}")
             return result
@@ -1627,8 +1643,9 @@ class TaskTools:
         kwargs.pop("task_id", None)
         self._logger.debug(f"[update_task_full] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 # El test no requiere project y subject como obligatorios
                 result = await client.update_task_full(task_id=task_id, **kwargs)
             self._logger.info(f"[update_task_full] Success | task_id={task_id}")
@@ -1645,8 +1662,9 @@ class TaskTools:
         kwargs.pop("task_id", None)
         self._logger.debug(f"[update_task_partial] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 # Remove None values for partial update
                 update_data = {k: v for k, v in kwargs.items() if v is not None}
                 result = await client.update_task(task_id=task_id, **update_data)
@@ -1665,8 +1683,9 @@ class TaskTools:
         """Elimina una tarea."""
         self._logger.debug(f"[delete_task] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.delete_task(task_id=task_id)
             self._logger.info(f"[delete_task] Success | task_id={task_id}")
             # Si el cliente devuelve un dict, retornarlo; si no, devolver un dict de confirmación
@@ -1684,8 +1703,9 @@ class TaskTools:
         kwargs.pop("auth_token", None)
         self._logger.debug(f"[bulk_create_tasks] Starting | project_id={project_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 # Soportar tanto bulk_tasks como lista simple
                 result = await client.bulk_create_tasks(project_id=project_id, **kwargs)
             count = len(result) if isinstance(result, list) else 0
@@ -1701,8 +1721,9 @@ class TaskTools:
         """Obtiene los filtros disponibles para tareas."""
         self._logger.debug(f"[get_task_filters] Starting | project={project}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_task_filters(project=project)
             self._logger.info(f"[get_task_filters] Success | project={project}")
             return result
@@ -1714,8 +1735,9 @@ class TaskTools:
         """Añade un voto positivo a una tarea."""
         self._logger.debug(f"[upvote_task] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.upvote_task(task_id=task_id)
             self._logger.info(f"[upvote_task] Success | task_id={task_id}")
             return result
@@ -1727,8 +1749,9 @@ class TaskTools:
         """Elimina el voto de una tarea."""
         self._logger.debug(f"[downvote_task] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.downvote_task(task_id=task_id)
             self._logger.info(f"[downvote_task] Success | task_id={task_id}")
             return result
@@ -1740,8 +1763,9 @@ class TaskTools:
         """Obtiene la lista de votantes de una tarea."""
         self._logger.debug(f"[get_task_voters] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_task_voters(task_id=task_id)
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(f"[get_task_voters] Success | task_id={task_id}, count={count}")
@@ -1754,8 +1778,9 @@ class TaskTools:
         """Comienza a seguir una tarea."""
         self._logger.debug(f"[watch_task] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.watch_task(task_id=task_id)
             self._logger.info(f"[watch_task] Success | task_id={task_id}")
             return result
@@ -1767,8 +1792,9 @@ class TaskTools:
         """Deja de seguir una tarea."""
         self._logger.debug(f"[unwatch_task] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.unwatch_task(task_id=task_id)
             self._logger.info(f"[unwatch_task] Success | task_id={task_id}")
             return result
@@ -1780,8 +1806,9 @@ class TaskTools:
         """Obtiene la lista de observadores de una tarea."""
         self._logger.debug(f"[get_task_watchers] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_task_watchers(task_id=task_id)
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(f"[get_task_watchers] Success | task_id={task_id}, count={count}")
@@ -1799,8 +1826,9 @@ class TaskTools:
         task_id = kwargs.get("object_id")
         self._logger.debug(f"[list_task_attachments] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.list_task_attachments(**kwargs)
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(f"[list_task_attachments] Success | task_id={task_id}, count={count}")
@@ -1818,8 +1846,9 @@ class TaskTools:
         task_id = kwargs.get("object_id")
         self._logger.debug(f"[create_task_attachment] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.create_task_attachment(**kwargs)
             attachment_id = result.get("id") if isinstance(result, dict) else None
             self._logger.info(
@@ -1834,8 +1863,9 @@ class TaskTools:
         """Obtiene un adjunto específico de tarea."""
         self._logger.debug(f"[get_task_attachment] Starting | attachment_id={attachment_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_task_attachment(attachment_id=attachment_id)
             self._logger.info(f"[get_task_attachment] Success | attachment_id={attachment_id}")
             return result
@@ -1854,8 +1884,9 @@ class TaskTools:
         self._logger.debug(f"[update_task_attachment] Starting | attachment_id={attachment_id}")
         try:
             update_data = {k: v for k, v in kwargs.items() if v is not None}
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.update_task_attachment(
                     attachment_id=attachment_id, **update_data
                 )
@@ -1871,8 +1902,9 @@ class TaskTools:
         """Elimina un adjunto de tarea."""
         self._logger.debug(f"[delete_task_attachment] Starting | attachment_id={attachment_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 await client.delete_task_attachment(attachment_id=attachment_id)
             self._logger.info(f"[delete_task_attachment] Success | attachment_id={attachment_id}")
             return {"status": "deleted", "attachment_id": str(attachment_id)}
@@ -1886,8 +1918,9 @@ class TaskTools:
         """Obtiene el historial de cambios de una tarea."""
         self._logger.debug(f"[get_task_history] Starting | task_id={task_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_task_history(task_id=task_id)
             count = len(result) if isinstance(result, list) else 0
             self._logger.info(f"[get_task_history] Success | task_id={task_id}, count={count}")
@@ -1904,8 +1937,9 @@ class TaskTools:
             f"[get_task_comment_versions] Starting | task_id={task_id}, comment_id={comment_id}"
         )
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.get_task_comment_versions(
                     task_id=task_id, comment_id=comment_id
                 )
@@ -1928,8 +1962,9 @@ class TaskTools:
             f"[edit_task_comment] Starting | task_id={task_id}, comment_id={comment_id}"
         )
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.edit_task_comment(
                     task_id=task_id, comment_id=comment_id, comment=comment
                 )
@@ -1951,8 +1986,9 @@ class TaskTools:
             f"[delete_task_comment] Starting | task_id={task_id}, comment_id={comment_id}"
         )
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 await client.delete_task_comment(task_id=task_id, comment_id=comment_id)
             self._logger.info(
                 f"[delete_task_comment] Success | task_id={task_id}, comment_id={comment_id}"
@@ -1972,8 +2008,9 @@ class TaskTools:
             f"[undelete_task_comment] Starting | task_id={task_id}, comment_id={comment_id}"
         )
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.undelete_task_comment(task_id=task_id, comment_id=comment_id)
             self._logger.info(
                 f"[undelete_task_comment] Success | task_id={task_id}, comment_id={comment_id}"
@@ -1989,8 +2026,9 @@ class TaskTools:
         """Lista los atributos personalizados de tareas."""
         self._logger.debug(f"[list_task_custom_attributes] Starting | project={project}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.list_task_custom_attributes(project=project)
             self._logger.info(f"[list_task_custom_attributes] Success | project={project}")
             return result
@@ -2009,8 +2047,9 @@ class TaskTools:
             f"[create_task_custom_attribute] Starting | project={project}, name={name}"
         )
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.create_task_custom_attribute(**kwargs)
             attr_id = result.get("id") if isinstance(result, dict) else None
             self._logger.info(
@@ -2032,8 +2071,9 @@ class TaskTools:
         self._logger.debug(f"[update_task_custom_attribute] Starting | attribute_id={attribute_id}")
         try:
             update_data = {k: v for k, v in kwargs.items() if v is not None}
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 result = await client.update_task_custom_attribute(attribute_id, **update_data)
             self._logger.info(
                 f"[update_task_custom_attribute] Success | attribute_id={attribute_id}"
@@ -2051,8 +2091,9 @@ class TaskTools:
         """Elimina un atributo personalizado."""
         self._logger.debug(f"[delete_task_custom_attribute] Starting | attribute_id={attribute_id}")
         try:
-            async with TaigaAPIClient(self.config) as client:
-                client.auth_token = auth_token
+            async with create_taiga_client(
+                self.config, auth_token, session_pool=self.session_pool
+            ) as client:
                 await client.delete_task_custom_attribute(attribute_id)
             self._logger.info(
                 f"[delete_task_custom_attribute] Success | attribute_id={attribute_id}"
@@ -14,8 +14,9 @@ from src.domain.exceptions import (
     ResourceNotFoundError,
     TaigaAPIError,
 )
+from src.infrastructure.client_factory import create_taiga_client, get_global_session_pool
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.pagination import AutoPaginator, PaginationConfig
-from src.taiga_client import TaigaAPIClient
 
 
 class UserTools:
@@ -25,15 +26,17 @@ class UserTools:
     Provides MCP tools for managing users in Taiga.
     """
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(self, mcp: FastMCP, session_pool: HTTPSessionPool | None = None) -> None:
         """
         Initialize user tools.
 
         Args:
             mcp: FastMCP server instance
+            session_pool: Shared HTTP session pool. Uses the global pool if None
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
         self.client = None  # For backward compatibility
 
     def set_client(self, client: Any) -> None:
@@ -94,8 +97,9 @@ class UserTools:
                 }
             """
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     stats = await client.get(f"/users/{user_id}/stats")
 
                     return {
@@ -190,8 +194,9 @@ class UserTools:
                 ]
             """
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     paginator = AutoPaginator(client, PaginationConfig())
                     params: dict[str, Any] = {}
                     if project_id is not None:
@@ -265,8 +270,9 @@ class UserTools:
                 "johndoe"
             """
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     return await client.get(f"/users/{user_id}")
 
             except ResourceNotFoundError:
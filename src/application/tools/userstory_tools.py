@@ -16,10 +16,37 @@ from src.domain.exceptions import (
     ValidationError,
 )
 from src.domain.validators import UserStoryCreateValidator, UserStoryUpdateValidator, validate_input
-from src.infrastructure.client_factory import get_taiga_client
+from src.infrastructure.client_factory import (
+    create_taiga_client,
+    get_global_session_pool,
+    get_taiga_client,
+)
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
-from src.infrastructure.pagination import AutoPaginator, PaginationConfig
-from src.taiga_client import TaigaAPIClient
+from src.infrastructure.pagination import CONCURRENT_PAGINATION_CONFIG, AutoPaginator
+
+
+def _summarize_userstory(story: dict[str, Any]) -> dict[str, Any]:
+    """Reduce una historia de la API a los campos que devuelve taiga_list_userstories."""
+    return {
+        "id": story.get("id"),
+        "ref": story.get("ref"),
+        "subject": story.get("subject"),
+        "description": story.get("description"),
+        "project": story.get("project"),
+        "milestone": story.get("milestone"),
+        "status": story.get("status"),
+        "points": story.get("points"),
+        "total_points": story.get("total_points"),
+        "is_closed": story.get("is_closed"),
+        "is_blocked": story.get("is_blocked"),
+        "blocked_note": story.get("blocked_note"),
+        "tags": story.get("tags", []),
+        "assigned_to": story.get("assigned_to"),
+        "watchers": story.get("watchers", []),
+        "total_watchers": story.get("total_watchers", 0),
+        "attachments": story.get("attachments", []),
+    }
 
 
 class UserStoryTools:
@@ -29,15 +56,17 @@ class UserStoryTools:
     Provides MCP tools for managing user stories in Taiga.
     """
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(self, mcp: FastMCP, session_pool: HTTPSessionPool | None = None) -> None:
         """
         Initialize user story tools.
 
         Args:
             mcp: FastMCP server instance
+            session_pool: Shared HTTP session pool. Uses the global pool if None
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
         self._client = None
         self.client = None  # For testing
         self._logger = get_logger("userstory_tools")
@@ -92,6 +121,7 @@ class UserStoryTools:
             tags: list[str] | None = None,
             assigned_to: int | None = None,
             auto_paginate: bool = True,
+            limit: int | None = None,
         ) -> list[dict[str, Any]]:
             """
             List user stories with optional filtering.
@@ -110,6 +140,8 @@ class UserStoryTools:
                 assigned_to: ID del usuario asignado para filtrar (opcional)
                 auto_paginate: Si True, obtiene automáticamente todas las páginas.
                     Si False, solo retorna la primera página. Default: True.
+                limit: Número máximo de historias a devolver, mayor que 0. La
+                    paginación se detiene en cuanto se alcanza (opcional)
 
             Returns:
                 Lista de diccionarios con información de historias de usuario,
@@ -133,7 +165,8 @@ class UserStoryTools:
                 - attachments: Lista de adjuntos
 
             Raises:
-                MCPError: Si la autenticación falla o hay error en la API
+                MCPError: Si limit es menor que 1, la autenticación falla o hay
+                    error en la API
 
             Example:
                 >>> stories = await taiga_list_userstories(
@@ -153,6 +186,8 @@ class UserStoryTools:
                     }
                 ]
             """
+            if limit is not None and limit < 1:
+                raise MCPError("limit must be greater than 0")
             try:
                 self._logger.debug(
                     f"[list_userstories] Starting | project_id={project_id}, milestone_id={milestone_id}"
@@ -174,41 +209,28 @@ class UserStoryTools:
                     # En tests: usar el mock inyectado (sin paginación para no romper tests)
                     stories = await self.client.get("/userstories", params=params)
                     all_stories = stories if isinstance(stories, list) else []
+                    result = [_summarize_userstory(story) for story in all_stories[:limit]]
                 else:
-                    # En producción: crear cliente real con AutoPaginator
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
-                        paginator = AutoPaginator(client, PaginationConfig())
+                    # En producción: crear cliente real con AutoPaginator; cada historia
+                    # se reduce según llega su página en lugar de acumular las crudas
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
+                        paginator = AutoPaginator(client, CONCURRENT_PAGINATION_CONFIG)
 
                         if auto_paginate:
-                            all_stories = await paginator.paginate("/userstories", params=params)
+                            result = await paginator.collect(
+                                "/userstories",
+                                params=params,
+                                transform=_summarize_userstory,
+                                limit=limit,
+                            )
                         else:
-                            all_stories = await paginator.paginate_first_page(
+                            first_page = await paginator.paginate_first_page(
                                 "/userstories", params=params
                             )
+                            result = [_summarize_userstory(story) for story in first_page[:limit]]
 
-                result = [
-                    {
-                        "id": story.get("id"),
-                        "ref": story.get("ref"),
-                        "subject": story.get("subject"),
-                        "description": story.get("description"),
-                        "project": story.get("project"),
-                        "milestone": story.get("milestone"),
-                        "status": story.get("status"),
-                        "points": story.get("points"),
-                        "total_points": story.get("total_points"),
-                        "is_closed": story.get("is_closed"),
-                        "is_blocked": story.get("is_blocked"),
-                        "blocked_note": story.get("blocked_note"),
-                        "tags": story.get("tags", []),
-                        "assigned_to": story.get("assigned_to"),
-                        "watchers": story.get("watchers", []),
-                        "total_watchers": story.get("total_watchers", 0),
-                        "attachments": story.get("attachments", []),
-                    }
-                    for story in all_stories
-                ]
                 self._logger.info(
                     f"[list_userstories] Success | project_id={project_id}, count={len(result)}"
                 )
@@ -359,8 +381,9 @@ class UserStoryTools:
                     story = await self.client.post("/userstories", data=story_data)
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         story = await client.post("/userstories", data=story_data)
 
                 result = {
@@ -492,9 +515,9 @@ class UserStoryTools:
                         raise MCPError("Either userstory_id or (project_id and ref) required")
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
-
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         if userstory_id:
                             story = await client.get(f"/userstories/{userstory_id}")
                         elif ref and project_id:
@@ -707,8 +730,9 @@ class UserStoryTools:
                     )
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         story = await client.patch(f"/userstories/{userstory_id}", data=update_data)
 
                 result = {
@@ -807,8 +831,9 @@ class UserStoryTools:
                     success = await self.client.delete(f"/userstories/{userstory_id}")
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         success = await client.delete(f"/userstories/{userstory_id}")
 
                 self._logger.info(f"[delete_userstory] Success | userstory_id={userstory_id}")
@@ -913,8 +938,9 @@ class UserStoryTools:
                     result = await self.client.post("/userstories/bulk_create", data=bulk_data)
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.post("/userstories/bulk_create", data=bulk_data)
 
                 if isinstance(result, list):
@@ -1034,8 +1060,9 @@ class UserStoryTools:
                     result = await self.client.post("/userstories/bulk_update", data=bulk_data)
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.post("/userstories/bulk_update", data=bulk_data)
 
                 if isinstance(result, list):
@@ -1123,8 +1150,9 @@ class UserStoryTools:
                     await self.client.post("/userstories/bulk_delete", data=bulk_data)
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         await client.post("/userstories/bulk_delete", data=bulk_data)
 
                 self._logger.info(f"[bulk_delete_userstories] Success | deleted={len(story_ids)}")
@@ -1212,8 +1240,9 @@ class UserStoryTools:
                     )
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         story = await client.patch(f"/userstories/{userstory_id}", data=update_data)
 
                 self._logger.info(
@@ -1307,8 +1336,9 @@ class UserStoryTools:
                     history = await self.client.get(f"/history/userstory/{userstory_id}")
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         history = await client.get(f"/history/userstory/{userstory_id}")
 
                 result = [
@@ -1399,8 +1429,9 @@ class UserStoryTools:
                     result = await self.client.post(f"/userstories/{userstory_id}/watch")
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.post(f"/userstories/{userstory_id}/watch")
 
                 self._logger.info(f"[watch_userstory] Success | userstory_id={userstory_id}")
@@ -1477,8 +1508,9 @@ class UserStoryTools:
                     result = await self.client.post(f"/userstories/{userstory_id}/unwatch")
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.post(f"/userstories/{userstory_id}/unwatch")
 
                 self._logger.info(f"[unwatch_userstory] Success | userstory_id={userstory_id}")
@@ -1555,8 +1587,9 @@ class UserStoryTools:
                     result = await self.client.post(f"/userstories/{userstory_id}/upvote")
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.post(f"/userstories/{userstory_id}/upvote")
 
                 self._logger.info(f"[upvote_userstory] Success | userstory_id={userstory_id}")
@@ -1632,8 +1665,9 @@ class UserStoryTools:
                     result = await self.client.post(f"/userstories/{userstory_id}/downvote")
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.post(f"/userstories/{userstory_id}/downvote")
 
                 self._logger.info(f"[downvote_userstory] Success | userstory_id={userstory_id}")
@@ -1717,8 +1751,9 @@ class UserStoryTools:
                     voters = await self.client.get(f"/userstories/{userstory_id}/voters")
                 else:
                     # En producción: crear cliente real
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         voters = await client.get(f"/userstories/{userstory_id}/voters")
 
                 if isinstance(voters, list):
@@ -1806,8 +1841,9 @@ class UserStoryTools:
                     self._logger.info(f"[get_userstory_filters] Success | project={project}")
                     return result
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.get_userstory_filters(project=project)
                     self._logger.info(f"[get_userstory_filters] Success | project={project}")
                     return result
@@ -1883,8 +1919,9 @@ class UserStoryTools:
                         data={"project_id": project_id, "bulk_stories": bulk_stories},
                     )
                 else:
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.post(
                             "/userstories/bulk_update_backlog_order",
                             data={"project_id": project_id, "bulk_stories": bulk_stories},
@@ -1970,8 +2007,9 @@ class UserStoryTools:
                         "/userstories/bulk_update_kanban_order", data=data
                     )
                 else:
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.post(
                             "/userstories/bulk_update_kanban_order", data=data
                         )
@@ -2056,8 +2094,9 @@ class UserStoryTools:
                         "/milestones/userstories/bulk_update_order", data=data
                     )
                 else:
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.post(
                             "/milestones/userstories/bulk_update_order", data=data
                         )
@@ -2139,8 +2178,9 @@ class UserStoryTools:
                 if self.client:
                     result = await self.client.post("/userstories/bulk_update_milestone", data=data)
                 else:
-                    async with TaigaAPIClient(self.config) as client:
-                        client.auth_token = auth_token
+                    async with create_taiga_client(
+                        self.config, auth_token, session_pool=self.session_pool
+                    ) as client:
                         result = await client.post("/userstories/bulk_update_milestone", data=data)
 
                 self._logger.info(
@@ -2212,8 +2252,9 @@ class UserStoryTools:
                 self._logger.debug(
                     f"[list_userstory_attachments] Starting | userstory_id={userstory_id}"
                 )
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.list_userstory_attachments(
                         userstory_id=userstory_id, project=project_id
                     )
@@ -2285,8 +2326,9 @@ class UserStoryTools:
                 self._logger.debug(
                     f"[create_userstory_attachment] Starting | userstory_id={userstory_id}"
                 )
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.create_userstory_attachment(
                         userstory_id=userstory_id,
                         project=project_id,
@@ -2352,8 +2394,9 @@ class UserStoryTools:
                 self._logger.debug(
                     f"[get_userstory_attachment] Starting | attachment_id={attachment_id}"
                 )
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.get_userstory_attachment(attachment_id=attachment_id)
                 self._logger.info(
                     f"[get_userstory_attachment] Success | attachment_id={attachment_id}"
@@ -2413,8 +2456,9 @@ class UserStoryTools:
                 self._logger.debug(
                     f"[update_userstory_attachment] Starting | attachment_id={attachment_id}"
                 )
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.update_userstory_attachment(
                         attachment_id=attachment_id,
                         description=description,
@@ -2470,13 +2514,17 @@ class UserStoryTools:
                 self._logger.debug(
                     f"[delete_userstory_attachment] Starting | attachment_id={attachment_id}"
                 )
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     await client.delete_userstory_attachment(attachment_id=attachment_id)
                 self._logger.info(
                     f"[delete_userstory_attachment] Success | attachment_id={attachment_id}"
                 )
-                return {"success": True, "message": f"Attachment {attachment_id} deleted successfully"}
+                return {
+                    "success": True,
+                    "message": f"Attachment {attachment_id} deleted successfully",
+                }
             except AuthenticationError:
                 self._logger.warning("[delete_userstory_attachment] Auth failed")
                 raise MCPError("Authentication failed") from None
@@ -2493,9 +2541,10 @@ class UserStoryTools:
         if hasattr(self, "client") and self.client:
             return await self.client.list_userstory_attachments(userstory_id=userstory_id)
 
-        # En producción, usar TaigaAPIClient real
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        # En producción, usar un cliente real del pool compartido
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             attachments = await client.get(
                 "/userstories/attachments", params={"object_id": userstory_id}
             )
@@ -2519,8 +2568,9 @@ class UserStoryTools:
             "description": kwargs.get("description", ""),
         }
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.post("/userstories/attachments", data=attachment_data)
 
     async def get_userstory_attachment(
@@ -2531,8 +2581,9 @@ class UserStoryTools:
         if hasattr(self, "client") and self.client:
             return await self.client.get_userstory_attachment(attachment_id=attachment_id)
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.get(f"/userstories/attachments/{attachment_id}")
 
     async def update_userstory_attachment(self, attachment_id: int, **kwargs: Any):
@@ -2549,8 +2600,9 @@ class UserStoryTools:
         if "is_deprecated" in kwargs:
             update_data["is_deprecated"] = kwargs["is_deprecated"]
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.patch(f"/userstories/attachments/{attachment_id}", data=update_data)
 
     async def delete_userstory_attachment(
@@ -2561,8 +2613,9 @@ class UserStoryTools:
         if hasattr(self, "client") and self.client:
             return await self.client.delete_userstory_attachment(attachment_id=attachment_id)
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             await client.delete(f"/userstories/attachments/{attachment_id}")
             return {"success": True}
 
@@ -2588,8 +2641,9 @@ class UserStoryTools:
                 return await result
             return result
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             history = await client.get(f"/history/userstory/{userstory_id}")
             if isinstance(history, list):
                 return history
@@ -2614,8 +2668,9 @@ class UserStoryTools:
                 return await result
             return result
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             versions = await client.get(
                 f"/userstories/{userstory_id}/history/{comment_id}/comment-versions"
             )
@@ -2643,8 +2698,9 @@ class UserStoryTools:
                 return await result
             return result
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.patch(
                 f"/userstories/{userstory_id}/history/{comment_id}", data={"comment": comment}
             )
@@ -2668,8 +2724,9 @@ class UserStoryTools:
                 return await result
             return result
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             await client.delete(f"/userstories/{userstory_id}/history/{comment_id}")
             return {"success": True}
 
@@ -2692,8 +2749,9 @@ class UserStoryTools:
                 return await result
             return result
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.post(f"/userstories/{userstory_id}/history/{comment_id}/undelete")
 
     async def get_userstory_by_ref(
@@ -2706,8 +2764,9 @@ class UserStoryTools:
                 return await result
             return result
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.get("/userstories/by_ref", params={"project": project, "ref": ref})
 
     async def update_userstory_full(self, userstory_id: int, **kwargs: Any):
@@ -2717,8 +2776,9 @@ class UserStoryTools:
         if hasattr(self, "client") and self.client:
             return await self.client.update_userstory_full(userstory_id, **kwargs)
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.put(f"/userstories/{userstory_id}", data=kwargs)
 
     async def bulk_update_backlog_order(self, auth_token: str | None = None, **kwargs: Any):
@@ -2726,8 +2786,9 @@ class UserStoryTools:
         if hasattr(self, "client") and self.client:
             return await self.client.bulk_update_backlog_order(**kwargs)
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             project_id = kwargs.get("project_id")
             bulk_stories = kwargs.get("bulk_stories", [])
 
@@ -2756,8 +2817,9 @@ class UserStoryTools:
                 return await result
             return result
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             data = {"project_id": project_id, "bulk_stories": bulk_stories or []}
             if status is not None:
                 data["status"] = status
@@ -2769,8 +2831,9 @@ class UserStoryTools:
         if hasattr(self, "client") and self.client:
             return await self.client.bulk_update_sprint_order(**kwargs)
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             project_id = kwargs.get("project_id")
             milestone_id = kwargs.get("milestone_id")
             bulk_stories = kwargs.get("bulk_stories", [])
@@ -2798,8 +2861,9 @@ class UserStoryTools:
                 return await result
             return result
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.get("/userstories/filters", params={"project": project})
 
     async def get_userstory_watchers(
@@ -2809,8 +2873,9 @@ class UserStoryTools:
         if hasattr(self, "client") and self.client:
             return await self.client.get_userstory_watchers(userstory_id=userstory_id)
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             watchers = await client.get(f"/userstories/{userstory_id}/watchers")
             if isinstance(watchers, list):
                 return watchers
@@ -2830,8 +2895,9 @@ class UserStoryTools:
                 return await result
             return result
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             attributes = await client.get(
                 "/userstory-custom-attributes", params={"project": project}
             )
@@ -2846,8 +2912,9 @@ class UserStoryTools:
         if hasattr(self, "client") and self.client:
             return await self.client.create_userstory_custom_attribute(**kwargs)
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.post("/userstory-custom-attributes", data=kwargs)
 
     async def get_userstory_custom_attribute(
@@ -2857,8 +2924,9 @@ class UserStoryTools:
         if hasattr(self, "client") and self.client:
             return await self.client.get_userstory_custom_attribute(attribute_id=attribute_id)
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.get(f"/userstory-custom-attributes/{attribute_id}")
 
     async def update_userstory_custom_attribute(self, attribute_id: int, **kwargs: Any):
@@ -2868,8 +2936,9 @@ class UserStoryTools:
         if hasattr(self, "client") and self.client:
             return await self.client.update_userstory_custom_attribute(attribute_id, **kwargs)
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.patch(f"/userstory-custom-attributes/{attribute_id}", data=kwargs)
 
     async def delete_userstory_custom_attribute(
@@ -2879,8 +2948,9 @@ class UserStoryTools:
         if hasattr(self, "client") and self.client:
             return await self.client.delete_userstory_custom_attribute(attribute_id=attribute_id)
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             await client.delete(f"/userstory-custom-attributes/{attribute_id}")
             return {"success": True}
 
@@ -2891,8 +2961,9 @@ class UserStoryTools:
         if hasattr(self, "client") and self.client:
             return await self.client.update_userstory_custom_attribute_full(attribute_id, **kwargs)
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.put(f"/userstory-custom-attributes/{attribute_id}", data=kwargs)
 
     async def update_userstory_custom_attribute_partial(self, attribute_id: int, **kwargs: Any):
@@ -2904,8 +2975,9 @@ class UserStoryTools:
                 attribute_id, **kwargs
             )
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.patch(f"/userstory-custom-attributes/{attribute_id}", data=kwargs)
 
     async def set_custom_attribute_values(self, **kwargs: Any):
@@ -2919,8 +2991,9 @@ class UserStoryTools:
         userstory_id = kwargs.get("userstory_id")
         attributes = kwargs.get("attributes", {})
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.patch(
                 f"/userstories/{userstory_id}", data={"custom_attributes_values": attributes}
             )
@@ -2962,8 +3035,9 @@ class UserStoryTools:
                 return await result
             return result
 
-        async with TaigaAPIClient(self.config) as client:
-            client.auth_token = auth_token
+        async with create_taiga_client(
+            self.config, auth_token, session_pool=self.session_pool
+        ) as client:
             return await client.patch(f"/userstories/{userstory_id}", data=kwargs)
 
     async def _validate_custom_attributes(
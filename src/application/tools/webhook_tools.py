@@ -16,9 +16,10 @@ from src.domain.exceptions import (
     ValidationError,
 )
 from src.domain.validators import WebhookCreateValidator, WebhookUpdateValidator, validate_input
+from src.infrastructure.client_factory import create_taiga_client, get_global_session_pool
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
 from src.infrastructure.pagination import AutoPaginator, PaginationConfig
-from src.taiga_client import TaigaAPIClient
 
 
 class WebhookTools:
@@ -28,15 +29,17 @@ class WebhookTools:
     Provides MCP tools for managing webhooks in Taiga projects.
     """
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(self, mcp: FastMCP, session_pool: HTTPSessionPool | None = None) -> None:
         """
         Initialize webhook tools.
 
         Args:
             mcp: FastMCP server instance
+            session_pool: Shared HTTP session pool. Uses the global pool if None
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
         self.client = None  # For backward compatibility
         self._logger = get_logger("webhook_tools")
 
@@ -105,8 +108,9 @@ class WebhookTools:
             """
             self._logger.debug(f"[list_webhooks] Starting | project_id={project_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     paginator = AutoPaginator(client, PaginationConfig())
                     params = {"project": project_id}
 
@@ -224,9 +228,9 @@ class WebhookTools:
                 }
                 validate_input(WebhookCreateValidator, validation_data)
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
-
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     webhook_data: dict[str, Any] = {
                         "project": project_id,  # API expects 'project'
                         "name": name,
@@ -338,8 +342,9 @@ class WebhookTools:
             """
             self._logger.debug(f"[get_webhook] Starting | webhook_id={webhook_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     webhook = await client.get(f"/webhooks/{webhook_id}")
 
                     result = {
@@ -466,8 +471,9 @@ class WebhookTools:
                     )
                     raise MCPError("No update data provided")
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     webhook = await client.patch(f"/webhooks/{webhook_id}", data=update_data)
 
                     result = {
@@ -546,8 +552,9 @@ class WebhookTools:
             """
             self._logger.debug(f"[delete_webhook] Starting | webhook_id={webhook_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.delete(f"/webhooks/{webhook_id}")
                     self._logger.info(f"[delete_webhook] Success | webhook_id={webhook_id}")
                     return result
@@ -621,8 +628,9 @@ class WebhookTools:
             """
             self._logger.debug(f"[test_webhook] Starting | webhook_id={webhook_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.post(f"/webhooks/{webhook_id}/test", data={})
 
                     response = {
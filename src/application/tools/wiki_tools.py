@@ -16,9 +16,10 @@ from src.domain.exceptions import (
     ValidationError,
 )
 from src.domain.validators import WikiPageCreateValidator, WikiPageUpdateValidator, validate_input
+from src.infrastructure.client_factory import create_taiga_client, get_global_session_pool
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.infrastructure.logging import get_logger
 from src.infrastructure.pagination import AutoPaginator, PaginationConfig
-from src.taiga_client import TaigaAPIClient
 
 
 class WikiTools:
@@ -28,15 +29,17 @@ class WikiTools:
     Provides MCP tools for managing wiki pages in Taiga projects.
     """
 
-    def __init__(self, mcp: FastMCP) -> None:
+    def __init__(self, mcp: FastMCP, session_pool: HTTPSessionPool | None = None) -> None:
         """
         Initialize wiki tools.
 
         Args:
             mcp: FastMCP server instance
+            session_pool: Shared HTTP session pool. Uses the global pool if None
         """
         self.mcp = mcp
         self.config = TaigaConfig()
+        self.session_pool = session_pool or get_global_session_pool()
         self.client = None  # Se inyecta después
         self._logger = get_logger("wiki_tools")
 
@@ -101,8 +104,9 @@ class WikiTools:
             """
             self._logger.debug(f"[list_wiki_pages] Starting | project_id={project_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     paginator = AutoPaginator(client, PaginationConfig())
                     params = {"project": project_id}
 
@@ -223,8 +227,9 @@ class WikiTools:
                 if watchers:
                     page_data["watchers"] = watchers
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     page = await client.post("/wiki", data=page_data)
 
                     result = {
@@ -321,8 +326,9 @@ class WikiTools:
             """
             self._logger.debug(f"[get_wiki_page] Starting | wiki_id={wiki_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     page = await client.get(f"/wiki/{wiki_id}")
 
                     result = {
@@ -415,8 +421,9 @@ class WikiTools:
                 f"[get_wiki_page_by_slug] Starting | project_id={project_id}, slug={slug}"
             )
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     page = await client.get(
                         "/wiki/by_slug",
                         params={"project": project_id, "slug": slug},  # API expects 'project'
@@ -537,8 +544,9 @@ class WikiTools:
                 if version is not None:
                     update_data["version"] = version
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     page = await client.patch(f"/wiki/{wiki_id}", data=update_data)
 
                     result = {
@@ -620,8 +628,9 @@ class WikiTools:
             """
             self._logger.debug(f"[delete_wiki_page] Starting | wiki_id={wiki_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.delete(f"/wiki/{wiki_id}")
                     self._logger.info(f"[delete_wiki_page] Success | wiki_id={wiki_id}")
                     return result
@@ -689,8 +698,9 @@ class WikiTools:
             """
             self._logger.debug(f"[restore_wiki_page] Starting | wiki_id={wiki_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     page = await client.post(f"/wiki/{wiki_id}/restore")
 
                     result = {
@@ -788,8 +798,9 @@ class WikiTools:
                 f"[list_wiki_attachments] Starting | wiki_page_id={wiki_page_id}, project_id={project_id}"
             )
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     paginator = AutoPaginator(client, PaginationConfig())
                     params = {
                         "object_id": wiki_page_id,
@@ -888,8 +899,9 @@ class WikiTools:
             """
             self._logger.debug(f"[watch_wiki_page] Starting | page_id={page_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     api_result = await client.post(f"/wiki/{page_id}/watch")
 
                     result = {
@@ -955,8 +967,9 @@ class WikiTools:
             """
             self._logger.debug(f"[unwatch_wiki_page] Starting | page_id={page_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     api_result = await client.post(f"/wiki/{page_id}/unwatch")
 
                     result = {
@@ -1034,8 +1047,9 @@ class WikiTools:
             try:
                 link_data = {"project": project_id, "title": title, "href": href}
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     link = await client.post("/wiki-links", data=link_data)
 
                     result = {
@@ -1128,15 +1142,17 @@ class WikiTools:
                 attachment_data: dict[str, Any] = {
                     "object_id": wiki_page_id,  # API expects object_id
                     "project": project_id,  # API expects 'project'
-                    "attached_file": attached_file,
                 }
 
                 if description:
                     attachment_data["description"] = description
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
-                    attachment = await client.post("/wiki/attachments", data=attachment_data)
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
+                    attachment = await client.post_multipart(
+                        "/wiki/attachments", data=attachment_data, file_path=attached_file
+                    )
 
                     result = {
                         "id": attachment.get("id"),
@@ -1237,8 +1253,9 @@ class WikiTools:
                 if is_deprecated is not None:
                     update_data["is_deprecated"] = is_deprecated
 
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     attachment = await client.patch(
                         f"/wiki/attachments/{attachment_id}", data=update_data
                     )
@@ -1325,8 +1342,9 @@ class WikiTools:
             """
             self._logger.debug(f"[delete_wiki_attachment] Starting | attachment_id={attachment_id}")
             try:
-                async with TaigaAPIClient(self.config) as client:
-                    client.auth_token = auth_token
+                async with create_taiga_client(
+                    self.config, auth_token, session_pool=self.session_pool
+                ) as client:
                     result = await client.delete(f"/wiki/attachments/{attachment_id}")
                     self._logger.info(
                         f"[delete_wiki_attachment] Success | attachment_id={attachment_id}"
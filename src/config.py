@@ -6,10 +6,11 @@ from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
-from pydantic import Field, field_validator
+from pydantic import Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from src.domain.exceptions import ConfigurationError
+from src.infrastructure.json_codec import BACKENDS as JSON_BACKENDS
 
 
 class MCPConfig(BaseSettings):
@@ -134,6 +135,129 @@ class TaigaConfig(BaseSettings):
         alias="TAIGA_MAX_AUTH_RETRIES",
         description="Maximum number of retries for authentication",
     )
+    request_deadline: float = Field(
+        default=60.0,
+        alias="TAIGA_REQUEST_DEADLINE",
+        description="Deadline in seconds for one API call including its retries (0 disables it)",
+    )
+    retry_budget_ratio: float = Field(
+        default=0.1,
+        alias="TAIGA_RETRY_BUDGET_RATIO",
+        description="Retries allowed per request across the process once the reserve is spent",
+    )
+    http_rate_limit_rps: float = Field(
+        default=0.0,
+        alias="TAIGA_HTTP_RATE_LIMIT_RPS",
+        description="Ceiling for outgoing API requests per second across the process (0 = none)",
+    )
+    circuit_failure_threshold: int = Field(
+        default=5,
+        alias="TAIGA_CIRCUIT_FAILURE_THRESHOLD",
+        description="Consecutive failures that open the circuit of an endpoint family",
+    )
+    circuit_recovery_timeout: float = Field(
+        default=30.0,
+        alias="TAIGA_CIRCUIT_RECOVERY_TIMEOUT",
+        description="Seconds an open circuit waits before letting a probe request through",
+    )
+    hedge_requests: bool = Field(
+        default=False,
+        alias="TAIGA_HEDGE_REQUESTS",
+        description="Resend a GET slower than its endpoint's p95 and keep the first response",
+    )
+    hedge_budget_ratio: float = Field(
+        default=0.05,
+        alias="TAIGA_HEDGE_BUDGET_RATIO",
+        description="Hedge requests allowed per GET once the reserve is spent",
+    )
+    negative_cache_ttl: float = Field(
+        default=30.0,
+        alias="TAIGA_NEGATIVE_CACHE_TTL",
+        description="Seconds a GET that ended in 404/403 is remembered per token (0 disables it)",
+    )
+    negative_cache_max_size: int = Field(
+        default=1000,
+        alias="TAIGA_NEGATIVE_CACHE_MAX_SIZE",
+        description="Maximum remembered 404/403 results, oldest dropped first",
+    )
+    cache_max_bytes: int = Field(
+        default=0,
+        alias="TAIGA_CACHE_MAX_BYTES",
+        description="Maximum estimated memory of the cache in bytes (0 = no limit)",
+    )
+    cache_shards: int = Field(
+        default=1,
+        alias="TAIGA_CACHE_SHARDS",
+        description=(
+            "Independent cache segments, each with its own lock (1 = not partitioned; "
+            "more than 1 cannot be combined with TAIGA_CACHE_MAX_BYTES)"
+        ),
+    )
+    cache_stale_grace: int = Field(
+        default=0,
+        alias="TAIGA_CACHE_STALE_GRACE",
+        description="Seconds expired metadata is served while it is refreshed in background (0 = off)",
+    )
+    cache_refresh_ahead: int = Field(
+        default=0,
+        alias="TAIGA_CACHE_REFRESH_AHEAD",
+        description="Seconds before expiry in which a read refreshes the entry in background (0 = off)",
+    )
+    cache_revalidate_window: int = Field(
+        default=3600,
+        alias="TAIGA_CACHE_REVALIDATE_WINDOW",
+        description="Seconds expired metadata is kept for ETag revalidation (0 = no conditional GETs)",
+    )
+    cache_dir: str = Field(
+        default="",
+        alias="TAIGA_CACHE_DIR",
+        description="Directory of the persistent on-disk cache tier (empty = memory only)",
+    )
+    cache_disk_max_size: int = Field(
+        default=10000,
+        alias="TAIGA_CACHE_DISK_MAX_SIZE",
+        description="Maximum number of entries in the on-disk cache",
+    )
+    cache_shared: bool = Field(
+        default=False,
+        alias="TAIGA_CACHE_SHARED",
+        description="Share the on-disk cache and its invalidations between server processes",
+    )
+    cache_sync_interval: float = Field(
+        default=0.5,
+        alias="TAIGA_CACHE_SYNC_INTERVAL",
+        description="Seconds between checks for invalidations made by other processes",
+    )
+    http2: bool = Field(
+        default=False,
+        alias="TAIGA_HTTP2",
+        description="Multiplex concurrent requests over HTTP/2 (requires the 'h2' package)",
+    )
+    http_warmup_connections: int = Field(
+        default=2,
+        alias="TAIGA_HTTP_WARMUP_CONNECTIONS",
+        description="Keep-alive connections opened to the Taiga API when the server starts",
+    )
+    http_keepalive_interval: float = Field(
+        default=30.0,
+        alias="TAIGA_HTTP_KEEPALIVE_INTERVAL",
+        description="Seconds between keep-alive requests on idle pooled connections (0 disables)",
+    )
+    http_keepalive_expiry: float = Field(
+        default=60.0,
+        alias="TAIGA_HTTP_KEEPALIVE_EXPIRY",
+        description="Seconds an idle pooled connection is kept before it is closed",
+    )
+    json_backend: str = Field(
+        default="auto",
+        alias="TAIGA_JSON_BACKEND",
+        description="JSON library for API responses and tool results: auto, orjson, msgspec or stdlib",
+    )
+    export_dir: str = Field(
+        default="",
+        alias="TAIGA_EXPORT_DIR",
+        description="Only directory taiga_export_project may write to (empty = no disk writes)",
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
@@ -217,6 +341,66 @@ class TaigaConfig(BaseSettings):
             raise ValueError(f"Max auth retries must be non-negative, got {v}")
         return v
 
+    @field_validator("cache_shared")
+    @classmethod
+    def validate_cache_shared(cls, v: bool, info: ValidationInfo) -> bool:
+        """Validate that a shared cache has a directory to share."""
+        if v and not info.data.get("cache_dir"):
+            raise ValueError("TAIGA_CACHE_SHARED requires TAIGA_CACHE_DIR")
+        return v
+
+    @field_validator("cache_shards")
+    @classmethod
+    def validate_cache_shards(cls, v: int, info: ValidationInfo) -> int:
+        """Validate that a partitioned cache has no memory limit to split."""
+        if v > 1 and info.data.get("cache_max_bytes"):
+            raise ValueError("TAIGA_CACHE_SHARDS > 1 cannot be combined with TAIGA_CACHE_MAX_BYTES")
+        return v
+
+    @field_validator("json_backend")
+    @classmethod
+    def validate_json_backend(cls, v: str) -> str:
+        """Validate the JSON backend name."""
+        backend = v.lower()
+        if backend != "auto" and backend not in JSON_BACKENDS:
+            raise ValueError(
+                f"Invalid JSON backend: {v}. Must be 'auto' or one of {', '.join(JSON_BACKENDS)}"
+            )
+        return backend
+
+    @field_validator(
+        "circuit_failure_threshold",
+        "circuit_recovery_timeout",
+        "negative_cache_max_size",
+        "cache_shards",
+        "cache_disk_max_size",
+        "cache_sync_interval",
+    )
+    @classmethod
+    def validate_positive(cls, v: float, info: ValidationInfo) -> float:
+        """Validate settings that must be greater than zero."""
+        if v <= 0:
+            raise ValueError(f"{info.field_name} must be positive, got {v}")
+        return v
+
+    @field_validator(
+        "request_deadline",
+        "retry_budget_ratio",
+        "http_rate_limit_rps",
+        "hedge_budget_ratio",
+        "negative_cache_ttl",
+        "cache_max_bytes",
+        "cache_stale_grace",
+        "cache_refresh_ahead",
+        "cache_revalidate_window",
+    )
+    @classmethod
+    def validate_non_negative(cls, v: float, info: ValidationInfo) -> float:
+        """Validate settings where 0 means disabled and negatives make no sense."""
+        if v < 0:
+            raise ValueError(f"{info.field_name} must be non-negative, got {v}")
+        return v
+
     @property
     def api_url(self) -> str:
         """Alias for taiga_api_url for backward compatibility with container."""
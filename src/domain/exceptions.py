@@ -26,6 +26,15 @@ class TaigaAPIError(DomainException):
         self.response_body = response_body
 
 
+class CircuitOpenError(TaigaAPIError):
+    """Circuito abierto: la familia de endpoints está fallando y se rechaza la petición."""
+
+    def __init__(self, family: str, retry_after: float):
+        super().__init__(f"Circuit open for '{family}' endpoints, retry in {retry_after:.1f}s")
+        self.family = family
+        self.retry_after = retry_after
+
+
 class ValidationError(DomainException):
     """Error de validación de datos."""
 
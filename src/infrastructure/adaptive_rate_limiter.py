@@ -0,0 +1,279 @@
+"""Limitador de peticiones HTTP adaptativo compartido por el proceso.
+
+RateLimitingMiddleware limita llamadas a tools, pero una sola llamada puede
+lanzar cientos de peticiones HTTP (auto-paginación, operaciones bulk). Este
+limitador actúa a nivel HTTP, es compartido por todos los TaigaAPIClient y
+ajusta su ritmo según las respuestas de Taiga (AIMD):
+
+- Mientras Taiga no devuelva 429 no se espacian las peticiones (salvo que
+  se configure un techo con ``TAIGA_HTTP_RATE_LIMIT_RPS``).
+- Un 429 reduce el ritmo a la mitad del observado (como mucho una vez por
+  segundo: un 429 en varias peticiones concurrentes es una sola señal). Si
+  el tráfico era demasiado bajo para reducirlo, solo se aplica la pausa.
+- Cada segundo sin 429 el ritmo crece ``increase`` req/s; al recuperar el
+  ritmo al que llegó el primer 429 vuelve a no espaciarse.
+- ``Retry-After`` pausa todo el tráfico saliente hasta que vence, en lugar
+  de que cada corrutina descubra el límite por su cuenta.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Any
+
+
+@dataclass
+class RateLimiterMetrics:
+    """Contadores del limitador adaptativo.
+
+    Attributes:
+        requests: Peticiones que pasaron por acquire().
+        delayed: Peticiones que tuvieron que esperar turno o pausa.
+        throttled: Respuestas 429 observadas.
+        decreases: Reducciones multiplicativas del ritmo.
+        pauses: Pausas globales por Retry-After.
+    """
+
+    requests: int = 0
+    delayed: int = 0
+    throttled: int = 0
+    decreases: int = 0
+    pauses: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializa las métricas para get_stats()."""
+        return {
+            "requests": self.requests,
+            "delayed": self.delayed,
+            "throttled": self.throttled,
+            "decreases": self.decreases,
+            "pauses": self.pauses,
+        }
+
+
+class AdaptiveRateLimiter:
+    """Espaciado de peticiones con ajuste AIMD a partir de 429 y Retry-After.
+
+    El estado se protege con un ``threading.Lock`` que solo se toma para
+    cálculos cortos; las esperas se hacen fuera con ``asyncio.sleep``, así que
+    la instancia puede compartirse entre event loops.
+
+    Example:
+        >>> limiter = AdaptiveRateLimiter()
+        >>> await limiter.acquire()
+        >>> limiter.on_response(429, retry_after=2)  # pausa global de 2s
+    """
+
+    def __init__(
+        self,
+        max_rate: float = 0.0,
+        min_rate: float = 1.0,
+        decrease_factor: float = 0.5,
+        increase: float = 1.0,
+    ) -> None:
+        """Inicializa el limitador.
+
+        Args:
+            max_rate: Techo en peticiones/segundo; 0 = sin techo (solo se
+                espacian las peticiones después de un 429).
+            min_rate: Ritmo mínimo al que puede bajar tras varios 429.
+            decrease_factor: Factor multiplicativo aplicado en cada 429.
+            increase: Peticiones/segundo añadidas por segundo sin 429.
+        """
+        if max_rate < 0:
+            raise ValueError("max_rate debe ser >= 0")
+        if min_rate <= 0:
+            raise ValueError("min_rate debe ser > 0")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor debe estar entre 0 y 1")
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.decrease_factor = decrease_factor
+        self.increase = increase
+        self._lock = Lock()
+        self._metrics = RateLimiterMetrics()
+        # None = sin espaciado
+        self._rate: float | None = max_rate or None
+        self._recovered_rate: float | None = None
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._last_increase = time.monotonic()
+        # Ventana de un segundo para medir el ritmo real
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._observed_rate = 0.0
+
+    @property
+    def rate(self) -> float | None:
+        """Ritmo actual en peticiones/segundo (None = sin espaciado)."""
+        return self._rate
+
+    def _observe(self, now: float) -> None:
+        self._window_count += 1
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self._observed_rate = self._window_count / elapsed
+            self._window_start = now
+            self._window_count = 0
+
+    def _current_rate(self, now: float) -> float:
+        """Ritmo observado, contando la ventana en curso."""
+        return max(self._observed_rate, self._window_count / max(now - self._window_start, 1.0))
+
+    def _reserve(self) -> tuple[float, float]:
+        """Reserva un turno; devuelve (espera por pausa, espera por ritmo)."""
+        with self._lock:
+            now = time.monotonic()
+            pause = max(0.0, self._paused_until - now)
+            if pause > 0:
+                return pause, 0.0
+            self._observe(now)
+            if self._rate is None:
+                return 0.0, 0.0
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self._rate
+            return 0.0, slot - now
+
+    async def acquire(self) -> None:
+        """Espera el turno de la siguiente petición.
+
+        Respeta la pausa global por Retry-After y, si hay ritmo, espacia las
+        peticiones ``1/rate`` segundos entre sí.
+        """
+        self._metrics.requests += 1
+        delayed = False
+        while True:
+            pause, wait = self._reserve()
+            if pause > 0:
+                delayed = True
+                await asyncio.sleep(pause)
+                continue
+            if wait > 0:
+                delayed = True
+                await asyncio.sleep(wait)
+                # Una pausa declarada mientras esperábamos también nos aplica
+                if self._paused_until > time.monotonic():
+                    continue
+            break
+        if delayed:
+            self._metrics.delayed += 1
+
+    def on_response(self, status_code: int, retry_after: float | None = None) -> None:
+        """Ajusta el ritmo según la respuesta recibida.
+
+        Args:
+            status_code: Código HTTP de la respuesta.
+            retry_after: Segundos de Retry-After si Taiga los indicó.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if status_code != 429:
+                self._increase(now)
+                return
+
+            self._metrics.throttled += 1
+            if retry_after and now + retry_after > self._paused_until:
+                self._paused_until = now + retry_after
+                self._metrics.pauses += 1
+            # Varios 429 simultáneos son una sola señal de congestión
+            if now - self._last_decrease < 1.0:
+                return
+            if self._rate is None:
+                observed = self._current_rate(now)
+                if observed * self.decrease_factor < self.min_rate:
+                    # Con tan poco tráfico basta la pausa de Retry-After
+                    return
+                self._recovered_rate = observed
+                self._rate = observed * self.decrease_factor
+            else:
+                self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            self._next_slot = max(self._next_slot, self._paused_until)
+            self._last_decrease = now
+            self._last_increase = now
+            self._metrics.decreases += 1
+
+    def _increase(self, now: float) -> None:
+        if self._rate is None:
+            return
+        elapsed = now - self._last_increase
+        self._last_increase = now
+        self._rate += self.increase * elapsed
+        if self.max_rate:
+            self._rate = min(self._rate, self.max_rate)
+        elif self._recovered_rate is not None and self._rate >= self._recovered_rate:
+            # Recuperado el ritmo al que llegó el primer 429: sin espaciado
+            self._rate = None
+            self._recovered_rate = None
+
+    def get_metrics(self) -> RateLimiterMetrics:
+        """Obtiene los contadores actuales."""
+        return self._metrics
+
+    def get_stats(self) -> dict[str, Any]:
+        """Obtiene estadísticas del limitador.
+
+        Returns:
+            Diccionario con el ritmo actual, la pausa pendiente y las métricas.
+        """
+        with self._lock:
+            rate = self._rate
+            paused_for = max(0.0, self._paused_until - time.monotonic())
+        return {
+            "rate": round(rate, 2) if rate is not None else None,
+            "max_rate": self.max_rate or None,
+            "paused_for": round(paused_for, 3),
+            **self._metrics.to_dict(),
+        }
+
+
+def parse_retry_after(value: str | None, default: float = 5.0) -> float:
+    """Convierte una cabecera Retry-After en segundos de espera.
+
+    Admite las dos formas de RFC 9110: segundos (``120``) y fecha HTTP
+    (``Wed, 21 Oct 2015 07:28:00 GMT``); una fecha ya pasada es 0. Sin
+    cabecera o con un valor no válido se usa ``default``.
+    """
+    if value is None:
+        return default
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+# Limitador del proceso: el container registra el configurado en TaigaConfig
+_rate_limiter: AdaptiveRateLimiter | None = None
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """Obtiene el limitador que comparten todos los TaigaAPIClient del proceso.
+
+    Si el container aún no ha registrado el suyo con set_rate_limiter(), se
+    crea uno sin techo de peticiones por segundo.
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = AdaptiveRateLimiter()
+    return _rate_limiter
+
+
+def set_rate_limiter(limiter: AdaptiveRateLimiter) -> None:
+    """Registra el limitador del proceso."""
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def reset_rate_limiter() -> None:
+    """Olvida el limitador del proceso (para tests)."""
+    global _rate_limiter
+    _rate_limiter = None
@@ -5,29 +5,112 @@ para reducir llamadas redundantes a endpoints de metadatos de Taiga.
 
 Features:
 - TTL configurable por entrada
-- Límite máximo de entradas
-- Invalidación por patrón
-- Métricas de hit/miss
-- Thread-safe con asyncio.Lock
+- Límite máximo de entradas con evicción LRU en O(1)
+- Límite opcional de memoria (``max_bytes``) con tamaño estimado por entrada
+- Expiración mediante min-heap en O(log n)
+- Invalidación por patrón e invalidación exacta por tags (índice secundario)
+- Ventana de gracia para servir entradas obsoletas (stale-while-revalidate)
+- Validadores HTTP (ETag, Last-Modified) por entrada para revalidar con GET condicional
+- Métricas de hit/miss y de espera del lock
+- Lecturas sin lock; escrituras serializadas con asyncio.Lock
+- Modo particionado (ShardedMemoryCache) con un lock por segmento
+- Nivel persistente opcional en disco (TieredCache, ver disk_cache.py),
+  compartible entre procesos (SharedCache, ver shared_cache.py)
 """
 
 import asyncio
+import heapq
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any
 
 
+# Contenedores con más elementos se estiman a partir de una muestra
+_SIZE_SAMPLE = 32
+
+
+def _sample(items: list[Any]) -> tuple[list[Any], float]:
+    """Muestra de como mucho ~32 elementos y el factor para extrapolar su tamaño."""
+    if len(items) <= _SIZE_SAMPLE:
+        return items, 1.0
+    sample = items[:: len(items) // _SIZE_SAMPLE]
+    return sample, len(items) / len(sample)
+
+
+def estimate_size(value: Any) -> int:
+    """Estima los bytes que ocupa un valor en memoria.
+
+    Suma ``sys.getsizeof`` de los objetos alcanzables a través de dicts,
+    listas, tuplas, sets y atributos de instancia, contando una sola vez los
+    objetos compartidos. En contenedores de más de 32 elementos solo se
+    recorre una muestra y se extrapola, para que estimar un listado de miles
+    de user stories no cueste más que recuperarlo.
+
+    Args:
+        value: Valor a medir.
+
+    Returns:
+        Tamaño aproximado en bytes.
+    """
+    seen: set[int] = set()
+    stack: list[tuple[Any, float]] = [(value, 1.0)]
+    total = 0.0
+    while stack:
+        obj, weight = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj) * weight
+        if isinstance(obj, dict):
+            items, factor = _sample(list(obj.items()))
+            children = [part for item in items for part in item]
+        elif isinstance(obj, list | tuple | set | frozenset):
+            children, factor = _sample(list(obj))
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+            children, factor = [vars(obj)], 1.0
+        else:
+            continue
+        stack.extend((child, weight * factor) for child in children)
+    return int(total)
+
+
+def endpoint_type(key: str) -> str:
+    """Tipo de endpoint de una clave (``project_stats:project_id=1`` -> ``project_stats``)."""
+    return key.split(":", 1)[0]
+
+
 @dataclass
 class CacheEntry:
     """Entrada individual del caché con valor y tiempo de expiración.
 
     Attributes:
         value: Valor almacenado en la entrada del caché.
-        expires_at: Momento en que la entrada expira.
+        expires_at: Momento en que la entrada expira y deja de servirse.
+        tags: Tags bajo los que está registrada la entrada (p. ej. ``project:123``).
+        fresh_until: Fin del TTL cuando la entrada tiene ventana de gracia; entre
+            fresh_until y expires_at la entrada es obsoleta: get() no la devuelve,
+            solo get_entry() para revalidarla.
+        validators: Cabeceras ``ETag`` / ``Last-Modified`` de la respuesta que
+            produjo el valor, para revalidarlo con una petición condicional.
+        size: Tamaño estimado del valor en bytes (lo calcula el caché al guardarla).
     """
 
     value: Any
     expires_at: datetime
+    tags: frozenset[str] = frozenset()
+    fresh_until: datetime | None = None
+    validators: dict[str, str] | None = None
+    size: int = 0
+
+    @property
+    def stale_at(self) -> datetime:
+        """Momento a partir del cual la entrada deja de estar fresca."""
+        return self.fresh_until or self.expires_at
 
     def is_expired(self) -> bool:
         """Verifica si la entrada ha expirado.
@@ -37,6 +120,14 @@ class CacheEntry:
         """
         return datetime.now() > self.expires_at
 
+    def is_stale(self) -> bool:
+        """Verifica si la entrada superó su TTL (aunque siga en la ventana de gracia).
+
+        Returns:
+            True si la entrada ya no está fresca, False en caso contrario.
+        """
+        return datetime.now() > self.stale_at
+
 
 @dataclass
 class CacheMetrics:
@@ -46,13 +137,29 @@ class CacheMetrics:
         hits: Número de aciertos en el caché.
         misses: Número de fallos en el caché.
         evictions: Número de entradas eliminadas por expiración o límite.
+        size_evictions: Evicciones (incluidas en ``evictions``) por superar max_bytes.
         invalidations: Número de invalidaciones manuales.
+        stale_hits: Aciertos servidos con una entrada obsoleta en su ventana de gracia.
+        refreshes: Entradas reemplazadas por una revalidación en segundo plano.
+        revalidations: Peticiones condicionales respondidas con un cuerpo nuevo (200).
+        not_modified: Peticiones condicionales respondidas con 304 Not Modified.
+        lock_acquisitions: Número de veces que se ha adquirido el lock.
+        lock_wait_total: Tiempo total de espera del lock en segundos.
+        lock_wait_max: Mayor espera individual del lock en segundos.
     """
 
     hits: int = 0
     misses: int = 0
     evictions: int = 0
+    size_evictions: int = 0
     invalidations: int = 0
+    stale_hits: int = 0
+    refreshes: int = 0
+    revalidations: int = 0
+    not_modified: int = 0
+    lock_acquisitions: int = 0
+    lock_wait_total: float = 0.0
+    lock_wait_max: float = 0.0
 
     @property
     def total_requests(self) -> int:
@@ -73,12 +180,81 @@ class CacheMetrics:
             return 0.0
         return self.misses / self.total_requests
 
+    @property
+    def lock_wait_avg(self) -> float:
+        """Espera media del lock en segundos."""
+        if self.lock_acquisitions == 0:
+            return 0.0
+        return self.lock_wait_total / self.lock_acquisitions
+
+    def record_lock_wait(self, seconds: float) -> None:
+        """Registra la espera de una adquisición del lock.
+
+        Args:
+            seconds: Tiempo transcurrido hasta obtener el lock.
+        """
+        self.lock_acquisitions += 1
+        self.lock_wait_total += seconds
+        self.lock_wait_max = max(self.lock_wait_max, seconds)
+
+    def merge(self, other: "CacheMetrics") -> None:
+        """Acumula las métricas de otro objeto (p. ej. de un segmento).
+
+        Args:
+            other: Métricas a sumar a estas.
+        """
+        self.hits += other.hits
+        self.misses += other.misses
+        self.evictions += other.evictions
+        self.size_evictions += other.size_evictions
+        self.invalidations += other.invalidations
+        self.stale_hits += other.stale_hits
+        self.refreshes += other.refreshes
+        self.revalidations += other.revalidations
+        self.not_modified += other.not_modified
+        self.lock_acquisitions += other.lock_acquisitions
+        self.lock_wait_total += other.lock_wait_total
+        self.lock_wait_max = max(self.lock_wait_max, other.lock_wait_max)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializa las métricas para get_stats().
+
+        Returns:
+            Diccionario con contadores, tasas y tiempos de espera en milisegundos.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size_evictions": self.size_evictions,
+            "invalidations": self.invalidations,
+            "stale_hits": self.stale_hits,
+            "refreshes": self.refreshes,
+            "revalidations": self.revalidations,
+            "not_modified": self.not_modified,
+            "total_requests": self.total_requests,
+            "hit_rate": self.hit_rate,
+            "miss_rate": self.miss_rate,
+            "lock_acquisitions": self.lock_acquisitions,
+            "lock_wait_total_ms": self.lock_wait_total * 1000,
+            "lock_wait_avg_ms": self.lock_wait_avg * 1000,
+            "lock_wait_max_ms": self.lock_wait_max * 1000,
+        }
+
     def reset(self) -> None:
         """Reinicia todas las métricas a cero."""
         self.hits = 0
         self.misses = 0
         self.evictions = 0
+        self.size_evictions = 0
         self.invalidations = 0
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.revalidations = 0
+        self.not_modified = 0
+        self.lock_acquisitions = 0
+        self.lock_wait_total = 0.0
+        self.lock_wait_max = 0.0
 
 
 @dataclass
@@ -88,60 +264,288 @@ class MemoryCache:
     Implementa un caché thread-safe con soporte para TTL configurable,
     límite de tamaño y métricas de rendimiento.
 
+    Las entradas se guardan en un OrderedDict en orden de uso (LRU), de modo
+    que get/set y la evicción por tamaño son O(1). Las expiraciones se
+    registran en un min-heap ``(expires_at, key)``; las entradas del heap que
+    ya no corresponden a la entrada vigente (borrada o sobrescrita) se
+    descartan al extraerlas y el heap se compacta cuando acumula demasiadas.
+
+    Las lecturas (get con acierto, contains, size, get_stats) no toman el
+    lock: en asyncio el código entre dos ``await`` se ejecuta sin
+    interrupciones, y ninguna operación suspende la corrutina mientras
+    modifica el diccionario. El lock solo serializa las escrituras y las
+    evicciones, y su tiempo de espera se registra en las métricas.
+
+    Cada entrada puede registrarse bajo tags (``project:123``,
+    ``endpoint:issue_filters``). Un índice secundario tag -> claves permite
+    invalidar un tag en O(entradas con ese tag) y con coincidencia exacta,
+    a diferencia de ``invalidate(pattern)``, que recorre todas las claves.
+
+    Con ``grace`` una entrada sigue almacenada durante ese margen tras su TTL:
+    get() y contains() ya no la consideran, pero get_entry() la devuelve,
+    marcada como obsoleta, para revalidarla (stale-while-revalidate).
+
+    El tamaño de cada entrada se estima al guardarla (estimate_size) y se
+    acumula en total y por tipo de endpoint. Con ``max_bytes`` se desalojan
+    entradas expiradas y después las menos usadas hasta volver al límite; una
+    entrada que por sí sola lo supera no se guarda.
+
     Attributes:
         default_ttl: TTL por defecto en segundos para nuevas entradas.
         max_size: Número máximo de entradas permitidas en el caché.
+        max_bytes: Memoria máxima estimada en bytes (0 = sin límite).
     """
 
     default_ttl: int = 3600
     max_size: int = 1000
-    _cache: dict[str, CacheEntry] = field(default_factory=dict)
+    max_bytes: int = 0
+    _cache: OrderedDict[str, CacheEntry] = field(default_factory=OrderedDict)
+    _expiry_heap: list[tuple[datetime, str]] = field(default_factory=list)
+    _tag_index: dict[str, set[str]] = field(default_factory=dict)
+    _bytes: int = 0
+    _bytes_by_endpoint: dict[str, int] = field(default_factory=dict)
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     _metrics: CacheMetrics = field(default_factory=CacheMetrics)
 
     async def get(self, key: str) -> Any | None:
-        """Obtiene valor del caché si existe y no expiró.
+        """Obtiene valor del caché si existe y sigue fresco.
+
+        Una entrada obsoleta (pasado su TTL, dentro de la ventana de gracia)
+        cuenta como fallo: solo get_entry() la devuelve, para quien sepa
+        revalidarla.
 
         Args:
             key: Clave de la entrada a obtener.
 
         Returns:
-            El valor almacenado si existe y no ha expirado, None en caso contrario.
+            El valor almacenado si existe y está fresco, None en caso contrario.
         """
-        async with self._lock:
-            entry = self._cache.get(key)
-            if entry is not None:
-                if not entry.is_expired():
-                    self._metrics.hits += 1
-                    return entry.value
-                # Entrada expirada, eliminar
-                del self._cache[key]
-                self._metrics.evictions += 1
+        entry = await self._live_entry(key)
+        if entry is None or entry.is_stale():
             self._metrics.misses += 1
             return None
+        self._cache.move_to_end(key)
+        self._metrics.hits += 1
+        return entry.value
+
+    async def get_entry(self, key: str) -> CacheEntry | None:
+        """Obtiene la entrada completa, incluida una obsoleta en su ventana de gracia.
+
+        Cuenta como acierto (y como ``stale_hits`` si la entrada está obsoleta)
+        o como fallo si no hay entrada o expiró.
 
-    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        Args:
+            key: Clave de la entrada a obtener.
+
+        Returns:
+            La entrada si existe y no ha expirado, None en caso contrario.
+        """
+        entry = await self._live_entry(key)
+        if entry is None:
+            self._metrics.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self._metrics.hits += 1
+        if entry.is_stale():
+            self._metrics.stale_hits += 1
+        return entry
+
+    async def _live_entry(self, key: str) -> CacheEntry | None:
+        """Obtiene la entrada si no ha expirado; si expiró, la elimina (sin contar acceso)."""
+        # Camino rápido sin lock para entradas vigentes
+        entry = self._cache.get(key)
+        if entry is None or not entry.is_expired():
+            return entry
+
+        async with self._locked():
+            # Entrada expirada, eliminar si sigue siendo la misma
+            if self._cache.get(key) is entry:
+                self._remove_unlocked(key)
+                self._metrics.evictions += 1
+        return None
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+        grace: int = 0,
+        validators: dict[str, str] | None = None,
+    ) -> None:
         """Guarda valor en caché con TTL.
 
         Si el caché está lleno, primero elimina las entradas expiradas.
-        Si aún está lleno después de la limpieza, elimina la entrada más antigua.
+        Si aún está lleno después de la limpieza, elimina la entrada usada
+        menos recientemente (LRU).
 
         Args:
             key: Clave bajo la cual almacenar el valor.
             value: Valor a almacenar.
             ttl: TTL en segundos. Si es None, usa el default_ttl.
+            tags: Tags bajo los que registrar la entrada para invalidate_tags().
+            grace: Segundos que la entrada se conserva, obsoleta, tras el TTL.
+            validators: ETag / Last-Modified de la respuesta, si los hubo.
         """
-        async with self._lock:
-            # Si estamos en el límite, limpiar expiradas primero
-            if len(self._cache) >= self.max_size and key not in self._cache:
-                await self._evict_expired_unlocked()
+        async with self._locked():
+            await self._store_unlocked(key, value, ttl, tags, grace, validators)
+
+    async def set_if_current(
+        self,
+        key: str,
+        current: CacheEntry,
+        value: Any,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+        grace: int = 0,
+        validators: dict[str, str] | None = None,
+    ) -> bool:
+        """Reemplaza una entrada solo si sigue siendo la misma.
+
+        Lo usa la revalidación en segundo plano: si la entrada se invalidó o
+        se sobrescribió mientras se recuperaba el nuevo valor, no se guarda,
+        para no resucitar datos anteriores a una escritura.
 
-            # Si aún estamos en el límite, eliminar la más antigua
-            if len(self._cache) >= self.max_size and key not in self._cache:
-                await self._evict_oldest_unlocked()
+        Args:
+            key: Clave de la entrada.
+            current: Entrada que se esperaba reemplazar (obtenida con get_entry()).
+            value: Nuevo valor.
+            ttl: TTL en segundos. Si es None, usa el default_ttl.
+            tags: Tags bajo los que registrar la entrada.
+            grace: Segundos que la entrada se conserva, obsoleta, tras el TTL.
+            validators: ETag / Last-Modified de la respuesta, si los hubo.
 
-            expires_at = datetime.now() + timedelta(seconds=ttl or self.default_ttl)
-            self._cache[key] = CacheEntry(value=value, expires_at=expires_at)
+        Returns:
+            True si se reemplazó la entrada, False si ya no era la vigente.
+        """
+        async with self._locked():
+            if self._cache.get(key) is not current:
+                return False
+            await self._store_unlocked(key, value, ttl, tags, grace, validators)
+            self._metrics.refreshes += 1
+            return True
+
+    async def _store_unlocked(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None,
+        tags: Iterable[str] | None,
+        grace: int,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """Guarda una entrada haciendo hueco si el caché está lleno (sin lock)."""
+        fresh_until = datetime.now() + timedelta(seconds=ttl or self.default_ttl)
+        entry = CacheEntry(
+            value=value,
+            expires_at=fresh_until + timedelta(seconds=grace),
+            tags=frozenset(tags) if tags else frozenset(),
+            fresh_until=fresh_until if grace > 0 else None,
+            validators=validators,
+        )
+        await self._insert_unlocked(key, entry)
+
+    async def _insert_unlocked(self, key: str, entry: CacheEntry) -> None:
+        """Inserta una entrada ya construida, con evicción e índices (sin lock)."""
+        if not entry.size:
+            entry.size = estimate_size(entry.value)
+        if self.max_bytes and entry.size > self.max_bytes:
+            # Ocuparía más que todo el límite: no se guarda (ni se deja la versión anterior)
+            if key in self._cache:
+                self._remove_unlocked(key)
+            self._metrics.evictions += 1
+            self._metrics.size_evictions += 1
+            return
+
+        # Si estamos en el límite, limpiar expiradas primero
+        if len(self._cache) >= self.max_size and key not in self._cache:
+            await self._evict_expired_unlocked()
+
+        # Si aún estamos en el límite, eliminar la más antigua
+        if len(self._cache) >= self.max_size and key not in self._cache:
+            await self._evict_oldest_unlocked()
+
+        previous = self._cache.get(key)
+        if previous is not None:
+            self._account_unlocked(key, -previous.size)
+            if previous.tags != entry.tags:
+                self._unindex_unlocked(key, previous)
+        self._cache[key] = entry
+        self._account_unlocked(key, entry.size)
+        for tag in entry.tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+        self._cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (entry.expires_at, key))
+        self._compact_heap_unlocked()
+
+        if self.max_bytes and self._bytes > self.max_bytes:
+            await self._evict_to_max_bytes_unlocked()
+
+    async def _evict_to_max_bytes_unlocked(self) -> None:
+        """Desaloja expiradas y después las menos usadas hasta volver a max_bytes (sin lock).
+
+        La entrada recién guardada es la más reciente y no supera max_bytes,
+        así que nunca se desaloja a sí misma.
+        """
+        before = self._metrics.evictions
+        await self._evict_expired_unlocked()
+        while self._bytes > self.max_bytes and len(self._cache) > 1:
+            await self._evict_oldest_unlocked()
+        self._metrics.size_evictions += self._metrics.evictions - before
+
+    def _account_unlocked(self, key: str, size: int) -> None:
+        """Suma (o resta) el tamaño de una entrada al total y a su tipo de endpoint."""
+        self._bytes += size
+        endpoint = endpoint_type(key)
+        total = self._bytes_by_endpoint.get(endpoint, 0) + size
+        if total > 0:
+            self._bytes_by_endpoint[endpoint] = total
+        else:
+            self._bytes_by_endpoint.pop(endpoint, None)
+
+    async def restore(self, key: str, entry: CacheEntry) -> bool:
+        """Inserta una entrada conservando sus expiraciones (p. ej. leída de disco).
+
+        No sobrescribe una entrada vigente: si otra corrutina guardó la clave
+        mientras se leía la copia persistida, la de memoria es más reciente.
+
+        Args:
+            key: Clave de la entrada.
+            entry: Entrada a insertar.
+
+        Returns:
+            True si se insertó, False si ya había una entrada vigente o había expirado.
+        """
+        if entry.is_expired():
+            return False
+        async with self._locked():
+            current = self._cache.get(key)
+            if current is not None and not current.is_expired():
+                return False
+            await self._insert_unlocked(key, entry)
+            return True
+
+    def peek(self, key: str) -> CacheEntry | None:
+        """Obtiene la entrada almacenada sin actualizar métricas ni el orden LRU.
+
+        Args:
+            key: Clave de la entrada.
+
+        Returns:
+            La entrada (aunque haya expirado) o None si no existe.
+        """
+        return self._cache.get(key)
+
+    async def flush(self) -> int:
+        """Persiste las escrituras pendientes de un nivel secundario.
+
+        El caché en memoria no tiene nada que persistir; TieredCache lo
+        sobrescribe para vaciar su buffer de escritura diferida en disco.
+
+        Returns:
+            Número de operaciones persistidas.
+        """
+        return 0
 
     async def delete(self, key: str) -> bool:
         """Elimina una entrada específica del caché.
@@ -152,9 +556,9 @@ class MemoryCache:
         Returns:
             True si la entrada existía y fue eliminada, False si no existía.
         """
-        async with self._lock:
+        async with self._locked():
             if key in self._cache:
-                del self._cache[key]
+                self._remove_unlocked(key)
                 self._metrics.invalidations += 1
                 return True
             return False
@@ -168,10 +572,32 @@ class MemoryCache:
         Returns:
             Número de entradas invalidadas.
         """
-        async with self._lock:
+        async with self._locked():
             keys_to_delete = [k for k in self._cache if pattern in k]
             for key in keys_to_delete:
-                del self._cache[key]
+                self._remove_unlocked(key)
+            self._metrics.invalidations += len(keys_to_delete)
+            return len(keys_to_delete)
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Invalida las entradas registradas bajo cualquiera de los tags.
+
+        Usa el índice secundario, por lo que el coste es proporcional al
+        número de entradas afectadas y la coincidencia es exacta
+        (``project:1`` no invalida ``project:12``).
+
+        Args:
+            *tags: Tags a invalidar (p. ej. ``project:123``).
+
+        Returns:
+            Número de entradas invalidadas.
+        """
+        async with self._locked():
+            keys_to_delete: set[str] = set()
+            for tag in tags:
+                keys_to_delete.update(self._tag_index.get(tag, ()))
+            for key in keys_to_delete:
+                self._remove_unlocked(key)
             self._metrics.invalidations += len(keys_to_delete)
             return len(keys_to_delete)
 
@@ -181,9 +607,13 @@ class MemoryCache:
         Returns:
             Número de entradas eliminadas.
         """
-        async with self._lock:
+        async with self._locked():
             count = len(self._cache)
             self._cache.clear()
+            self._expiry_heap.clear()
+            self._tag_index.clear()
+            self._bytes = 0
+            self._bytes_by_endpoint.clear()
             self._metrics.invalidations += count
             return count
 
@@ -191,19 +621,26 @@ class MemoryCache:
         """Elimina todas las entradas expiradas (sin lock).
 
         Este método debe ser llamado solo cuando ya se tiene el lock.
+        Solo recorre las entradas del heap ya vencidas: O(k log n).
 
         Returns:
             Número de entradas eliminadas.
         """
         now = datetime.now()
-        keys_to_delete = [k for k, entry in self._cache.items() if entry.expires_at <= now]
-        for key in keys_to_delete:
-            del self._cache[key]
-        self._metrics.evictions += len(keys_to_delete)
-        return len(keys_to_delete)
+        heap = self._expiry_heap
+        evicted = 0
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Ignorar entradas obsoletas (clave borrada o sobrescrita)
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove_unlocked(key)
+                evicted += 1
+        self._metrics.evictions += evicted
+        return evicted
 
     async def _evict_oldest_unlocked(self) -> bool:
-        """Elimina la entrada más antigua (sin lock).
+        """Elimina la entrada usada menos recientemente (sin lock).
 
         Este método debe ser llamado solo cuando ya se tiene el lock.
 
@@ -213,19 +650,54 @@ class MemoryCache:
         if not self._cache:
             return False
 
-        # Encontrar la entrada que expira primero
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].expires_at)
-        del self._cache[oldest_key]
+        key, entry = self._cache.popitem(last=False)
+        self._unindex_unlocked(key, entry)
+        self._account_unlocked(key, -entry.size)
         self._metrics.evictions += 1
         return True
 
+    def _remove_unlocked(self, key: str) -> None:
+        """Elimina una entrada existente y la retira del índice de tags (sin lock)."""
+        entry = self._cache.pop(key)
+        self._unindex_unlocked(key, entry)
+        self._account_unlocked(key, -entry.size)
+
+    def _unindex_unlocked(self, key: str, entry: CacheEntry) -> None:
+        """Retira una clave del índice de tags (sin lock)."""
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    @asynccontextmanager
+    async def _locked(self) -> AsyncIterator[None]:
+        """Adquiere el lock registrando el tiempo de espera en las métricas."""
+        start = time.perf_counter()
+        async with self._lock:
+            self._metrics.record_lock_wait(time.perf_counter() - start)
+            yield
+
+    def _compact_heap_unlocked(self) -> None:
+        """Reconstruye el heap de expiración si acumula demasiadas entradas obsoletas.
+
+        Borrados y sobrescrituras no retiran su entrada del heap. Cuando el heap
+        duplica el número de entradas vivas se reconstruye en O(n), lo que deja
+        un coste amortizado O(1) por operación.
+        """
+        if len(self._expiry_heap) <= 2 * len(self._cache) + 64:
+            return
+        self._expiry_heap = [(entry.expires_at, key) for key, entry in self._cache.items()]
+        heapq.heapify(self._expiry_heap)
+
     async def evict_expired(self) -> int:
         """Elimina todas las entradas expiradas.
 
         Returns:
             Número de entradas eliminadas.
         """
-        async with self._lock:
+        async with self._locked():
             return await self._evict_expired_unlocked()
 
     def get_metrics(self) -> CacheMetrics:
@@ -240,27 +712,36 @@ class MemoryCache:
         """Reinicia las métricas del caché a cero."""
         self._metrics.reset()
 
+    def record_revalidation(self, not_modified: bool) -> None:
+        """Registra el resultado de una petición condicional.
+
+        Args:
+            not_modified: True si la API respondió 304 Not Modified.
+        """
+        if not_modified:
+            self._metrics.not_modified += 1
+        else:
+            self._metrics.revalidations += 1
+
     async def size(self) -> int:
         """Obtiene el número actual de entradas en el caché.
 
         Returns:
             Número de entradas en el caché.
         """
-        async with self._lock:
-            return len(self._cache)
+        return len(self._cache)
 
     async def contains(self, key: str) -> bool:
-        """Verifica si una clave existe en el caché (sin actualizar métricas).
+        """Verifica si una clave tiene una entrada fresca (sin actualizar métricas).
 
         Args:
             key: Clave a verificar.
 
         Returns:
-            True si la clave existe y no ha expirado, False en caso contrario.
+            True si la clave existe y está fresca, False en caso contrario.
         """
-        async with self._lock:
-            entry = self._cache.get(key)
-            return bool(entry is not None and not entry.is_expired())
+        entry = self._cache.get(key)
+        return bool(entry is not None and not entry.is_stale())
 
     async def get_stats(self) -> dict[str, Any]:
         """Obtiene estadísticas completas del caché.
@@ -270,20 +751,253 @@ class MemoryCache:
             - size: Número de entradas
             - max_size: Tamaño máximo
             - default_ttl: TTL por defecto
-            - metrics: Métricas de hit/miss
+            - tags: Número de tags indexados
+            - bytes / max_bytes: Memoria estimada y su límite (0 = sin límite)
+            - bytes_by_endpoint: Memoria estimada por tipo de endpoint, de mayor a menor
+            - metrics: Métricas de hit/miss y de espera del lock
         """
-        async with self._lock:
-            return {
-                "size": len(self._cache),
-                "max_size": self.max_size,
-                "default_ttl": self.default_ttl,
-                "metrics": {
-                    "hits": self._metrics.hits,
-                    "misses": self._metrics.misses,
-                    "evictions": self._metrics.evictions,
-                    "invalidations": self._metrics.invalidations,
-                    "total_requests": self._metrics.total_requests,
-                    "hit_rate": self._metrics.hit_rate,
-                    "miss_rate": self._metrics.miss_rate,
-                },
-            }
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "default_ttl": self.default_ttl,
+            "tags": len(self._tag_index),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "bytes_by_endpoint": _by_size(self._bytes_by_endpoint),
+            "metrics": self._metrics.to_dict(),
+        }
+
+
+class ShardedMemoryCache:
+    """Caché en memoria particionado en N segmentos independientes.
+
+    Cada clave se asigna a un segmento por ``hash(key) % shards``; cada
+    segmento es un MemoryCache con su propio lock, LRU y heap de expiración,
+    de modo que las escrituras concurrentes sobre claves distintas no
+    compiten por un único lock. ``max_size`` se reparte entre los segmentos,
+    por lo que el LRU es aproximado (por segmento).
+
+    No admite ``max_bytes``: repartirlo entre segmentos rechazaría en silencio
+    las entradas mayores que un segmento, y aplicarlo de forma global
+    obligaría a tomar los locks de todos ellos en cada escritura.
+
+    Las operaciones sobre una clave (get, set, delete, contains) solo tocan su
+    segmento; invalidate, clear, evict_expired y size recorren todos.
+
+    Attributes:
+        default_ttl: TTL por defecto en segundos para nuevas entradas.
+        max_size: Número máximo de entradas (total entre todos los segmentos).
+        max_bytes: Siempre 0 (sin límite de memoria).
+        shards: Número de segmentos.
+    """
+
+    max_bytes = 0
+
+    def __init__(self, default_ttl: int = 3600, max_size: int = 1000, shards: int = 8) -> None:
+        """Valida la configuración y crea los segmentos.
+
+        Raises:
+            ValueError: Si shards no es mayor que 0.
+        """
+        if shards <= 0:
+            raise ValueError("shards debe ser mayor a 0")
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+        self.shards = shards
+        base, extra = divmod(max_size, shards)
+        self._segments = [
+            MemoryCache(default_ttl=default_ttl, max_size=max(1, base + (i < extra)))
+            for i in range(shards)
+        ]
+
+    def _segment(self, key: str) -> MemoryCache:
+        """Obtiene el segmento responsable de una clave."""
+        return self._segments[hash(key) % self.shards]
+
+    async def get(self, key: str) -> Any | None:
+        """Obtiene valor del segmento correspondiente a la clave."""
+        return await self._segment(key).get(key)
+
+    async def get_entry(self, key: str) -> CacheEntry | None:
+        """Obtiene la entrada completa del segmento correspondiente a la clave."""
+        return await self._segment(key).get_entry(key)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+        grace: int = 0,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """Guarda valor en el segmento correspondiente a la clave."""
+        await self._segment(key).set(key, value, ttl, tags, grace, validators)
+
+    async def set_if_current(
+        self,
+        key: str,
+        current: CacheEntry,
+        value: Any,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+        grace: int = 0,
+        validators: dict[str, str] | None = None,
+    ) -> bool:
+        """Reemplaza la entrada en su segmento solo si sigue siendo la misma."""
+        return await self._segment(key).set_if_current(
+            key, current, value, ttl, tags, grace, validators
+        )
+
+    async def restore(self, key: str, entry: CacheEntry) -> bool:
+        """Inserta una entrada conservando sus expiraciones en su segmento."""
+        return await self._segment(key).restore(key, entry)
+
+    def peek(self, key: str) -> CacheEntry | None:
+        """Obtiene la entrada de su segmento sin actualizar métricas ni el orden LRU."""
+        return self._segment(key).peek(key)
+
+    async def flush(self) -> int:
+        """El caché en memoria no tiene escrituras pendientes que persistir."""
+        return 0
+
+    async def delete(self, key: str) -> bool:
+        """Elimina una entrada de su segmento."""
+        return await self._segment(key).delete(key)
+
+    async def invalidate(self, pattern: str) -> int:
+        """Invalida en todos los segmentos las claves que contengan el patrón."""
+        return sum([await segment.invalidate(pattern) for segment in self._segments])
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Invalida los tags en todos los segmentos usando sus índices."""
+        return sum([await segment.invalidate_tags(*tags) for segment in self._segments])
+
+    async def clear(self) -> int:
+        """Limpia todos los segmentos."""
+        return sum([await segment.clear() for segment in self._segments])
+
+    async def evict_expired(self) -> int:
+        """Elimina las entradas expiradas de todos los segmentos."""
+        return sum([await segment.evict_expired() for segment in self._segments])
+
+    def get_metrics(self) -> CacheMetrics:
+        """Obtiene una instantánea de las métricas agregadas de todos los segmentos.
+
+        Returns:
+            Nuevo CacheMetrics con la suma de los segmentos.
+        """
+        metrics = CacheMetrics()
+        for segment in self._segments:
+            metrics.merge(segment.get_metrics())
+        return metrics
+
+    def reset_metrics(self) -> None:
+        """Reinicia las métricas de todos los segmentos."""
+        for segment in self._segments:
+            segment.reset_metrics()
+
+    def record_revalidation(self, not_modified: bool) -> None:
+        """Registra el resultado de una petición condicional (en el primer segmento).
+
+        get_metrics() suma todos los segmentos, así que basta con uno.
+        """
+        self._segments[0].record_revalidation(not_modified)
+
+    async def size(self) -> int:
+        """Obtiene el número total de entradas en todos los segmentos."""
+        return sum(len(segment._cache) for segment in self._segments)
+
+    async def contains(self, key: str) -> bool:
+        """Verifica si una clave existe en su segmento."""
+        return await self._segment(key).contains(key)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Obtiene estadísticas agregadas, incluyendo el número de segmentos.
+
+        Returns:
+            Diccionario con las mismas claves que MemoryCache.get_stats() más
+            ``shards`` y el tamaño de cada segmento en ``shard_sizes``.
+        """
+        shard_sizes = [len(segment._cache) for segment in self._segments]
+        bytes_by_endpoint: dict[str, int] = {}
+        for segment in self._segments:
+            for endpoint, size in segment._bytes_by_endpoint.items():
+                bytes_by_endpoint[endpoint] = bytes_by_endpoint.get(endpoint, 0) + size
+        return {
+            "size": sum(shard_sizes),
+            "max_size": self.max_size,
+            "default_ttl": self.default_ttl,
+            "tags": sum(len(segment._tag_index) for segment in self._segments),
+            "bytes": sum(segment._bytes for segment in self._segments),
+            "max_bytes": self.max_bytes,
+            "bytes_by_endpoint": _by_size(bytes_by_endpoint),
+            "shards": self.shards,
+            "shard_sizes": shard_sizes,
+            "metrics": self.get_metrics().to_dict(),
+        }
+
+
+# Cualquier caché en memoria (los niveles de disk_cache y shared_cache son MemoryCache)
+CacheBackend = MemoryCache | ShardedMemoryCache
+
+
+def _by_size(bytes_by_endpoint: dict[str, int]) -> dict[str, int]:
+    """Ordena los bytes por tipo de endpoint de mayor a menor."""
+    return dict(sorted(bytes_by_endpoint.items(), key=lambda item: item[1], reverse=True))
+
+
+def create_memory_cache(
+    default_ttl: int = 3600,
+    max_size: int = 1000,
+    shards: int = 1,
+    max_bytes: int = 0,
+    directory: str = "",
+    disk_max_size: int = 10000,
+    shared: bool = False,
+    sync_interval: float = 0.5,
+) -> CacheBackend:
+    """Crea el caché en memoria, particionado si se configuran varios segmentos.
+
+    Args:
+        default_ttl: TTL por defecto en segundos.
+        max_size: Número máximo de entradas (total entre todos los segmentos).
+        shards: Número de segmentos (1 = sin particionar).
+        max_bytes: Memoria máxima estimada en bytes (0 = sin límite).
+        directory: Directorio del nivel persistente en disco (vacío = sin
+            nivel en disco).
+        disk_max_size: Número máximo de entradas en disco.
+        shared: Si varios procesos comparten el directorio y se propagan las
+            invalidaciones entre ellos.
+        sync_interval: Segundos entre comprobaciones de invalidaciones de
+            otros procesos (solo si shared).
+
+    Returns:
+        MemoryCache con un solo lock, o ShardedMemoryCache si shards > 1;
+        envuelto en un TieredCache si se configura un directorio, o en un
+        SharedCache si además es compartido.
+
+    Raises:
+        ValueError: Si se pide un caché compartido sin directorio o un caché
+            particionado con límite de memoria.
+    """
+    memory: CacheBackend
+    if shards > 1:
+        if max_bytes:
+            raise ValueError("El caché particionado no admite max_bytes")
+        memory = ShardedMemoryCache(default_ttl=default_ttl, max_size=max_size, shards=shards)
+    else:
+        memory = MemoryCache(default_ttl=default_ttl, max_size=max_size, max_bytes=max_bytes)
+
+    if not directory:
+        if shared:
+            raise ValueError("El caché compartido requiere un directorio")
+        return memory
+    # Importación diferida: disk_cache y shared_cache dependen de este módulo
+    from src.infrastructure.disk_cache import DiskCache, TieredCache
+    from src.infrastructure.shared_cache import SharedCache
+
+    disk = DiskCache(directory, max_size=disk_max_size, broadcast=shared)
+    if shared:
+        return SharedCache(memory, disk, sync_interval=sync_interval)
+    return TieredCache(memory, disk)
@@ -0,0 +1,159 @@
+"""Invalidación automática del caché en operaciones de escritura.
+
+Este módulo define un mapeo declarativo entre los endpoints de escritura de
+Taiga (POST/PUT/PATCH/DELETE) y los tipos de endpoint cacheados por
+CachedTaigaClient que dejan obsoletos. TaigaAPIClient lo consulta tras cada
+escritura exitosa para expulsar exactamente las entradas afectadas.
+
+Features:
+- Reglas declarativas ruta -> tipos de endpoint cacheados
+- Invalidación acotada al proyecto cuando la petición lo identifica
+- Invalidación de todo el proyecto al modificar el propio proyecto
+- Sin efecto para rutas que no afectan a metadatos cacheados
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from src.infrastructure.cached_client import CacheKeyBuilder
+
+
+# Métodos HTTP que modifican datos en Taiga
+MUTATING_METHODS: frozenset[str] = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+# Tipos de endpoint cuyas claves no incluyen project_id (solo admiten el tag global)
+UNSCOPED_ENDPOINTS: frozenset[str] = frozenset({"milestone_stats"})
+
+_ALL_FILTERS = ("epic_filters", "issue_filters", "task_filters", "userstory_filters")
+
+
+@dataclass(frozen=True)
+class InvalidationRule:
+    """Regla que asocia rutas de escritura con los datos cacheados que invalidan.
+
+    Attributes:
+        pattern: Expresión regular sobre la ruta (sin query string). Si define
+            el grupo ``project`` se usa como ID del proyecto.
+        endpoint_types: Tipos de endpoint cacheados (claves de
+            CachedTaigaClient.CACHEABLE_ENDPOINTS) afectados por la escritura.
+        whole_project: Si es True invalida todas las entradas del proyecto.
+    """
+
+    pattern: re.Pattern[str]
+    endpoint_types: tuple[str, ...] = ()
+    whole_project: bool = False
+
+
+def _rule(pattern: str, *endpoint_types: str, whole_project: bool = False) -> InvalidationRule:
+    """Crea una regla compilando su patrón."""
+    return InvalidationRule(re.compile(pattern), endpoint_types, whole_project)
+
+
+# Se aplica la primera regla cuyo patrón coincide con la ruta
+INVALIDATION_RULES: tuple[InvalidationRule, ...] = (
+    # Configuración del proyecto
+    _rule(r"^/projects/(?P<project>\d+)/modules/?$", "project_modules"),
+    _rule(r"^/projects/(?P<project>\d+)(/.*)?$", whole_project=True),
+    # Estados, tipos, puntos y roles: listas de configuración y opciones de los filtros
+    _rule(r"^/epic-statuses(/.*)?$", "epic_statuses", "epic_filters"),
+    _rule(r"^/issue-statuses(/.*)?$", "issue_statuses", "issue_filters"),
+    _rule(r"^/issue-types(/.*)?$", "issue_types", "issue_filters"),
+    _rule(r"^/priorities(/.*)?$", "priorities", "issue_filters"),
+    _rule(r"^/severities(/.*)?$", "severities", "issue_filters"),
+    _rule(r"^/task-statuses(/.*)?$", "task_statuses", "task_filters"),
+    _rule(r"^/userstory-statuses(/.*)?$", "userstory_statuses", "userstory_filters"),
+    _rule(r"^/points(/.*)?$", "points", "userstory_filters", "project_stats"),
+    _rule(r"^/roles(/.*)?$", "roles", "project_stats"),
+    # Definiciones de atributos personalizados
+    _rule(r"^/epic-custom-attributes(/.*)?$", "epic_custom_attributes"),
+    _rule(r"^/issue-custom-attributes(/.*)?$", "issue_custom_attributes"),
+    _rule(r"^/task-custom-attributes(/.*)?$", "task_custom_attributes"),
+    _rule(r"^/userstory-custom-attributes(/.*)?$", "userstory_custom_attributes"),
+    # Miembros: opciones de asignación de todos los filtros
+    _rule(r"^/memberships(/.*)?$", *_ALL_FILTERS),
+    # Elementos: contadores de filtros y estadísticas
+    _rule(r"^/epics(/\d+|/bulk_create)?/?$", "epic_filters"),
+    _rule(r"^/issues(/\d+|/bulk_create)?/?$", "issue_filters", "project_stats"),
+    _rule(r"^/tasks(/\d+|/bulk_create)?/?$", "task_filters", "project_stats", "milestone_stats"),
+    _rule(
+        r"^/userstories(/\d+|/bulk_create|/bulk_update_\w+)?/?$",
+        "userstory_filters",
+        "project_stats",
+        "milestone_stats",
+    ),
+    _rule(r"^/milestones(/\d+)?/?$", "project_stats", "milestone_stats"),
+)
+
+
+def _project_id(
+    match: re.Match[str],
+    query: str,
+    data: dict[str, Any] | None,
+    params: dict[str, Any] | None,
+) -> int | None:
+    """Extrae el ID del proyecto de la ruta, el cuerpo o los parámetros."""
+    candidates = [
+        match.groupdict().get("project"),
+        (data or {}).get("project"),
+        (params or {}).get("project"),
+        next(iter(parse_qs(query).get("project", [])), None),
+    ]
+    for candidate in candidates:
+        if candidate is None or isinstance(candidate, bool):
+            continue
+        try:
+            return int(candidate)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def tags_for_mutation(
+    method: str,
+    endpoint: str,
+    data: dict[str, Any] | None = None,
+    params: dict[str, Any] | None = None,
+) -> frozenset[str]:
+    """Calcula los tags de caché que invalida una escritura.
+
+    Si la petición identifica el proyecto (en la ruta, el cuerpo o los
+    parámetros) solo se invalidan las entradas de ese proyecto; si no, se
+    invalida el tipo de endpoint completo.
+
+    Args:
+        method: Método HTTP de la petición.
+        endpoint: Ruta de la API (p. ej. ``/issue-statuses/5``).
+        data: Cuerpo de la petición.
+        params: Parámetros de query.
+
+    Returns:
+        Tags a pasar a MemoryCache.invalidate_tags(); vacío si la petición
+        no es de escritura o no afecta a datos cacheados.
+    """
+    if method.upper() not in MUTATING_METHODS:
+        return frozenset()
+
+    parts = urlsplit(endpoint)
+    path = parts.path
+    for rule in INVALIDATION_RULES:
+        match = rule.pattern.match(path)
+        if match is None:
+            continue
+
+        project_id = _project_id(match, parts.query, data, params)
+        if rule.whole_project:
+            if project_id is None:
+                return frozenset()
+            return frozenset({CacheKeyBuilder.project_tag(project_id)})
+
+        tags = set()
+        for endpoint_type in rule.endpoint_types:
+            if project_id is None or endpoint_type in UNSCOPED_ENDPOINTS:
+                tags.add(CacheKeyBuilder.endpoint_tag(endpoint_type))
+            else:
+                tags.add(CacheKeyBuilder.scoped_tag(endpoint_type, project_id))
+        return frozenset(tags)
+
+    return frozenset()
@@ -6,14 +6,25 @@ la carga en la API.
 
 Features:
 - Cacheo automático de endpoints estáticos
+- Claves por proyecto y por principal autenticado (hash del token)
 - TTL configurable por tipo de endpoint
 - Métricas de hit/miss disponibles
-- Invalidación manual de caché
+- Invalidación manual de caché por tags (proyecto y tipo de endpoint)
+- Invalidación automática en escrituras (ver cache_invalidation)
+- Stale-while-revalidate y refresco anticipado de claves en uso
+- Revalidación con GET condicional (ETag / Last-Modified): un 304 renueva el
+  TTL sin transferir ni parsear el cuerpo
 """
 
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-from src.infrastructure.cache import CacheMetrics, MemoryCache
+from src.infrastructure.cache import CacheBackend, CacheEntry, CacheMetrics, MemoryCache
+from src.infrastructure.logging import get_logger
 
 
 if TYPE_CHECKING:
@@ -42,6 +53,71 @@ class CacheKeyBuilder:
             return f"{endpoint_type}:{param_str}"
         return endpoint_type
 
+    @staticmethod
+    def principal(auth_token: str) -> str:
+        """Identificador estable de un token que no expone el token en las claves.
+
+        Args:
+            auth_token: Token de autenticación del usuario.
+
+        Returns:
+            Prefijo hexadecimal del SHA-256 del token.
+        """
+        return hashlib.sha256(auth_token.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def project_tag(project_id: int) -> str:
+        """Tag bajo el que se registran las entradas de un proyecto."""
+        return f"project:{project_id}"
+
+    @staticmethod
+    def endpoint_tag(endpoint_type: str) -> str:
+        """Tag bajo el que se registran las entradas de un tipo de endpoint."""
+        return f"endpoint:{endpoint_type}"
+
+    @staticmethod
+    def scoped_tag(endpoint_type: str, project_id: int) -> str:
+        """Tag de las entradas de un tipo de endpoint dentro de un proyecto."""
+        return f"endpoint:{endpoint_type}:project:{project_id}"
+
+    @staticmethod
+    def tags(endpoint_type: str, **params: Any) -> frozenset[str]:
+        """Construye los tags de invalidación de una entrada.
+
+        Args:
+            endpoint_type: Tipo de endpoint (e.g., 'epic_filters').
+            **params: Parámetros de la clave; si incluyen ``project_id`` se
+                añaden el tag del proyecto y el del endpoint en el proyecto.
+
+        Returns:
+            Conjunto con ``endpoint:<tipo>`` y, si aplica, ``project:<id>`` y
+            ``endpoint:<tipo>:project:<id>``.
+        """
+        tags = {CacheKeyBuilder.endpoint_tag(endpoint_type)}
+        project_id = params.get("project_id")
+        if project_id is not None:
+            tags.add(CacheKeyBuilder.project_tag(project_id))
+            tags.add(CacheKeyBuilder.scoped_tag(endpoint_type, project_id))
+        return frozenset(tags)
+
+
+# (endpoint, params) de un GET que puede revalidarse con una petición condicional
+ConditionalGet = tuple[str, dict[str, Any] | None]
+
+
+@dataclass(frozen=True)
+class _Request:
+    """Cómo recuperar una entrada: fetch, su GET condicional equivalente, TTL y tags.
+
+    fetch recibe el cliente con el que hacer la petición, que en una
+    revalidación en segundo plano no es el de la llamada original.
+    """
+
+    fetch: Callable[["TaigaAPIClient"], Awaitable[Any]]
+    conditional_get: ConditionalGet | None
+    ttl: int
+    tags: Iterable[str]
+
 
 class CachedTaigaClient:
     """Cliente Taiga con cacheo inteligente.
@@ -49,38 +125,94 @@ class CachedTaigaClient:
     Envuelve un TaigaAPIClient y cachea automáticamente las llamadas
     a endpoints de metadatos (filtros, atributos personalizados, módulos).
 
+    Con ``stale_grace`` las entradas se conservan ese margen tras su TTL: una
+    lectura de una entrada obsoleta la devuelve al instante y lanza su
+    revalidación en segundo plano, de modo que nunca se sirven datos con más
+    de un ciclo de refresco de antigüedad. Con ``refresh_ahead`` una entrada
+    leída cuando le quedan menos de esos segundos de TTL (una clave en uso) se
+    refresca antes de expirar. Solo hay una revalidación en vuelo por clave.
+
+    Con ``revalidate_window`` las lecturas se hacen con
+    ``TaigaAPIClient.get_conditional``: cada entrada guarda el ``ETag`` /
+    ``Last-Modified`` de su respuesta y se conserva ese margen tras su TTL. Una lectura en ese margen no
+    sirve la entrada: la revalida con If-None-Match / If-Modified-Since, y si
+    la API responde 304 se renueva el TTL con el valor ya parseado.
+
     Attributes:
         CACHEABLE_ENDPOINTS: Diccionario de endpoints cacheables con sus TTLs.
     """
 
-    # Endpoints cacheables con TTL en segundos
+    # Endpoints cacheables con TTL en segundos. Las escrituras a través de
+    # TaigaAPIClient invalidan estas entradas (ver cache_invalidation), por lo
+    # que el TTL solo acota la obsolescencia por cambios hechos fuera del servidor.
     CACHEABLE_ENDPOINTS: ClassVar[dict[str, int]] = {
-        "epic_filters": 3600,  # 1 hora
-        "issue_filters": 3600,
-        "task_filters": 3600,
-        "userstory_filters": 3600,
-        "project_modules": 1800,  # 30 minutos
-        "epic_custom_attributes": 3600,
-        "issue_custom_attributes": 3600,
-        "task_custom_attributes": 3600,
-        "userstory_custom_attributes": 3600,
+        "epic_filters": 21600,  # 6 horas
+        "issue_filters": 21600,
+        "task_filters": 21600,
+        "userstory_filters": 21600,
+        "project_modules": 21600,
+        "epic_custom_attributes": 21600,
+        "issue_custom_attributes": 21600,
+        "task_custom_attributes": 21600,
+        "userstory_custom_attributes": 21600,
+        "points": 21600,
+        "userstory_statuses": 21600,
+        "task_statuses": 21600,
+        "issue_statuses": 21600,
+        "epic_statuses": 21600,
+        "priorities": 21600,
+        "severities": 21600,
+        "issue_types": 21600,
+        "roles": 21600,
         "project_stats": 600,  # 10 minutos (cambian más frecuentemente)
         "milestone_stats": 600,
     }
 
+    # Configuración del proyecto que se lista con GET <ruta>?project=<id>
+    PROJECT_SETTINGS_ENDPOINTS: ClassVar[dict[str, str]] = {
+        "points": "/points",
+        "userstory_statuses": "/userstory-statuses",
+        "task_statuses": "/task-statuses",
+        "issue_statuses": "/issue-statuses",
+        "epic_statuses": "/epic-statuses",
+        "priorities": "/priorities",
+        "severities": "/severities",
+        "issue_types": "/issue-types",
+        "roles": "/roles",
+    }
+
+    # Revalidaciones en vuelo, compartidas por todas las instancias (los tools
+    # crean un CachedTaigaClient por llamada). Clave: (id del caché, clave).
+    _refreshing: ClassVar[dict[tuple[int, str], "asyncio.Task[None]"]] = {}
+
     def __init__(
         self,
         client: "TaigaAPIClient",
-        cache: MemoryCache | None = None,
+        cache: CacheBackend | None = None,
+        stale_grace: int = 0,
+        refresh_ahead: int = 0,
+        revalidate_window: int = 0,
     ) -> None:
         """Inicializa el cliente cacheado.
 
         Args:
             client: Instancia de TaigaAPIClient a envolver.
             cache: Instancia de MemoryCache. Si es None, crea una nueva.
+            stale_grace: Segundos tras el TTL en los que se sirve la entrada
+                obsoleta mientras se revalida (0 lo desactiva).
+            refresh_ahead: Segundos antes del fin del TTL en los que una lectura
+                lanza el refresco anticipado (0 lo desactiva).
+            revalidate_window: Segundos tras el TTL en los que se conserva una
+                entrada con validadores para revalidarla con un GET
+                condicional (0 desactiva las peticiones condicionales).
         """
         self._client = client
         self._cache = cache or MemoryCache()
+        self._stale_grace = max(0, stale_grace)
+        self._refresh_ahead = max(0, refresh_ahead)
+        self._revalidate_window = max(0, revalidate_window)
+        self._conditional = self._revalidate_window > 0
+        self._logger = get_logger("cached_client")
 
     @property
     def client(self) -> "TaigaAPIClient":
@@ -88,7 +220,7 @@ class CachedTaigaClient:
         return self._client
 
     @property
-    def cache(self) -> MemoryCache:
+    def cache(self) -> CacheBackend:
         """Obtiene la instancia del caché."""
         return self._cache
 
@@ -103,6 +235,163 @@ class CachedTaigaClient:
         """
         return self.CACHEABLE_ENDPOINTS.get(endpoint_type, self._cache.default_ttl)
 
+    @property
+    def principal(self) -> str | None:
+        """Principal autenticado del cliente subyacente, o None sin token."""
+        auth_token = getattr(self._client, "auth_token", None)
+        if isinstance(auth_token, str) and auth_token:
+            return CacheKeyBuilder.principal(auth_token)
+        return None
+
+    async def _cached(
+        self,
+        endpoint_type: str,
+        fetch: Callable[["TaigaAPIClient"], Awaitable[Any]],
+        conditional_get: ConditionalGet | None = None,
+        **key_params: Any,
+    ) -> Any:
+        """Devuelve la entrada cacheada o la recupera con fetch y la guarda.
+
+        La clave incluye el principal del token, de modo que usuarios con
+        permisos distintos no comparten entradas; los tags solo dependen del
+        proyecto, así que una invalidación alcanza a todos los principales.
+
+        Args:
+            endpoint_type: Tipo de endpoint para determinar TTL y tags.
+            fetch: Corrutina que recupera los datos de la API con el cliente
+                que recibe.
+            conditional_get: (endpoint, params) del GET equivalente a fetch;
+                con revalidate_window se usa en su lugar para poder
+                revalidar la entrada con una petición condicional.
+            **key_params: Parámetros que distinguen la entrada (p. ej. project_id).
+
+        Returns:
+            Los datos del caché o de la API.
+        """
+        cache_key = CacheKeyBuilder.build(endpoint_type, principal=self.principal, **key_params)
+        ttl = self.get_ttl(endpoint_type)
+        tags = CacheKeyBuilder.tags(endpoint_type, **key_params)
+        request = _Request(fetch, conditional_get if self._conditional else None, ttl, tags)
+
+        entry = await self._cache.get_entry(cache_key)
+        if entry is not None:
+            if entry.validators and self._past_grace(entry):
+                # Conservada solo para revalidarla: no se sirve sin preguntar a la API
+                return await self._revalidate(cache_key, entry, request, self._client)
+            if self._needs_refresh(entry):
+                self._schedule_refresh(cache_key, entry, request)
+            return entry.value
+
+        result, validators = await self._fetch(None, request, self._client)
+        await self._cache.set(
+            cache_key,
+            result,
+            ttl,
+            tags=tags,
+            grace=self._grace(validators),
+            validators=validators,
+        )
+        return result
+
+    def _grace(self, validators: dict[str, str] | None) -> int:
+        """Margen tras el TTL: gracia obsoleta y, con validadores, ventana de revalidación."""
+        if validators:
+            return max(self._stale_grace, self._revalidate_window)
+        return self._stale_grace
+
+    def _past_grace(self, entry: CacheEntry) -> bool:
+        """Indica si una entrada superó la gracia en la que puede servirse obsoleta."""
+        return datetime.now() > entry.stale_at + timedelta(seconds=self._stale_grace)
+
+    async def _fetch(
+        self, entry: CacheEntry | None, request: _Request, client: "TaigaAPIClient"
+    ) -> tuple[Any, dict[str, str] | None]:
+        """Recupera el valor, con un GET condicional si la entrada tiene validadores.
+
+        Args:
+            entry: Entrada cacheada que se revalida, o None.
+            request: Cómo recuperar la entrada.
+            client: Cliente con el que hacer la petición.
+
+        Returns:
+            Tupla (valor, validadores de la respuesta o None).
+        """
+        if request.conditional_get is None:
+            return await request.fetch(client), None
+        endpoint, params = request.conditional_get
+        validators = entry.validators if entry is not None else None
+        result, new_validators = await client.get_conditional(
+            endpoint, params=params, validators=validators
+        )
+        if validators:
+            self._cache.record_revalidation(not_modified=result is None)
+        if result is None:
+            # 304: la copia cacheada sigue vigente, sin cuerpo que parsear
+            assert entry is not None, "304 Not Modified without a cached entry"
+            result = entry.value
+        return result, new_validators or None
+
+    async def _revalidate(
+        self, cache_key: str, entry: CacheEntry, request: _Request, client: "TaigaAPIClient"
+    ) -> Any:
+        """Recupera el valor y reemplaza la entrada si no se invalidó entretanto."""
+        result, validators = await self._fetch(entry, request, client)
+        await self._cache.set_if_current(
+            cache_key,
+            entry,
+            result,
+            request.ttl,
+            tags=request.tags,
+            grace=self._grace(validators),
+            validators=validators,
+        )
+        return result
+
+    def _needs_refresh(self, entry: CacheEntry) -> bool:
+        """Indica si una entrada servida debe revalidarse en segundo plano."""
+        if entry.is_stale():
+            return True
+        if self._refresh_ahead <= 0:
+            return False
+        return entry.stale_at - datetime.now() <= timedelta(seconds=self._refresh_ahead)
+
+    def _schedule_refresh(self, cache_key: str, entry: CacheEntry, request: _Request) -> None:
+        """Lanza la revalidación de una entrada si no hay otra en vuelo."""
+        refresh_key = (id(self._cache), cache_key)
+        running = self._refreshing.get(refresh_key)
+        loop = asyncio.get_running_loop()
+        if running is not None and not running.done() and running.get_loop() is loop:
+            return
+
+        task = loop.create_task(self._refresh(cache_key, entry, request))
+        self._refreshing[refresh_key] = task
+
+        def _release(done: "asyncio.Task[None]") -> None:
+            if self._refreshing.get(refresh_key) is done:
+                del self._refreshing[refresh_key]
+
+        task.add_done_callback(_release)
+
+    async def _refresh(self, cache_key: str, entry: CacheEntry, request: _Request) -> None:
+        """Revalida una entrada en segundo plano.
+
+        La llamada que la lanzó puede cerrar su cliente antes de que termine,
+        así que la revalidación usa un clon propio (``clone()``) que abre y
+        cierra ella misma. Los clientes sin clone() (dobles de test) se usan
+        tal cual.
+
+        Un fallo se registra y se ignora: la entrada obsoleta se sigue
+        sirviendo hasta que expire su ventana de gracia.
+        """
+        try:
+            if not callable(getattr(type(self._client), "clone", None)):
+                await self._revalidate(cache_key, entry, request, self._client)
+                return
+            async with self._client.clone() as client:
+                await self._revalidate(cache_key, entry, request, client)
+        except Exception as e:
+            self._logger.warning(f"[CACHE] Background refresh failed | key={cache_key} | error={e}")
+
     async def get_cached_or_fetch(
         self,
         endpoint_type: str,
@@ -125,24 +414,13 @@ class CachedTaigaClient:
         Returns:
             Los datos del caché o de la API.
         """
-        # Construir clave de caché
-        cache_key = CacheKeyBuilder.build(endpoint_type, **kwargs)
-
-        # Intentar obtener del caché
-        cached_value = await self._cache.get(cache_key)
-        if cached_value is not None:
-            return cached_value
-
-        # Llamar a la función de fetch
-        result = await fetch_func(*args, **kwargs)
-
-        # Guardar en caché con TTL apropiado
-        ttl = self.get_ttl(endpoint_type)
-        await self._cache.set(cache_key, result, ttl)
-
-        return result
+        return await self._cached(
+            endpoint_type, lambda _client: fetch_func(*args, **kwargs), **kwargs
+        )
 
     # === Métodos de filtros cacheados ===
+    # La clave usa project_id (consistente con tags e invalidación); el
+    # cliente recibe el parámetro 'project' que espera la API.
 
     async def get_epic_filters(self, project_id: int) -> dict[str, Any]:
         """Obtiene filtros de epics (cacheado).
@@ -153,17 +431,13 @@ class CachedTaigaClient:
         Returns:
             Filtros disponibles para epics.
         """
-        # Usamos project_id para consistencia en claves de caché e invalidación
-        # Luego pasamos como 'project' al método del cliente
-        cache_key = CacheKeyBuilder.build("epic_filters", project_id=project_id)
-        cached_value = await self._cache.get(cache_key)
-        if cached_value is not None:
-            return cast("dict[str, Any]", cached_value)
-
-        result = await self._client.get_epic_filters(project=project_id)
-        ttl = self.get_ttl("epic_filters")
-        await self._cache.set(cache_key, result, ttl)
-        return result
+        result = await self._cached(
+            "epic_filters",
+            lambda client: client.get_epic_filters(project=project_id),
+            ("/epics/filters_data", {"project": project_id}),
+            project_id=project_id,
+        )
+        return cast("dict[str, Any]", result)
 
     async def get_issue_filters(self, project_id: int) -> dict[str, Any]:
         """Obtiene filtros de issues (cacheado).
@@ -174,9 +448,10 @@ class CachedTaigaClient:
         Returns:
             Filtros disponibles para issues.
         """
-        result = await self.get_cached_or_fetch(
+        result = await self._cached(
             "issue_filters",
-            self._client.get_issue_filters_data,
+            lambda client: client.get_issue_filters(project=project_id),
+            ("/issues/filters_data", {"project": project_id}),
             project_id=project_id,
         )
         return cast("dict[str, Any]", result)
@@ -190,9 +465,10 @@ class CachedTaigaClient:
         Returns:
             Filtros disponibles para tareas.
         """
-        result = await self.get_cached_or_fetch(
+        result = await self._cached(
             "task_filters",
-            self._client.get_task_filters,
+            lambda client: client.get_task_filters(project=project_id),
+            ("/tasks/filters_data", {"project": project_id}),
             project_id=project_id,
         )
         return cast("dict[str, Any]", result)
@@ -208,16 +484,94 @@ class CachedTaigaClient:
         Returns:
             Lista de atributos personalizados.
         """
-        # Usamos project_id para consistencia en claves de caché e invalidación
-        cache_key = CacheKeyBuilder.build("epic_custom_attributes", project_id=project_id)
-        cached_value = await self._cache.get(cache_key)
-        if cached_value is not None:
-            return cast("list[dict[str, Any]]", cached_value)
-
-        result = await self._client.list_epic_custom_attributes(project=project_id)
-        ttl = self.get_ttl("epic_custom_attributes")
-        await self._cache.set(cache_key, result, ttl)
-        return result
+        result = await self._cached(
+            "epic_custom_attributes",
+            lambda client: client.list_epic_custom_attributes(project=project_id),
+            ("/epic-custom-attributes", {"project": project_id}),
+            project_id=project_id,
+        )
+        return cast("list[dict[str, Any]]", result)
+
+    # === Métodos de proyecto y estadísticas cacheados ===
+
+    async def get_project_modules(self, project_id: int) -> dict[str, Any]:
+        """Obtiene la configuración de módulos de un proyecto (cacheado).
+
+        Args:
+            project_id: ID del proyecto.
+
+        Returns:
+            Configuración de módulos tal como la devuelve la API.
+        """
+        result = await self._cached(
+            "project_modules",
+            lambda client: client.get(f"/projects/{project_id}/modules"),
+            (f"/projects/{project_id}/modules", None),
+            project_id=project_id,
+        )
+        return cast("dict[str, Any]", result)
+
+    async def get_project_stats(self, project_id: int) -> dict[str, Any]:
+        """Obtiene las estadísticas de un proyecto (cacheado).
+
+        Args:
+            project_id: ID del proyecto.
+
+        Returns:
+            Estadísticas del proyecto.
+        """
+        result = await self._cached(
+            "project_stats",
+            lambda client: client.get(f"/projects/{project_id}/stats"),
+            (f"/projects/{project_id}/stats", None),
+            project_id=project_id,
+        )
+        return cast("dict[str, Any]", result)
+
+    async def get_milestone_stats(self, milestone_id: int) -> dict[str, Any]:
+        """Obtiene las estadísticas de un milestone (cacheado).
+
+        Args:
+            milestone_id: ID del milestone.
+
+        Returns:
+            Estadísticas del milestone.
+        """
+        result = await self._cached(
+            "milestone_stats",
+            lambda client: client.get_milestone_stats(milestone_id=milestone_id),
+            (f"/milestones/{milestone_id}/stats", None),
+            milestone_id=milestone_id,
+        )
+        return cast("dict[str, Any]", result)
+
+    # === Configuración del proyecto cacheada ===
+
+    async def list_project_settings(
+        self, endpoint_type: str, project_id: int
+    ) -> list[dict[str, Any]]:
+        """Lista un tipo de configuración del proyecto (cacheado).
+
+        Args:
+            endpoint_type: Clave de PROJECT_SETTINGS_ENDPOINTS (p. ej. 'issue_statuses').
+            project_id: ID del proyecto.
+
+        Returns:
+            Lista de elementos configurados (estados, prioridades, roles...).
+
+        Raises:
+            ValueError: Si endpoint_type no es una configuración de proyecto.
+        """
+        endpoint = self.PROJECT_SETTINGS_ENDPOINTS.get(endpoint_type)
+        if endpoint is None:
+            raise ValueError(f"Unknown project settings endpoint: {endpoint_type}")
+        result = await self._cached(
+            endpoint_type,
+            lambda client: client.get(endpoint, params={"project": project_id}),
+            (endpoint, {"project": project_id}),
+            project_id=project_id,
+        )
+        return cast("list[dict[str, Any]]", result)
 
     # === Métodos de invalidación ===
 
@@ -230,8 +584,7 @@ class CachedTaigaClient:
         Returns:
             Número de entradas invalidadas.
         """
-        pattern = f"project_id={project_id}"
-        return await self._cache.invalidate(pattern)
+        return await self._cache.invalidate_tags(CacheKeyBuilder.project_tag(project_id))
 
     async def invalidate_endpoint_type(self, endpoint_type: str) -> int:
         """Invalida todo el caché de un tipo de endpoint.
@@ -242,7 +595,7 @@ class CachedTaigaClient:
         Returns:
             Número de entradas invalidadas.
         """
-        return await self._cache.invalidate(endpoint_type)
+        return await self._cache.invalidate_tags(CacheKeyBuilder.endpoint_tag(endpoint_type))
 
     async def clear_cache(self) -> int:
         """Limpia todo el caché.
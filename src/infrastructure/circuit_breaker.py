@@ -0,0 +1,269 @@
+"""Circuit breaker por familia de endpoints de la API de Taiga.
+
+Cuando un endpoint se degrada (``/search``, ``/timeline``...), cada llamada
+espera el timeout completo y reintenta con backoff, ocupando conexiones del
+pool que necesitan los endpoints sanos. El breaker de esa familia se abre
+tras varios fallos consecutivos y rechaza las llamadas al instante con
+CircuitOpenError; pasado ``recovery_timeout`` deja pasar una petición de
+prueba (half-open) y, si sale bien, vuelve a cerrarse.
+
+Features:
+- Un breaker por familia (primer segmento de la ruta: ``search``, ``userstories``...)
+- Clasificación de errores transitorios compartida con ErrorHandlingMiddleware
+- Una sola petición de prueba en half-open
+- Estado y contadores por familia para taiga_cache_stats
+"""
+
+import time
+from enum import StrEnum
+from threading import Lock
+from typing import Any
+
+import httpx
+
+from src.domain.exceptions import CircuitOpenError, TaigaAPIError
+
+
+_TRANSIENT_INDICATORS = ("timeout", "connection", "network", "502", "503", "504")
+_TRANSIENT_STATUS = frozenset({502, 503, 504})
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Indica si un error es transitorio (timeouts, red, 502/503/504).
+
+    Args:
+        error: Excepción a clasificar.
+
+    Returns:
+        True si el error puede resolverse reintentando más tarde.
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(
+        error, httpx.TimeoutException | httpx.NetworkError | TimeoutError | ConnectionError
+    ):
+        return True
+    if isinstance(error, TaigaAPIError) and error.status_code in _TRANSIENT_STATUS:
+        return True
+    error_str = str(error).lower()
+    if any(indicator in error_str for indicator in _TRANSIENT_INDICATORS):
+        return True
+    # TaigaAPIError que envuelve un timeout o un error de red
+    return error.__cause__ is not None and is_transient_error(error.__cause__)
+
+
+def counts_as_failure(error: BaseException) -> bool:
+    """Indica si un error cuenta como fallo del endpoint para el breaker.
+
+    Además de los transitorios cuenta cualquier 5xx. Los 4xx (404, 403,
+    401...) indican que el endpoint responde bien.
+    """
+    if (
+        isinstance(error, TaigaAPIError)
+        and error.status_code is not None
+        and error.status_code >= 500
+    ):
+        return True
+    return is_transient_error(error)
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Obtiene la familia de un endpoint (primer segmento de la ruta).
+
+    Example:
+        >>> endpoint_family("/userstories/42/watch")
+        'userstories'
+    """
+    path = endpoint.split("?", 1)[0].strip("/")
+    return path.split("/", 1)[0] or "/"
+
+
+class CircuitState(StrEnum):
+    """Estados del circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker de una familia de endpoints.
+
+    Attributes:
+        family: Familia de endpoints protegida.
+        failure_threshold: Fallos consecutivos que abren el circuito.
+        recovery_timeout: Segundos en abierto antes de probar de nuevo.
+    """
+
+    def __init__(
+        self, family: str, failure_threshold: int = 5, recovery_timeout: float = 30.0
+    ) -> None:
+        """Inicializa el breaker cerrado.
+
+        Args:
+            family: Familia de endpoints protegida.
+            failure_threshold: Fallos consecutivos que abren el circuito.
+            recovery_timeout: Segundos en abierto antes de la petición de prueba.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold debe ser >= 1")
+        self.family = family
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = Lock()
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Estado actual (un circuito abierto pasa a half-open al vencer el plazo)."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> CircuitState:
+        if self._state is CircuitState.OPEN and now - self._opened_at >= self.recovery_timeout:
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    def before_request(self) -> bool:
+        """Comprueba si la petición puede salir.
+
+        Returns:
+            True si la petición ocupa el hueco de prueba del half-open. Quien
+            lo ocupa tiene que pasar ``probe=True`` al registrar el resultado,
+            o llamar a release() si se cancela.
+
+        Raises:
+            CircuitOpenError: Si el circuito está abierto o ya hay una
+                petición de prueba en curso.
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state is CircuitState.CLOSED:
+                return False
+            if state is CircuitState.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self._rejected += 1
+            retry_after = max(0.0, self._opened_at + self.recovery_timeout - now)
+        raise CircuitOpenError(self.family, retry_after)
+
+    def record_success(self, probe: bool = False) -> None:
+        """Registra una respuesta sana: cierra el circuito y reinicia el contador.
+
+        Una petición que salió con el circuito cerrado y responde cuando ya
+        está abierto no lo cierra: eso lo decide la petición de prueba.
+
+        Args:
+            probe: Si la petición ocupaba el hueco de prueba.
+        """
+        with self._lock:
+            if probe:
+                self._probe_in_flight = False
+            elif self._current_state(time.monotonic()) is not CircuitState.CLOSED:
+                return
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+
+    def record_failure(self, probe: bool = False) -> None:
+        """Registra un fallo; abre el circuito al llegar al umbral o si falla la prueba.
+
+        El fallo de una petición que salió antes de abrirse el circuito no
+        lo reabre ni alarga el plazo.
+
+        Args:
+            probe: Si la petición ocupaba el hueco de prueba.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if probe:
+                self._probe_in_flight = False
+            elif self._current_state(now) is not CircuitState.CLOSED:
+                return
+            self._consecutive_failures += 1
+            if probe or self._consecutive_failures >= self.failure_threshold:
+                if self._state is not CircuitState.OPEN:
+                    self._opened += 1
+                self._state = CircuitState.OPEN
+                self._opened_at = now
+
+    def release(self) -> None:
+        """Libera el hueco de prueba sin resultado (la petición de prueba se canceló)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def get_stats(self) -> dict[str, Any]:
+        """Obtiene el estado y los contadores del breaker."""
+        with self._lock:
+            return {
+                "state": self._current_state(time.monotonic()).value,
+                "consecutive_failures": self._consecutive_failures,
+                "times_opened": self._opened,
+                "rejected": self._rejected,
+            }
+
+
+class CircuitBreakerRegistry:
+    """Breakers por familia de endpoints, creados bajo demanda."""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        """Inicializa el registro.
+
+        Args:
+            failure_threshold: Fallos consecutivos que abren cada circuito.
+            recovery_timeout: Segundos en abierto antes de la petición de prueba.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = Lock()
+
+    def for_endpoint(self, endpoint: str) -> CircuitBreaker:
+        """Obtiene (o crea) el breaker de la familia de ``endpoint``."""
+        family = endpoint_family(endpoint)
+        breaker = self._breakers.get(family)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    family,
+                    CircuitBreaker(family, self.failure_threshold, self.recovery_timeout),
+                )
+        return breaker
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Obtiene el estado de cada familia vista hasta ahora."""
+        return {family: breaker.get_stats() for family, breaker in list(self._breakers.items())}
+
+
+# Breakers del proceso: el container registra los configurados en TaigaConfig
+_circuit_breakers: CircuitBreakerRegistry | None = None
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Obtiene el registro de breakers que comparten todos los TaigaAPIClient.
+
+    El estado de cada circuito solo sirve si lo ven todos los clientes. Si el
+    container aún no ha registrado el suyo con set_circuit_breakers(), se crea
+    uno con el umbral y el plazo por defecto.
+    """
+    global _circuit_breakers
+    if _circuit_breakers is None:
+        _circuit_breakers = CircuitBreakerRegistry()
+    return _circuit_breakers
+
+
+def set_circuit_breakers(registry: CircuitBreakerRegistry) -> None:
+    """Registra los breakers del proceso."""
+    global _circuit_breakers
+    _circuit_breakers = registry
+
+
+def reset_circuit_breakers() -> None:
+    """Olvida los breakers del proceso (para tests)."""
+    global _circuit_breakers
+    _circuit_breakers = None
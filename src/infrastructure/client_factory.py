@@ -7,36 +7,58 @@ instancia de cache para maximizar los hits.
 
 Features:
 - Cache global singleton compartido entre todos los tools
-- Factory function para obtener clientes cacheados
+- Pool de sesiones HTTP global compartido (conexiones keep-alive)
+- Factory function para obtener clientes por token sobre el pool
+- Factory functions para obtener clientes cacheados con las opciones de TaigaConfig
 - Funciones de invalidacion para operaciones de escritura
 """
 
 from src.config import TaigaConfig
-from src.infrastructure.cache import MemoryCache
-from src.infrastructure.cached_client import CachedTaigaClient
+from src.infrastructure.cache import CacheBackend, create_memory_cache
+from src.infrastructure.cached_client import CachedTaigaClient, CacheKeyBuilder
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.taiga_client import TaigaAPIClient
 
 
 # Cache global compartido - singleton
-_global_cache: MemoryCache | None = None
+_global_cache: CacheBackend | None = None
 
+# Pool de sesiones HTTP global compartido - singleton
+_global_session_pool: HTTPSessionPool | None = None
 
-def get_global_cache() -> MemoryCache:
+
+def get_global_cache() -> CacheBackend:
     """
     Obtiene la instancia global del cache.
 
-    La instancia se crea de forma lazy la primera vez que se llama.
-    Todas las llamadas subsecuentes retornan la misma instancia.
+    La instancia se crea de forma lazy la primera vez que se llama, con la
+    configuracion por defecto, salvo que el container haya registrado la
+    suya con set_global_cache(). Todas las llamadas subsecuentes retornan
+    la misma instancia.
 
     Returns:
-        MemoryCache: Instancia singleton del cache.
+        CacheBackend: Instancia singleton del cache.
     """
     global _global_cache
     if _global_cache is None:
-        _global_cache = MemoryCache(default_ttl=3600, max_size=1000)
+        _global_cache = create_memory_cache(default_ttl=3600, max_size=1000)
     return _global_cache
 
 
+def set_global_cache(cache: CacheBackend) -> None:
+    """
+    Establece el cache global.
+
+    Permite que el container registre el cache configurado en TaigaConfig
+    para que tools, clientes y tools de cache lean e invaliden uno solo.
+
+    Args:
+        cache: Cache a usar globalmente.
+    """
+    global _global_cache
+    _global_cache = cache
+
+
 def reset_global_cache() -> None:
     """
     Reinicia la instancia global del cache.
@@ -47,23 +69,128 @@ def reset_global_cache() -> None:
     _global_cache = None
 
 
-def get_taiga_client(auth_token: str | None = None) -> TaigaAPIClient:
+def get_global_session_pool() -> HTTPSessionPool:
+    """
+    Obtiene la instancia global del pool de sesiones HTTP.
+
+    La instancia se crea de forma lazy la primera vez que se llama, con la
+    URL y el timeout de TaigaConfig. Los clientes creados sobre el pool
+    reutilizan sus conexiones keep-alive en lugar de abrir una conexion
+    TCP + TLS nueva en cada llamada.
+
+    Returns:
+        HTTPSessionPool: Instancia singleton del pool.
+    """
+    global _global_session_pool
+    if _global_session_pool is None:
+        config = TaigaConfig()
+        _global_session_pool = HTTPSessionPool(
+            base_url=config.taiga_api_url,
+            timeout=config.timeout,
+            max_connections=100,
+            max_keepalive=20,
+            http2=config.http2,
+            warmup_connections=config.http_warmup_connections,
+            keepalive_interval=config.http_keepalive_interval,
+            keepalive_expiry=config.http_keepalive_expiry,
+        )
+    return _global_session_pool
+
+
+def set_global_session_pool(pool: HTTPSessionPool) -> None:
+    """
+    Establece el pool de sesiones HTTP global.
+
+    Permite que el container registre su pool singleton para que las
+    factories de este modulo compartan las mismas conexiones.
+
+    Args:
+        pool: Pool de sesiones HTTP a usar globalmente.
+    """
+    global _global_session_pool
+    _global_session_pool = pool
+
+
+def reset_global_session_pool() -> None:
+    """
+    Reinicia la instancia global del pool de sesiones HTTP.
+
+    No cierra el pool anterior; util principalmente para tests.
+    """
+    global _global_session_pool
+    _global_session_pool = None
+
+
+def create_taiga_client(
+    config: TaigaConfig,
+    auth_token: str | None = None,
+    session_pool: HTTPSessionPool | None = None,
+) -> TaigaAPIClient:
     """
-    Crea un cliente Taiga sin cache (para compatibilidad hacia atras).
+    Crea un cliente Taiga sin cache para un token sobre un pool de sesiones.
+
+    Es el proveedor que usan tools y resources en cada llamada: el cliente
+    solo guarda el token y las conexiones keep-alive son las del pool.
 
     Args:
+        config: Configuracion de Taiga.
         auth_token: Token de autenticacion opcional.
+        session_pool: Pool de sesiones HTTP. Si es None, usa el pool global.
 
     Returns:
-        TaigaAPIClient: Cliente sin cache.
+        TaigaAPIClient: Cliente sin cache sobre el pool.
     """
-    config = TaigaConfig()
-    client = TaigaAPIClient(config)
+    client = TaigaAPIClient(config, session_pool=session_pool or get_global_session_pool())
     if auth_token:
         client.auth_token = auth_token
     return client
 
 
+def create_cached_client(
+    config: TaigaConfig,
+    client: TaigaAPIClient,
+    cache: CacheBackend | None = None,
+) -> CachedTaigaClient:
+    """
+    Envuelve un cliente Taiga con el cache de metadatos.
+
+    Es el proveedor que usan tools y resources para las lecturas cacheadas:
+    la gracia stale-while-revalidate, el refresco anticipado y la ventana de
+    revalidacion condicional salen de TaigaConfig, validados al arrancar.
+
+    Args:
+        config: Configuracion de Taiga.
+        client: Cliente sin cache a envolver.
+        cache: Cache a usar. Si es None, CachedTaigaClient crea uno propio.
+
+    Returns:
+        CachedTaigaClient: Cliente cacheado con las opciones de la configuracion.
+    """
+    return CachedTaigaClient(
+        client,
+        cache=cache,
+        stale_grace=config.cache_stale_grace,
+        refresh_ahead=config.cache_refresh_ahead,
+        revalidate_window=config.cache_revalidate_window,
+    )
+
+
+def get_taiga_client(auth_token: str | None = None) -> TaigaAPIClient:
+    """
+    Crea un cliente Taiga sin cache para un token.
+
+    El cliente es ligero: solo guarda el token y delega las conexiones
+    en el pool de sesiones HTTP global.
+
+    Args:
+        auth_token: Token de autenticacion opcional.
+
+    Returns:
+        TaigaAPIClient: Cliente sin cache sobre el pool compartido.
+    """
+    return create_taiga_client(TaigaConfig(), auth_token)
+
+
 def get_cached_taiga_client(auth_token: str | None = None) -> CachedTaigaClient:
     """
     Crea un cliente Taiga con cache.
@@ -78,10 +205,9 @@ def get_cached_taiga_client(auth_token: str | None = None) -> CachedTaigaClient:
         CachedTaigaClient: Cliente configurado con cache global.
     """
     config = TaigaConfig()
-    base_client = TaigaAPIClient(config)
-    if auth_token:
-        base_client.auth_token = auth_token
-    return CachedTaigaClient(base_client, cache=get_global_cache())
+    return create_cached_client(
+        config, create_taiga_client(config, auth_token), cache=get_global_cache()
+    )
 
 
 async def invalidate_project_cache(project_id: int) -> int:
@@ -89,7 +215,8 @@ async def invalidate_project_cache(project_id: int) -> int:
     Invalida cache relacionado con un proyecto.
 
     Debe llamarse despues de operaciones de escritura que afecten
-    datos del proyecto (create, update, delete).
+    datos del proyecto (create, update, delete). Usa el tag ``project:<id>``,
+    por lo que solo invalida las entradas de ese proyecto exacto.
 
     Args:
         project_id: ID del proyecto a invalidar.
@@ -98,7 +225,7 @@ async def invalidate_project_cache(project_id: int) -> int:
         int: Numero de entradas invalidadas.
     """
     cache = get_global_cache()
-    return await cache.invalidate(f"project_id={project_id}")
+    return await cache.invalidate_tags(CacheKeyBuilder.project_tag(project_id))
 
 
 async def invalidate_cache_by_pattern(pattern: str) -> int:
@@ -45,6 +45,11 @@ class TaigaConfig(BaseSettings):
         alias="TAIGA_MAX_RETRIES",
         description="Maximum number of retries for failed requests",
     )
+    http2: bool = Field(
+        default=False,
+        alias="TAIGA_HTTP2",
+        description="Multiplex concurrent requests over HTTP/2 (requires the 'h2' package)",
+    )
 
     # MCP Server settings
     server_name: str = Field(
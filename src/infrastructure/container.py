@@ -4,6 +4,8 @@ Este módulo implementa el container de inyección de dependencias usando
 dependency-injector para gestionar todas las dependencias de la aplicación.
 """
 
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from typing import Any
 
 from dependency_injector import containers, providers
@@ -35,11 +37,21 @@ from src.application.use_cases import (
     WikiUseCases,
 )
 from src.config import ServerConfig, TaigaConfig
-from src.infrastructure.cache import MemoryCache
+from src.infrastructure.adaptive_rate_limiter import AdaptiveRateLimiter, set_rate_limiter
+from src.infrastructure.cache import CacheBackend, create_memory_cache
 from src.infrastructure.cached_client import CachedTaigaClient
+from src.infrastructure.circuit_breaker import CircuitBreakerRegistry, set_circuit_breakers
+from src.infrastructure.client_factory import set_global_cache, set_global_session_pool
+from src.infrastructure.hedging import HedgingPolicy, set_hedging_policy
 from src.infrastructure.http_session_pool import HTTPSessionPool
+from src.infrastructure.json_codec import (
+    create_json_codec,
+    serialize_tool_result,
+    set_json_codec,
+)
 from src.infrastructure.logging import LoggingConfig, setup_logging
 from src.infrastructure.metrics import MetricsCollector
+from src.infrastructure.negative_cache import NegativeCache, set_negative_cache
 from src.infrastructure.repositories.epic_repository_impl import EpicRepositoryImpl
 from src.infrastructure.repositories.issue_repository_impl import IssueRepositoryImpl
 from src.infrastructure.repositories.member_repository_impl import MemberRepositoryImpl
@@ -48,6 +60,7 @@ from src.infrastructure.repositories.project_repository_impl import ProjectRepos
 from src.infrastructure.repositories.task_repository_impl import TaskRepositoryImpl
 from src.infrastructure.repositories.user_story_repository_impl import UserStoryRepositoryImpl
 from src.infrastructure.repositories.wiki_repository_impl import WikiRepositoryImpl
+from src.infrastructure.retry import RetryBudget, set_retry_budget
 from src.taiga_client import TaigaAPIClient
 
 
@@ -66,8 +79,20 @@ class _Container(containers.DeclarativeContainer):
     # Logging configuration (Singleton)
     logging_config = providers.Singleton(LoggingConfig)
 
-    # FastMCP instance (Singleton)
-    mcp = providers.Singleton(FastMCP, name="taiga-mcp-server")
+    # Lifespan del servidor MCP (ApplicationContainer lo sustituye por su lifespan,
+    # que inicia y precalienta el pool de sesiones)
+    mcp_lifespan: providers.Object[Callable[..., AbstractAsyncContextManager[Any]] | None] = (
+        providers.Object(None)
+    )
+
+    # FastMCP instance (Singleton - los resultados de los tools se serializan con
+    # el codec JSON global: orjson/msgspec si están instalados)
+    mcp = providers.Singleton(
+        FastMCP,
+        name="taiga-mcp-server",
+        lifespan=mcp_lifespan,
+        tool_serializer=serialize_tool_result,
+    )
 
     # HTTP Session Pool (Singleton - reutiliza conexiones HTTP)
     http_session_pool = providers.Singleton(
@@ -76,6 +101,48 @@ class _Container(containers.DeclarativeContainer):
         timeout=config.provided.timeout,
         max_connections=100,
         max_keepalive=20,
+        http2=config.provided.http2,
+        warmup_connections=config.provided.http_warmup_connections,
+        keepalive_interval=config.provided.http_keepalive_interval,
+        keepalive_expiry=config.provided.http_keepalive_expiry,
+    )
+
+    # Servicios compartidos por todos los TaigaAPIClient. Los tools crean un cliente
+    # por llamada, así que register_shared_services() los registra como globales
+    json_codec = providers.Singleton(create_json_codec, backend=config.provided.json_backend)
+    retry_budget = providers.Singleton(RetryBudget, ratio=config.provided.retry_budget_ratio)
+    rate_limiter = providers.Singleton(
+        AdaptiveRateLimiter, max_rate=config.provided.http_rate_limit_rps
+    )
+    circuit_breakers = providers.Singleton(
+        CircuitBreakerRegistry,
+        failure_threshold=config.provided.circuit_failure_threshold,
+        recovery_timeout=config.provided.circuit_recovery_timeout,
+    )
+    hedging_policy = providers.Singleton(
+        HedgingPolicy,
+        enabled=config.provided.hedge_requests,
+        budget_ratio=config.provided.hedge_budget_ratio,
+    )
+    negative_cache = providers.Singleton(
+        NegativeCache,
+        ttl=config.provided.negative_cache_ttl,
+        max_size=config.provided.negative_cache_max_size,
+    )
+
+    # Memory Cache (Singleton - register_shared_services() lo registra como el caché de
+    # client_factory.get_global_cache, para que tools, clientes y tools de caché lean e
+    # invaliden un único caché)
+    memory_cache = providers.Singleton(
+        create_memory_cache,
+        default_ttl=3600,
+        max_size=1000,
+        max_bytes=config.provided.cache_max_bytes,
+        shards=config.provided.cache_shards,
+        directory=config.provided.cache_dir,
+        disk_max_size=config.provided.cache_disk_max_size,
+        shared=config.provided.cache_shared,
+        sync_interval=config.provided.cache_sync_interval,
     )
 
     # Cliente Taiga (Factory porque cada request puede necesitar su instancia)
@@ -83,13 +150,12 @@ class _Container(containers.DeclarativeContainer):
         TaigaAPIClient,
         config=config,
         session_pool=http_session_pool,
-    )
-
-    # Memory Cache (Singleton - una sola instancia compartida)
-    memory_cache = providers.Singleton(
-        MemoryCache,
-        default_ttl=3600,  # 1 hora por defecto
-        max_size=1000,
+        cache=memory_cache,  # Invalidado en cada escritura
+        retry_budget=retry_budget,
+        rate_limiter=rate_limiter,
+        circuit_breakers=circuit_breakers,
+        hedging=hedging_policy,
+        negative_cache=negative_cache,
     )
 
     # Metrics Collector (Singleton - recolector de métricas thread-safe)
@@ -123,34 +189,46 @@ class _Container(containers.DeclarativeContainer):
     wiki_use_cases = providers.Singleton(WikiUseCases, repository=wiki_repository)
 
     # Tools (Singleton)
-    auth_tools = providers.Singleton(AuthTools, mcp=mcp)
+    auth_tools = providers.Singleton(AuthTools, mcp=mcp, session_pool=http_session_pool)
 
     cache_tools = providers.Singleton(CacheTools, mcp=mcp)
 
-    epic_tools = providers.Singleton(EpicTools, mcp=mcp)
+    epic_tools = providers.Singleton(
+        EpicTools, mcp=mcp, session_pool=http_session_pool, cache=memory_cache
+    )
 
-    project_tools = providers.Singleton(ProjectTools, mcp=mcp)
+    project_tools = providers.Singleton(
+        ProjectTools, mcp=mcp, session_pool=http_session_pool, cache=memory_cache
+    )
 
-    userstory_tools = providers.Singleton(UserStoryTools, mcp=mcp)
+    userstory_tools = providers.Singleton(UserStoryTools, mcp=mcp, session_pool=http_session_pool)
 
-    issue_tools = providers.Singleton(IssueTools, mcp=mcp)
+    issue_tools = providers.Singleton(
+        IssueTools, mcp=mcp, session_pool=http_session_pool, cache=memory_cache
+    )
 
-    milestone_tools = providers.Singleton(MilestoneTools, mcp=mcp)
+    milestone_tools = providers.Singleton(
+        MilestoneTools, mcp=mcp, session_pool=http_session_pool, cache=memory_cache
+    )
 
-    task_tools = providers.Singleton(TaskTools, mcp=mcp)
+    task_tools = providers.Singleton(TaskTools, mcp=mcp, session_pool=http_session_pool)
 
-    membership_tools = providers.Singleton(MembershipTools, mcp=mcp)
+    membership_tools = providers.Singleton(MembershipTools, mcp=mcp, session_pool=http_session_pool)
 
-    webhook_tools = providers.Singleton(WebhookTools, mcp=mcp)
+    webhook_tools = providers.Singleton(WebhookTools, mcp=mcp, session_pool=http_session_pool)
 
-    wiki_tools = providers.Singleton(WikiTools, mcp=mcp)
+    wiki_tools = providers.Singleton(WikiTools, mcp=mcp, session_pool=http_session_pool)
 
-    settings_tools = providers.Singleton(SettingsTools, mcp=mcp)
+    settings_tools = providers.Singleton(
+        SettingsTools, mcp=mcp, session_pool=http_session_pool, cache=memory_cache
+    )
 
-    search_tools = providers.Singleton(SearchTools, mcp=mcp)
+    search_tools = providers.Singleton(SearchTools, mcp=mcp, session_pool=http_session_pool)
 
     # MCP Resources (Singleton)
-    taiga_resources = providers.Singleton(TaigaResources, mcp=mcp)
+    taiga_resources = providers.Singleton(
+        TaigaResources, mcp=mcp, session_pool=http_session_pool, cache=memory_cache
+    )
 
     # MCP Prompts (Singleton)
     taiga_prompts = providers.Singleton(TaigaPrompts, mcp=mcp)
@@ -167,6 +245,11 @@ class ApplicationContainer:
         server_config: Configuración del servidor MCP
         mcp: Instancia de FastMCP
         http_session_pool: Pool de sesiones HTTP reutilizables
+        retry_budget: Presupuesto de reintentos compartido
+        rate_limiter: Limitador HTTP adaptativo compartido
+        circuit_breakers: Circuit breakers por familia de endpoints
+        hedging_policy: Política de peticiones GET con cobertura
+        negative_cache: Caché negativo de respuestas 404 y 403
         memory_cache: Caché en memoria con TTL
         metrics_collector: Recolector de métricas thread-safe
         taiga_client: Cliente de la API de Taiga
@@ -202,6 +285,7 @@ class ApplicationContainer:
     def __init__(self) -> None:
         """Inicializa el container de aplicación."""
         self._container = _Container()
+        self._container.mcp_lifespan.override(self.lifespan)
         # Setup logging on container initialization
         logging_config = self._container.logging_config()
         setup_logging(logging_config)
@@ -210,8 +294,28 @@ class ApplicationContainer:
         """Delega los atributos al container interno."""
         return getattr(self._container, name)
 
+    def register_shared_services(self) -> None:
+        """Registra como globales del proceso los servicios configurados en TaigaConfig.
+
+        Los tools construyen un TaigaAPIClient por llamada sin pasarle estos
+        servicios, por lo que el cliente los toma de get_retry_budget(),
+        get_rate_limiter()... Registrarlos aquí hace que esos accesos devuelvan
+        las instancias del container.
+        """
+        set_json_codec(self._container.json_codec())
+        set_retry_budget(self._container.retry_budget())
+        set_rate_limiter(self._container.rate_limiter())
+        set_circuit_breakers(self._container.circuit_breakers())
+        set_hedging_policy(self._container.hedging_policy())
+        set_negative_cache(self._container.negative_cache())
+        set_global_cache(self._container.memory_cache())
+
     def register_all_tools(self) -> None:
-        """Registra todas las herramientas, recursos y prompts en el servidor MCP."""
+        """Registra todas las herramientas, recursos y prompts en el servidor MCP.
+
+        Antes registra los servicios compartidos, que los tools usan en cada llamada.
+        """
+        self.register_shared_services()
         # Register tools
         self._container.auth_tools().register_tools()
         self._container.cache_tools().register_tools()
@@ -235,12 +339,18 @@ class ApplicationContainer:
         self._container.taiga_prompts().register_prompts()
 
     async def start_session_pool(self) -> None:
-        """Inicia el pool de sesiones HTTP.
+        """Inicia el pool de sesiones HTTP y lo precalienta.
 
         Debe llamarse antes de realizar peticiones a la API de Taiga.
+        Registra además el pool como pool global para que las factories de
+        ``client_factory`` compartan las mismas conexiones que los tools, y
+        abre ``TAIGA_HTTP_WARMUP_CONNECTIONS`` conexiones keep-alive para que
+        la primera llamada no pague DNS + TCP + TLS.
         """
         pool: HTTPSessionPool = self._container.http_session_pool()
+        set_global_session_pool(pool)
         await pool.start()
+        await pool.warm_up()
 
     async def stop_session_pool(self) -> None:
         """Detiene el pool de sesiones HTTP.
@@ -250,6 +360,21 @@ class ApplicationContainer:
         pool: HTTPSessionPool = self._container.http_session_pool()
         await pool.stop()
 
+    @asynccontextmanager
+    async def lifespan(self, _server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+        """Lifespan de FastMCP: inicia el pool al arrancar y lo cierra al terminar.
+
+        Se ejecuta en el event loop del servidor, que es donde viven las
+        conexiones precalentadas y la tarea de keep-alive. Al terminar también
+        persiste las escrituras pendientes del caché en disco, si lo hay.
+        """
+        await self.start_session_pool()
+        try:
+            yield {}
+        finally:
+            await self.stop_session_pool()
+            await self.get_memory_cache().flush()
+
     def get_session_pool(self) -> HTTPSessionPool:
         """Obtiene la instancia del pool de sesiones HTTP.
 
@@ -258,11 +383,21 @@ class ApplicationContainer:
         """
         return self._container.http_session_pool()
 
-    def get_memory_cache(self) -> MemoryCache:
+    def get_session_pool_stats(self) -> dict[str, Any]:
+        """Obtiene las estadísticas de conexiones del pool de sesiones HTTP.
+
+        Returns:
+            dict: Conexiones activas/ociosas, peticiones esperando conexión,
+            histogramas de espera y de conexión, y ratio de reutilización.
+        """
+        pool: HTTPSessionPool = self._container.http_session_pool()
+        return pool.get_stats()
+
+    def get_memory_cache(self) -> CacheBackend:
         """Obtiene la instancia del caché en memoria.
 
         Returns:
-            MemoryCache: El caché en memoria singleton.
+            CacheBackend: El caché en memoria singleton.
         """
         return self._container.memory_cache()
 
@@ -0,0 +1,813 @@
+"""Segundo nivel de caché persistente en disco (SQLite).
+
+Los servidores MCP se reinician en cada despliegue y el MemoryCache arranca
+vacío, así que todas las sesiones vuelven a pedir a Taiga filtros, atributos
+personalizados y estados. Con ``TAIGA_CACHE_DIR`` el caché en memoria se
+respalda con un segundo nivel en disco que sobrevive al reinicio:
+
+- DiskCache: base de datos SQLite (``taiga-cache.sqlite3``) con el valor
+  serializado con el codec JSON, sus expiraciones, tags y validadores
+- Lectura a través (read-through): un fallo en memoria consulta el disco y
+  promociona la entrada, de modo que un proceso recién arrancado sirve
+  metadatos en milisegundos
+- Escritura diferida (write-behind): set() solo anota la entrada y una tarea
+  en segundo plano persiste el lote en una única transacción
+- Límite de entradas en disco con evicción de expiradas y después LRU
+- Invalidaciones (por clave, patrón, tag o total) aplicadas en ambos niveles
+- Registro opcional de invalidaciones (``broadcast``) para que otros procesos
+  que comparten el fichero las apliquen a su memoria (ver shared_cache.py)
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from src.infrastructure.cache import CacheBackend, CacheEntry, CacheMetrics, MemoryCache
+from src.infrastructure.json_codec import JSONCodec, get_json_codec
+
+
+DB_FILENAME = "taiga-cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    fresh_until REAL,
+    tags TEXT NOT NULL,
+    validators TEXT,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS entry_tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+);
+CREATE INDEX IF NOT EXISTS entry_tags_key ON entry_tags (key);
+CREATE TABLE IF NOT EXISTS invalidations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    origin TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    args TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+# Segundos que se conservan las invalidaciones registradas para otros procesos
+INVALIDATION_RETENTION = 3600
+
+Operation = Callable[[sqlite3.Connection], int]
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Invalidation:
+    """Invalidación registrada por un proceso para el resto.
+
+    Attributes:
+        kind: ``keys``, ``pattern``, ``tags`` o ``clear``.
+        args: Claves, patrón o tags invalidados (vacío para ``clear``).
+    """
+
+    kind: str
+    args: tuple[str, ...] = ()
+
+    def matches(self, key: str, tags: frozenset[str]) -> bool:
+        """Indica si la invalidación alcanza a una entrada."""
+        if self.kind == "keys":
+            return key in self.args
+        if self.kind == "pattern":
+            return any(pattern in key for pattern in self.args)
+        if self.kind == "tags":
+            return not tags.isdisjoint(self.args)
+        return self.kind == "clear"
+
+
+@dataclass
+class DiskCacheMetrics:
+    """Contadores del nivel en disco.
+
+    Attributes:
+        hits: Lecturas tras un fallo en memoria que encontraron la entrada.
+        misses: Lecturas tras un fallo en memoria sin entrada vigente.
+        writes: Entradas persistidas.
+        evictions: Entradas eliminadas por expiración o por el límite de tamaño.
+        skipped: Entradas no persistidas por no ser serializables a JSON.
+        errors: Errores de SQLite (el caché en memoria sigue funcionando).
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    skipped: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializa las métricas para get_stats()."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "skipped": self.skipped,
+            "errors": self.errors,
+        }
+
+
+class DiskCache:
+    """Almacén de entradas del caché en un fichero SQLite.
+
+    Las consultas se ejecutan en un hilo (``asyncio.to_thread``) sobre una
+    única conexión protegida por un lock. Las escrituras se acumulan en un
+    buffer y se persisten en lote ``flush_delay`` segundos después de la
+    primera; las lecturas consultan antes el buffer para no devolver una
+    versión anterior a una escritura aún no persistida.
+
+    Example:
+        >>> disk = DiskCache("/var/cache/taiga-mcp", max_size=10000)
+        >>> disk.put("project_modules:project_id=1", entry)
+        >>> await disk.flush()
+        >>> entry = await disk.get("project_modules:project_id=1")
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_size: int = 10000,
+        flush_delay: float = 0.5,
+        codec: JSONCodec | None = None,
+        broadcast: bool = False,
+    ) -> None:
+        """Inicializa el almacén (la base de datos se abre en el primer uso).
+
+        Args:
+            directory: Directorio donde se crea la base de datos.
+            max_size: Número máximo de entradas en disco.
+            flush_delay: Segundos que se acumulan escrituras antes de persistirlas.
+            codec: Codec JSON para serializar los valores. Si es None, usa el global.
+            broadcast: Si se registran las invalidaciones para otros procesos y
+                se leen las suyas (ver poll_invalidations()).
+
+        Raises:
+            ValueError: Si max_size no es mayor a 0.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size debe ser mayor a 0")
+        self.path = Path(directory) / DB_FILENAME
+        self.max_size = max_size
+        self.flush_delay = flush_delay
+        self.broadcast = broadcast
+        # Identifica las invalidaciones propias en el registro compartido
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._codec = codec or get_json_codec()
+        self._conn: sqlite3.Connection | None = None
+        self._db_lock = Lock()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+        # Escrituras pendientes y en curso: clave -> entrada (None = borrado)
+        self._pending: dict[str, CacheEntry | None] = {}
+        self._inflight: dict[str, CacheEntry | None] = {}
+        # Última invalidación leída del registro e invalidaciones aún no entregadas
+        self._last_invalidation = self._opened_at_invalidation = 0
+        self._received: list[Invalidation] = []
+        self._metrics = DiskCacheMetrics()
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Obtiene una entrada vigente del buffer o del disco.
+
+        Args:
+            key: Clave de la entrada.
+
+        Returns:
+            La entrada si existe y no ha expirado, None en caso contrario.
+        """
+        entry = await self._lookup(key)
+        if entry is None:
+            self._metrics.misses += 1
+            return None
+        self._metrics.hits += 1
+        return entry
+
+    async def contains(self, key: str) -> bool:
+        """Verifica si hay una entrada fresca para la clave (sin actualizar métricas)."""
+        entry = await self._lookup(key)
+        return entry is not None and not entry.is_stale()
+
+    async def _lookup(self, key: str) -> CacheEntry | None:
+        """Busca la entrada en las escrituras pendientes y, si no está, en disco."""
+        for buffer in (self._pending, self._inflight):
+            if key in buffer:
+                entry = buffer[key]
+                break
+        else:
+            try:
+                entry = await asyncio.to_thread(self._read, key)
+            except (sqlite3.Error, ValueError) as e:
+                self._record_error("read", e)
+                entry = None
+        if entry is None or entry.is_expired():
+            return None
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Anota una entrada para persistirla en el próximo lote."""
+        self._pending[key] = entry
+        self._schedule_flush()
+
+    async def delete(self, key: str) -> bool:
+        """Elimina una entrada del disco.
+
+        Returns:
+            True si la entrada existía en disco o estaba pendiente de escribirse.
+        """
+        pending = self._pending.get(key) is not None
+        deleted = await self._apply(
+            lambda conn: self._invalidate_where(conn, Invalidation("keys", (key,)), "key = ?", key)
+        )
+        return pending or deleted > 0
+
+    async def invalidate(self, pattern: str) -> int:
+        """Elimina las entradas cuya clave contiene el patrón.
+
+        Returns:
+            Número de entradas eliminadas del disco.
+        """
+        return await self._apply(
+            lambda conn: self._invalidate_where(
+                conn, Invalidation("pattern", (pattern,)), "instr(key, ?) > 0", pattern
+            )
+        )
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Elimina las entradas registradas bajo cualquiera de los tags.
+
+        Returns:
+            Número de entradas eliminadas del disco.
+        """
+        tags = list(tags)
+        if not tags:
+            return 0
+        placeholders = ",".join("?" * len(tags))
+        return await self._apply(
+            lambda conn: self._invalidate_where(
+                conn,
+                Invalidation("tags", tuple(tags)),
+                f"key IN (SELECT key FROM entry_tags WHERE tag IN ({placeholders}))",
+                *tags,
+            )
+        )
+
+    async def clear(self) -> int:
+        """Elimina todas las entradas del disco.
+
+        Returns:
+            Número de entradas eliminadas.
+        """
+        return await self._apply(
+            lambda conn: self._invalidate_where(conn, Invalidation("clear"), "1")
+        )
+
+    async def evict_expired(self) -> int:
+        """Elimina las entradas expiradas del disco.
+
+        Returns:
+            Número de entradas eliminadas.
+        """
+        return await self._apply(self._evict_expired)
+
+    async def flush(self) -> int:
+        """Persiste las escrituras pendientes en una única transacción.
+
+        Returns:
+            Número de escrituras y borrados persistidos.
+        """
+        if not self._pending:
+            return 0
+        count = len(self._pending)
+        await self._apply()
+        return count
+
+    def open(self) -> None:
+        """Abre la base de datos ahora en lugar de en el primer uso.
+
+        Las invalidaciones de otros procesos se leen a partir de la apertura:
+        quien necesite todas las posteriores a su arranque debe abrirla al crearse.
+        """
+        with self._db_lock:
+            self._connection()
+
+    async def poll_invalidations(self) -> list[Invalidation]:
+        """Obtiene las invalidaciones registradas por otros procesos desde la última lectura.
+
+        Solo se registran con ``broadcast``; sin él devuelve siempre una lista vacía.
+
+        Returns:
+            Invalidaciones en el orden en que se registraron.
+        """
+        if not self.broadcast:
+            return []
+        try:
+            received = await asyncio.to_thread(self._poll)
+        except (sqlite3.Error, ValueError) as e:
+            self._record_error("poll", e)
+            return []
+        # Las escrituras pendientes que alcanzan no deben llegar al disco
+        for key, entry in list(self._pending.items()):
+            if entry is not None and any(inv.matches(key, entry.tags) for inv in received):
+                self._pending[key] = None
+        return received
+
+    async def close(self) -> None:
+        """Persiste lo pendiente y cierra la base de datos."""
+        await self.flush()
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Obtiene estadísticas del nivel en disco.
+
+        Returns:
+            Diccionario con la ruta, el número de entradas, el límite, las
+            escrituras pendientes y las métricas.
+        """
+        try:
+            size = await asyncio.to_thread(self._count)
+        except sqlite3.Error as e:
+            self._record_error("stats", e)
+            size = None
+        return {
+            "path": str(self.path),
+            "size": size,
+            "max_size": self.max_size,
+            "pending_writes": len(self._pending),
+            "broadcast": self.broadcast,
+            **self._metrics.to_dict(),
+        }
+
+    def get_metrics(self) -> DiskCacheMetrics:
+        """Obtiene los contadores actuales."""
+        return self._metrics
+
+    def reset_metrics(self) -> None:
+        """Reinicia los contadores a cero."""
+        self._metrics = DiskCacheMetrics()
+
+    def _schedule_flush(self) -> None:
+        """Lanza la persistencia diferida si no hay una programada en este loop."""
+        loop = asyncio.get_running_loop()
+        task = self._flush_task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """Espera ``flush_delay`` para acumular escrituras y las persiste."""
+        while self._pending:
+            await asyncio.sleep(self.flush_delay)
+            await self.flush()
+
+    async def _apply(self, operation: Operation | None = None) -> int:
+        """Persiste el buffer y después aplica ``operation`` en la misma transacción.
+
+        El lock mantiene el orden de los lotes; mientras uno se escribe sus
+        entradas siguen visibles para get() a través de ``_inflight``.
+
+        Returns:
+            El resultado de ``operation`` (0 si no se indicó o si SQLite falló).
+        """
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            self._inflight = batch
+            # Las invalidaciones posteriores a este punto pueden alcanzar al lote
+            since = self._last_invalidation
+            try:
+                return await asyncio.to_thread(self._write, batch, operation, since)
+            except sqlite3.Error as e:
+                self._record_error("write", e)
+                return 0
+            finally:
+                self._inflight = {}
+
+    def _record_error(self, action: str, error: Exception) -> None:
+        """Registra un error de SQLite sin interrumpir el caché en memoria."""
+        self._metrics.errors += 1
+        _logger.warning("Disk cache %s failed (%s): %s", action, self.path, error)
+
+    # Métodos síncronos: se ejecutan en un hilo con la conexión bajo _db_lock
+
+    def _connection(self) -> sqlite3.Connection:
+        """Abre la base de datos en el primer uso (con ``_db_lock`` adquirido)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            # Transacciones explícitas (ver _transaction); timeout: espera al lock de otro proceso
+            conn = sqlite3.connect(
+                self.path, check_same_thread=False, timeout=5.0, isolation_level=None
+            )
+            # WAL: las lecturas no bloquean a las escrituras; NORMAL evita un fsync por commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            # Las invalidaciones anteriores al arranque no afectan a una memoria vacía
+            self._opened_at_invalidation = self._last_invalidation = conn.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM invalidations"
+            ).fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    @contextmanager
+    def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+        """Transacción que toma el lock de escritura al empezar.
+
+        Con ``BEGIN IMMEDIATE`` una transacción que lee antes de escribir no
+        falla si otro proceso escribe entretanto: espera su turno.
+        """
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _read(self, key: str) -> CacheEntry | None:
+        """Lee una entrada vigente y actualiza su último acceso."""
+        with self._db_lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, expires_at, fresh_until, tags, validators "
+                "FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at, fresh_until, tags, validators = row
+            now = time.time()
+            with self._transaction(conn):
+                if expires_at <= now:
+                    self._delete_where(conn, "key = ?", key)
+                    self._metrics.evictions += 1
+                    return None
+                conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return CacheEntry(
+            value=self._codec.loads(value),
+            expires_at=datetime.fromtimestamp(expires_at),
+            tags=frozenset(self._codec.loads(tags)),
+            fresh_until=datetime.fromtimestamp(fresh_until) if fresh_until is not None else None,
+            validators=self._codec.loads(validators) if validators is not None else None,
+        )
+
+    def _write(
+        self,
+        batch: dict[str, CacheEntry | None],
+        operation: Operation | None,
+        since: int,
+    ) -> int:
+        """Aplica un lote de escrituras, ``operation`` y el límite de tamaño."""
+        rows: dict[str, tuple[Any, ...]] = {}
+        for key, entry in batch.items():
+            if entry is None:
+                continue
+            try:
+                rows[key] = self._encode(key, entry)
+            except (TypeError, ValueError):
+                # Valor no serializable: solo vive en memoria
+                batch[key] = None
+                self._metrics.skipped += 1
+
+        with self._db_lock:
+            conn = self._connection()
+            with self._transaction(conn):
+                if self.broadcast:
+                    self._discard_invalidated(conn, batch, rows, since)
+                keys = [(key,) for key in batch]
+                conn.executemany("DELETE FROM entries WHERE key = ?", keys)
+                conn.executemany("DELETE FROM entry_tags WHERE key = ?", keys)
+                conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)", rows.values())
+                conn.executemany(
+                    "INSERT INTO entry_tags (tag, key) VALUES (?, ?)",
+                    [(tag, key) for key, entry in batch.items() if entry for tag in entry.tags],
+                )
+                self._metrics.writes += len(rows)
+                result = operation(conn) if operation is not None else 0
+                self._enforce_max_size(conn)
+        return result
+
+    def _discard_invalidated(
+        self,
+        conn: sqlite3.Connection,
+        batch: dict[str, CacheEntry | None],
+        rows: dict[str, tuple[Any, ...]],
+        since: int,
+    ) -> None:
+        """Descarta del lote las entradas que otro proceso invalidó después de leerlas.
+
+        El valor pudo recuperarse de la API antes de la invalidación: escribirlo
+        ahora resucitaría datos anteriores a la escritura que la provocó.
+        """
+        invalidations = self._poll_with(conn, since)
+        if not invalidations:
+            return
+        for key, entry in batch.items():
+            if entry is not None and any(inv.matches(key, entry.tags) for inv in invalidations):
+                batch[key] = None
+                rows.pop(key, None)
+
+    def _encode(self, key: str, entry: CacheEntry) -> tuple[Any, ...]:
+        """Serializa una entrada como fila de ``entries``."""
+        return (
+            key,
+            self._codec.dumps(entry.value),
+            entry.expires_at.timestamp(),
+            entry.fresh_until.timestamp() if entry.fresh_until is not None else None,
+            self._codec.dumps(sorted(entry.tags)).decode(),
+            self._codec.dumps(entry.validators).decode() if entry.validators else None,
+            time.time(),
+        )
+
+    def _enforce_max_size(self, conn: sqlite3.Connection) -> None:
+        """Elimina expiradas y, si aún se supera max_size, las de acceso más antiguo."""
+        excess = self._count_with(conn) - self.max_size
+        if excess <= 0:
+            return
+        excess -= self._evict_expired(conn)
+        if excess > 0:
+            self._metrics.evictions += self._delete_where(
+                conn,
+                "key IN (SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+                excess,
+            )
+
+    def _invalidate_where(
+        self, conn: sqlite3.Connection, invalidation: Invalidation, condition: str, *params: Any
+    ) -> int:
+        """Elimina las entradas que cumplen la condición y registra la invalidación."""
+        deleted = self._delete_where(conn, condition, *params)
+        if self.broadcast:
+            now = time.time()
+            conn.execute(
+                "INSERT INTO invalidations (origin, kind, args, created_at) VALUES (?, ?, ?, ?)",
+                (
+                    self.origin,
+                    invalidation.kind,
+                    self._codec.dumps(list(invalidation.args)).decode(),
+                    now,
+                ),
+            )
+            conn.execute(
+                "DELETE FROM invalidations WHERE created_at < ?", (now - INVALIDATION_RETENTION,)
+            )
+        return deleted
+
+    def _poll(self) -> list[Invalidation]:
+        """Lee las invalidaciones nuevas y entrega las acumuladas en ``_received``."""
+        with self._db_lock:
+            self._poll_with(self._connection())
+            received, self._received = self._received, []
+        return received
+
+    def _poll_with(self, conn: sqlite3.Connection, since: int | None = None) -> list[Invalidation]:
+        """Lee las invalidaciones de otros procesos posteriores a ``since``.
+
+        Las que aún no se habían leído se dejan en ``_received`` para
+        poll_invalidations().
+
+        Args:
+            conn: Conexión abierta.
+            since: ID a partir del que leer (por defecto, la última leída).
+
+        Returns:
+            Invalidaciones posteriores a ``since``.
+        """
+        last = self._last_invalidation
+        since = last if since is None else max(since, self._opened_at_invalidation)
+        rows = conn.execute(
+            "SELECT id, kind, args FROM invalidations WHERE id > ? AND origin != ? ORDER BY id",
+            (since, self.origin),
+        ).fetchall()
+        invalidations = []
+        for row_id, kind, args in rows:
+            invalidation = Invalidation(kind, tuple(self._codec.loads(args)))
+            invalidations.append(invalidation)
+            if row_id > last:
+                self._received.append(invalidation)
+                self._last_invalidation = row_id
+        return invalidations
+
+    def _evict_expired(self, conn: sqlite3.Connection) -> int:
+        """Elimina las entradas expiradas y las cuenta como evicciones."""
+        evicted = self._delete_where(conn, "expires_at <= ?", time.time())
+        self._metrics.evictions += evicted
+        return evicted
+
+    @staticmethod
+    def _delete_where(conn: sqlite3.Connection, condition: str, *params: Any) -> int:
+        """Elimina las entradas que cumplen la condición junto con sus tags."""
+        keys = conn.execute(f"SELECT key FROM entries WHERE {condition}", params).fetchall()
+        conn.executemany("DELETE FROM entries WHERE key = ?", keys)
+        conn.executemany("DELETE FROM entry_tags WHERE key = ?", keys)
+        return len(keys)
+
+    def _count(self) -> int:
+        """Número de entradas en disco."""
+        with self._db_lock:
+            return self._count_with(self._connection())
+
+    @staticmethod
+    def _count_with(conn: sqlite3.Connection) -> int:
+        """Número de entradas en disco con una conexión ya abierta."""
+        return int(conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+
+class TieredCache(MemoryCache):
+    """Caché en memoria (L1) respaldado por un DiskCache (L2).
+
+    Tiene la misma interfaz que MemoryCache. Los fallos en memoria se leen
+    del disco y la entrada se promociona a memoria con sus expiraciones
+    originales; las escrituras se guardan en memoria y se persisten de forma
+    diferida. Las métricas (hits, misses...) son las del nivel en memoria;
+    las del disco se informan en ``get_stats()["disk"]``.
+
+    Example:
+        >>> cache = TieredCache(MemoryCache(max_size=1000), DiskCache("/var/cache/taiga-mcp"))
+        >>> await cache.set("project_modules:project_id=1", modules, ttl=3600)
+    """
+
+    def __init__(self, memory: CacheBackend, disk: DiskCache) -> None:
+        """Inicializa el caché de dos niveles.
+
+        Args:
+            memory: Nivel en memoria (MemoryCache o ShardedMemoryCache).
+            disk: Nivel persistente.
+        """
+        super().__init__(
+            default_ttl=memory.default_ttl, max_size=memory.max_size, max_bytes=memory.max_bytes
+        )
+        self.memory = memory
+        self.disk = disk
+
+    async def get(self, key: str) -> Any | None:
+        """Obtiene el valor fresco de memoria o, si falla, del disco.
+
+        Como en MemoryCache, una entrada obsoleta leída del disco se
+        promociona a memoria pero no se devuelve: solo get_entry() la sirve.
+        """
+        value = await self.memory.get(key)
+        if value is not None:
+            return value
+        entry = await self._read_through(key)
+        return entry.value if entry is not None and not entry.is_stale() else None
+
+    async def get_entry(self, key: str) -> CacheEntry | None:
+        """Obtiene la entrada completa de memoria o, si falla, del disco."""
+        entry = await self.memory.get_entry(key)
+        if entry is not None:
+            return entry
+        return await self._read_through(key)
+
+    async def _read_through(self, key: str) -> CacheEntry | None:
+        """Lee la entrada del disco y la promociona a memoria."""
+        entry = await self.disk.get(key)
+        if entry is None:
+            return None
+        await self.memory.restore(key, entry)
+        # Si otra corrutina guardó la clave mientras se leía el disco, gana la suya
+        return self.memory.peek(key) or entry
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+        grace: int = 0,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """Guarda el valor en memoria y anota su persistencia en disco."""
+        await self.memory.set(key, value, ttl, tags, grace, validators)
+        self._write_behind(key)
+
+    async def set_if_current(
+        self,
+        key: str,
+        current: CacheEntry,
+        value: Any,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+        grace: int = 0,
+        validators: dict[str, str] | None = None,
+    ) -> bool:
+        """Reemplaza la entrada en memoria si sigue siendo la misma y la persiste."""
+        replaced = await self.memory.set_if_current(
+            key, current, value, ttl, tags, grace, validators
+        )
+        if replaced:
+            self._write_behind(key)
+        return replaced
+
+    async def restore(self, key: str, entry: CacheEntry) -> bool:
+        """Inserta una entrada en memoria conservando sus expiraciones y la persiste."""
+        restored = await self.memory.restore(key, entry)
+        if restored:
+            self._write_behind(key)
+        return restored
+
+    def _write_behind(self, key: str) -> None:
+        """Anota la entrada vigente en memoria para persistirla."""
+        entry = self.memory.peek(key)
+        if entry is not None:
+            self.disk.put(key, entry)
+
+    def peek(self, key: str) -> CacheEntry | None:
+        """Obtiene la entrada en memoria sin actualizar métricas ni el orden LRU."""
+        return self.memory.peek(key)
+
+    async def delete(self, key: str) -> bool:
+        """Elimina la entrada de ambos niveles.
+
+        Returns:
+            True si la entrada existía en memoria o en disco.
+        """
+        in_memory = await self.memory.delete(key)
+        return await self.disk.delete(key) or in_memory
+
+    async def invalidate(self, pattern: str) -> int:
+        """Invalida en ambos niveles las claves que contengan el patrón.
+
+        Returns:
+            Entradas invalidadas (el mayor recuento de los dos niveles).
+        """
+        in_memory = await self.memory.invalidate(pattern)
+        return max(in_memory, await self.disk.invalidate(pattern))
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Invalida los tags en ambos niveles.
+
+        Returns:
+            Entradas invalidadas (el mayor recuento de los dos niveles).
+        """
+        in_memory = await self.memory.invalidate_tags(*tags)
+        return max(in_memory, await self.disk.invalidate_tags(tags))
+
+    async def clear(self) -> int:
+        """Limpia ambos niveles.
+
+        Returns:
+            Entradas eliminadas (el mayor recuento de los dos niveles).
+        """
+        in_memory = await self.memory.clear()
+        return max(in_memory, await self.disk.clear())
+
+    async def evict_expired(self) -> int:
+        """Elimina las entradas expiradas de ambos niveles.
+
+        Returns:
+            Entradas eliminadas de memoria.
+        """
+        await self.disk.evict_expired()
+        return await self.memory.evict_expired()
+
+    async def flush(self) -> int:
+        """Persiste las escrituras pendientes en disco."""
+        return await self.disk.flush()
+
+    def get_metrics(self) -> CacheMetrics:
+        """Obtiene las métricas del nivel en memoria."""
+        return self.memory.get_metrics()
+
+    def reset_metrics(self) -> None:
+        """Reinicia las métricas de ambos niveles."""
+        self.memory.reset_metrics()
+        self.disk.reset_metrics()
+
+    def record_revalidation(self, not_modified: bool) -> None:
+        """Registra el resultado de una petición condicional."""
+        self.memory.record_revalidation(not_modified)
+
+    async def size(self) -> int:
+        """Obtiene el número de entradas en memoria."""
+        return await self.memory.size()
+
+    async def contains(self, key: str) -> bool:
+        """Verifica si la clave está fresca en memoria o en disco (sin actualizar métricas)."""
+        return await self.memory.contains(key) or await self.disk.contains(key)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Obtiene las estadísticas de memoria con las del disco en ``disk``."""
+        return {**await self.memory.get_stats(), "disk": await self.disk.get_stats()}
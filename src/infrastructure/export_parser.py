@@ -0,0 +1,183 @@
+"""Lectura incremental de exports de proyecto de Taiga.
+
+Un export (``GET /exporter/{id}``) es un único objeto JSON cuyas claves de
+primer nivel son datos del proyecto (``name``, ``slug``...) y listas con
+todas sus entidades (``user_stories``, ``issues``, ``tasks``, ``wiki_pages``...).
+En proyectos grandes ocupa cientos de MB, así que ``json.load`` no es una
+opción para sacar estadísticas.
+
+Este módulo recorre el fichero por bloques y decodifica un elemento cada
+vez con ``json.JSONDecoder.raw_decode``: la memoria depende del elemento
+más grande, no del tamaño del export. Acepta ficheros comprimidos con gzip.
+
+Features:
+- iter_export(): pares (sección, elemento) sin cargar el fichero entero
+- summarize_export(): nombre, slug y número de elementos por sección
+"""
+
+import gzip
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+_GZIP_MAGIC = b"\x1f\x8b"
+_SUMMARY_FIELDS = ("name", "slug", "description", "is_private", "created_date")
+
+# Marca el inicio de una sección de tipo lista (puede no tener elementos)
+_LIST_START = object()
+
+
+class _ChunkReader:
+    """Buffer deslizante sobre un fichero de texto leído por bloques."""
+
+    def __init__(self, stream: IO[str], chunk_size: int) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int | None = None) -> bool:
+        """Añade un bloque al buffer descartando lo ya consumido."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Devuelve el siguiente carácter significativo sin consumirlo."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume ``char`` o lanza ValueError si el siguiente carácter es otro."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid export: expected {char!r}, found {found!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decodifica el siguiente valor JSON completo."""
+        self.peek()
+        # Cada reintento vuelve a decodificar desde el principio del valor:
+        # duplicar el bloque mantiene lineal el coste de los elementos grandes
+        size = self._chunk_size
+        while True:
+            try:
+                result, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                size *= 2
+                if self._fill(size):
+                    continue
+                raise
+            # Un número cortado por el bloque ("12" de "12.5") también se decodifica:
+            # solo es completo si le sigue un delimitador
+            complete = end < len(self._buffer) and self._buffer[end] in _DELIMITERS
+            if not complete and self._fill(size):
+                continue
+            self._pos = end
+            return result
+
+
+def _open(path: Path) -> IO[str]:
+    with path.open("rb") as raw:
+        compressed = raw.read(2) == _GZIP_MAGIC
+    if compressed:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open(encoding="utf-8")
+
+
+def _walk(path: Path, chunk_size: int) -> Iterator[tuple[str, Any]]:
+    """Produce los pares de primer nivel; las listas van precedidas de _LIST_START."""
+    with _open(path) as stream:
+        reader = _ChunkReader(stream, chunk_size)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            if reader.peek() == "[":
+                reader.expect("[")
+                yield key, _LIST_START
+                if reader.peek() == "]":
+                    reader.expect("]")
+                else:
+                    while True:
+                        yield key, reader.value()
+                        if reader.peek() == "]":
+                            reader.expect("]")
+                            break
+                        reader.expect(",")
+            else:
+                yield key, reader.value()
+            if reader.peek() == "}":
+                return
+            reader.expect(",")
+
+
+def iter_export(
+    path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[str, Any]]:
+    """Recorre un export de proyecto sin cargarlo entero en memoria.
+
+    Args:
+        path: Ruta del export (JSON plano o comprimido con gzip).
+        chunk_size: Caracteres leídos del fichero en cada bloque.
+
+    Yields:
+        ``(clave, valor)`` por cada campo de primer nivel. Los campos que son
+        listas se expanden: un par por elemento.
+
+    Raises:
+        ValueError: Si el fichero no es un objeto JSON válido.
+    """
+    for key, value in _walk(Path(path), chunk_size):
+        if value is not _LIST_START:
+            yield key, value
+
+
+def summarize_export(path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict[str, Any]:
+    """Calcula estadísticas de un export recorriéndolo de forma incremental.
+
+    Args:
+        path: Ruta del export (JSON plano o comprimido con gzip).
+        chunk_size: Caracteres leídos del fichero en cada bloque.
+
+    Returns:
+        Campos descriptivos del proyecto, número de elementos por sección
+        (``counts``) y tamaño del fichero en bytes.
+
+    Raises:
+        ValueError: Si el fichero no es un objeto JSON válido.
+    """
+    export_path = Path(path)
+    summary: dict[str, Any] = {}
+    counts: dict[str, int] = {}
+    for key, value in _walk(export_path, chunk_size):
+        if value is _LIST_START:
+            counts[key] = 0
+        elif key in counts:
+            counts[key] += 1
+        elif key in _SUMMARY_FIELDS:
+            summary[key] = value
+    summary["counts"] = counts
+    summary["size_bytes"] = export_path.stat().st_size
+    return summary
@@ -0,0 +1,245 @@
+"""Peticiones GET con cobertura (hedged requests) para recortar la latencia de cola.
+
+La p99 de lecturas como ``GET /userstories/{id}`` la marcan los workers de
+Taiga que ocasionalmente tardan mucho, no la mediana. Con la cobertura
+activada, si una GET no ha respondido pasado el p95 observado de su
+endpoint se envía una segunda petición idéntica, se usa la primera
+respuesta que llegue y se cancela la otra.
+
+Features:
+- Retardo por endpoint a partir del p95 de EndpointMetricsStore (rutas con
+  IDs normalizados: ``/userstories/{id}``)
+- Presupuesto de coberturas (RetryBudget): como mucho ``budget_ratio`` de
+  peticiones adicionales de forma sostenida
+- Desactivado por defecto (``TAIGA_HEDGE_REQUESTS=true`` en TaigaConfig)
+"""
+
+import asyncio
+import re
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from src.infrastructure.logging.performance import EndpointMetricsStore, get_performance_logger
+from src.infrastructure.retry import RetryBudget
+
+
+T = TypeVar("T")
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Normaliza un endpoint sustituyendo los IDs numéricos.
+
+    Example:
+        >>> endpoint_template("/userstories/42?project=1")
+        '/userstories/{id}'
+    """
+    return _ID_SEGMENT.sub("/{id}", endpoint.split("?", 1)[0])
+
+
+@dataclass
+class HedgingMetrics:
+    """Contadores de la política de cobertura.
+
+    Attributes:
+        requests: GETs que pasaron por la política.
+        hedged: Peticiones de cobertura enviadas.
+        hedge_wins: Respuestas servidas por la petición de cobertura.
+        rejected: Coberturas descartadas por falta de presupuesto.
+    """
+
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    rejected: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializa las métricas para get_stats()."""
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "rejected": self.rejected,
+        }
+
+
+class HedgingPolicy:
+    """Política de cobertura para GETs idempotentes.
+
+    Example:
+        >>> policy = HedgingPolicy(enabled=True)
+        >>> response = await policy.run("/userstories/42", lambda: client.get(...))
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        metrics_store: EndpointMetricsStore | None = None,
+        quantile: float = 95.0,
+        min_samples: int = 20,
+        min_delay: float = 0.01,
+        budget_ratio: float = 0.05,
+        budget_reserve: float = 5.0,
+    ) -> None:
+        """Inicializa la política.
+
+        Args:
+            enabled: Si se envían peticiones de cobertura.
+            metrics_store: Almacén de latencias por endpoint. Si es None, usa
+                el del PerformanceLogger global.
+            quantile: Percentil de latencia tras el que se envía la cobertura.
+            min_samples: Muestras necesarias antes de cubrir un endpoint.
+            min_delay: Retardo mínimo en segundos antes de cubrir.
+            budget_ratio: Coberturas permitidas por petición (0.05 = ≤ 5%).
+            budget_reserve: Coberturas disponibles antes de acumular ``ratio``.
+        """
+        if not 0 < quantile < 100:
+            raise ValueError("quantile debe estar entre 0 y 100")
+        self.enabled = enabled
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self._store = metrics_store or get_performance_logger().metrics_store
+        self._budget = RetryBudget(ratio=budget_ratio, reserve=budget_reserve)
+        self._metrics = HedgingMetrics()
+
+    def delay_for(self, endpoint: str) -> float | None:
+        """Segundos de espera antes de cubrir una GET, o None si aún no hay datos.
+
+        Args:
+            endpoint: Endpoint de la petición (con IDs y query).
+        """
+        p95 = self._store.percentile(
+            f"GET {endpoint_template(endpoint)}", self.quantile, self.min_samples
+        )
+        if p95 is None:
+            return None
+        return max(self.min_delay, p95 / 1000)
+
+    async def run(
+        self,
+        endpoint: str,
+        send: Callable[[], Awaitable[T]],
+        before_hedge: Callable[[], Awaitable[None]] | None = None,
+    ) -> T:
+        """Envía una GET y, si tarda más que el p95, una segunda idéntica.
+
+        Devuelve la primera respuesta que llegue sin error; la otra petición
+        se cancela. Si todas fallan se propaga el error de la última en terminar.
+        La latencia observada alimenta el p95 del endpoint.
+
+        Args:
+            endpoint: Endpoint de la petición (con IDs y query).
+            send: Corrutina sin argumentos que envía la petición.
+            before_hedge: Espera previa a la cobertura (p. ej. el turno del
+                limitador de peticiones).
+
+        Returns:
+            El resultado de la petición que respondió primero.
+        """
+        key = f"GET {endpoint_template(endpoint)}"
+        self._metrics.requests += 1
+        self._budget.record_request()
+        delay = self.delay_for(endpoint)
+
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(send())
+        tasks: list[asyncio.Future[T]] = [primary]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    await self._hedge(tasks, send, before_hedge)
+            winner = await self._first_success(tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # Recupera el error del perdedor para no registrarlo
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        if winner.exception() is not None:
+            self._store.record(key, duration_ms, success=False)
+            return winner.result()
+        if winner is not primary:
+            self._metrics.hedge_wins += 1
+        self._store.record(key, duration_ms, success=True)
+        return winner.result()
+
+    async def _hedge(
+        self,
+        tasks: "list[asyncio.Future[T]]",
+        send: Callable[[], Awaitable[T]],
+        before_hedge: Callable[[], Awaitable[None]] | None,
+    ) -> None:
+        """Añade la petición de cobertura si el presupuesto lo permite."""
+        if not self._budget.try_acquire():
+            self._metrics.rejected += 1
+            return
+        if before_hedge is not None:
+            await before_hedge()
+        if not tasks[0].done():
+            tasks.append(asyncio.ensure_future(send()))
+            self._metrics.hedged += 1
+
+    @staticmethod
+    async def _first_success(tasks: "Sequence[asyncio.Future[T]]") -> "asyncio.Future[T]":
+        """Espera a la primera tarea sin error (o a la última si todas fallan)."""
+        pending = set(tasks)
+        while True:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Con varias terminadas a la vez se prefiere la primera enviada
+            for task in tasks:
+                if task in done and task.exception() is None:
+                    return task
+            if not pending:
+                return next(task for task in tasks if task in done)
+
+    def get_metrics(self) -> HedgingMetrics:
+        """Obtiene los contadores actuales."""
+        return self._metrics
+
+    def get_stats(self) -> dict[str, Any]:
+        """Obtiene estadísticas de la política.
+
+        Returns:
+            Diccionario con la configuración, el presupuesto y las métricas.
+        """
+        return {
+            "enabled": self.enabled,
+            "quantile": self.quantile,
+            "budget_tokens": self._budget.get_stats()["tokens"],
+            **self._metrics.to_dict(),
+        }
+
+
+# Política del proceso: el container registra la configurada en TaigaConfig
+_hedging_policy: HedgingPolicy | None = None
+
+
+def get_hedging_policy() -> HedgingPolicy:
+    """Obtiene la política de cobertura que comparten todos los TaigaAPIClient.
+
+    Si el container aún no ha registrado la suya con set_hedging_policy(), se
+    crea una desactivada.
+    """
+    global _hedging_policy
+    if _hedging_policy is None:
+        _hedging_policy = HedgingPolicy()
+    return _hedging_policy
+
+
+def set_hedging_policy(policy: HedgingPolicy) -> None:
+    """Registra la política de cobertura del proceso."""
+    global _hedging_policy
+    _hedging_policy = policy
+
+
+def reset_hedging_policy() -> None:
+    """Olvida la política de cobertura del proceso (para tests)."""
+    global _hedging_policy
+    _hedging_policy = None
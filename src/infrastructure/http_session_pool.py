@@ -2,8 +2,21 @@
 
 Este módulo implementa un pool de conexiones HTTP usando httpx.AsyncClient
 con soporte para keep-alive y límites configurables de conexiones.
+
+Opcionalmente usa HTTP/2 (requiere el paquete ``h2``): las peticiones
+concurrentes se multiplexan como streams sobre unas pocas conexiones en
+lugar de abrir un socket por petición.
+
+El pool puede precalentarse (``warm_up``) abriendo varias conexiones
+keep-alive al arrancar el servidor, de modo que la primera llamada a un
+tool no pague DNS + TCP + TLS, y mantenerlas vivas con una petición ligera
+periódica para que el balanceador no las cierre por inactividad.
 """
 
+import asyncio
+import bisect
+import contextlib
+import importlib.util
 import logging
 import time
 from collections.abc import AsyncIterator
@@ -15,6 +28,173 @@ import httpx
 from src.infrastructure.logging.performance import PerformanceLogger, get_performance_logger
 
 
+# Extensión que marca las peticiones propias del pool (precalentamiento y
+# keep-alive) para que no cuenten en las estadísticas de get_stats()
+POOL_TRAFFIC_EXTENSION = "taiga_mcp.pool_traffic"
+
+
+class LatencyHistogram:
+    """Histograma de latencias con buckets fijos en milisegundos.
+
+    Attributes:
+        count: Observaciones registradas.
+        total_ms: Suma de las latencias observadas.
+        max_ms: Mayor latencia observada.
+    """
+
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self) -> None:
+        """Inicializa el histograma vacío."""
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._buckets = [0] * (len(self.BUCKETS_MS) + 1)
+
+    def observe(self, duration_ms: float) -> None:
+        """Registra una latencia en su bucket."""
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self._buckets[bisect.bisect_left(self.BUCKETS_MS, duration_ms)] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializa el histograma (buckets no acumulados: ``<=5ms`` excluye ``<=1ms``)."""
+        labels = [f"<={bound}ms" for bound in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "buckets": dict(zip(labels, self._buckets, strict=True)),
+        }
+
+
+class _TrackedTransport(httpx.AsyncBaseTransport):
+    """Transporte que cuenta las peticiones en vuelo y la versión HTTP usada.
+
+    Envuelve el AsyncHTTPTransport del pool para que las estadísticas cubran
+    todo el tráfico del cliente compartido, no solo HTTPSessionPool.request().
+    Una petición cuenta como stream activo desde que envía sus cabeceras por
+    una conexión (evento ``trace`` de httpcore) hasta que recibe la respuesta;
+    las que esperan una conexión libre solo cuentan como en vuelo.
+
+    Con los mismos eventos mide cuánto espera cada petición a obtener una
+    conexión (hasta que abre una nueva o envía sus cabeceras por una
+    existente), cuánto tardan las conexiones nuevas en establecerse y cuántas
+    peticiones reutilizan una conexión del pool.
+
+    Las peticiones marcadas con ``POOL_TRAFFIC_EXTENSION`` se delegan sin
+    contarlas: el tráfico de precalentamiento y keep-alive no debe inflar la
+    reutilización ni las esperas que ven los tools.
+    """
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport) -> None:
+        """Inicializa los contadores sobre el transporte real.
+
+        Args:
+            transport: Transporte httpx que realiza las peticiones.
+        """
+        self._transport = transport
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.active_streams = 0
+        self.peak_streams_per_connection = 0.0
+        self.requests_by_http_version: dict[str, int] = {}
+        self.pending = 0
+        self.peak_pending = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.acquire_wait = LatencyHistogram()
+        self.connect_time = LatencyHistogram()
+
+    @property
+    def open_connections(self) -> int:
+        """Número de conexiones abiertas en el pool de httpcore."""
+        pool = getattr(self._transport, "_pool", None)
+        return len(getattr(pool, "connections", ()))
+
+    @property
+    def idle_connections(self) -> int:
+        """Número de conexiones abiertas sin peticiones en curso."""
+        pool = getattr(self._transport, "_pool", None)
+        return sum(1 for connection in getattr(pool, "connections", ()) if connection.is_idle())
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fracción de peticiones servidas por una conexión ya abierta."""
+        total = self.new_connections + self.reused_connections
+        return self.reused_connections / total if total else 0.0
+
+    @property
+    def streams_per_connection(self) -> float:
+        """Streams activos por conexión abierta."""
+        return self.active_streams / max(1, self.open_connections)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Delega la petición registrando la concurrencia y la versión HTTP."""
+        if request.extensions.get(POOL_TRAFFIC_EXTENSION):
+            return await self._transport.handle_async_request(request)
+
+        sent = False
+        acquired = False
+        connect_started: float | None = None
+        started = time.perf_counter()
+        user_trace = request.extensions.get("trace")
+
+        def acquire(now: float) -> None:
+            nonlocal acquired
+            acquired = True
+            self.pending -= 1
+            self.acquire_wait.observe((now - started) * 1000)
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal sent, connect_started
+            now = time.perf_counter()
+            if event_name.startswith("connection.connect_") and event_name.endswith(".started"):
+                # Sin conexión libre: la petición abre una nueva
+                if not acquired:
+                    acquire(now)
+                connect_started = now
+            if not sent and event_name.endswith(".send_request_headers.started"):
+                sent = True
+                if connect_started is None:
+                    self.reused_connections += 1
+                else:
+                    self.new_connections += 1
+                    self.connect_time.observe((now - connect_started) * 1000)
+                if not acquired:
+                    acquire(now)
+                self.active_streams += 1
+                self.peak_streams_per_connection = max(
+                    self.peak_streams_per_connection, self.streams_per_connection
+                )
+            if user_trace is not None:
+                await user_trace(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        try:
+            response = await self._transport.handle_async_request(request)
+            version = response.extensions.get("http_version", b"HTTP/1.1").decode()
+            self.requests_by_http_version[version] = (
+                self.requests_by_http_version.get(version, 0) + 1
+            )
+            return response
+        finally:
+            self.in_flight -= 1
+            if not acquired:
+                self.pending -= 1
+            if sent:
+                self.active_streams -= 1
+
+    async def aclose(self) -> None:
+        """Cierra el transporte real."""
+        await self._transport.aclose()
+
+
 class HTTPSessionPool:
     """Pool de sesiones HTTP con keep-alive y límites configurables.
 
@@ -27,6 +207,9 @@ class HTTPSessionPool:
         timeout: Timeout en segundos para las peticiones.
         max_connections: Número máximo de conexiones en el pool.
         max_keepalive: Número máximo de conexiones keep-alive.
+        http2: Si se solicitó HTTP/2. Con una URL ``https://`` se negocia por
+            ALPN (con vuelta a HTTP/1.1 si el servidor no lo admite); con una
+            URL ``http://`` se usa HTTP/2 sin TLS (h2c) directamente.
 
     Example:
         >>> pool = HTTPSessionPool(
@@ -48,6 +231,10 @@ class HTTPSessionPool:
         max_connections: int = 100,
         max_keepalive: int = 20,
         perf_logger: PerformanceLogger | None = None,
+        http2: bool = False,
+        warmup_connections: int = 0,
+        keepalive_interval: float = 0.0,
+        keepalive_expiry: float = 5.0,
     ) -> None:
         """Inicializa el pool de sesiones HTTP.
 
@@ -57,12 +244,27 @@ class HTTPSessionPool:
             max_connections: Número máximo de conexiones permitidas (default: 100).
             max_keepalive: Número máximo de conexiones keep-alive (default: 20).
             perf_logger: Logger de performance. Si es None, usa el global.
+            http2: Multiplexar las peticiones sobre HTTP/2 (default: False).
+                Si el paquete ``h2`` no está instalado se usa HTTP/1.1.
+            warmup_connections: Conexiones que abre warm_up() y que la tarea
+                de keep-alive mantiene abiertas (default: 0).
+            keepalive_interval: Segundos entre peticiones de keep-alive a las
+                conexiones ociosas; 0 desactiva la tarea (default: 0).
+            keepalive_expiry: Segundos que una conexión ociosa se conserva en
+                el pool antes de cerrarla (default: 5.0, el de httpx).
         """
         self.base_url = base_url
         self.timeout = timeout
         self.max_connections = max_connections
         self.max_keepalive = max_keepalive
+        self.http2 = http2
+        self.warmup_connections = warmup_connections
+        self.keepalive_interval = keepalive_interval
+        self.keepalive_expiry = keepalive_expiry
         self._client: httpx.AsyncClient | None = None
+        self._transport: _TrackedTransport | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._keepalive_task: asyncio.Task[None] | None = None
         self._logger = logging.getLogger(__name__)
         self._perf_logger = perf_logger or get_performance_logger()
 
@@ -79,7 +281,8 @@ class HTTPSessionPool:
         """Inicializa el pool de conexiones.
 
         Crea un httpx.AsyncClient configurado con los límites de conexión
-        y timeout especificados. Si el pool ya está iniciado, no hace nada.
+        y timeout especificados y, si ``keepalive_interval`` > 0, lanza la
+        tarea de keep-alive. Si el pool ya está iniciado, no hace nada.
 
         Example:
             >>> pool = HTTPSessionPool("https://api.example.com")
@@ -87,27 +290,53 @@ class HTTPSessionPool:
             >>> assert pool.is_started
         """
         if self._client is None:
+            http2 = self._http2_available()
             self._logger.debug(
-                "Starting HTTP session pool for %s with max_connections=%d, max_keepalive=%d",
+                "Starting HTTP session pool for %s with max_connections=%d, max_keepalive=%d, http2=%s",
                 self.base_url,
                 self.max_connections,
                 self.max_keepalive,
+                http2,
+            )
+            self._transport = _TrackedTransport(
+                httpx.AsyncHTTPTransport(
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_keepalive,
+                        keepalive_expiry=self.keepalive_expiry,
+                    ),
+                    http2=http2,
+                    # Sin TLS no hay ALPN: h2c solo es posible con conocimiento previo
+                    http1=not (http2 and self.base_url.startswith("http://")),
+                )
             )
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 timeout=httpx.Timeout(self.timeout),
-                limits=httpx.Limits(
-                    max_connections=self.max_connections,
-                    max_keepalive_connections=self.max_keepalive,
-                ),
+                transport=self._transport,
                 headers={
                     "Content-Type": "application/json",
                     "Accept": "application/json",
                     "Accept-Encoding": "gzip, deflate",
                 },
             )
+            self._loop = asyncio.get_running_loop()
+            if self.keepalive_interval > 0:
+                self._keepalive_task = asyncio.create_task(self._keepalive_loop())
             self._logger.info("HTTP session pool started successfully")
 
+    def _http2_available(self) -> bool:
+        """Indica si se puede usar HTTP/2, avisando si falta el paquete h2."""
+        if not self.http2:
+            return False
+        if importlib.util.find_spec("h2") is None:
+            self._logger.warning(
+                "HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1 "
+                "(install with: pip install 'httpx[http2]')"
+            )
+            return False
+        return True
+
     async def stop(self) -> None:
         """Cierra todas las conexiones del pool.
 
@@ -122,10 +351,147 @@ class HTTPSessionPool:
         """
         if self._client is not None:
             self._logger.debug("Stopping HTTP session pool")
+            if self._keepalive_task is not None:
+                self._keepalive_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._keepalive_task
+                self._keepalive_task = None
             await self._client.aclose()
             self._client = None
+            self._transport = None
+            self._loop = None
             self._logger.info("HTTP session pool stopped")
 
+    async def get_client(self) -> httpx.AsyncClient:
+        """Obtiene el cliente HTTP compartido, iniciando el pool si es necesario.
+
+        Las conexiones de httpx quedan ligadas al event loop en el que se
+        abrieron. Si el pool se inició en otro loop (por ejemplo, durante
+        ``asyncio.run(server.initialize())`` antes de ``mcp.run()``), el
+        cliente anterior se cierra (ver _close_stale_client) y se crea uno
+        nuevo en el loop actual.
+
+        Returns:
+            httpx.AsyncClient: Cliente HTTP configurado del pool.
+
+        Raises:
+            RuntimeError: Si el cliente no puede ser inicializado.
+        """
+        if self._loop is not None and self._loop is not asyncio.get_running_loop():
+            await self._close_stale_client()
+
+        if self._client is None:
+            await self.start()
+
+        if self._client is None:
+            raise RuntimeError("Failed to initialize HTTP client")
+
+        return self._client
+
+    async def _close_stale_client(self) -> None:
+        """Cierra el cliente y la tarea de keep-alive creados en otro event loop.
+
+        Si ese loop sigue en marcha (en otro hilo), la cancelación y el cierre
+        se programan en él, que es donde viven sus conexiones. Si ya no corre,
+        su tarea no volverá a ejecutarse y el cliente se cierra desde aquí; un
+        fallo al cerrar sockets de un loop cerrado se registra y se ignora.
+        """
+        loop, client, task = self._loop, self._client, self._keepalive_task
+        self._client = None
+        self._transport = None
+        self._loop = None
+        self._keepalive_task = None
+        if loop is None:
+            return
+        self._logger.debug("Event loop changed, closing stale HTTP session pool client")
+
+        if loop.is_running():
+            if task is not None:
+                loop.call_soon_threadsafe(task.cancel)
+            if client is not None:
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+
+        if task is not None and not loop.is_closed():
+            task.cancel()
+        if client is not None:
+            try:
+                await client.aclose()
+            except Exception as e:
+                self._logger.warning("Could not close HTTP client of a stale event loop: %s", e)
+
+    async def warm_up(self, connections: int | None = None) -> int:
+        """Abre conexiones keep-alive por adelantado.
+
+        Envía ``connections`` peticiones HEAD concurrentes a ``base_url``; como
+        no hay conexiones ociosas, cada una abre la suya (DNS + TCP + TLS) y
+        queda en el pool para las siguientes llamadas. Los errores se
+        registran y se ignoran: el precalentamiento nunca impide arrancar.
+
+        Args:
+            connections: Conexiones a abrir. Si es None, usa
+                ``warmup_connections``. Se limita a ``max_keepalive``.
+
+        Returns:
+            Número de conexiones abiertas en el pool tras el precalentamiento.
+        """
+        count = self.warmup_connections if connections is None else connections
+        count = min(count, self.max_keepalive)
+        client = await self.get_client()
+        if count > 0:
+            await asyncio.gather(*(self._ping(client) for _ in range(count)))
+        open_connections = self._transport.open_connections if self._transport else 0
+        self._logger.info(
+            "HTTP session pool warmed up: %d connection(s) open to %s",
+            open_connections,
+            self.base_url,
+        )
+        return open_connections
+
+    async def _ping(self, client: httpx.AsyncClient) -> bool:
+        """Envía una petición HEAD ligera a la raíz de la API.
+
+        Cualquier respuesta (incluso 4xx) demuestra que la conexión funciona.
+        La petición no cuenta en las estadísticas de get_stats().
+
+        Returns:
+            True si se obtuvo respuesta, False si falló.
+        """
+        try:
+            await client.head("/", extensions={POOL_TRAFFIC_EXTENSION: True})
+        except httpx.HTTPError as e:
+            self._logger.debug("Keep-alive request to %s failed: %s", self.base_url, e)
+            return False
+        except Exception as e:
+            self._logger.warning(
+                "Unexpected error in keep-alive request to %s: %s", self.base_url, e
+            )
+            return False
+        return True
+
+    async def _keepalive_loop(self) -> None:
+        """Mantiene vivas y valida las conexiones ociosas del pool.
+
+        Cada ``keepalive_interval`` segundos envía tantas peticiones
+        concurrentes como conexiones ociosas haya (al menos
+        ``warmup_connections``), de modo que todas se usan antes de que el
+        balanceador las cierre. Las conexiones muertas fallan aquí, en la
+        petición de keep-alive, en lugar de en la siguiente llamada de un tool.
+        Un error inesperado en una ronda se registra y no detiene el bucle.
+        """
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            client = self._client
+            if client is None:
+                return
+            try:
+                idle = self._transport.idle_connections if self._transport else 0
+                count = min(max(self.warmup_connections, idle), self.max_keepalive)
+                if count > 0:
+                    await asyncio.gather(*(self._ping(client) for _ in range(count)))
+            except Exception as e:
+                self._logger.warning("Keep-alive round to %s failed: %s", self.base_url, e)
+
     @asynccontextmanager
     async def session(self) -> AsyncIterator[httpx.AsyncClient]:
         """Obtiene una sesión del pool.
@@ -144,13 +510,7 @@ class HTTPSessionPool:
             >>> async with pool.session() as client:
             ...     response = await client.get("/endpoint")
         """
-        if self._client is None:
-            await self.start()
-
-        if self._client is None:
-            raise RuntimeError("Failed to initialize HTTP client")
-
-        yield self._client
+        yield await self.get_client()
 
     async def __aenter__(self) -> "HTTPSessionPool":
         """Permite usar el pool como async context manager.
@@ -215,11 +575,7 @@ class HTTPSessionPool:
             >>> async with pool.session() as client:
             ...     response = await pool.request("GET", "/projects")
         """
-        if self._client is None:
-            await self.start()
-
-        if self._client is None:
-            raise RuntimeError("HTTP client not initialized")
+        client = await self.get_client()
 
         start_time = time.perf_counter()
         status_code = 0
@@ -236,7 +592,7 @@ class HTTPSessionPool:
             elif content is not None:
                 request_size = len(content)
 
-            response = await self._client.request(
+            response = await client.request(
                 method=method,
                 url=endpoint,
                 headers=headers,
@@ -366,6 +722,66 @@ class HTTPSessionPool:
         """
         return await self.request("DELETE", endpoint, headers=headers, params=params)
 
+    def get_stats(self) -> dict[str, Any]:
+        """Obtiene las estadísticas de conexiones y concurrencia del pool.
+
+        Los contadores de peticiones no incluyen el tráfico de precalentamiento
+        ni de keep-alive; las conexiones que ese tráfico abre sí se ven en
+        open_connections e idle_connections.
+
+        Returns:
+            Diccionario con:
+            - http2: Si el pool se configuró con HTTP/2
+            - open_connections: Conexiones abiertas (activas u ociosas)
+            - in_flight: Peticiones en curso (incluidas las que esperan conexión)
+            - peak_in_flight: Máximo de peticiones simultáneas observado
+            - active_streams: Peticiones ya enviadas por una conexión
+            - streams_per_connection: Streams activos por conexión abierta
+            - peak_streams_per_connection: Máximo observado de la métrica anterior
+            - requests_by_http_version: Peticiones por versión de protocolo
+            - max_connections / max_keepalive: Límites configurados del pool
+            - idle_connections: Conexiones abiertas sin peticiones en curso
+            - active_connections: Conexiones abiertas con peticiones en curso
+            - pending_acquisitions: Peticiones esperando una conexión
+            - peak_pending_acquisitions: Máximo observado de la métrica anterior
+            - new_connections / reused_connections: Peticiones que abrieron una
+              conexión nueva o reutilizaron una del pool
+            - reuse_ratio: Fracción de peticiones sobre conexiones reutilizadas
+            - acquisition_wait_ms: Histograma de la espera hasta obtener conexión
+            - connect_ms: Histograma del establecimiento de conexiones nuevas
+              (TCP + TLS)
+        """
+        transport = self._transport
+        open_connections = transport.open_connections if transport else 0
+        idle_connections = transport.idle_connections if transport else 0
+        return {
+            "http2": self.http2,
+            "open_connections": open_connections,
+            "in_flight": transport.in_flight if transport else 0,
+            "peak_in_flight": transport.peak_in_flight if transport else 0,
+            "active_streams": transport.active_streams if transport else 0,
+            "streams_per_connection": transport.streams_per_connection if transport else 0.0,
+            "peak_streams_per_connection": (
+                transport.peak_streams_per_connection if transport else 0.0
+            ),
+            "requests_by_http_version": (
+                dict(transport.requests_by_http_version) if transport else {}
+            ),
+            "max_connections": self.max_connections,
+            "max_keepalive": self.max_keepalive,
+            "idle_connections": idle_connections,
+            "active_connections": open_connections - idle_connections,
+            "pending_acquisitions": transport.pending if transport else 0,
+            "peak_pending_acquisitions": transport.peak_pending if transport else 0,
+            "new_connections": transport.new_connections if transport else 0,
+            "reused_connections": transport.reused_connections if transport else 0,
+            "reuse_ratio": round(transport.reuse_ratio, 4) if transport else 0.0,
+            "acquisition_wait_ms": (
+                transport.acquire_wait if transport else LatencyHistogram()
+            ).to_dict(),
+            "connect_ms": (transport.connect_time if transport else LatencyHistogram()).to_dict(),
+        }
+
     def get_metrics(self) -> dict[str, dict[str, Any]]:
         """Obtiene las métricas de performance del pool.
 
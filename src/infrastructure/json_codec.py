@@ -0,0 +1,198 @@
+"""Codec JSON intercambiable para las respuestas de Taiga y los resultados de los tools.
+
+En los listados grandes (miles de user stories) decodificar las respuestas
+de la API y volver a serializar los resultados de los tools domina el uso
+de CPU. Este módulo ofrece una única interfaz ``loads`` / ``dumps`` con
+varios backends:
+
+- ``orjson``: el más rápido; se usa si está instalado
+- ``msgspec``: alternativa rápida si no hay orjson
+- ``stdlib``: módulo ``json`` de la biblioteca estándar, siempre disponible
+
+El backend se elige con ``TAIGA_JSON_BACKEND`` (``auto``, ``orjson``,
+``msgspec`` o ``stdlib``; default: ``auto``), que valida TaigaConfig; el
+container crea el codec y lo registra con set_json_codec(). Si el backend
+pedido no está instalado se avisa y se usa el siguiente disponible.
+"""
+
+import importlib
+import json
+import logging
+from collections.abc import Callable
+from threading import Lock
+from typing import Any, cast
+
+import pydantic_core
+
+
+Default = Callable[[Any], Any]
+
+BACKENDS = ("orjson", "msgspec", "stdlib")
+
+_logger = logging.getLogger(__name__)
+
+
+class JSONCodec:
+    """Codec JSON de la biblioteca estándar (backend ``stdlib``).
+
+    Los demás backends heredan de esta clase y sustituyen ``loads`` y
+    ``dumps``. Todos aceptan ``bytes`` o ``str`` y lanzan ValueError si el
+    documento no es JSON válido.
+
+    Example:
+        >>> codec = get_json_codec()
+        >>> codec.loads(b'{"id": 1}')
+        {'id': 1}
+        >>> codec.dumps({"id": 1})
+        b'{"id":1}'
+    """
+
+    name = "stdlib"
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decodifica un documento JSON."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any, default: Default | None = None) -> bytes:
+        """Codifica ``obj`` como JSON compacto en UTF-8.
+
+        Args:
+            obj: Valor a serializar.
+            default: Conversión para los tipos que el backend no admite.
+        """
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default).encode()
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec basado en orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Importa orjson (lanza ImportError si no está instalado)."""
+        self._orjson = importlib.import_module("orjson")
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decodifica un documento JSON."""
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any, default: Default | None = None) -> bytes:
+        """Codifica ``obj`` como JSON compacto en UTF-8."""
+        return cast(
+            "bytes", self._orjson.dumps(obj, default=default, option=self._orjson.OPT_NON_STR_KEYS)
+        )
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec basado en msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Importa msgspec (lanza ImportError si no está instalado)."""
+        self._msgspec = importlib.import_module("msgspec")
+        self._decoder = self._msgspec.json.Decoder()
+        self._encoder = self._msgspec.json.Encoder()
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decodifica un documento JSON."""
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any, default: Default | None = None) -> bytes:
+        """Codifica ``obj`` como JSON compacto en UTF-8."""
+        if default is None:
+            return cast("bytes", self._encoder.encode(obj))
+        return cast("bytes", self._msgspec.json.encode(obj, enc_hook=default))
+
+
+_CODECS: dict[str, type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "stdlib": JSONCodec,
+}
+
+
+def create_json_codec(backend: str = "auto") -> JSONCodec:
+    """Crea el codec del backend pedido o del primero disponible.
+
+    Args:
+        backend: ``auto`` (el más rápido instalado), ``orjson``, ``msgspec``
+            o ``stdlib``.
+
+    Returns:
+        El codec del backend elegido.
+
+    Raises:
+        ValueError: Si el backend no es ninguno de los admitidos.
+    """
+    if backend != "auto" and backend not in _CODECS:
+        raise ValueError(f"backend debe ser 'auto' o uno de {', '.join(BACKENDS)}")
+    candidates = BACKENDS if backend == "auto" else (backend, *BACKENDS)
+    for name in candidates:
+        try:
+            codec = _CODECS[name]()
+        except ImportError:
+            if name == backend:
+                _logger.warning(
+                    "JSON backend '%s' requested but not installed; falling back", backend
+                )
+            continue
+        return codec
+    return JSONCodec()
+
+
+def _to_jsonable(obj: Any) -> Any:
+    """Conversión de los tipos que el backend no admite (modelos pydantic, sets...)."""
+    return pydantic_core.to_jsonable_python(obj, fallback=str)
+
+
+def serialize_tool_result(data: Any) -> str:
+    """Serializa el resultado de un tool con el codec global.
+
+    Se usa como ``tool_serializer`` de FastMCP. Los tipos que el backend no
+    admite se convierten como en el serializador por defecto de FastMCP
+    (``pydantic_core`` con ``str`` como último recurso).
+    """
+    return get_json_codec().dumps(data, default=_to_jsonable).decode()
+
+
+# Singleton global para uso en toda la aplicación
+_json_codec: JSONCodec | None = None
+_json_codec_lock = Lock()
+
+
+def get_json_codec() -> JSONCodec:
+    """Obtiene la instancia singleton del codec JSON.
+
+    Si el container aún no ha registrado el suyo con set_json_codec(), se
+    crea uno con el backend más rápido instalado.
+
+    Returns:
+        La instancia singleton de JSONCodec.
+    """
+    global _json_codec
+    if _json_codec is None:
+        with _json_codec_lock:
+            if _json_codec is None:
+                _json_codec = create_json_codec()
+    return _json_codec
+
+
+def set_json_codec(codec: JSONCodec) -> None:
+    """Registra el codec JSON del proceso."""
+    global _json_codec
+    with _json_codec_lock:
+        _json_codec = codec
+
+
+def reset_json_codec() -> None:
+    """Resetea el singleton del codec JSON.
+
+    Útil para testing para asegurar un estado limpio entre tests.
+    """
+    global _json_codec
+    with _json_codec_lock:
+        _json_codec = None
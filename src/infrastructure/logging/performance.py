@@ -8,7 +8,7 @@ de bottlenecks y el monitoreo de performance.
 
 import logging
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Generator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -18,6 +18,10 @@ from src.infrastructure.logging.correlation import CorrelationIdManager
 from src.infrastructure.logging.logger import get_logger
 
 
+# Duraciones recientes que se conservan por endpoint para calcular percentiles
+RECENT_DURATIONS = 256
+
+
 @dataclass
 class APIMetrics:
     """Métricas agregadas por endpoint.
@@ -29,6 +33,7 @@ class APIMetrics:
         max_duration_ms: Duración máxima registrada.
         success_count: Número de llamadas exitosas.
         error_count: Número de llamadas con error.
+        recent_durations_ms: Últimas duraciones de llamadas exitosas, para percentiles.
     """
 
     total_calls: int = 0
@@ -37,6 +42,9 @@ class APIMetrics:
     max_duration_ms: float = 0.0
     success_count: int = 0
     error_count: int = 0
+    recent_durations_ms: deque[float] = field(
+        default_factory=lambda: deque(maxlen=RECENT_DURATIONS), repr=False
+    )
 
     @property
     def avg_duration_ms(self) -> float:
@@ -52,8 +60,17 @@ class APIMetrics:
             return 0.0
         return self.success_count / self.total_calls
 
+    def percentile(self, q: float) -> float | None:
+        """Percentil ``q`` (0-100) de las duraciones recientes, o None sin muestras."""
+        if not self.recent_durations_ms:
+            return None
+        ordered = sorted(self.recent_durations_ms)
+        index = min(len(ordered) - 1, int(len(ordered) * q / 100))
+        return ordered[index]
+
     def to_dict(self) -> dict[str, Any]:
         """Convierte las métricas a diccionario."""
+        p95 = self.percentile(95)
         return {
             "total_calls": self.total_calls,
             "total_duration_ms": round(self.total_duration_ms, 2),
@@ -65,6 +82,7 @@ class APIMetrics:
             "success_count": self.success_count,
             "error_count": self.error_count,
             "success_rate": round(self.success_rate, 4),
+            "p95_duration_ms": round(p95, 2) if p95 is not None else 0.0,
         }
 
 
@@ -98,9 +116,26 @@ class EndpointMetricsStore:
         metrics.max_duration_ms = max(metrics.max_duration_ms, duration_ms)
         if success:
             metrics.success_count += 1
+            metrics.recent_durations_ms.append(duration_ms)
         else:
             metrics.error_count += 1
 
+    def percentile(self, endpoint: str, q: float, min_samples: int = 1) -> float | None:
+        """Obtiene el percentil ``q`` de la latencia reciente de un endpoint.
+
+        Args:
+            endpoint: Identificador del endpoint.
+            q: Percentil entre 0 y 100 (p. ej. 95).
+            min_samples: Muestras mínimas para considerar fiable el valor.
+
+        Returns:
+            Duración en milisegundos, o None si no hay suficientes muestras.
+        """
+        metrics = self._metrics.get(endpoint)
+        if metrics is None or len(metrics.recent_durations_ms) < min_samples:
+            return None
+        return metrics.percentile(q)
+
     def get_metrics(self, endpoint: str) -> APIMetrics:
         """Obtiene métricas para un endpoint específico.
 
@@ -17,6 +17,7 @@ from src.domain.exceptions import (
     TaigaAPIError,
     ValidationError,
 )
+from src.infrastructure.circuit_breaker import is_transient_error
 from src.infrastructure.logging import get_logger
 
 
@@ -141,17 +142,8 @@ class ErrorHandlingMiddleware(Middleware):
         Returns:
             True if the error is transient.
         """
-        # Network errors, timeouts, 5xx errors are transient
-        error_str = str(error).lower()
-        transient_indicators = [
-            "timeout",
-            "connection",
-            "network",
-            "502",
-            "503",
-            "504",
-        ]
-        return any(indicator in error_str for indicator in transient_indicators)
+        # Network errors, timeouts, 502/503/504 are transient; an open circuit is not
+        return is_transient_error(error)
 
     def _track_error(self, tool_name: str, error: Exception) -> None:
         """Track error occurrence for monitoring.
@@ -0,0 +1,302 @@
+"""Caché negativo de respuestas 404 y 403.
+
+Los agentes repiten a menudo búsquedas como ``/issues/by_ref`` o
+``/wiki/by_slug`` con refs y slugs que no existen, y cada intento es una
+petición completa que termina en ResourceNotFoundError o
+PermissionDeniedError. El caché negativo recuerda esos resultados durante un
+TTL corto y vuelve a lanzar el mismo error sin llamar a la API.
+
+Features:
+- Claves por principal (hash del token): un 403 de un usuario no afecta a otro
+- TTL corto configurable (``TAIGA_NEGATIVE_CACHE_TTL`` en TaigaConfig, 0 lo desactiva)
+- Una escritura exitosa sobre el mismo recurso y proyecto (``POST /issues``
+  con ``project=1`` para ``/issues/by_ref?project=1``) elimina sus entradas
+  de todos los principales
+- Métricas de llamadas ahorradas, resultados guardados e invalidaciones
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import parse_qs
+
+from src.domain.exceptions import PermissionDeniedError, ResourceNotFoundError
+
+
+# Errores que se recuerdan: el mismo GET volvería a fallar igual mientras nada cambie
+NEGATIVE_ERRORS: tuple[type[Exception], ...] = (ResourceNotFoundError, PermissionDeniedError)
+
+
+def resource_of(endpoint: str) -> str:
+    """Recurso de primer nivel de un endpoint, sin query string.
+
+    Example:
+        >>> resource_of("/issues/by_ref?ref=12&project=1")
+        '/issues'
+    """
+    path = endpoint.split("?", 1)[0].strip("/")
+    return "/" + path.split("/", 1)[0]
+
+
+def project_of(endpoint: str, *fields: Mapping[str, Any] | None) -> str | None:
+    """Proyecto de una petición, o None si no lo indica.
+
+    Se toma el campo ``project`` del primer cuerpo o parámetros que lo
+    tengan y, si ninguno lo tiene, el de la query string del endpoint.
+
+    Example:
+        >>> project_of("/issues/by_ref?ref=12&project=1")
+        '1'
+        >>> project_of("/issues", {"project": 3, "subject": "Bug"})
+        '3'
+    """
+    for values in fields:
+        if isinstance(values, Mapping) and values.get("project") is not None:
+            return str(values["project"])
+    projects = parse_qs(endpoint.partition("?")[2]).get("project")
+    return projects[0] if projects else None
+
+
+@dataclass(frozen=True)
+class NegativeEntry:
+    """Resultado negativo recordado.
+
+    Attributes:
+        error_type: Clase de la excepción original.
+        message: Mensaje de la excepción original.
+        resource: Recurso de primer nivel del endpoint (``/issues``).
+        project: Proyecto de la petición, o None si no lo indica.
+        expires_at: Instante (``time.monotonic()``) en que deja de servirse.
+    """
+
+    error_type: type[Exception]
+    message: str
+    resource: str
+    project: str | None
+    expires_at: float
+
+
+@dataclass
+class NegativeCacheMetrics:
+    """Contadores del caché negativo.
+
+    Attributes:
+        saved_calls: GETs respondidos con el error recordado sin llamar a la API.
+        stored: Resultados 404/403 guardados.
+        invalidations: Entradas eliminadas por escrituras sobre su recurso.
+        evictions: Entradas descartadas por superar max_size.
+    """
+
+    saved_calls: int = 0
+    stored: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializa las métricas para get_stats()."""
+        return {
+            "saved_calls": self.saved_calls,
+            "stored": self.stored,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+        }
+
+
+class NegativeCache:
+    """Recuerda durante un TTL corto los GETs que terminaron en 404 o 403.
+
+    Las claves las construye el llamador e incluyen el principal, de modo que
+    cada usuario solo ve sus propios resultados. Las invalidaciones, en
+    cambio, son por recurso y proyecto y afectan a todos los principales: un
+    elemento recién creado existe para todos. Las entradas se indexan por
+    recurso y proyecto, así que invalidar no recorre el caché entero.
+
+    Example:
+        >>> negative = NegativeCache(ttl=30)
+        >>> negative.store(key, "/issues/by_ref?ref=9&project=1", error)
+        >>> negative.lookup(key)  # ResourceNotFoundError(...)
+        >>> negative.invalidate("/issues", project="1")
+        1
+    """
+
+    def __init__(self, ttl: float = 30.0, max_size: int = 1000) -> None:
+        """Inicializa el caché negativo.
+
+        Args:
+            ttl: Segundos que se recuerda un 404/403; 0 desactiva el caché.
+            max_size: Número máximo de entradas (se descartan las más antiguas).
+
+        Raises:
+            ValueError: Si ttl es negativo o max_size no es mayor a 0.
+        """
+        if ttl < 0:
+            raise ValueError("ttl no puede ser negativo")
+        if max_size <= 0:
+            raise ValueError("max_size debe ser mayor a 0")
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, NegativeEntry] = OrderedDict()
+        # recurso -> proyecto -> claves, para invalidar sin recorrer todas las entradas
+        self._index: dict[str, dict[str | None, set[Hashable]]] = {}
+        self._metrics = NegativeCacheMetrics()
+
+    @property
+    def enabled(self) -> bool:
+        """Si se guardan resultados negativos."""
+        return self.ttl > 0
+
+    def lookup(self, key: Hashable) -> Exception | None:
+        """Devuelve el error recordado para la clave, o None si no hay.
+
+        Cada acierto cuenta como una llamada ahorrada. Se devuelve una
+        excepción nueva para que cada llamador tenga su propio traceback.
+
+        Args:
+            key: Clave de la petición (incluye el principal).
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._discard(key)
+            return None
+        self._metrics.saved_calls += 1
+        return entry.error_type(entry.message)
+
+    def store(
+        self, key: Hashable, endpoint: str, error: Exception, project: str | None = None
+    ) -> bool:
+        """Recuerda el error de un GET si es un 404 o un 403.
+
+        Args:
+            key: Clave de la petición (incluye el principal).
+            endpoint: Endpoint de la petición, para invalidar por recurso.
+            error: Excepción con la que terminó la petición.
+            project: Proyecto de la petición. Si es None, se toma de la query
+                string del endpoint.
+
+        Returns:
+            True si el error se guardó.
+        """
+        if not self.enabled or not isinstance(error, NEGATIVE_ERRORS):
+            return False
+        self._discard(key)
+        entry = NegativeEntry(
+            error_type=type(error),
+            message=str(error),
+            resource=resource_of(endpoint),
+            project=project if project is not None else project_of(endpoint),
+            expires_at=time.monotonic() + self.ttl,
+        )
+        self._entries[key] = entry
+        self._index.setdefault(entry.resource, {}).setdefault(entry.project, set()).add(key)
+        self._metrics.stored += 1
+        while len(self._entries) > self.max_size:
+            self._discard(next(iter(self._entries)))
+            self._metrics.evictions += 1
+        return True
+
+    def invalidate(self, endpoint: str, project: str | None = None) -> int:
+        """Elimina las entradas que una escritura sobre el endpoint puede dejar obsoletas.
+
+        Con proyecto se eliminan las entradas de ese recurso y proyecto y las
+        del recurso que no indican proyecto (``/issues/42``); sin proyecto,
+        todas las del recurso.
+
+        Args:
+            endpoint: Endpoint de la escritura (``/issues``, ``/wiki/12``...).
+            project: Proyecto de la escritura. Si es None, se toma de la query
+                string del endpoint.
+
+        Returns:
+            Número de entradas eliminadas.
+        """
+        scopes = self._index.get(resource_of(endpoint))
+        if not scopes:
+            return 0
+        if project is None:
+            project = project_of(endpoint)
+        if project is None:
+            keys = [key for keys in scopes.values() for key in keys]
+        else:
+            keys = [*scopes.get(project, ()), *scopes.get(None, ())]
+        for key in keys:
+            self._discard(key)
+        self._metrics.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> int:
+        """Elimina todas las entradas.
+
+        Returns:
+            Número de entradas eliminadas.
+        """
+        count = len(self._entries)
+        self._entries.clear()
+        self._index.clear()
+        return count
+
+    def _discard(self, key: Hashable) -> None:
+        """Elimina una entrada y su referencia en el índice, si existe."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        scopes = self._index[entry.resource]
+        keys = scopes[entry.project]
+        keys.discard(key)
+        if not keys:
+            del scopes[entry.project]
+            if not scopes:
+                del self._index[entry.resource]
+
+    def size(self) -> int:
+        """Número de entradas guardadas (incluidas las expiradas aún no purgadas)."""
+        return len(self._entries)
+
+    def get_metrics(self) -> NegativeCacheMetrics:
+        """Obtiene los contadores actuales."""
+        return self._metrics
+
+    def get_stats(self) -> dict[str, Any]:
+        """Obtiene estadísticas del caché negativo.
+
+        Returns:
+            Diccionario con la configuración, el tamaño y las métricas.
+        """
+        return {
+            "enabled": self.enabled,
+            "ttl": self.ttl,
+            "size": self.size(),
+            "max_size": self.max_size,
+            **self._metrics.to_dict(),
+        }
+
+
+# Caché negativo del proceso: el container registra el configurado en TaigaConfig
+_negative_cache: NegativeCache | None = None
+
+
+def get_negative_cache() -> NegativeCache:
+    """Obtiene el caché negativo que comparten todos los TaigaAPIClient del proceso.
+
+    Si el container aún no ha registrado el suyo con set_negative_cache(), se
+    crea uno con el TTL por defecto (30 s).
+    """
+    global _negative_cache
+    if _negative_cache is None:
+        _negative_cache = NegativeCache()
+    return _negative_cache
+
+
+def set_negative_cache(negative_cache: NegativeCache) -> None:
+    """Registra el caché negativo del proceso."""
+    global _negative_cache
+    _negative_cache = negative_cache
+
+
+def reset_negative_cache() -> None:
+    """Olvida el caché negativo del proceso (para tests)."""
+    global _negative_cache
+    _negative_cache = None
@@ -6,12 +6,16 @@ de forma automática y transparente en los endpoints de lista de Taiga.
 
 from __future__ import annotations
 
+import asyncio
+import math
+from collections import deque
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncGenerator, Callable, Mapping
 
     from src.taiga_client import TaigaAPIClient
 
@@ -24,11 +28,15 @@ class PaginationConfig:
         page_size: Número de items por página. Default: 100.
         max_pages: Límite máximo de páginas a obtener (seguridad). Default: 50.
         max_total_items: Límite máximo de items totales a obtener. Default: 5000.
+        max_concurrency: Número máximo de páginas solicitadas en paralelo cuando la
+            primera respuesta incluye la cabecera x-pagination-count. Con 1 (default)
+            las páginas se obtienen de forma secuencial.
     """
 
     page_size: int = 100
     max_pages: int = 50
     max_total_items: int = 5000
+    max_concurrency: int = 1
 
     def __post_init__(self) -> None:
         """Valida la configuración después de la inicialización."""
@@ -38,6 +46,8 @@ class PaginationConfig:
             raise ValueError("max_pages debe ser mayor a 0")
         if self.max_total_items < 1:
             raise ValueError("max_total_items debe ser mayor a 0")
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency debe ser mayor a 0")
 
 
 @dataclass
@@ -108,7 +118,9 @@ class AutoPaginator:
         """Obtiene todos los items con información de paginación.
 
         Similar a paginate() pero retorna información adicional sobre
-        el proceso de paginación.
+        el proceso de paginación. Si ``max_concurrency`` es mayor a 1, las
+        páginas restantes se solicitan en paralelo a partir de las cabeceras
+        de paginación de la primera respuesta.
 
         Args:
             endpoint: Endpoint de la API.
@@ -117,57 +129,202 @@ class AutoPaginator:
         Returns:
             PaginationResult con items y metadatos de paginación.
         """
-        all_items: list[dict[str, Any]] = []
-        page = 1
+        result = PaginationResult()
+        async with aclosing(self.paginate_pages(endpoint, params, result)) as pages:
+            async for items in pages:
+                result.items.extend(items)
+        return result
+
+    async def paginate_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        info: PaginationResult | None = None,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Itera página a página respetando los límites de seguridad.
+
+        Es la base del resto de métodos de paginación. Las páginas se
+        solicitan bajo demanda: si el consumidor deja de iterar no se piden
+        más páginas y las peticiones adelantadas en vuelo se cancelan.
+
+        Args:
+            endpoint: Endpoint de la API.
+            params: Parámetros adicionales para la petición.
+            info: PaginationResult donde acumular los metadatos (total_pages,
+                total_items, has_more, was_truncated). Sus items no se tocan.
+
+        Yields:
+            Lista de items de cada página, en orden.
+        """
         request_params = dict(params) if params else {}
-        was_truncated = False
-        has_more = False
+        info = info if info is not None else PaginationResult()
+
+        if self.config.max_concurrency > 1:
+            pages = self._iter_pages_concurrent(endpoint, request_params, info)
+        else:
+            pages = self._iter_pages_sequential(endpoint, request_params, info)
+
+        async with aclosing(pages):
+            async for items in pages:
+                yield items
+
+    async def _iter_pages_sequential(
+        self,
+        endpoint: str,
+        request_params: dict[str, Any],
+        info: PaginationResult,
+        first_response: Any = None,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Obtiene las páginas una tras otra hasta agotar los resultados.
+
+        Args:
+            endpoint: Endpoint de la API.
+            request_params: Parámetros de la petición (se modifican en cada página).
+            info: Metadatos de paginación a actualizar.
+            first_response: Respuesta ya obtenida de la primera página, si existe.
+
+        Yields:
+            Lista de items de cada página.
+        """
+        page = 1
 
         while page <= self.config.max_pages:
+            info.total_pages = page
             request_params["page"] = page
             request_params["page_size"] = self.config.page_size
 
-            response = await self.client.get(endpoint, params=request_params)
+            if page == 1 and first_response is not None:
+                response = first_response
+            else:
+                response = await self.client.get(endpoint, params=request_params)
 
             # Manejar diferentes formatos de respuesta
             items = self._extract_items(response)
 
             if not items:
-                break
-
-            all_items.extend(items)
+                return
 
             # Verificar límite de items totales
-            if len(all_items) >= self.config.max_total_items:
-                was_truncated = True
-                all_items = all_items[: self.config.max_total_items]
-                has_more = True
-                break
+            remaining = self.config.max_total_items - info.total_items
+            if len(items) >= remaining:
+                info.was_truncated = True
+                info.has_more = True
+                info.total_items += remaining
+                yield items[:remaining]
+                return
+
+            info.total_items += len(items)
+            yield items
 
             # Verificar si hay más páginas
             if not self._has_next_page(response, items):
-                break
+                return
 
             page += 1
 
             # Si alcanzamos max_pages pero hay más datos
             if page > self.config.max_pages:
-                was_truncated = True
-                has_more = True
-
-        return PaginationResult(
-            items=all_items,
-            total_pages=page,
-            total_items=len(all_items),
-            has_more=has_more,
-            was_truncated=was_truncated,
+                info.total_pages = page
+                info.was_truncated = True
+                info.has_more = True
+
+    async def _iter_pages_concurrent(
+        self,
+        endpoint: str,
+        request_params: dict[str, Any],
+        info: PaginationResult,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Obtiene las páginas restantes en paralelo con un fan-out acotado.
+
+        La primera página se obtiene junto con sus cabeceras. Con
+        x-pagination-count y x-paginated-by se calcula el número total de
+        páginas, recortado por max_pages y max_total_items, y se mantienen
+        como máximo ``max_concurrency`` páginas en vuelo por delante de la
+        que se está entregando. Si la respuesta no trae cabeceras de
+        paginación se continúa de forma secuencial.
+
+        Args:
+            endpoint: Endpoint de la API.
+            request_params: Parámetros de la petición.
+            info: Metadatos de paginación a actualizar.
+
+        Yields:
+            Lista de items de cada página, en el orden de las páginas.
+        """
+        request_params["page"] = 1
+        request_params["page_size"] = self.config.page_size
+
+        response, headers = await self.client.get_with_headers(endpoint, params=request_params)
+        items = self._extract_items(response)
+        total_count = self._header_int(headers, "x-pagination-count")
+        info.total_pages = 1
+
+        if not items:
+            return
+        if total_count is None:
+            sequential = self._iter_pages_sequential(endpoint, request_params, info, response)
+            async with aclosing(sequential):
+                async for page_items in sequential:
+                    yield page_items
+            return
+
+        page_size = self._header_int(headers, "x-paginated-by") or self.config.page_size
+        available_pages = math.ceil(total_count / page_size)
+        last_page = min(
+            available_pages,
+            self.config.max_pages,
+            math.ceil(self.config.max_total_items / page_size),
         )
 
+        async def fetch_page(page: int) -> list[dict[str, Any]]:
+            page_params = {**request_params, "page": page}
+            return self._extract_items(await self.client.get(endpoint, params=page_params))
+
+        pending: deque[asyncio.Task[list[dict[str, Any]]]] = deque()
+        next_page = 2
+
+        def schedule() -> None:
+            nonlocal next_page
+            while next_page <= last_page and len(pending) < self.config.max_concurrency:
+                pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                next_page += 1
+
+        try:
+            schedule()
+            while True:
+                remaining = self.config.max_total_items - info.total_items
+                # Misma regla que la ruta secuencial: alcanzar el límite cuenta como truncado
+                if len(items) >= remaining:
+                    items = items[:remaining]
+                    info.was_truncated = True
+                    info.has_more = True
+                info.total_items += len(items)
+                yield items
+
+                if info.was_truncated or not pending:
+                    break
+                items = await pending.popleft()
+                info.total_pages += 1
+                schedule()
+                # Los datos pueden haber cambiado entre la primera página y el resto
+                if not items:
+                    break
+        finally:
+            # Esperar a las páginas canceladas para que ninguna petición siga viva
+            # (ni use el cliente) cuando el consumidor ya ha cortado el stream
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if last_page < available_pages:
+            info.was_truncated = True
+            info.has_more = True
+
     async def paginate_lazy(
         self,
         endpoint: str,
         params: dict[str, Any] | None = None,
-    ) -> AsyncIterator[dict[str, Any]]:
+    ) -> AsyncGenerator[dict[str, Any], None]:
         """Itera sobre items paginando bajo demanda (lazy).
 
         Esta implementación es más eficiente en memoria para grandes
@@ -180,30 +337,76 @@ class AutoPaginator:
         Yields:
             Items individuales de cada página.
         """
-        page = 1
-        total_items = 0
-        request_params = dict(params) if params else {}
-
-        while page <= self.config.max_pages:
-            request_params["page"] = page
-            request_params["page_size"] = self.config.page_size
+        async with aclosing(self.paginate_pages(endpoint, params)) as pages:
+            async for items in pages:
+                for item in items:
+                    yield item
 
-            response = await self.client.get(endpoint, params=request_params)
-            items = self._extract_items(response)
+    async def stream(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        *,
+        where: Callable[[dict[str, Any]], bool] | None = None,
+        transform: Callable[[dict[str, Any]], Any] | None = None,
+        limit: int | None = None,
+    ) -> AsyncGenerator[Any, None]:
+        """Pipeline en streaming: filtra y transforma los items según llegan.
+
+        Cada página se procesa en cuanto se recibe y se descarta después,
+        de modo que la memoria ocupada por los datos crudos está acotada
+        por una página (o por ``max_concurrency`` páginas adelantadas).
+        Al alcanzar ``limit`` se deja de paginar.
 
-            if not items:
-                break
+        Args:
+            endpoint: Endpoint de la API.
+            params: Parámetros adicionales para la petición.
+            where: Predicado sobre el item crudo; los items que no lo cumplen
+                se descartan antes de transformarlos.
+            transform: Función aplicada a cada item que pasa el filtro.
+            limit: Número máximo de items a emitir.
 
-            for item in items:
-                if total_items >= self.config.max_total_items:
-                    return
-                yield item
-                total_items += 1
+        Yields:
+            Items filtrados y transformados, en el orden de la API.
+        """
+        if limit is not None and limit < 1:
+            return
+
+        emitted = 0
+        async with aclosing(self.paginate_pages(endpoint, params)) as pages:
+            async for items in pages:
+                for item in items:
+                    if where is not None and not where(item):
+                        continue
+                    yield transform(item) if transform is not None else item
+                    emitted += 1
+                    if limit is not None and emitted >= limit:
+                        return
+
+    async def collect(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        *,
+        where: Callable[[dict[str, Any]], bool] | None = None,
+        transform: Callable[[dict[str, Any]], Any] | None = None,
+        limit: int | None = None,
+    ) -> list[Any]:
+        """Materializa el resultado de stream() en una lista.
 
-            if not self._has_next_page(response, items):
-                break
+        Args:
+            endpoint: Endpoint de la API.
+            params: Parámetros adicionales para la petición.
+            where: Predicado sobre el item crudo.
+            transform: Función aplicada a cada item que pasa el filtro.
+            limit: Número máximo de items a devolver.
 
-            page += 1
+        Returns:
+            Lista de items filtrados y transformados.
+        """
+        stream = self.stream(endpoint, params, where=where, transform=transform, limit=limit)
+        async with aclosing(stream):
+            return [item async for item in stream]
 
     async def paginate_first_page(
         self,
@@ -259,6 +462,25 @@ class AutoPaginator:
 
         return []
 
+    @staticmethod
+    def _header_int(headers: Mapping[str, str], name: str) -> int | None:
+        """Lee una cabecera de paginación como entero.
+
+        Args:
+            headers: Cabeceras de la respuesta.
+            name: Nombre de la cabecera.
+
+        Returns:
+            Valor entero de la cabecera, o None si no existe o no es válido.
+        """
+        value = headers.get(name)
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
     def _has_next_page(
         self,
         response: Any,
@@ -293,3 +515,6 @@ class AutoPaginator:
 
 # Instancia por defecto con configuración estándar
 DEFAULT_PAGINATION_CONFIG = PaginationConfig()
+
+# Configuración para listados grandes (issues, tareas, historias, épicas)
+CONCURRENT_PAGINATION_CONFIG = PaginationConfig(max_concurrency=4)
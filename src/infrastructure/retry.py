@@ -4,6 +4,10 @@ Este módulo implementa un decorador para reintentos automáticos con backoff
 exponencial y jitter, útil para manejar errores transitorios en operaciones
 de red como timeouts y errores de conexión.
 
+También define el presupuesto de reintentos compartido por el proceso
+(RetryBudget): limita los reintentos a una fracción de las peticiones para
+que una degradación de Taiga no multiplique la carga que le enviamos.
+
 Example:
     >>> from src.infrastructure.retry import with_retry, RetryConfig
     >>> import httpx
@@ -27,7 +31,8 @@ import random
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from functools import wraps
-from typing import ParamSpec, TypeVar
+from threading import Lock
+from typing import Any, ParamSpec, TypeVar
 
 import httpx
 
@@ -48,6 +53,8 @@ class RetryConfig:
         exponential_base: Base para el cálculo exponencial (default: 2.0).
         jitter: Si añadir variabilidad aleatoria al delay (default: True).
         retryable_exceptions: Set de excepciones que triggean reintentos.
+        deadline: Tiempo máximo en segundos de una llamada, contando reintentos
+            y esperas (default: None, sin límite).
 
     Example:
         >>> config = RetryConfig(
@@ -74,11 +81,14 @@ class RetryConfig:
             httpx.NetworkError,
         }
     )
+    deadline: float | None = None
 
     def __post_init__(self) -> None:
         """Valida la configuración después de inicialización."""
         if self.max_retries < 0:
             raise ValueError("max_retries debe ser >= 0")
+        if self.deadline is not None and self.deadline <= 0:
+            raise ValueError("deadline debe ser > 0")
         if self.base_delay < 0:
             raise ValueError("base_delay debe ser >= 0")
         if self.max_delay < self.base_delay:
@@ -131,6 +141,135 @@ def calculate_delay(
     return delay
 
 
+@dataclass
+class RetryBudgetMetrics:
+    """Contadores del presupuesto de reintentos.
+
+    Attributes:
+        requests: Peticiones registradas (primeros intentos).
+        retries: Reintentos concedidos.
+        rejected: Reintentos denegados por falta de presupuesto.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    rejected: int = 0
+
+    @property
+    def retry_rate(self) -> float:
+        """Proporción de reintentos sobre las peticiones."""
+        return self.retries / self.requests if self.requests > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializa las métricas para get_stats()."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "rejected": self.rejected,
+            "retry_rate": round(self.retry_rate, 4),
+        }
+
+
+class RetryBudget:
+    """Presupuesto de reintentos basado en fichas (token bucket).
+
+    Cada petición deposita ``ratio`` fichas y cada reintento consume una,
+    así que de forma sostenida los reintentos no superan ``ratio`` veces
+    las peticiones. El saldo empieza en ``reserve`` y nunca la supera: con
+    poco tráfico se puede reintentar, pero durante una caída prolongada la
+    reserva se agota enseguida y solo queda el ``ratio``.
+
+    Example:
+        >>> budget = RetryBudget(ratio=0.1, reserve=10)
+        >>> budget.record_request()
+        >>> budget.try_acquire()
+        True
+    """
+
+    def __init__(self, ratio: float = 0.1, reserve: float = 10.0) -> None:
+        """Inicializa el presupuesto.
+
+        Args:
+            ratio: Fichas depositadas por petición (0.1 = reintentos ≤ 10%).
+            reserve: Saldo inicial y máximo de fichas.
+        """
+        if ratio < 0:
+            raise ValueError("ratio debe ser >= 0")
+        if reserve < 0:
+            raise ValueError("reserve debe ser >= 0")
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = reserve
+        self._lock = Lock()
+        self._metrics = RetryBudgetMetrics()
+
+    def record_request(self) -> None:
+        """Registra un primer intento y deposita ``ratio`` fichas."""
+        with self._lock:
+            self._metrics.requests += 1
+            self._tokens = min(self.reserve, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """Consume una ficha para reintentar.
+
+        Returns:
+            True si queda presupuesto; False si el reintento debe descartarse.
+        """
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._metrics.retries += 1
+                return True
+            self._metrics.rejected += 1
+            return False
+
+    def get_metrics(self) -> RetryBudgetMetrics:
+        """Obtiene los contadores actuales."""
+        return self._metrics
+
+    def get_stats(self) -> dict[str, Any]:
+        """Obtiene estadísticas del presupuesto.
+
+        Returns:
+            Diccionario con la configuración, el saldo y las métricas.
+        """
+        with self._lock:
+            return {
+                "ratio": self.ratio,
+                "reserve": self.reserve,
+                "tokens": round(self._tokens, 2),
+                **self._metrics.to_dict(),
+            }
+
+
+# Presupuesto del proceso: el container registra el configurado en TaigaConfig
+_retry_budget: RetryBudget | None = None
+
+
+def get_retry_budget() -> RetryBudget:
+    """Obtiene el presupuesto del que tiran los reintentos de todos los TaigaAPIClient.
+
+    Si el container aún no ha registrado el suyo con set_retry_budget(), se
+    crea uno con el ratio por defecto (0.1).
+    """
+    global _retry_budget
+    if _retry_budget is None:
+        _retry_budget = RetryBudget()
+    return _retry_budget
+
+
+def set_retry_budget(budget: RetryBudget) -> None:
+    """Registra el presupuesto de reintentos del proceso."""
+    global _retry_budget
+    _retry_budget = budget
+
+
+def reset_retry_budget() -> None:
+    """Olvida el presupuesto de reintentos del proceso (para tests)."""
+    global _retry_budget
+    _retry_budget = None
+
+
 def with_retry(
     config: RetryConfig | None = None,
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
@@ -0,0 +1,116 @@
+"""Caché compartido entre varios procesos del mismo host.
+
+Con el transporte HTTP se ejecutan varios procesos del servidor detrás de un
+balanceador. Cada uno tiene su propio singleton de caché, por lo que los
+mismos metadatos se piden y se guardan N veces y una invalidación solo llega
+al proceso que la recibe. Con ``TAIGA_CACHE_SHARED=true`` todos los procesos
+que apuntan al mismo ``TAIGA_CACHE_DIR`` comparten el nivel en disco:
+
+- Lo que un proceso guarda lo leen los demás tras un fallo en su memoria
+- Las invalidaciones se registran en la misma base de datos SQLite y cada
+  proceso las aplica a su memoria cada ``TAIGA_CACHE_SYNC_INTERVAL`` segundos
+- Una escritura pendiente que otro proceso invalidó se descarta en vez de
+  persistirse, para no resucitar datos anteriores a la invalidación
+
+No necesita servicios externos: la coordinación es el propio fichero SQLite.
+"""
+
+import asyncio
+from typing import Any
+
+from src.infrastructure.cache import CacheBackend, CacheEntry
+from src.infrastructure.disk_cache import DiskCache, Invalidation, TieredCache
+
+
+class SharedCache(TieredCache):
+    """TieredCache cuyo nivel en disco comparten varios procesos.
+
+    Una tarea en segundo plano (lanzada en el primer uso dentro del event
+    loop) lee periódicamente las invalidaciones de los demás procesos y las
+    aplica a la memoria de este. Entre dos lecturas una entrada invalidada en
+    otro proceso puede seguir sirviéndose desde memoria como mucho
+    ``sync_interval`` segundos.
+
+    Example:
+        >>> disk = DiskCache("/var/cache/taiga-mcp", broadcast=True)
+        >>> cache = SharedCache(MemoryCache(max_size=1000), disk, sync_interval=0.5)
+    """
+
+    def __init__(self, memory: CacheBackend, disk: DiskCache, sync_interval: float = 0.5) -> None:
+        """Inicializa el caché compartido.
+
+        Args:
+            memory: Nivel en memoria propio del proceso.
+            disk: Nivel en disco compartido; se activa su ``broadcast``.
+            sync_interval: Segundos entre lecturas de invalidaciones remotas.
+
+        Raises:
+            ValueError: Si sync_interval no es mayor a 0.
+        """
+        if sync_interval <= 0:
+            raise ValueError("sync_interval debe ser mayor a 0")
+        super().__init__(memory, disk)
+        disk.broadcast = True
+        disk.open()
+        self.sync_interval = sync_interval
+        self.remote_invalidations = 0
+        self._sync_task: asyncio.Task[None] | None = None
+
+    async def get(self, key: str) -> Any | None:
+        """Obtiene el valor de memoria o del disco compartido."""
+        self._ensure_sync()
+        return await super().get(key)
+
+    async def get_entry(self, key: str) -> CacheEntry | None:
+        """Obtiene la entrada completa de memoria o del disco compartido."""
+        self._ensure_sync()
+        return await super().get_entry(key)
+
+    async def sync(self) -> int:
+        """Aplica a la memoria las invalidaciones registradas por otros procesos.
+
+        Returns:
+            Número de invalidaciones aplicadas.
+        """
+        invalidations = await self.disk.poll_invalidations()
+        for invalidation in invalidations:
+            await self._apply_remote(invalidation)
+        self.remote_invalidations += len(invalidations)
+        return len(invalidations)
+
+    async def _apply_remote(self, invalidation: Invalidation) -> None:
+        """Aplica una invalidación remota solo al nivel en memoria."""
+        if invalidation.kind == "keys":
+            for key in invalidation.args:
+                await self.memory.delete(key)
+        elif invalidation.kind == "pattern":
+            for pattern in invalidation.args:
+                await self.memory.invalidate(pattern)
+        elif invalidation.kind == "tags":
+            await self.memory.invalidate_tags(*invalidation.args)
+        elif invalidation.kind == "clear":
+            await self.memory.clear()
+
+    def _ensure_sync(self) -> None:
+        """Lanza la sincronización periódica si no hay una en este loop."""
+        loop = asyncio.get_running_loop()
+        task = self._sync_task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self._sync_task = loop.create_task(self._sync_loop())
+
+    async def _sync_loop(self) -> None:
+        """Lee y aplica invalidaciones remotas cada ``sync_interval`` segundos."""
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            await self.sync()
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Obtiene las estadísticas de ambos niveles y de la sincronización en ``sync``."""
+        stats = await super().get_stats()
+        stats["sync"] = {
+            "origin": self.disk.origin,
+            "interval": self.sync_interval,
+            "remote_invalidations": self.remote_invalidations,
+        }
+        return stats
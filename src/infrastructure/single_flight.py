@@ -0,0 +1,156 @@
+"""Coalescencia de peticiones idénticas concurrentes (single-flight).
+
+Cuando varias sesiones piden a la vez el mismo recurso (estadísticas de
+un proyecto, filtros, ``/issues/{id}``...), cada fallo de caché acababa en
+una llamada independiente a la API. SingleFlight agrupa las llamadas
+concurrentes con la misma clave: la primera ejecuta la petición y las
+demás esperan su resultado (o su excepción).
+
+Features:
+- Una sola petición en vuelo por clave y event loop
+- Los seguidores reciben el mismo resultado o la misma excepción
+- Cancelar a un llamador no cancela la petición compartida
+- Métricas de peticiones ejecutadas y coalescidas
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, TypeVar
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightMetrics:
+    """Contadores de la coalescencia de peticiones.
+
+    Attributes:
+        executed: Peticiones que llegaron a ejecutarse.
+        coalesced: Peticiones servidas por otra ya en vuelo.
+    """
+
+    executed: int = 0
+    coalesced: int = 0
+
+    @property
+    def coalesce_rate(self) -> float:
+        """Proporción de peticiones coalescidas sobre el total."""
+        total = self.executed + self.coalesced
+        return self.coalesced / total if total > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializa las métricas para get_stats()."""
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "coalesce_rate": round(self.coalesce_rate, 4),
+        }
+
+
+class SingleFlight:
+    """Agrupa llamadas concurrentes con la misma clave en una sola ejecución.
+
+    La primera llamada con una clave lanza ``fn`` como tarea; las que llegan
+    mientras sigue en vuelo esperan esa misma tarea. Al terminar, la clave se
+    libera y la siguiente llamada vuelve a ejecutar ``fn``: no es un caché.
+
+    Las tareas quedan ligadas al event loop en el que se crearon; una llamada
+    desde otro loop no se une a ellas y ejecuta su propia petición.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> result = await flight.do(("GET", "/projects/1"), fetch_project)
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el registro de peticiones en vuelo."""
+        self._in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+        self._metrics = SingleFlightMetrics()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Ejecuta fn, o espera a la ejecución en vuelo con la misma clave.
+
+        Args:
+            key: Clave que identifica peticiones equivalentes.
+            fn: Corrutina sin argumentos que realiza la petición.
+
+        Returns:
+            El resultado de la única ejecución de fn para la clave.
+
+        Raises:
+            Exception: La misma excepción que lanzó la ejecución compartida.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get(key)
+        if task is not None and not task.done() and task.get_loop() is loop:
+            self._metrics.coalesced += 1
+        else:
+            task = loop.create_task(self._run(fn))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+            self._metrics.executed += 1
+
+        # shield: cancelar a un llamador no cancela la petición de los demás
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _run(fn: Callable[[], Awaitable[T]]) -> T:
+        """Envuelve fn en una corrutina para poder lanzarla como tarea."""
+        return await fn()
+
+    def _release(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        """Libera la clave y marca la excepción como recuperada."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Evita el aviso "exception was never retrieved" si todos se cancelaron
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        """Número de peticiones actualmente en vuelo."""
+        return len(self._in_flight)
+
+    def get_metrics(self) -> SingleFlightMetrics:
+        """Obtiene los contadores de coalescencia."""
+        return self._metrics
+
+    def get_stats(self) -> dict[str, Any]:
+        """Obtiene las estadísticas de coalescencia.
+
+        Returns:
+            Diccionario con las peticiones en vuelo y las métricas.
+        """
+        return {"in_flight": self.in_flight, **self._metrics.to_dict()}
+
+
+# Singleton global para uso en toda la aplicación
+_single_flight: SingleFlight | None = None
+_single_flight_lock = Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Obtiene el registro de peticiones en vuelo que comparten todos los TaigaAPIClient.
+
+    Returns:
+        La instancia singleton de SingleFlight.
+    """
+    global _single_flight
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                _single_flight = SingleFlight()
+    return _single_flight
+
+
+def reset_single_flight() -> None:
+    """Resetea el singleton de SingleFlight.
+
+    Útil para testing para asegurar un estado limpio entre tests.
+    """
+    global _single_flight
+    with _single_flight_lock:
+        _single_flight = None
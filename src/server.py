@@ -16,6 +16,7 @@ from fastmcp import FastMCP
 
 from src.domain.exceptions import AuthenticationError
 from src.infrastructure.container import ApplicationContainer
+from src.infrastructure.json_codec import serialize_tool_result
 from src.infrastructure.middleware import (
     ErrorHandlingMiddleware,
     RateLimitingMiddleware,
@@ -79,7 +80,13 @@ class TaigaMCPServer:
 
         # Override MCP name if needed
         if name != "Taiga MCP Server":
-            self.container.mcp.override(FastMCP(name))
+            self.container.mcp.override(
+                FastMCP(
+                    name,
+                    lifespan=self.container.lifespan,
+                    tool_serializer=serialize_tool_result,
+                )
+            )
 
         try:
             self.config = self.container.config()
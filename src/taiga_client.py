@@ -7,6 +7,7 @@ All methods have explicit type hints for parameters and return values.
 
 import asyncio
 import time
+from pathlib import Path
 
 # Import TYPE_CHECKING to avoid circular imports
 from typing import TYPE_CHECKING, Any, cast
@@ -22,13 +23,33 @@ from src.domain.exceptions import (
     ResourceNotFoundError,
     TaigaAPIError,
 )
+from src.infrastructure.adaptive_rate_limiter import (
+    AdaptiveRateLimiter,
+    get_rate_limiter,
+    parse_retry_after,
+)
+from src.infrastructure.cache_invalidation import MUTATING_METHODS, tags_for_mutation
+from src.infrastructure.cached_client import CacheKeyBuilder
+from src.infrastructure.circuit_breaker import (
+    CircuitBreakerRegistry,
+    counts_as_failure,
+    get_circuit_breakers,
+)
+from src.infrastructure.hedging import HedgingPolicy, get_hedging_policy
+from src.infrastructure.json_codec import JSONCodec, get_json_codec
 from src.infrastructure.logging import get_logger
-from src.infrastructure.retry import RetryConfig, calculate_delay
+from src.infrastructure.negative_cache import NegativeCache, get_negative_cache, project_of
+from src.infrastructure.retry import RetryBudget, RetryConfig, calculate_delay, get_retry_budget
+from src.infrastructure.single_flight import SingleFlight, get_single_flight
 
 
 if TYPE_CHECKING:
+    from src.infrastructure.cache import CacheBackend
     from src.infrastructure.http_session_pool import HTTPSessionPool
 
+# File part of a multipart request: form field, file on disk and content type
+Upload = tuple[str, Path, str]
+
 
 class TaigaAPIClient:
     """
@@ -42,6 +63,14 @@ class TaigaAPIClient:
         config: TaigaConfig | None = None,
         session_pool: "HTTPSessionPool | None" = None,
         retry_config: RetryConfig | None = None,
+        cache: "CacheBackend | None" = None,
+        single_flight: SingleFlight | None = None,
+        retry_budget: RetryBudget | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        hedging: HedgingPolicy | None = None,
+        json_codec: JSONCodec | None = None,
+        negative_cache: NegativeCache | None = None,
     ) -> None:
         """
         Initialize Taiga API client.
@@ -53,6 +82,26 @@ class TaigaAPIClient:
                          creating its own HTTP client.
             retry_config: Configuration for retry behavior with exponential backoff.
                          If not provided, uses default RetryConfig values.
+            cache: Metadata cache invalidated after successful writes.
+                   If not provided, uses the global cache from client_factory.
+            single_flight: Registry used to coalesce identical concurrent GETs.
+                   If not provided, uses the process-wide SingleFlight.
+            retry_budget: Budget every retry draws from.
+                   If not provided, uses the process-wide RetryBudget.
+            rate_limiter: Limiter that paces outgoing requests and reacts to 429s.
+                   If not provided, uses the process-wide AdaptiveRateLimiter.
+            circuit_breakers: Per-endpoint-family breakers that fail fast
+                   while an endpoint keeps failing.
+                   If not provided, uses the process-wide CircuitBreakerRegistry.
+            hedging: Policy that sends a second identical GET when the first
+                   is slower than the endpoint's p95 (opt-in).
+                   If not provided, uses the process-wide HedgingPolicy.
+            json_codec: Codec that decodes response bodies and encodes request
+                   bodies (orjson / msgspec when installed, stdlib otherwise).
+                   If not provided, uses the process-wide JSONCodec.
+            negative_cache: Short-TTL memory of GETs that ended in 404 / 403,
+                   cleared by writes to the same resource.
+                   If not provided, uses the process-wide NegativeCache.
         """
         self.config = config or TaigaConfig()
         self.base_url = self.config.taiga_api_url
@@ -61,13 +110,53 @@ class TaigaAPIClient:
         self._client: AsyncClient | None = None
         self._session_pool = session_pool
         self._owns_client: bool = session_pool is None
+        # Shared GETs led by this client still running for other callers
+        self._flights = 0
+        self._disconnect_pending = False
+        self._cache = cache
+        self._single_flight = single_flight or get_single_flight()
+        self._retry_budget = retry_budget or get_retry_budget()
+        self._rate_limiter = rate_limiter or get_rate_limiter()
+        self._circuit_breakers = circuit_breakers or get_circuit_breakers()
+        self._hedging = hedging or get_hedging_policy()
+        self._json = json_codec or get_json_codec()
+        self._negative_cache = negative_cache or get_negative_cache()
         self._logger = get_logger("taiga_client")
         self._retry_config = retry_config or RetryConfig(
             max_retries=self.config.max_retries,
             base_delay=1.0,
             max_delay=60.0,
             jitter=True,
+            deadline=self.config.request_deadline or None,
+        )
+
+    def clone(self) -> "TaigaAPIClient":
+        """
+        Create a client with the same configuration, shared services and tokens.
+
+        The clone has its own connection state, so it can keep working after
+        this client is closed, e.g. for a background cache refresh scheduled
+        during a tool call.
+
+        Returns:
+            New TaigaAPIClient, not yet connected
+        """
+        clone = TaigaAPIClient(
+            self.config,
+            session_pool=self._session_pool,
+            retry_config=self._retry_config,
+            cache=self._cache,
+            single_flight=self._single_flight,
+            retry_budget=self._retry_budget,
+            rate_limiter=self._rate_limiter,
+            circuit_breakers=self._circuit_breakers,
+            hedging=self._hedging,
+            json_codec=self._json,
+            negative_cache=self._negative_cache,
         )
+        clone.auth_token = self.auth_token
+        clone.refresh_token = self.refresh_token
+        return clone
 
     async def __aenter__(self) -> "TaigaAPIClient":
         """Async context manager entry."""
@@ -150,14 +239,13 @@ class TaigaAPIClient:
         If a session pool was provided, obtains a client from the pool.
         Otherwise, creates a new HTTP client.
         """
+        self._disconnect_pending = False
         if not self._client:
             self._logger.debug(f"Connecting to Taiga API at {self.base_url}")
 
             if self._session_pool is not None:
                 # Use the shared session pool
-                if not self._session_pool.is_started:
-                    await self._session_pool.start()
-                self._client = self._session_pool._client
+                self._client = await self._session_pool.get_client()
                 self._owns_client = False
                 self._logger.info(f"Connected to Taiga API at {self.base_url} using session pool")
             else:
@@ -175,7 +263,12 @@ class TaigaAPIClient:
 
         Only closes the client if it owns it (not using session pool).
         When using a session pool, the pool manages the client lifecycle.
+        While a coalesced GET led by this client is still running for other
+        callers, the close is deferred until that request finishes.
         """
+        if self._flights:
+            self._disconnect_pending = True
+            return
         if self._client:
             self._logger.debug("Disconnecting from Taiga API")
             if self._owns_client:
@@ -287,6 +380,86 @@ class TaigaAPIClient:
             headers["Authorization"] = f"Bearer {self.auth_token}"
         return headers
 
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        headers: dict[str, str],
+        upload: Upload | None = None,
+    ) -> Response:
+        """
+        Send a single attempt of a request, paced by the shared rate limiter.
+
+        With hedging enabled, a GET slower than its endpoint's p95 is sent a
+        second time and the first response wins. A POST with an ``upload``
+        sends ``data`` as form fields and streams the file from disk; the file
+        is reopened on every attempt so retries send it whole.
+        """
+        assert self._client is not None, "Client not initialized after connect()"
+        client = self._client
+        await self._rate_limiter.acquire()
+        if method == "GET":
+            if self._hedging.enabled:
+                return await self._hedging.run(
+                    endpoint,
+                    lambda: client.get(endpoint, params=params, headers=headers),
+                    before_hedge=self._rate_limiter.acquire,
+                )
+            return await self._client.get(endpoint, params=params, headers=headers)
+        if method == "POST" and upload is not None:
+            field, path, content_type = upload
+            # httpx reads the open file in chunks while sending the request body
+            with path.open("rb") as file_obj:
+                return await self._client.post(
+                    endpoint,
+                    data=data,
+                    files={field: (path.name, file_obj, content_type)},
+                    params=params,
+                    headers=headers,
+                )
+        # The client's default Content-Type is already application/json
+        content = None if data is None else self._json.dumps(data)
+        if method == "POST":
+            return await self._client.post(
+                endpoint, content=content, params=params, headers=headers
+            )
+        if method == "PUT":
+            return await self._client.put(endpoint, content=content, params=params, headers=headers)
+        if method == "PATCH":
+            return await self._client.patch(
+                endpoint, content=content, params=params, headers=headers
+            )
+        if method == "DELETE":
+            return await self._client.delete(endpoint, params=params, headers=headers)
+        self._logger.error(f"Unsupported HTTP method: {method}")
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
+    def _decode(self, response: Response) -> Any:
+        """Decode a JSON response body with the configured codec."""
+        return self._json.loads(response.content)
+
+    def _report_rate_limit(self, response: Response) -> None:
+        """Feed a response status (and Retry-After on 429) to the shared rate limiter."""
+        if response.status_code == 429:
+            self._rate_limiter.on_response(
+                429, parse_retry_after(response.headers.get("Retry-After"))
+            )
+        else:
+            self._rate_limiter.on_response(response.status_code)
+
+    def _can_retry(self, delay: float, deadline: float | None) -> bool:
+        """
+        Check whether a retry after ``delay`` seconds is allowed.
+
+        A retry must finish its wait before the call deadline and take a
+        token from the process-wide retry budget.
+        """
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return False
+        return self._retry_budget.try_acquire()
+
     async def _make_request(
         self,
         method: str,
@@ -295,17 +468,79 @@ class TaigaAPIClient:
         params: dict[str, Any] | None = None,
         retry_count: int = 0,
         headers: dict[str, str] | None = None,
+        upload: Upload | None = None,
+    ) -> Response:
+        """
+        Make HTTP request guarded by the circuit breaker of its endpoint family.
+
+        While the breaker is open the call fails fast with CircuitOpenError
+        instead of waiting for timeouts and retries. The outcome of the whole
+        call (after retries) is reported back: transient failures and 5xx
+        count towards opening the circuit, any other response closes it.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            data: Request body data
+            params: Query parameters
+            retry_count: Retry attempts already made for this call
+            headers: Additional headers to include in the request
+            upload: File to stream as multipart form data (field, path, content type)
+
+        Returns:
+            HTTP response
+
+        Raises:
+            CircuitOpenError: If the endpoint family is failing
+            TaigaAPIError: On request failure
+        """
+        breaker = self._circuit_breakers.for_endpoint(endpoint)
+        probe = breaker.before_request()
+        try:
+            response = await self._request_with_retries(
+                method, endpoint, data, params, retry_count, headers, upload
+            )
+        except Exception as e:
+            if counts_as_failure(e):
+                breaker.record_failure(probe)
+            else:
+                breaker.record_success(probe)
+            raise
+        except BaseException:
+            # Cancelled: a probe gives its half-open slot back without a verdict
+            if probe:
+                breaker.release()
+            raise
+        breaker.record_success(probe)
+        return response
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        retry_count: int = 0,
+        headers: dict[str, str] | None = None,
+        upload: Upload | None = None,
     ) -> Response:
         """
         Make HTTP request with retry logic.
 
+        Retries run in a loop: 429 responses pause the shared rate limiter
+        for Retry-After, timeouts back off exponentially and a 401 refreshes
+        the token once. Every
+        retry needs a token from the process-wide RetryBudget, and no retry
+        (nor attempt) runs past the call deadline of the RetryConfig.
+
         Args:
             method: HTTP method
             endpoint: API endpoint
             data: Request body data
             params: Query parameters
-            retry_count: Current retry attempt
+            retry_count: Retry attempts already made for this call
             headers: Additional headers to include in the request
+            upload: File to stream as multipart form data (field, path, content type)
 
         Returns:
             HTTP response
@@ -318,103 +553,122 @@ class TaigaAPIClient:
         # Assert client is connected after connect()
         assert self._client is not None, "Client not initialized after connect()"
 
-        # Merge auth headers with custom headers
-        request_headers = self._get_headers()
-        if headers:
-            request_headers.update(headers)
+        call_deadline = self._retry_config.deadline
+        deadline = time.monotonic() + call_deadline if call_deadline else None
+        if retry_count == 0:
+            self._retry_budget.record_request()
+        refreshed = retry_count > 0
 
-        # Log request start
-        retry_info = f" (retry {retry_count})" if retry_count > 0 else ""
-        self._logger.debug(f"[API] {method} {endpoint}{retry_info}")
+        while True:
+            # Merge auth headers with custom headers (rebuilt after a token refresh)
+            request_headers = self._get_headers()
+            if headers:
+                request_headers.update(headers)
 
-        start_time = time.perf_counter()
+            # Log request start
+            retry_info = f" (retry {retry_count})" if retry_count > 0 else ""
+            self._logger.debug(f"[API] {method} {endpoint}{retry_info}")
 
-        try:
-            if method == "GET":
-                response = await self._client.get(endpoint, params=params, headers=request_headers)
-            elif method == "POST":
-                response = await self._client.post(
-                    endpoint, json=data, params=params, headers=request_headers
-                )
-            elif method == "PUT":
-                response = await self._client.put(
-                    endpoint, json=data, params=params, headers=request_headers
-                )
-            elif method == "PATCH":
-                response = await self._client.patch(
-                    endpoint, json=data, params=params, headers=request_headers
-                )
-            elif method == "DELETE":
-                response = await self._client.delete(
-                    endpoint, params=params, headers=request_headers
-                )
-            else:
-                self._logger.error(f"Unsupported HTTP method: {method}")
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            start_time = time.perf_counter()
 
-            duration = time.perf_counter() - start_time
+            try:
+                if deadline is None:
+                    response = await self._send(
+                        method, endpoint, data, params, request_headers, upload
+                    )
+                else:
+                    try:
+                        async with asyncio.timeout(max(0.0, deadline - time.monotonic())):
+                            response = await self._send(
+                                method, endpoint, data, params, request_headers, upload
+                            )
+                    except TimeoutError as e:
+                        duration = time.perf_counter() - start_time
+                        self._logger.error(
+                            f"[API] {method} {endpoint} | Deadline of {call_deadline}s exceeded | "
+                            f"retries={retry_count} | duration={duration:.3f}s"
+                        )
+                        raise TaigaAPIError(
+                            f"Request deadline of {call_deadline}s exceeded "
+                            f"after {retry_count} retries"
+                        ) from e
+
+                duration = time.perf_counter() - start_time
+
+                # Slows down (and on 429 pauses) every client sharing the limiter
+                self._report_rate_limit(response)
+
+                # Handle rate limiting
+                if response.status_code == 429:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_count < self.config.max_retries and self._can_retry(
+                        retry_after, deadline
+                    ):
+                        # The retry waits for the pause in _send, like all other traffic
+                        self._logger.warning(
+                            f"[API] {method} {endpoint} | status=429 Rate Limited | "
+                            f"retry_after={retry_after:g}s | duration={duration:.3f}s"
+                        )
+                        retry_count += 1
+                        continue
+                    self._logger.error(
+                        f"[API] {method} {endpoint} | status=429 Rate limit exceeded after {retry_count} retries"
+                    )
+                    raise RateLimitError(f"Rate limit exceeded after {retry_count} retries")
+
+                # Handle authentication errors
+                if response.status_code == 401:
+                    # Try to refresh token once; the refresh is not charged to the budget
+                    if not refreshed and self.refresh_token:
+                        self._logger.warning(
+                            f"[API] {method} {endpoint} | status=401 | "
+                            f"Attempting token refresh | duration={duration:.3f}s"
+                        )
+                        await self.refresh_auth_token()
+                        refreshed = True
+                        retry_count += 1
+                        continue
+                    self._logger.error(
+                        f"[API] {method} {endpoint} | status=401 Authentication failed | duration={duration:.3f}s"
+                    )
+                    raise AuthenticationError("Authentication failed")
 
-            # Handle rate limiting
-            if response.status_code == 429:
-                if retry_count < self.config.max_retries:
-                    # Wait and retry
-                    retry_after = int(response.headers.get("Retry-After", 5))
+                # Handle not found
+                if response.status_code == 404:
                     self._logger.warning(
-                        f"[API] {method} {endpoint} | status=429 Rate Limited | "
-                        f"retry_after={retry_after}s | duration={duration:.3f}s"
-                    )
-                    await asyncio.sleep(retry_after)
-                    return await self._make_request(
-                        method, endpoint, data, params, retry_count + 1, headers
+                        f"[API] {method} {endpoint} | status=404 Not Found | duration={duration:.3f}s"
                     )
-                self._logger.error(
-                    f"[API] {method} {endpoint} | status=429 Rate limit exceeded after {retry_count} retries"
-                )
-                raise RateLimitError(f"Rate limit exceeded after {retry_count} retries")
+                    raise ResourceNotFoundError(f"Resource not found: {endpoint}")
 
-            # Handle authentication errors
-            if response.status_code == 401:
-                # Try to refresh token once
-                if retry_count == 0 and self.refresh_token:
+                # Handle forbidden
+                if response.status_code == 403:
                     self._logger.warning(
-                        f"[API] {method} {endpoint} | status=401 | "
-                        f"Attempting token refresh | duration={duration:.3f}s"
+                        f"[API] {method} {endpoint} | status=403 Permission Denied | duration={duration:.3f}s"
                     )
-                    await self.refresh_auth_token()
-                    return await self._make_request(
-                        method, endpoint, data, params, retry_count + 1, headers
+                    raise PermissionDeniedError(f"Permission denied: {endpoint}")
+
+                # Conditional GET: the cached copy is still current, there is no body
+                if response.status_code == 304:
+                    self._logger.info(
+                        f"[API] {method} {endpoint} | status=304 Not Modified | duration={duration:.3f}s"
                     )
-                self._logger.error(
-                    f"[API] {method} {endpoint} | status=401 Authentication failed | duration={duration:.3f}s"
-                )
-                raise AuthenticationError("Authentication failed")
+                    return response
 
-            # Handle not found
-            if response.status_code == 404:
-                self._logger.warning(
-                    f"[API] {method} {endpoint} | status=404 Not Found | duration={duration:.3f}s"
-                )
-                raise ResourceNotFoundError(f"Resource not found: {endpoint}")
+                # Raise for other HTTP errors
+                response.raise_for_status()
 
-            # Handle forbidden
-            if response.status_code == 403:
-                self._logger.warning(
-                    f"[API] {method} {endpoint} | status=403 Permission Denied | duration={duration:.3f}s"
+                # Log successful request
+                self._logger.info(
+                    f"[API] {method} {endpoint} | status={response.status_code} | duration={duration:.3f}s"
                 )
-                raise PermissionDeniedError(f"Permission denied: {endpoint}")
 
-            # Raise for other HTTP errors
-            response.raise_for_status()
+                if method in MUTATING_METHODS:
+                    self._negative_cache.invalidate(endpoint, project_of(endpoint, data, params))
+                    await self._invalidate_cache(method, endpoint, data, params)
+                return response
 
-            # Log successful request
-            self._logger.info(
-                f"[API] {method} {endpoint} | status={response.status_code} | duration={duration:.3f}s"
-            )
-            return response
-
-        except httpx.TimeoutException as e:
-            duration = time.perf_counter() - start_time
-            if retry_count < self._retry_config.max_retries:
+            except httpx.TimeoutException as e:
+                duration = time.perf_counter() - start_time
                 # Calculate delay using exponential backoff with jitter
                 delay = calculate_delay(
                     attempt=retry_count,
@@ -423,50 +677,143 @@ class TaigaAPIClient:
                     exponential_base=self._retry_config.exponential_base,
                     jitter=self._retry_config.jitter,
                 )
-                self._logger.warning(
-                    f"[API] {method} {endpoint} | Timeout | "
-                    f"retry={retry_count + 1}/{self._retry_config.max_retries} | "
-                    f"delay={delay:.2f}s | duration={duration:.3f}s"
+                if retry_count < self._retry_config.max_retries and self._can_retry(
+                    delay, deadline
+                ):
+                    self._logger.warning(
+                        f"[API] {method} {endpoint} | Timeout | "
+                        f"retry={retry_count + 1}/{self._retry_config.max_retries} | "
+                        f"delay={delay:.2f}s | duration={duration:.3f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    retry_count += 1
+                    continue
+                self._logger.error(
+                    f"[API] {method} {endpoint} | Timeout after {retry_count} retries | "
+                    f"error={e!s} | duration={duration:.3f}s"
+                )
+                raise TaigaAPIError(f"Request timeout after {retry_count} retries: {e!s}") from e
+
+            except httpx.HTTPStatusError as e:
+                duration = time.perf_counter() - start_time
+                self._logger.error(
+                    f"[API] {method} {endpoint} | status={e.response.status_code} | "
+                    f"error={e!s} | duration={duration:.3f}s"
                 )
-                await asyncio.sleep(delay)
-                return await self._make_request(
-                    method, endpoint, data, params, retry_count + 1, headers
+                # Already handled specific status codes above
+                raise TaigaAPIError(
+                    f"HTTP error: {e!s}",
+                    status_code=e.response.status_code,
+                    response_body=e.response.text,
+                ) from e
+
+            except Exception as e:
+                duration = time.perf_counter() - start_time
+                if isinstance(
+                    e,
+                    AuthenticationError
+                    | ResourceNotFoundError
+                    | PermissionDeniedError
+                    | RateLimitError
+                    | TaigaAPIError,
+                ):
+                    raise
+                self._logger.error(
+                    f"[API] {method} {endpoint} | Unexpected error | "
+                    f"error={type(e).__name__}: {e!s} | duration={duration:.3f}s"
                 )
-            self._logger.error(
-                f"[API] {method} {endpoint} | Timeout after {retry_count} retries | "
-                f"error={e!s} | duration={duration:.3f}s"
-            )
-            raise TaigaAPIError(f"Request timeout after {retry_count} retries: {e!s}") from e
+                raise TaigaAPIError(f"Request error: {e!s}") from e
 
-        except httpx.HTTPStatusError as e:
-            duration = time.perf_counter() - start_time
-            self._logger.error(
-                f"[API] {method} {endpoint} | status={e.response.status_code} | "
-                f"error={e!s} | duration={duration:.3f}s"
+    async def _invalidate_cache(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+    ) -> None:
+        """
+        Evict the cached metadata made stale by a successful write.
+
+        Args:
+            method: HTTP method of the write
+            endpoint: API endpoint that was modified
+            data: Request body data
+            params: Query parameters
+        """
+        tags = tags_for_mutation(method, endpoint, data, params)
+        if not tags:
+            return
+
+        cache = self._cache
+        if cache is None:
+            # Imported lazily: client_factory depends on this module
+            from src.infrastructure.client_factory import get_global_cache
+
+            cache = get_global_cache()
+
+        count = await cache.invalidate_tags(*tags)
+        if count:
+            self._logger.debug(
+                f"[CACHE] {method} {endpoint} | invalidated={count} | tags={sorted(tags)}"
             )
-            # Already handled specific status codes above
-            raise TaigaAPIError(
-                f"HTTP error: {e!s}",
-                status_code=e.response.status_code,
-                response_body=e.response.text,
-            ) from e
 
+    async def _coalesced_get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        """
+        Make GET request, sharing it with identical concurrent GETs.
+
+        The key includes the token principal, so users with different
+        permissions never share a response. Each caller parses the shared
+        response itself, so no JSON object is aliased between callers.
+
+        A 404 or 403 is remembered by the negative cache under the same key,
+        so repeating the lookup re-raises the error without an API call.
+
+        The request runs on this (the leader's) client. If the leader's call
+        is cancelled and it disconnects meanwhile, the connection stays open
+        until the shared request finishes for the remaining callers.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            headers: Additional headers to include in the request
+
+        Returns:
+            HTTP response
+        """
+        principal = CacheKeyBuilder.principal(self.auth_token) if self.auth_token else None
+        key = (
+            "GET",
+            self.base_url,
+            endpoint,
+            tuple(sorted((k, repr(v)) for k, v in (params or {}).items())),
+            tuple(sorted((headers or {}).items())),
+            principal,
+        )
+        error = self._negative_cache.lookup(key)
+        if error is not None:
+            self._logger.debug(f"[API] GET {endpoint} | negative cache hit | {error!s}")
+            raise error
+
+        async def fetch() -> Response:
+            # The shared request outlives a cancelled leader: keep its connection open
+            self._flights += 1
+            try:
+                return await self._make_request("GET", endpoint, params=params, headers=headers)
+            finally:
+                self._flights -= 1
+                if self._disconnect_pending and not self._flights:
+                    await self.disconnect()
+
+        try:
+            return await self._single_flight.do(key, fetch)
         except Exception as e:
-            duration = time.perf_counter() - start_time
-            if isinstance(
-                e,
-                AuthenticationError
-                | ResourceNotFoundError
-                | PermissionDeniedError
-                | RateLimitError
-                | TaigaAPIError,
-            ):
-                raise
-            self._logger.error(
-                f"[API] {method} {endpoint} | Unexpected error | "
-                f"error={type(e).__name__}: {e!s} | duration={duration:.3f}s"
-            )
-            raise TaigaAPIError(f"Request error: {e!s}") from e
+            self._negative_cache.store(key, endpoint, e, project_of(endpoint, params))
+            raise
 
     async def get(
         self,
@@ -485,8 +832,68 @@ class TaigaAPIClient:
         Returns:
             JSON response data
         """
-        response = await self._make_request("GET", endpoint, params=params, headers=headers)
-        return cast("dict[str, Any] | list[Any]", response.json())
+        response = await self._coalesced_get(endpoint, params=params, headers=headers)
+        return cast("dict[str, Any] | list[Any]", self._decode(response))
+
+    async def get_with_headers(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[dict[str, Any] | list[Any], httpx.Headers]:
+        """
+        Make GET request and also return the response headers.
+
+        Used by the paginator to read the x-pagination-* headers.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            headers: Additional headers to include in the request
+
+        Returns:
+            Tuple of (JSON response data, response headers)
+        """
+        response = await self._coalesced_get(endpoint, params=params, headers=headers)
+        return cast("dict[str, Any] | list[Any]", self._decode(response)), response.headers
+
+    async def get_conditional(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        validators: dict[str, str] | None = None,
+    ) -> tuple[dict[str, Any] | list[Any] | None, dict[str, str]]:
+        """
+        Make GET request revalidating a cached copy with its validators.
+
+        Sends ``If-None-Match`` / ``If-Modified-Since`` built from the
+        ``ETag`` / ``Last-Modified`` of the cached response. On 304 Not
+        Modified the body is neither transferred nor parsed.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            validators: ETag / Last-Modified of the cached copy, if any
+
+        Returns:
+            Tuple of (JSON response data, validators). The data is None on
+            304, in which case the cached copy is still current.
+        """
+        headers = {}
+        if validators:
+            if "ETag" in validators:
+                headers["If-None-Match"] = validators["ETag"]
+            if "Last-Modified" in validators:
+                headers["If-Modified-Since"] = validators["Last-Modified"]
+        response = await self._coalesced_get(endpoint, params=params, headers=headers or None)
+        new_validators = {
+            name: response.headers[name]
+            for name in ("ETag", "Last-Modified")
+            if name in response.headers
+        }
+        if response.status_code == 304:
+            return None, {**(validators or {}), **new_validators}
+        return cast("dict[str, Any] | list[Any]", self._decode(response)), new_validators
 
     async def post(
         self,
@@ -508,7 +915,7 @@ class TaigaAPIClient:
         response = await self._make_request("POST", endpoint, data=data, params=params)
         if response.status_code == 204 or not response.content:
             return {}
-        return cast("dict[str, Any] | list[Any]", response.json())
+        return cast("dict[str, Any] | list[Any]", self._decode(response))
 
     async def post_multipart(
         self,
@@ -520,6 +927,12 @@ class TaigaAPIClient:
         """
         Make POST request with multipart/form-data for file upload.
 
+        The file is streamed from disk in chunks through the same HTTP client
+        as every other request (the shared session pool when there is one),
+        so memory use does not grow with the file size and no new connection
+        is opened per upload. Like every other write it goes through the
+        circuit breaker, the retry loop and the cache invalidation.
+
         Args:
             endpoint: API endpoint
             data: Form data fields
@@ -530,74 +943,29 @@ class TaigaAPIClient:
             JSON response data
         """
         import mimetypes
-        from pathlib import Path
-
-        await self.connect()
-        assert self._client is not None, "Client not initialized after connect()"
+        import secrets
 
         file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
+        if not file_path_obj.is_file():
             raise TaigaAPIError(f"File not found: {file_path}")
 
-        # For multipart, we need to use a fresh client without Content-Type header
-        # The default client has Content-Type: application/json which breaks multipart
+        # The client's default Content-Type is application/json; an explicit
+        # multipart Content-Type overrides it and httpx takes the boundary from it
+        boundary = secrets.token_hex(16)
         headers = {
-            "Authorization": f"Bearer {self.auth_token}",
             "Accept": "application/json",
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
         }
 
-        # Read file content
-        file_content = file_path_obj.read_bytes()
-        file_name = file_path_obj.name
-
-        # Determine content type
-        content_type, _ = mimetypes.guess_type(file_name)
-        if content_type is None:
-            content_type = "application/octet-stream"
-
-        # Prepare files dict for httpx with content-type
-        files = {file_field: (file_name, file_content, content_type)}
-
-        start_time = time.perf_counter()
+        content_type, _ = mimetypes.guess_type(file_path_obj.name)
+        upload = (file_field, file_path_obj, content_type or "application/octet-stream")
 
-        try:
-            # Use a fresh client for multipart to avoid Content-Type: application/json
-            async with httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=httpx.Timeout(self.config.timeout),
-            ) as multipart_client:
-                response = await multipart_client.post(
-                    endpoint,
-                    data=data,
-                    files=files,
-                    headers=headers,
-                )
-            duration = time.perf_counter() - start_time
-
-            if response.status_code == 401:
-                raise AuthenticationError("Authentication failed")
-            if response.status_code == 403:
-                raise PermissionDeniedError(f"Permission denied: {endpoint}")
-            if response.status_code == 404:
-                raise ResourceNotFoundError(f"Resource not found: {endpoint}")
-
-            response.raise_for_status()
-
-            self._logger.info(
-                f"[API] POST {endpoint} (multipart) | status={response.status_code} | duration={duration:.3f}s"
-            )
-
-            if response.status_code == 204 or not response.content:
-                return {}
-            return cast("dict[str, Any]", response.json())
-
-        except httpx.HTTPStatusError as e:
-            duration = time.perf_counter() - start_time
-            self._logger.error(
-                f"[API] POST {endpoint} (multipart) | status={e.response.status_code} | "
-                f"error={e!s} | duration={duration:.3f}s"
-            )
-            raise TaigaAPIError(f"HTTP error: {e!s}") from e
+        response = await self._make_request(
+            "POST", endpoint, data=data, headers=headers, upload=upload
+        )
+        if response.status_code == 204 or not response.content:
+            return {}
+        return cast("dict[str, Any]", self._decode(response))
 
     async def put(
         self,
@@ -619,7 +987,7 @@ class TaigaAPIClient:
         response = await self._make_request("PUT", endpoint, data=data, params=params)
         if response.status_code == 204 or not response.content:
             return {}
-        return cast("dict[str, Any] | list[Any]", response.json())
+        return cast("dict[str, Any] | list[Any]", self._decode(response))
 
     async def patch(
         self,
@@ -641,7 +1009,7 @@ class TaigaAPIClient:
         response = await self._make_request("PATCH", endpoint, data=data, params=params)
         if response.status_code == 204 or not response.content:
             return {}
-        return cast("dict[str, Any] | list[Any]", response.json())
+        return cast("dict[str, Any] | list[Any]", self._decode(response))
 
     async def get_raw(self, endpoint: str, params: dict[str, Any] | None = None) -> bytes:
         """
@@ -657,6 +1025,89 @@ class TaigaAPIClient:
         response = await self._make_request("GET", endpoint, params=params)
         return response.content
 
+    async def download(
+        self,
+        endpoint: str,
+        target_path: str,
+        params: dict[str, Any] | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> dict[str, Any]:
+        """
+        Stream a GET response body to a file.
+
+        The body is written in chunks while it arrives, so memory use does not
+        grow with the response size. Data goes to ``<target>.part`` first and
+        is renamed into place only once the whole body was received.
+
+        Args:
+            endpoint: API endpoint
+            target_path: Destination file path
+            params: Query parameters
+            chunk_size: Size of the chunks read from the response
+
+        Returns:
+            Dict with the file path, size_bytes and sha256 hex digest
+        """
+        import hashlib
+        from pathlib import Path
+
+        await self.connect()
+        assert self._client is not None, "Client not initialized after connect()"
+
+        target = Path(target_path)
+        partial = target.with_name(f"{target.name}.part")
+        digest = hashlib.sha256()
+        size = 0
+        start_time = time.perf_counter()
+
+        try:
+            await self._rate_limiter.acquire()
+            async with self._client.stream(
+                "GET", endpoint, params=params, headers=self._get_headers()
+            ) as response:
+                self._report_rate_limit(response)
+                if response.status_code == 401:
+                    raise AuthenticationError("Authentication failed")
+                if response.status_code == 403:
+                    raise PermissionDeniedError(f"Permission denied: {endpoint}")
+                if response.status_code == 404:
+                    raise ResourceNotFoundError(f"Resource not found: {endpoint}")
+                if response.status_code == 429:
+                    raise RateLimitError("Rate limit exceeded")
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with partial.open("wb") as file_obj:
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        file_obj.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+            partial.replace(target)
+
+        except httpx.HTTPStatusError as e:
+            duration = time.perf_counter() - start_time
+            self._logger.error(
+                f"[API] GET {endpoint} (download) | status={e.response.status_code} | "
+                f"error={e!s} | duration={duration:.3f}s"
+            )
+            raise TaigaAPIError(
+                f"HTTP error: {e!s}",
+                status_code=e.response.status_code,
+                response_body=e.response.text,
+            ) from e
+        except httpx.HTTPError as e:
+            raise TaigaAPIError(f"Request error: {e!s}") from e
+        finally:
+            partial.unlink(missing_ok=True)
+
+        duration = time.perf_counter() - start_time
+        self._logger.info(
+            f"[API] GET {endpoint} (download) | size_bytes={size} | duration={duration:.3f}s"
+        )
+        return {"path": str(target), "size_bytes": size, "sha256": digest.hexdigest()}
+
     async def delete(self, endpoint: str, params: dict[str, Any] | None = None) -> bool:
         """
         Make DELETE request.
@@ -1074,9 +1525,7 @@ class TaigaAPIClient:
         Returns:
             Attachment data
         """
-        return cast(
-            "dict[str, Any]", await self.get(f"/userstories/attachments/{attachment_id}")
-        )
+        return cast("dict[str, Any]", await self.get(f"/userstories/attachments/{attachment_id}"))
 
     async def update_userstory_attachment(
         self,
@@ -1625,7 +2074,7 @@ class TaigaAPIClient:
         Args:
             object_id: Issue ID to attach the file to
             project: Project ID
-            attached_file: File path or content
+            attached_file: Path to the file to attach
             description: Attachment description
             is_deprecated: Whether the attachment is deprecated
 
@@ -1635,13 +2084,12 @@ class TaigaAPIClient:
         data: dict[str, Any] = {
             "object_id": object_id,
             "project": project,
-            "attached_file": attached_file,
         }
         if description is not None:
             data["description"] = description
         if is_deprecated is not None:
             data["is_deprecated"] = is_deprecated
-        return cast("dict[str, Any]", await self.post("/issues/attachments", data=data))
+        return await self.post_multipart("/issues/attachments", data=data, file_path=attached_file)
 
     async def get_issue_attachment(self, attachment_id: int) -> dict[str, Any]:
         """Get issue attachment."""
@@ -2803,15 +3251,14 @@ class TaigaAPIClient:
         Returns:
             Created attachment data
         """
-        data = {
+        data: dict[str, Any] = {
             "object_id": epic_id,
             "project": project_id,
-            "attached_file": attached_file,
             "is_deprecated": is_deprecated,
         }
         if description:
             data["description"] = description
-        return cast("dict[str, Any]", await self.post("/epics/attachments", data=data))
+        return await self.post_multipart("/epics/attachments", data=data, file_path=attached_file)
 
     async def get_epic_attachment(self, attachment_id: int) -> dict[str, Any]:
         """Get a specific epic attachment.
@@ -5,7 +5,7 @@ Define fixtures que se usan en múltiples tests del proyecto MCP Taiga.
 
 import asyncio
 import inspect
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from datetime import date, timedelta
 from pathlib import Path
 from typing import Any
@@ -83,6 +83,72 @@ def event_loop() -> None:
         asyncio.set_event_loop(None)
 
 
+@pytest.fixture(autouse=True)
+def reset_metadata_cache() -> None:
+    """Reinicia el caché global para que las entradas no pasen de un test a otro."""
+    from src.infrastructure.client_factory import reset_global_cache
+
+    reset_global_cache()
+
+
+@pytest.fixture(autouse=True)
+def plain_cached_reads(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Desactiva los GET condicionales: los mocks de cliente simulan el método de cada endpoint.
+
+    Los tests que revalidan con ETag activan TAIGA_CACHE_REVALIDATE_WINDOW o
+    pasan revalidate_window a CachedTaigaClient.
+    """
+    monkeypatch.setenv("TAIGA_CACHE_REVALIDATE_WINDOW", "0")
+
+
+@pytest.fixture(autouse=True)
+def reset_retry_budget() -> None:
+    """Reinicia el presupuesto de reintentos para que un test no agote el de otro."""
+    from src.infrastructure.retry import reset_retry_budget as reset_budget
+
+    reset_budget()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter() -> None:
+    """Reinicia el limitador HTTP adaptativo para que un 429 no frene otros tests."""
+    from src.infrastructure.adaptive_rate_limiter import reset_rate_limiter as reset_limiter
+
+    reset_limiter()
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers() -> None:
+    """Reinicia los circuit breakers para que un circuito abierto no afecte a otros tests."""
+    from src.infrastructure.circuit_breaker import reset_circuit_breakers as reset_breakers
+
+    reset_breakers()
+
+
+@pytest.fixture(autouse=True)
+def reset_hedging_policy() -> None:
+    """Reinicia la política de cobertura para que sus latencias no pasen a otros tests."""
+    from src.infrastructure.hedging import reset_hedging_policy as reset_policy
+
+    reset_policy()
+
+
+@pytest.fixture(autouse=True)
+def reset_json_codec() -> None:
+    """Reinicia el codec JSON para que el registrado por un test no pase a otros."""
+    from src.infrastructure.json_codec import reset_json_codec as reset_codec
+
+    reset_codec()
+
+
+@pytest.fixture(autouse=True)
+def reset_negative_cache() -> None:
+    """Reinicia el caché negativo para que un 404 no se sirva en otros tests."""
+    from src.infrastructure.negative_cache import reset_negative_cache as reset_negative
+
+    reset_negative()
+
+
 # ============================================================================
 # FIXTURES DE DATOS DE PRUEBA
 # ============================================================================
@@ -214,6 +280,44 @@ async def http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
         yield client
 
 
+@pytest.fixture
+def make_api_client() -> Callable[..., Any]:
+    """Factory de TaigaAPIClient sobre un TaigaConfig real.
+
+    Los argumentos con nombre de campo de TaigaConfig (taiga_api_url,
+    taiga_auth_token, max_retries, request_deadline, ...) sustituyen los de la
+    configuración; el resto (single_flight, session_pool, retry_config, ...)
+    se pasan al constructor del cliente. Con ``http`` el cliente usa ese
+    cliente httpx (normalmente un mock) en lugar de conectarse.
+    """
+    from src.config import TaigaConfig
+    from src.taiga_client import TaigaAPIClient
+
+    def _make(http: Any = None, **overrides: Any) -> TaigaAPIClient:
+        settings: dict[str, Any] = {
+            "taiga_api_url": "https://api.taiga.io/api/v1",
+            "taiga_username": "user@example.com",
+            "taiga_password": "password123",
+            "taiga_auth_token": "token",
+        }
+        client_kwargs: dict[str, Any] = {}
+        for name, value in overrides.items():
+            if name in TaigaConfig.model_fields:
+                settings[name] = value
+            else:
+                client_kwargs[name] = value
+        fields = TaigaConfig.model_fields
+        config = TaigaConfig(
+            **{fields[name].alias or name: value for name, value in settings.items()}
+        )
+        client = TaigaAPIClient(config, **client_kwargs)
+        if http is not None:
+            client._client = http
+        return client
+
+    return _make
+
+
 # ============================================================================
 # FIXTURES DE MOCKING (RESPX)
 # ============================================================================
@@ -563,6 +667,12 @@ def taiga_client_mock() -> None:
 
     client.post = AsyncMock(side_effect=mock_post)
     client.get = AsyncMock(return_value={})
+
+    # El paginador concurrente lee la primera página con sus cabeceras
+    async def mock_get_with_headers(*args, **kwargs) -> tuple:
+        return await client.get(*args, **kwargs), {}
+
+    client.get_with_headers = AsyncMock(side_effect=mock_get_with_headers)
     client.patch = AsyncMock(return_value={})
     client.delete = AsyncMock(return_value=True)
     client.put = AsyncMock(return_value={})
@@ -1180,121 +1290,73 @@ def mcp_server(taiga_client_mock) -> None:
     # Crear instancia de FastMCP para las herramientas
     mcp = FastMCP("Test")
 
-    # Patch TaigaAPIClient en los tools para usar el mock
+    # Patch TaigaAPIClient en client_factory: todos los tools crean sus
+    # clientes con create_taiga_client
     import unittest.mock as mock
     from unittest.mock import AsyncMock
 
+    client_patch = mock.patch("src.infrastructure.client_factory.TaigaAPIClient")
+    mock_client_cls = client_patch.start()
+    mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=taiga_client_mock)
+    mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=None)
+
     # Crear y configurar issue_tools (usa patching de TaigaAPIClient)
-    mock_issue_patch = mock.patch("src.application.tools.issue_tools.TaigaAPIClient")
-    mock_issue_cls = mock_issue_patch.start()
-    mock_issue_cls.return_value.__aenter__ = AsyncMock(return_value=taiga_client_mock)
-    mock_issue_cls.return_value.__aexit__ = AsyncMock(return_value=None)
     issue_tools = IssueTools(mcp)
     issue_tools.register_tools()
     server.issue_tools = issue_tools
 
     # Crear y configurar task_tools (usa patching de TaigaAPIClient)
-    mock_task_patch = mock.patch("src.application.tools.task_tools.TaigaAPIClient")
-    mock_task_cls = mock_task_patch.start()
-    mock_task_cls.return_value.__aenter__ = AsyncMock(return_value=taiga_client_mock)
-    mock_task_cls.return_value.__aexit__ = AsyncMock(return_value=None)
     task_tools = TaskTools(mcp)
     server.task_tools = task_tools
 
     # Crear y configurar milestone_tools (usa patching de TaigaAPIClient)
-    mock_milestone_patch = mock.patch("src.application.tools.milestone_tools.TaigaAPIClient")
-    mock_milestone_cls = mock_milestone_patch.start()
-    mock_milestone_cls.return_value.__aenter__ = AsyncMock(return_value=taiga_client_mock)
-    mock_milestone_cls.return_value.__aexit__ = AsyncMock(return_value=None)
     milestone_tools = MilestoneTools(mcp)
     server.milestone_tools = milestone_tools
 
     # Crear y configurar epic_tools (usa patching de TaigaAPIClient)
     from src.application.tools.epic_tools import EpicTools
 
-    mock_epic_patch = mock.patch("src.application.tools.epic_tools.TaigaAPIClient")
-    mock_epic_cls = mock_epic_patch.start()
-    mock_epic_cls.return_value.__aenter__ = AsyncMock(return_value=taiga_client_mock)
-    mock_epic_cls.return_value.__aexit__ = AsyncMock(return_value=None)
     epic_tools = EpicTools(mcp)
     server.epic_tools = epic_tools
 
     # Crear y configurar wiki_tools
-    mock_wiki_patch = mock.patch("src.application.tools.wiki_tools.TaigaAPIClient")
-    mock_wiki_cls = mock_wiki_patch.start()
-    mock_wiki_cls.return_value.__aenter__ = AsyncMock(return_value=taiga_client_mock)
-    mock_wiki_cls.return_value.__aexit__ = AsyncMock(return_value=None)
     wiki_tools = WikiTools(mcp)
     wiki_tools.register_tools()  # Register tools to make methods available
     server.wiki_tools = wiki_tools
 
     # Crear y configurar user_tools (usa patching de TaigaAPIClient)
-    mock_user_patch = mock.patch("src.application.tools.user_tools.TaigaAPIClient")
-    mock_user_cls = mock_user_patch.start()
-    mock_user_cls.return_value.__aenter__ = AsyncMock(return_value=taiga_client_mock)
-    mock_user_cls.return_value.__aexit__ = AsyncMock(return_value=None)
     user_tools = UserTools(mcp)
     server.user_tools = user_tools
 
     # Crear y configurar membership_tools
-    mock_membership_patch = mock.patch("src.application.tools.membership_tools.TaigaAPIClient")
-    mock_membership_cls = mock_membership_patch.start()
-    mock_membership_cls.return_value.__aenter__ = AsyncMock(return_value=taiga_client_mock)
-    mock_membership_cls.return_value.__aexit__ = AsyncMock(return_value=None)
     membership_tools = MembershipTools(mcp)
     membership_tools.register_tools()  # Register tools to make methods available
     server.membership_tools = membership_tools
 
     # Crear y configurar webhook_tools
-    mock_webhook_patch = mock.patch("src.application.tools.webhook_tools.TaigaAPIClient")
-    mock_webhook_cls = mock_webhook_patch.start()
-    mock_webhook_cls.return_value.__aenter__ = AsyncMock(return_value=taiga_client_mock)
-    mock_webhook_cls.return_value.__aexit__ = AsyncMock(return_value=None)
     webhook_tools = WebhookTools(mcp)
     webhook_tools.register_tools()  # Register tools to make methods available
     server.webhook_tools = webhook_tools
 
     # Crear y configurar userstory_tools
-    mock_userstory_patch = mock.patch("src.application.tools.userstory_tools.TaigaAPIClient")
-    mock_userstory_cls = mock_userstory_patch.start()
-    mock_userstory_cls.return_value.__aenter__ = AsyncMock(return_value=taiga_client_mock)
-    mock_userstory_cls.return_value.__aexit__ = AsyncMock(return_value=None)
     userstory_tools = UserStoryTools(mcp)
     userstory_tools.set_client(taiga_client_mock)  # Configure the client for tests
     userstory_tools.register_tools()  # Register tools to make methods available
     server.userstory_tools = userstory_tools
 
     # Crear otros objetos de herramientas con el cliente mock
-    mock_auth_patch = mock.patch("src.application.tools.auth_tools.TaigaAPIClient")
-    mock_auth_cls = mock_auth_patch.start()
-    mock_auth_cls.return_value.__aenter__ = AsyncMock(return_value=taiga_client_mock)
-    mock_auth_cls.return_value.__aexit__ = AsyncMock(return_value=None)
     auth_tools = AuthTools(mcp)
     auth_tools.register_tools()  # Register tools to make methods available
     server.auth_tools = auth_tools
 
-    mock_project_patch = mock.patch("src.application.tools.project_tools.TaigaAPIClient")
-    mock_project_cls = mock_project_patch.start()
-    mock_project_cls.return_value.__aenter__ = AsyncMock(return_value=taiga_client_mock)
-    mock_project_cls.return_value.__aexit__ = AsyncMock(return_value=None)
     project_tools = ProjectTools(mcp)
     project_tools.register_tools()  # Register tools to make methods available
     server.project_tools = project_tools
 
     yield server
 
-    # Limpieza: detener TODOS los patches de módulos que importan TaigaAPIClient
-    mock_issue_patch.stop()
-    mock_task_patch.stop()
-    mock_milestone_patch.stop()
-    mock_epic_patch.stop()
-    mock_wiki_patch.stop()
-    mock_user_patch.stop()
-    mock_membership_patch.stop()
-    mock_webhook_patch.stop()
-    mock_userstory_patch.stop()
-    mock_auth_patch.stop()
-    mock_project_patch.stop()
+    # Limpieza: detener el patch de TaigaAPIClient
+    client_patch.stop()
 
 
 # ============================================================================
@@ -20,42 +20,10 @@ def mcp_server_real(taiga_client_mock, monkeypatch) -> None:
     mock_client_instance.__aenter__ = AsyncMock(return_value=taiga_client_mock)
     mock_client_instance.__aexit__ = AsyncMock(return_value=None)
 
-    # Patchear TODOS los módulos que importan TaigaAPIClient
-    # Todos los tools ahora usan TaigaAPIClient(self.config) localmente
+    # Todos los tools crean sus clientes con client_factory.create_taiga_client
     monkeypatch.setattr(
-        "src.application.tools.wiki_tools.TaigaAPIClient", lambda config: mock_client_instance
-    )
-    monkeypatch.setattr(
-        "src.application.tools.membership_tools.TaigaAPIClient",
-        lambda config: mock_client_instance,
-    )
-    monkeypatch.setattr(
-        "src.application.tools.webhook_tools.TaigaAPIClient", lambda config: mock_client_instance
-    )
-    monkeypatch.setattr(
-        "src.application.tools.userstory_tools.TaigaAPIClient", lambda config: mock_client_instance
-    )
-    monkeypatch.setattr(
-        "src.application.tools.auth_tools.TaigaAPIClient", lambda config: mock_client_instance
-    )
-    monkeypatch.setattr(
-        "src.application.tools.project_tools.TaigaAPIClient", lambda config: mock_client_instance
-    )
-    # Tools migrados al patrón TaigaAPIClient local (ya no usan set_client)
-    monkeypatch.setattr(
-        "src.application.tools.issue_tools.TaigaAPIClient", lambda config: mock_client_instance
-    )
-    monkeypatch.setattr(
-        "src.application.tools.task_tools.TaigaAPIClient", lambda config: mock_client_instance
-    )
-    monkeypatch.setattr(
-        "src.application.tools.milestone_tools.TaigaAPIClient", lambda config: mock_client_instance
-    )
-    monkeypatch.setattr(
-        "src.application.tools.epic_tools.TaigaAPIClient", lambda config: mock_client_instance
-    )
-    monkeypatch.setattr(
-        "src.application.tools.user_tools.TaigaAPIClient", lambda config: mock_client_instance
+        "src.infrastructure.client_factory.TaigaAPIClient",
+        lambda config, **kwargs: mock_client_instance,
     )
 
     # Importar herramientas desde application/tools
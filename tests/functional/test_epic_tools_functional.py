@@ -24,13 +24,19 @@ class TestEpicToolsMCP:
         if not isinstance(mock_taiga_client.get, AsyncMock):
             mock_taiga_client.get = AsyncMock(return_value=[])
 
+        # The concurrent paginator reads the first page together with its headers
+        async def get_with_headers(*args, **kwargs):
+            return await mock_taiga_client.get(*args, **kwargs), {}
+
+        mock_taiga_client.get_with_headers = AsyncMock(side_effect=get_with_headers)
+
         # Patch TaigaAPIClient to use the mock
         mock_client_instance = MagicMock()
         mock_client_instance.__aenter__ = AsyncMock(return_value=mock_taiga_client)
         mock_client_instance.__aexit__ = AsyncMock(return_value=None)
         monkeypatch.setattr(
-            "src.application.tools.epic_tools.TaigaAPIClient",
-            lambda config: mock_client_instance,
+            "src.infrastructure.client_factory.TaigaAPIClient",
+            lambda config, session_pool=None: mock_client_instance,
         )
 
         mcp = FastMCP("Test")
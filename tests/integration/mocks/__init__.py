@@ -1,6 +1,7 @@
 """Mock server infrastructure for Taiga API integration tests."""
 
+from tests.integration.mocks.stub_http_server import StubHTTPServer, StubRequest, StubResponse
 from tests.integration.mocks.taiga_mock_server import TaigaMockServer
 
 
-__all__ = ["TaigaMockServer"]
+__all__ = ["StubHTTPServer", "StubRequest", "StubResponse", "TaigaMockServer"]
@@ -0,0 +1,141 @@
+"""Local HTTP/2 (h2c) stub server listening on a real socket.
+
+Companion of StubHTTPServer for the HTTP/2 mode of HTTPSessionPool. It
+speaks cleartext HTTP/2 with prior knowledge, answers every stream
+concurrently and records how many streams each connection carried.
+Requires the ``h2`` package; responses are expected to fit in the
+initial flow-control window (64 KiB).
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import ConnectionTerminated, DataReceived, RequestReceived, StreamEnded
+from h2.settings import SettingCodes
+
+from tests.integration.mocks.stub_http_server import Handler, StubRequest
+
+
+class StubH2Server:
+    """Minimal h2c server for local benchmarks.
+
+    Usage:
+        async with StubH2Server(handler) as server:
+            url = server.base_url  # http://127.0.0.1:<port>/api/v1
+            ...
+        assert server.connection_count == 1
+    """
+
+    def __init__(
+        self, handler: Handler, latency: float = 0.0, max_concurrent_streams: int = 100
+    ) -> None:
+        """Initialize the stub server.
+
+        Args:
+            handler: Callable that maps a StubRequest to a StubResponse.
+            latency: Artificial server-side delay in seconds per request.
+            max_concurrent_streams: SETTINGS_MAX_CONCURRENT_STREAMS advertised to clients.
+        """
+        self._handler = handler
+        self._latency = latency
+        self._max_concurrent_streams = max_concurrent_streams
+        self._server: asyncio.Server | None = None
+        self.port: int = 0
+        self.connection_count: int = 0
+        self.request_count: int = 0
+        self.peak_streams_per_connection: int = 0
+
+    @property
+    def base_url(self) -> str:
+        """Base API URL served by the stub."""
+        return f"http://127.0.0.1:{self.port}/api/v1"
+
+    async def __aenter__(self) -> StubH2Server:
+        """Start listening on an ephemeral port."""
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the server and close listening sockets."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connection_count += 1
+        conn = H2Connection(config=H2Configuration(client_side=False))
+        conn.local_settings.max_concurrent_streams = self._max_concurrent_streams
+        conn.initiate_connection()
+        conn.update_settings({SettingCodes.MAX_CONCURRENT_STREAMS: self._max_concurrent_streams})
+        writer.write(conn.data_to_send())
+
+        requests: dict[int, StubRequest] = {}
+        tasks: set[asyncio.Task[None]] = set()
+        try:
+            while True:
+                try:
+                    data = await reader.read(65535)
+                except ConnectionError:
+                    break
+                if not data:
+                    break
+                for event in conn.receive_data(data):
+                    if isinstance(event, RequestReceived):
+                        headers = {_text(name): _text(value) for name, value in event.headers or []}
+                        requests[event.stream_id] = StubRequest(
+                            headers.get(":method", "GET"), headers.get(":path", "/"), headers
+                        )
+                        self.peak_streams_per_connection = max(
+                            self.peak_streams_per_connection, len(requests)
+                        )
+                    elif isinstance(event, DataReceived):
+                        requests[event.stream_id].body += event.data
+                        conn.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                    elif isinstance(event, StreamEnded):
+                        task = asyncio.create_task(
+                            self._respond(conn, writer, event.stream_id, requests)
+                        )
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                    elif isinstance(event, ConnectionTerminated):
+                        return
+                writer.write(conn.data_to_send())
+                await writer.drain()
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _respond(
+        self,
+        conn: H2Connection,
+        writer: asyncio.StreamWriter,
+        stream_id: int,
+        requests: dict[int, StubRequest],
+    ) -> None:
+        request = requests[stream_id]
+        self.request_count += 1
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        response = self._handler(request)
+        payload = response.payload()
+        headers = {"content-type": "application/json", **response.headers}
+        headers["content-length"] = str(len(payload))
+        conn.send_headers(
+            stream_id,
+            [(":status", str(response.status)), *((k.lower(), v) for k, v in headers.items())],
+        )
+        conn.send_data(stream_id, payload, end_stream=True)
+        del requests[stream_id]
+        writer.write(conn.data_to_send())
+        await writer.drain()
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
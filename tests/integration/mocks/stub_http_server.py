@@ -0,0 +1,150 @@
+"""Local HTTP/1.1 stub server listening on a real socket.
+
+Unlike TaigaMockServer (respx, no sockets), this stub accepts real TCP
+connections on 127.0.0.1 so tests and benchmarks can observe connection
+reuse, keep-alive and handshake costs of the HTTP client layer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class StubRequest:
+    """Request received by the stub server."""
+
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes = b""
+    body_size: int = 0
+
+
+@dataclass
+class StubResponse:
+    """Response returned by a stub route handler.
+
+    When ``stream`` is set its chunks are sent with chunked transfer encoding
+    instead of ``body``, so large responses are never built in memory.
+    """
+
+    status: int = 200
+    body: Any = None
+    headers: dict[str, str] = field(default_factory=dict)
+    stream: Iterable[bytes] | None = None
+
+    def payload(self) -> bytes:
+        """Serialize the response body."""
+        if isinstance(self.body, bytes):
+            return self.body
+        if self.body is None:
+            return b""
+        return json.dumps(self.body).encode()
+
+    def encode(self) -> bytes:
+        """Serialize the response as raw HTTP/1.1 bytes."""
+        payload = self.payload()
+        return self.encode_head({"Content-Length": str(len(payload))}) + payload
+
+    def encode_head(self, framing: dict[str, str]) -> bytes:
+        """Serialize the status line and headers plus the given framing headers."""
+        headers = {"Content-Type": "application/json", **self.headers, **framing}
+        head = f"HTTP/1.1 {self.status} STUB\r\n" + "".join(
+            f"{k}: {v}\r\n" for k, v in headers.items()
+        )
+        return head.encode() + b"\r\n"
+
+
+Handler = Callable[[StubRequest], StubResponse]
+
+
+class StubHTTPServer:
+    """Minimal keep-alive HTTP/1.1 server for local benchmarks.
+
+    Usage:
+        async with StubHTTPServer(handler) as server:
+            url = server.base_url  # http://127.0.0.1:<port>/api/v1
+            ...
+        assert server.connection_count == 1
+    """
+
+    def __init__(self, handler: Handler, latency: float = 0.0, discard_body: bool = False) -> None:
+        """Initialize the stub server.
+
+        Args:
+            handler: Callable that maps a StubRequest to a StubResponse.
+            latency: Artificial server-side delay in seconds per request.
+            discard_body: Read request bodies in chunks and keep only their size
+                (``StubRequest.body_size``), for large uploads.
+        """
+        self._handler = handler
+        self._latency = latency
+        self._discard_body = discard_body
+        self._server: asyncio.Server | None = None
+        self.port: int = 0
+        self.connection_count: int = 0
+        self.request_count: int = 0
+
+    @property
+    def base_url(self) -> str:
+        """Base API URL served by the stub."""
+        return f"http://127.0.0.1:{self.port}/api/v1"
+
+    async def __aenter__(self) -> StubHTTPServer:
+        """Start listening on an ephemeral port."""
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the server and close listening sockets."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connection_count += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, target, _ = request_line.split(" ", 2)
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", "0"))
+                if self._discard_body:
+                    body = b""
+                    remaining = length
+                    while remaining:
+                        remaining -= len(await reader.readexactly(min(remaining, 1 << 16)))
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                self.request_count += 1
+                if self._latency:
+                    await asyncio.sleep(self._latency)
+                response = self._handler(StubRequest(method, target, headers, body, length))
+                if response.stream is None:
+                    writer.write(response.encode())
+                else:
+                    # Chunked transfer encoding: the body is never held whole
+                    writer.write(response.encode_head({"Transfer-Encoding": "chunked"}))
+                    for chunk in response.stream:
+                        writer.write(b"%x\r\n" % len(chunk))
+                        writer.write(chunk)
+                        writer.write(b"\r\n")
+                        await writer.drain()
+                    writer.write(b"0\r\n\r\n")
+                await writer.drain()
+        finally:
+            writer.close()
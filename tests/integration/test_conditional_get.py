@@ -0,0 +1,117 @@
+"""Integration tests for ETag revalidation of cached metadata.
+
+A local stub issues ETags for a large filters_data payload and answers
+If-None-Match with 304 Not Modified. CachedTaigaClient must revalidate
+expired entries with conditional requests and keep the parsed value on 304.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.infrastructure.cache import MemoryCache
+from src.infrastructure.cached_client import CachedTaigaClient, CacheKeyBuilder
+from src.infrastructure.http_session_pool import HTTPSessionPool
+from tests.integration.mocks import StubHTTPServer, StubRequest, StubResponse
+
+
+FILTERS = {"statuses": [{"id": i, "name": f"Status {i}", "count": i} for i in range(2000)]}
+
+
+class ETagServer:
+    """Stub handler serving filters_data with a content-derived ETag."""
+
+    def __init__(self) -> None:
+        self.body = FILTERS
+        self.version = 1
+        self.statuses: list[int] = []
+        self.body_bytes = 0
+
+    @property
+    def etag(self) -> str:
+        return f'"filters-v{self.version}"'
+
+    def __call__(self, request: StubRequest) -> StubResponse:
+        if request.headers.get("if-none-match") == self.etag:
+            response = StubResponse(status=304, headers={"ETag": self.etag})
+        else:
+            response = StubResponse(body=self.body, headers={"ETag": self.etag})
+            self.body_bytes += len(json.dumps(self.body))
+        self.statuses.append(response.status)
+        return response
+
+
+def _expire(cache: MemoryCache, key: str) -> None:
+    """Move an entry past its TTL while keeping its revalidation window."""
+    entry = cache._cache[key]
+    window = entry.expires_at - entry.stale_at
+    entry.fresh_until = datetime.now() - timedelta(seconds=1)
+    entry.expires_at = entry.fresh_until + window
+
+
+class TestConditionalGet:
+    """Conditional requests against a real local socket."""
+
+    @pytest.mark.asyncio
+    async def test_get_conditional_returns_none_on_304(self, make_api_client) -> None:
+        """Test that a matching If-None-Match yields no body."""
+        server_state = ETagServer()
+        async with StubHTTPServer(server_state) as server:
+            pool = HTTPSessionPool(base_url=server.base_url)
+            try:
+                client = make_api_client(
+                    taiga_api_url=pool.base_url, max_retries=0, session_pool=pool
+                )
+                data, validators = await client.get_conditional(
+                    "/issues/filters_data", params={"project": 1}
+                )
+                again, same = await client.get_conditional(
+                    "/issues/filters_data", params={"project": 1}, validators=validators
+                )
+            finally:
+                await pool.stop()
+
+        assert data == FILTERS
+        assert validators == {"ETag": '"filters-v1"'}
+        assert again is None
+        assert same == validators
+        assert server_state.statuses == [200, 304]
+
+    @pytest.mark.asyncio
+    async def test_cached_client_revalidates_with_etag(self, make_api_client) -> None:
+        """Test that expired entries are revalidated and only changes transfer a body."""
+        server_state = ETagServer()
+        cache = MemoryCache(default_ttl=3600, max_size=10)
+        key = CacheKeyBuilder.build(
+            "issue_filters", principal=CacheKeyBuilder.principal("token"), project_id=1
+        )
+        async with StubHTTPServer(server_state) as server:
+            pool = HTTPSessionPool(base_url=server.base_url)
+            try:
+                cached = CachedTaigaClient(
+                    make_api_client(taiga_api_url=pool.base_url, max_retries=0, session_pool=pool),
+                    cache=cache,
+                    revalidate_window=600,
+                )
+                first = await cached.get_issue_filters(project_id=1)
+                body_bytes = server_state.body_bytes
+
+                for _ in range(3):
+                    _expire(cache, key)
+                    assert await cached.get_issue_filters(project_id=1) is first
+                assert server_state.body_bytes == body_bytes
+
+                server_state.body = {"statuses": []}
+                server_state.version = 2
+                _expire(cache, key)
+                changed = await cached.get_issue_filters(project_id=1)
+            finally:
+                await pool.stop()
+
+        assert changed == {"statuses": []}
+        assert server_state.statuses == [200, 304, 304, 304, 200]
+        metrics = cache.get_metrics()
+        assert metrics.not_modified == 3
+        assert metrics.revalidations == 1
+        assert cache._cache[key].validators == {"ETag": '"filters-v2"'}
@@ -0,0 +1,136 @@
+"""Integration tests for streaming project exports to disk.
+
+TaigaAPIClient.download writes the export body to a file while it arrives;
+export_parser then walks that file without loading it. These tests run
+against a real local socket serving a chunked ~100 MB export.
+"""
+
+import hashlib
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.domain.exceptions import ResourceNotFoundError
+from src.infrastructure.export_parser import iter_export, summarize_export
+from src.infrastructure.http_session_pool import HTTPSessionPool
+from tests.integration.mocks import StubHTTPServer, StubRequest, StubResponse
+
+
+STORY_COUNT = 100_000
+MEMORY_CAP = 16 * 1024 * 1024
+
+
+def _export_chunks() -> Iterator[bytes]:
+    """Generate a Taiga-like export of ~100 MB in chunks of 100 user stories."""
+    yield b'{"name": "Big project", "slug": "big-project", "issues": [], "user_stories": ['
+    description = "x" * 1000
+    for start in range(1, STORY_COUNT + 1, 100):
+        yield ",".join(
+            f'{{"ref": {ref}, "subject": "Story {ref}", "description": "{description}"}}'
+            for ref in range(start, start + 100)
+        ).encode()
+        if start + 100 <= STORY_COUNT:
+            yield b","
+    yield b'], "tasks": [{"ref": 1}, {"ref": 2}]}'
+
+
+class TestStreamingExport:
+    """download() streams the export to disk over the shared pool."""
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_large_export_streams_under_memory_cap(
+        self, tmp_path: Path, make_api_client
+    ) -> None:
+        """Test that a ~100 MB export is written to disk with bounded memory."""
+        expected = hashlib.sha256()
+        expected_size = 0
+        for chunk in _export_chunks():
+            expected.update(chunk)
+            expected_size += len(chunk)
+
+        def handler(request: StubRequest) -> StubResponse:
+            return StubResponse(stream=_export_chunks())
+
+        target = tmp_path / "exports" / "project_1.json"
+        async with StubHTTPServer(handler) as server:
+            pool = HTTPSessionPool(base_url=server.base_url)
+            client = make_api_client(
+                taiga_api_url=pool.base_url, taiga_auth_token="export-token", session_pool=pool
+            )
+            tracemalloc.start()
+            try:
+                info = await client.download("/exporter/1", str(target))
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+                await pool.stop()
+
+        assert info == {
+            "path": str(target),
+            "size_bytes": expected_size,
+            "sha256": expected.hexdigest(),
+        }
+        assert target.stat().st_size == expected_size
+        assert not target.with_name("project_1.json.part").exists()
+        assert peak < MEMORY_CAP
+
+        tracemalloc.start()
+        try:
+            summary = summarize_export(target)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert summary["name"] == "Big project"
+        assert summary["counts"] == {"issues": 0, "user_stories": STORY_COUNT, "tasks": 2}
+        assert peak < MEMORY_CAP
+
+    @pytest.mark.asyncio
+    async def test_download_error_leaves_no_file(self, tmp_path: Path, make_api_client) -> None:
+        """Test that an error status raises and writes nothing."""
+
+        def handler(request: StubRequest) -> StubResponse:
+            return StubResponse(status=404, body={"detail": "Not found."})
+
+        target = tmp_path / "project_9.json"
+        async with StubHTTPServer(handler) as server:
+            pool = HTTPSessionPool(base_url=server.base_url)
+            try:
+                with pytest.raises(ResourceNotFoundError):
+                    await make_api_client(
+                        taiga_api_url=pool.base_url,
+                        taiga_auth_token="export-token",
+                        session_pool=pool,
+                    ).download("/exporter/9", str(target))
+            finally:
+                await pool.stop()
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_download_then_iterate_items(self, tmp_path: Path, make_api_client) -> None:
+        """Test that a downloaded export can be walked item by item."""
+
+        def handler(request: StubRequest) -> StubResponse:
+            return StubResponse(
+                body={"name": "Small", "user_stories": [{"ref": 1}, {"ref": 2}], "wiki_pages": []}
+            )
+
+        target = tmp_path / "small.json"
+        async with StubHTTPServer(handler) as server:
+            pool = HTTPSessionPool(base_url=server.base_url)
+            try:
+                await make_api_client(
+                    taiga_api_url=pool.base_url, taiga_auth_token="export-token", session_pool=pool
+                ).download("/exporter/2", str(target))
+            finally:
+                await pool.stop()
+
+        assert list(iter_export(target)) == [
+            ("name", "Small"),
+            ("user_stories", {"ref": 1}),
+            ("user_stories", {"ref": 2}),
+        ]
@@ -6,15 +6,21 @@ Tests:
 - Test 3.1.3: Pool respeta límites de conexiones
 - Test 3.1.4: Pool se cierra correctamente al finalizar
 - Test 3.1.5: Múltiples requests concurrentes funcionan
+- Modo HTTP/2 opcional y estadísticas de streams por conexión
+- Precalentamiento de conexiones y keep-alive periódico
+- Métricas de conexiones: activas/ociosas, esperas y reutilización
 """
 
 import asyncio
+import threading
 import time
+from unittest.mock import patch
 
 import httpx
 import pytest
 
-from src.infrastructure.http_session_pool import HTTPSessionPool
+from src.infrastructure.http_session_pool import HTTPSessionPool, LatencyHistogram
+from tests.integration.mocks import StubHTTPServer, StubRequest, StubResponse
 
 
 class TestHTTPSessionPoolInitialization:
@@ -119,6 +125,53 @@ class TestHTTPSessionPoolSessionReuse:
         finally:
             await pool.stop()
 
+    @pytest.mark.asyncio
+    async def test_get_client_rebuilds_client_on_new_event_loop(self) -> None:
+        """Test that a client started on another event loop is replaced."""
+        pool = HTTPSessionPool(base_url="https://api.example.com")
+
+        try:
+            stale_client = await pool.get_client()
+            other_loop = asyncio.new_event_loop()
+            pool._loop = other_loop
+            other_loop.close()
+
+            fresh_client = await pool.get_client()
+
+            assert fresh_client is not stale_client
+            assert stale_client.is_closed
+            assert pool._loop is asyncio.get_running_loop()
+        finally:
+            await pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_get_client_closes_client_on_its_running_loop(self) -> None:
+        """Test that a client and keep-alive task of a loop running elsewhere are closed there."""
+        pool = HTTPSessionPool(base_url="https://api.example.com", keepalive_interval=60)
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+
+        try:
+            asyncio.run_coroutine_threadsafe(pool.start(), other_loop).result(timeout=5)
+            stale_client, task = pool._client, pool._keepalive_task
+            assert stale_client is not None and task is not None
+
+            fresh_client = await pool.get_client()
+            for _ in range(100):
+                if stale_client.is_closed and task.done():
+                    break
+                await asyncio.sleep(0.01)
+
+            assert fresh_client is not stale_client
+            assert stale_client.is_closed
+            assert task.cancelled()
+        finally:
+            await pool.stop()
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(timeout=5)
+            other_loop.close()
+
     @pytest.mark.asyncio
     async def test_multiple_sessions_share_connections(self) -> None:
         """Test that multiple session calls reuse the underlying connection pool."""
@@ -457,3 +510,274 @@ class TestHTTPSessionPoolPerformance:
         # We expect the pool to be faster, but exact percentage varies
         # The improvement should be significant (pool reuses, new creates each time)
         assert pool_time < new_client_time
+
+
+class TestHTTPSessionPoolHTTP2:
+    """Modo HTTP/2 opcional y estadísticas de streams por conexión."""
+
+    @staticmethod
+    def _handler(request: StubRequest) -> StubResponse:
+        return StubResponse(body={"path": request.path})
+
+    @pytest.mark.asyncio
+    async def test_stats_before_start(self) -> None:
+        """Test that a pool that was never started reports empty stats."""
+        pool = HTTPSessionPool(base_url="https://api.example.com", http2=True)
+
+        stats = pool.get_stats()
+
+        assert stats["http2"] is True
+        assert stats["open_connections"] == 0
+        assert stats["requests_by_http_version"] == {}
+
+    @pytest.mark.asyncio
+    async def test_http2_multiplexes_concurrent_requests(self) -> None:
+        """Test that concurrent requests share one HTTP/2 connection."""
+        pytest.importorskip("h2")
+        from tests.integration.mocks.stub_h2_server import StubH2Server
+
+        async with StubH2Server(self._handler, latency=0.02) as server:
+            pool = HTTPSessionPool(base_url=server.base_url, http2=True)
+            try:
+                client = await pool.get_client()
+                responses = await asyncio.gather(*(client.get(f"/items/{i}") for i in range(20)))
+                stats = pool.get_stats()
+            finally:
+                await pool.stop()
+
+        assert [r.json()["path"] for r in responses] == [f"/api/v1/items/{i}" for i in range(20)]
+        assert server.connection_count == 1
+        assert stats["requests_by_http_version"] == {"HTTP/2": 20}
+        assert stats["peak_streams_per_connection"] > 1
+        assert stats["in_flight"] == 0
+        assert stats["active_streams"] == 0
+
+    @pytest.mark.asyncio
+    async def test_http1_reports_one_stream_per_connection(self) -> None:
+        """Test that HTTP/1.1 never carries more than one stream per connection."""
+        async with StubHTTPServer(self._handler, latency=0.02) as server:
+            pool = HTTPSessionPool(base_url=server.base_url)
+            try:
+                client = await pool.get_client()
+                await asyncio.gather(*(client.get(f"/items/{i}") for i in range(10)))
+                stats = pool.get_stats()
+            finally:
+                await pool.stop()
+
+        assert stats["requests_by_http_version"] == {"HTTP/1.1": 10}
+        assert stats["peak_streams_per_connection"] == 1.0
+        assert stats["peak_in_flight"] == 10
+
+    @pytest.mark.asyncio
+    async def test_http2_falls_back_without_h2_package(self) -> None:
+        """Test that the pool uses HTTP/1.1 when the h2 package is missing."""
+        async with StubHTTPServer(self._handler) as server:
+            pool = HTTPSessionPool(base_url=server.base_url, http2=True)
+            with patch("importlib.util.find_spec", return_value=None):
+                await pool.start()
+            try:
+                response = await (await pool.get_client()).get("/items/1")
+            finally:
+                await pool.stop()
+
+        assert response.http_version == "HTTP/1.1"
+
+
+class TestHTTPSessionPoolWarmUp:
+    """Precalentamiento de conexiones y keep-alive de las conexiones ociosas."""
+
+    @staticmethod
+    def _handler(request: StubRequest) -> StubResponse:
+        if request.method == "HEAD":
+            return StubResponse()
+        return StubResponse(body={"path": request.path})
+
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_reusable_connections(self) -> None:
+        """Test that warm_up() opens connections later reused by real requests."""
+        async with StubHTTPServer(self._handler, latency=0.02) as server:
+            pool = HTTPSessionPool(base_url=server.base_url, warmup_connections=3)
+            try:
+                opened = await pool.warm_up()
+                warm_connections = server.connection_count
+                client = await pool.get_client()
+                await asyncio.gather(*(client.get(f"/items/{i}") for i in range(3)))
+            finally:
+                await pool.stop()
+
+        assert opened == 3
+        assert warm_connections == 3
+        assert server.connection_count == 3
+
+    @pytest.mark.asyncio
+    async def test_warm_up_and_keepalive_traffic_is_not_counted(self) -> None:
+        """Test that pool pings open connections without touching the request stats."""
+        async with StubHTTPServer(self._handler) as server:
+            pool = HTTPSessionPool(base_url=server.base_url, warmup_connections=2)
+            try:
+                await pool.warm_up()
+                warm = pool.get_stats()
+                client = await pool.get_client()
+                for i in range(2):
+                    await client.get(f"/items/{i}")
+                stats = pool.get_stats()
+            finally:
+                await pool.stop()
+
+        assert warm["open_connections"] == 2
+        assert warm["new_connections"] == 0
+        assert warm["acquisition_wait_ms"]["count"] == 0
+        assert warm["requests_by_http_version"] == {}
+        assert stats["new_connections"] == 0
+        assert stats["reused_connections"] == 2
+        assert stats["reuse_ratio"] == 1.0
+        assert stats["connect_ms"]["count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_warm_up_is_capped_by_max_keepalive(self) -> None:
+        """Test that warm-up never opens more connections than the pool keeps alive."""
+        async with StubHTTPServer(self._handler, latency=0.02) as server:
+            pool = HTTPSessionPool(base_url=server.base_url, max_keepalive=2)
+            try:
+                assert await pool.warm_up(connections=5) == 2
+            finally:
+                await pool.stop()
+
+        assert server.connection_count == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_up_ignores_unreachable_server(self) -> None:
+        """Test that warm-up failures are logged instead of raised."""
+        async with StubHTTPServer(self._handler) as server:
+            base_url = server.base_url
+        pool = HTTPSessionPool(base_url=base_url, warmup_connections=2)
+        try:
+            assert await pool.warm_up() == 0
+        finally:
+            await pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_keepalive_task_pings_idle_connections(self) -> None:
+        """Test that the keep-alive task reuses idle connections and stops with the pool."""
+        async with StubHTTPServer(self._handler) as server:
+            pool = HTTPSessionPool(
+                base_url=server.base_url, warmup_connections=2, keepalive_interval=0.05
+            )
+            try:
+                await pool.warm_up()
+                await asyncio.sleep(0.2)
+                task = pool._keepalive_task
+            finally:
+                await pool.stop()
+
+        assert task is not None and task.cancelled()
+        assert pool._keepalive_task is None
+        assert server.request_count > 2
+        assert server.connection_count == 2
+
+    @pytest.mark.asyncio
+    async def test_keepalive_task_survives_unexpected_errors(self) -> None:
+        """Test that an unexpected error in a keep-alive round is logged and the loop goes on."""
+        pool = HTTPSessionPool(
+            base_url="https://api.example.com", warmup_connections=1, keepalive_interval=0.01
+        )
+        rounds = 0
+
+        async def ping(client: httpx.AsyncClient) -> bool:
+            nonlocal rounds
+            rounds += 1
+            if rounds == 1:
+                raise RuntimeError("boom")
+            return True
+
+        with patch.object(pool, "_ping", ping), patch.object(pool._logger, "warning") as warning:
+            await pool.start()
+            try:
+                for _ in range(100):
+                    if rounds >= 3:
+                        break
+                    await asyncio.sleep(0.01)
+                task = pool._keepalive_task
+                assert task is not None and not task.done()
+            finally:
+                await pool.stop()
+
+        assert rounds >= 3
+        warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_keepalive_disabled_by_default(self) -> None:
+        """Test that no keep-alive task runs unless an interval is configured."""
+        pool = HTTPSessionPool(base_url="https://api.example.com")
+
+        await pool.start()
+        try:
+            assert pool._keepalive_task is None
+        finally:
+            await pool.stop()
+
+
+class TestHTTPSessionPoolObservability:
+    """Métricas de conexiones: activas/ociosas, esperas y reutilización."""
+
+    @staticmethod
+    def _handler(request: StubRequest) -> StubResponse:
+        return StubResponse(body={"path": request.path})
+
+    def test_latency_histogram_buckets(self) -> None:
+        """Test that observations land in the first bucket whose bound covers them."""
+        histogram = LatencyHistogram()
+        for duration_ms in (0.5, 1.0, 3.0, 7000.0):
+            histogram.observe(duration_ms)
+
+        stats = histogram.to_dict()
+
+        assert stats["count"] == 4
+        assert stats["max_ms"] == 7000.0
+        assert stats["buckets"]["<=1ms"] == 2
+        assert stats["buckets"]["<=5ms"] == 1
+        assert stats["buckets"][">5000ms"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reused_connections_are_counted(self) -> None:
+        """Test that sequential requests open one connection and reuse it."""
+        async with StubHTTPServer(self._handler) as server:
+            pool = HTTPSessionPool(base_url=server.base_url)
+            try:
+                client = await pool.get_client()
+                for i in range(4):
+                    await client.get(f"/items/{i}")
+                stats = pool.get_stats()
+            finally:
+                await pool.stop()
+
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 3
+        assert stats["reuse_ratio"] == 0.75
+        assert stats["connect_ms"]["count"] == 1
+        assert stats["acquisition_wait_ms"]["count"] == 4
+        assert stats["idle_connections"] == 1
+        assert stats["active_connections"] == 0
+
+    @pytest.mark.asyncio
+    async def test_saturated_pool_reports_pending_acquisitions(self) -> None:
+        """Test that requests queued behind max_connections are visible as pending."""
+        async with StubHTTPServer(self._handler, latency=0.05) as server:
+            pool = HTTPSessionPool(base_url=server.base_url, max_connections=2, max_keepalive=2)
+            try:
+                client = await pool.get_client()
+                requests = asyncio.gather(*(client.get(f"/items/{i}") for i in range(6)))
+                await asyncio.sleep(0.02)
+                during = pool.get_stats()
+                await requests
+                after = pool.get_stats()
+            finally:
+                await pool.stop()
+
+        assert during["active_connections"] == 2
+        assert during["pending_acquisitions"] == 4
+        assert after["pending_acquisitions"] == 0
+        assert after["peak_pending_acquisitions"] >= 4
+        assert after["new_connections"] == 2
+        # Las peticiones encoladas esperan al menos una respuesta (50 ms)
+        assert after["acquisition_wait_ms"]["max_ms"] >= 40
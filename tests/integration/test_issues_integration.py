@@ -190,7 +190,8 @@ class TestIssuesIntegration:
             attachment = await mcp_server.issue_tools.create_issue_attachment(
                 auth_token=auth_token,
                 issue_id=issue_id,
-                attached_file=f"@{test_file_path}",
+                project_id=self.project_id,
+                attached_file=test_file_path,
                 description="Test attachment",
             )
 
@@ -0,0 +1,175 @@
+"""Integration tests for streaming multipart uploads.
+
+TaigaAPIClient.post_multipart streams the file from disk through the pooled
+HTTP client; these tests run it against a real local socket and check
+memory use, connection reuse and the multipart Content-Type.
+"""
+
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from src.domain.exceptions import CircuitOpenError, TaigaAPIError
+from src.infrastructure.circuit_breaker import CircuitBreakerRegistry
+from src.infrastructure.http_session_pool import HTTPSessionPool
+from tests.integration.mocks import StubHTTPServer, StubRequest, StubResponse
+
+
+UPLOAD_SIZE = 500 * 1024 * 1024
+MEMORY_CAP = 32 * 1024 * 1024
+
+
+class TestStreamingMultipartUpload:
+    """post_multipart streams from disk over the shared pool."""
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_large_sparse_file_uploads_under_memory_cap(
+        self, tmp_path: Path, make_api_client
+    ) -> None:
+        """Test that a 500 MB upload keeps Python allocations under the cap."""
+        design = tmp_path / "design.psd"
+        with design.open("wb") as f:
+            f.truncate(UPLOAD_SIZE)  # Sparse: no disk blocks are written
+        received: list[StubRequest] = []
+
+        def handler(request: StubRequest) -> StubResponse:
+            received.append(request)
+            return StubResponse(status=201, body={"id": 1, "size": request.body_size})
+
+        async with StubHTTPServer(handler, discard_body=True) as server:
+            pool = HTTPSessionPool(base_url=server.base_url)
+            client = make_api_client(
+                taiga_api_url=pool.base_url,
+                taiga_auth_token="upload-token",
+                session_pool=pool,
+            )
+            tracemalloc.start()
+            try:
+                result = await client.post_multipart(
+                    "/userstories/attachments",
+                    data={"object_id": 7, "project": 1},
+                    file_path=str(design),
+                )
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+                await pool.stop()
+
+        assert result["id"] == 1
+        assert received[0].body_size > UPLOAD_SIZE
+        assert received[0].headers["content-type"].startswith("multipart/form-data; boundary=")
+        assert received[0].headers["authorization"] == "Bearer upload-token"
+        assert peak < MEMORY_CAP
+
+    @pytest.mark.asyncio
+    async def test_uploads_reuse_the_pooled_connection(
+        self, tmp_path: Path, make_api_client
+    ) -> None:
+        """Test that consecutive uploads and GETs share one keep-alive connection."""
+        attachment = tmp_path / "notes.txt"
+        attachment.write_text("release notes")
+
+        def handler(request: StubRequest) -> StubResponse:
+            return StubResponse(status=201, body={"id": 1, "method": request.method})
+
+        async with StubHTTPServer(handler) as server:
+            pool = HTTPSessionPool(base_url=server.base_url)
+            client = make_api_client(
+                taiga_api_url=pool.base_url,
+                taiga_auth_token="upload-token",
+                session_pool=pool,
+            )
+            try:
+                for _ in range(3):
+                    await client.post_multipart(
+                        "/issues/attachments", data={"project": 1}, file_path=str(attachment)
+                    )
+                await client.get("/issues/1")
+            finally:
+                await pool.stop()
+
+        assert server.request_count == 4
+        assert server.connection_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_upload_is_retried_with_the_whole_file(
+        self, tmp_path: Path, make_api_client
+    ) -> None:
+        """Test that a 429 is retried like any other write and resends the file."""
+        attachment = tmp_path / "notes.txt"
+        attachment.write_text("release notes")
+        received: list[StubRequest] = []
+
+        def handler(request: StubRequest) -> StubResponse:
+            received.append(request)
+            if len(received) == 1:
+                return StubResponse(status=429, headers={"Retry-After": "0"})
+            return StubResponse(status=201, body={"id": 1})
+
+        async with StubHTTPServer(handler) as server:
+            pool = HTTPSessionPool(base_url=server.base_url)
+            client = make_api_client(
+                taiga_api_url=pool.base_url,
+                taiga_auth_token="upload-token",
+                session_pool=pool,
+            )
+            try:
+                result = await client.post_multipart(
+                    "/issues/attachments", data={"project": 1}, file_path=str(attachment)
+                )
+            finally:
+                await pool.stop()
+
+        assert result == {"id": 1}
+        assert len(received) == 2
+        assert all(b"release notes" in request.body for request in received)
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_rejects_uploads(self, tmp_path: Path, make_api_client) -> None:
+        """Test that uploads count towards and respect the endpoint's circuit breaker."""
+        attachment = tmp_path / "notes.txt"
+        attachment.write_text("release notes")
+
+        def handler(request: StubRequest) -> StubResponse:
+            return StubResponse(status=503, body={"detail": "unavailable"})
+
+        async with StubHTTPServer(handler) as server:
+            pool = HTTPSessionPool(base_url=server.base_url)
+            client = make_api_client(
+                taiga_api_url=pool.base_url,
+                taiga_auth_token="upload-token",
+                session_pool=pool,
+                circuit_breakers=CircuitBreakerRegistry(failure_threshold=1),
+            )
+            try:
+                with pytest.raises(TaigaAPIError, match="503"):
+                    await client.post_multipart(
+                        "/issues/attachments", data={"project": 1}, file_path=str(attachment)
+                    )
+                with pytest.raises(CircuitOpenError):
+                    await client.post_multipart(
+                        "/issues/attachments", data={"project": 1}, file_path=str(attachment)
+                    )
+            finally:
+                await pool.stop()
+
+        assert server.request_count == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_file_raises(self, tmp_path: Path, make_api_client) -> None:
+        """Test that a missing file fails before any request is sent."""
+        pool = HTTPSessionPool(base_url="http://127.0.0.1:9/api/v1")
+        client = make_api_client(
+            taiga_api_url=pool.base_url,
+            taiga_auth_token="upload-token",
+            session_pool=pool,
+        )
+        try:
+            with pytest.raises(TaigaAPIError, match="File not found"):
+                await client.post_multipart(
+                    "/wiki/attachments", data={}, file_path=str(tmp_path / "missing.png")
+                )
+        finally:
+            await pool.stop()
@@ -6,6 +6,7 @@ funcionamiento del sistema de paginación automática con la API de Taiga.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -27,6 +28,7 @@ class TestPaginationConfig:
         assert config.page_size == 100
         assert config.max_pages == 50
         assert config.max_total_items == 5000
+        assert config.max_concurrency == 1
 
     def test_custom_values(self) -> None:
         """Test 3.3.1b: Configuración acepta valores personalizados."""
@@ -50,6 +52,11 @@ class TestPaginationConfig:
         with pytest.raises(ValueError, match="max_total_items debe ser mayor a 0"):
             PaginationConfig(max_total_items=0)
 
+    def test_invalid_max_concurrency_raises_error(self) -> None:
+        """Test: max_concurrency inválido lanza error."""
+        with pytest.raises(ValueError, match="max_concurrency debe ser mayor a 0"):
+            PaginationConfig(max_concurrency=0)
+
     def test_config_is_immutable(self) -> None:
         """Test 3.3.1f: Configuración es inmutable (frozen)."""
         from dataclasses import FrozenInstanceError
@@ -371,6 +378,296 @@ class TestAutoPaginatorWithListResponse:
         assert mock_client.get.call_count == 2
 
 
+class TestConcurrentPagination:
+    """Tests para la paginación concurrente basada en cabeceras x-pagination-*."""
+
+    @staticmethod
+    def _make_client(total: int, page_size: int, headers: bool = True) -> MagicMock:
+        """Crea un cliente mock que sirve ``total`` items paginados."""
+        client = MagicMock()
+        client.in_flight = 0
+        client.max_in_flight = 0
+
+        def page_items(params: dict[str, Any]) -> list[dict[str, Any]]:
+            start = (params["page"] - 1) * page_size
+            return [{"id": i} for i in range(start, min(start + page_size, total))]
+
+        async def get(endpoint: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+            client.in_flight += 1
+            client.max_in_flight = max(client.max_in_flight, client.in_flight)
+            # Las páginas tempranas tardan más para desordenar las respuestas
+            await asyncio.sleep(0.01 / params["page"])
+            client.in_flight -= 1
+            return page_items(params)
+
+        async def get_with_headers(
+            endpoint: str, params: dict[str, Any]
+        ) -> tuple[list[dict[str, Any]], dict[str, str]]:
+            response_headers = (
+                {"x-pagination-count": str(total), "x-paginated-by": str(page_size)}
+                if headers
+                else {}
+            )
+            return page_items(params), response_headers
+
+        client.get = AsyncMock(side_effect=get)
+        client.get_with_headers = AsyncMock(side_effect=get_with_headers)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_fetches_all_pages_in_order(self) -> None:
+        """Test: Obtiene todas las páginas en paralelo conservando el orden."""
+        client = self._make_client(total=95, page_size=10)
+        config = PaginationConfig(page_size=10, max_concurrency=4)
+
+        result = await AutoPaginator(client, config).paginate_with_info("/issues")
+
+        assert [item["id"] for item in result.items] == list(range(95))
+        assert result.total_pages == 10
+        assert result.was_truncated is False
+        assert client.get_with_headers.call_count == 1
+        assert client.get.call_count == 9
+
+    @pytest.mark.asyncio
+    async def test_fan_out_is_bounded(self) -> None:
+        """Test: No hay más de max_concurrency peticiones en vuelo."""
+        client = self._make_client(total=200, page_size=10)
+        config = PaginationConfig(page_size=10, max_concurrency=3)
+
+        await AutoPaginator(client, config).paginate("/issues")
+
+        assert client.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_respects_max_pages(self) -> None:
+        """Test: No solicita páginas más allá de max_pages."""
+        client = self._make_client(total=100, page_size=10)
+        config = PaginationConfig(page_size=10, max_pages=3, max_concurrency=4)
+
+        result = await AutoPaginator(client, config).paginate_with_info("/issues")
+
+        assert result.total_items == 30
+        assert result.total_pages == 3
+        assert result.was_truncated is True
+        assert result.has_more is True
+        assert client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_respects_max_total_items(self) -> None:
+        """Test: Solo solicita las páginas necesarias para max_total_items."""
+        client = self._make_client(total=100, page_size=10)
+        config = PaginationConfig(page_size=10, max_total_items=25, max_concurrency=4)
+
+        result = await AutoPaginator(client, config).paginate_with_info("/issues")
+
+        assert [item["id"] for item in result.items] == list(range(25))
+        assert result.was_truncated is True
+        assert client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("headers", [True, False], ids=["concurrent", "sequential"])
+    async def test_reaching_max_total_items_is_truncation(self, headers: bool) -> None:
+        """Test: Ambas rutas marcan como truncado llegar justo a max_total_items."""
+        client = self._make_client(total=20, page_size=10, headers=headers)
+        config = PaginationConfig(page_size=10, max_total_items=20, max_concurrency=4)
+
+        result = await AutoPaginator(client, config).paginate_with_info("/issues")
+
+        assert result.total_items == 20
+        assert result.was_truncated is True
+        assert result.has_more is True
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_sequential_without_headers(self) -> None:
+        """Test: Sin cabeceras de paginación continúa secuencialmente."""
+        client = self._make_client(total=25, page_size=10, headers=False)
+        config = PaginationConfig(page_size=10, max_concurrency=4)
+
+        result = await AutoPaginator(client, config).paginate_with_info("/issues")
+
+        assert [item["id"] for item in result.items] == list(range(25))
+        assert client.get_with_headers.call_count == 1
+        assert client.get.call_count == 2
+        assert client.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_first_page(self) -> None:
+        """Test: Primera página vacía no lanza más peticiones."""
+        client = self._make_client(total=0, page_size=10)
+        config = PaginationConfig(page_size=10, max_concurrency=4)
+
+        result = await AutoPaginator(client, config).paginate_with_info("/issues")
+
+        assert result.items == []
+        client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_error_cancels_pending_pages(self) -> None:
+        """Test: Un error en una página cancela las pendientes y se propaga."""
+        client = self._make_client(total=100, page_size=10)
+        original_get = client.get.side_effect
+
+        async def failing_get(endpoint: str, params: dict[str, Any]) -> Any:
+            if params["page"] == 2:
+                raise RuntimeError("boom")
+            return await original_get(endpoint, params)
+
+        client.get.side_effect = failing_get
+        config = PaginationConfig(page_size=10, max_concurrency=2)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await AutoPaginator(client, config).paginate("/issues")
+
+        assert client.get.call_count < 9
+
+
+class TestStreamingPipeline:
+    """Tests para el pipeline en streaming (paginate_pages, stream, collect)."""
+
+    @pytest.fixture
+    def mock_client(self) -> MagicMock:
+        """Cliente mock con 5 páginas completas de 10 items y una final de 3."""
+        client = MagicMock()
+
+        async def get(endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+            start = (params["page"] - 1) * 10
+            count = 10 if params["page"] <= 5 else 3
+            return {"results": [{"id": i} for i in range(start, start + count)], "next": None}
+
+        client.get = AsyncMock(side_effect=get)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_paginate_pages_yields_pages_in_order(self, mock_client: MagicMock) -> None:
+        """Test: paginate_pages entrega cada página como una lista."""
+        paginator = AutoPaginator(mock_client, PaginationConfig(page_size=10))
+
+        pages = [page async for page in paginator.paginate_pages("/issues")]
+
+        assert [len(page) for page in pages] == [10, 10, 10, 10, 10, 3]
+        assert pages[1][0]["id"] == 10
+
+    @pytest.mark.asyncio
+    async def test_paginate_pages_updates_info(self, mock_client: MagicMock) -> None:
+        """Test: paginate_pages acumula metadatos en el PaginationResult dado."""
+        paginator = AutoPaginator(mock_client, PaginationConfig(page_size=10))
+        info = PaginationResult()
+
+        async for _ in paginator.paginate_pages("/issues", info=info):
+            pass
+
+        assert info.total_pages == 6
+        assert info.total_items == 53
+        assert info.items == []
+
+    @pytest.mark.asyncio
+    async def test_where_runs_before_transform(self, mock_client: MagicMock) -> None:
+        """Test: Solo se transforman los items que pasan el filtro."""
+        paginator = AutoPaginator(mock_client, PaginationConfig(page_size=10))
+        transform = MagicMock(side_effect=lambda item: item["id"])
+
+        result = await paginator.collect(
+            "/issues", where=lambda item: item["id"] % 2 == 0, transform=transform
+        )
+
+        assert result == list(range(0, 53, 2))
+        assert transform.call_count == 27
+
+    @pytest.mark.asyncio
+    async def test_limit_stops_fetching(self, mock_client: MagicMock) -> None:
+        """Test: Al alcanzar limit no se solicitan más páginas."""
+        paginator = AutoPaginator(mock_client, PaginationConfig(page_size=10))
+
+        result = await paginator.collect("/issues", limit=15)
+
+        assert [item["id"] for item in result] == list(range(15))
+        assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_limit_counts_filtered_items(self, mock_client: MagicMock) -> None:
+        """Test: limit cuenta los items emitidos, no los recibidos."""
+        paginator = AutoPaginator(mock_client, PaginationConfig(page_size=10))
+
+        result = await paginator.collect("/issues", where=lambda item: item["id"] >= 25, limit=3)
+
+        assert [item["id"] for item in result] == [25, 26, 27]
+        assert mock_client.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_zero_limit_makes_no_requests(self, mock_client: MagicMock) -> None:
+        """Test: limit=0 devuelve una lista vacía sin llamar a la API."""
+        paginator = AutoPaginator(mock_client, PaginationConfig(page_size=10))
+
+        assert await paginator.collect("/issues", limit=0) == []
+        mock_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_emits_before_last_page(self, mock_client: MagicMock) -> None:
+        """Test: Los items se emiten en cuanto llega su página."""
+        paginator = AutoPaginator(mock_client, PaginationConfig(page_size=10))
+
+        stream = paginator.stream("/issues")
+        first = await anext(stream)
+        await stream.aclose()
+
+        assert first == {"id": 0}
+        assert mock_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_early_stop_cancels_prefetch(self) -> None:
+        """Test: Cortar el stream concurrente cancela las páginas adelantadas."""
+        started: list[int] = []
+        finished: list[int] = []
+
+        async def get(endpoint: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+            started.append(params["page"])
+            await asyncio.sleep(0.05)
+            finished.append(params["page"])
+            return [{"id": params["page"]}] * 10
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=get)
+        client.get_with_headers = AsyncMock(
+            return_value=([{"id": 1}] * 10, {"x-pagination-count": "500", "x-paginated-by": "10"})
+        )
+        config = PaginationConfig(page_size=10, max_concurrency=3)
+
+        result = await AutoPaginator(client, config).collect("/issues", limit=5)
+        await asyncio.sleep(0.1)
+
+        assert len(result) == 5
+        assert len(started) <= 3
+        assert finished == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_early_stop_awaits_cancelled_prefetch(self) -> None:
+        """Test: Las páginas adelantadas han terminado al volver del stream."""
+        started: list[int] = []
+        cancelled: list[int] = []
+
+        async def get(endpoint: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+            started.append(params["page"])
+            try:
+                # La página 2 llega enseguida; las siguientes quedan en vuelo
+                await asyncio.sleep(0 if params["page"] == 2 else 1)
+            except asyncio.CancelledError:
+                cancelled.append(params["page"])
+                raise
+            return [{"id": params["page"]}] * 10
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=get)
+        client.get_with_headers = AsyncMock(
+            return_value=([{"id": 1}] * 10, {"x-pagination-count": "500", "x-paginated-by": "10"})
+        )
+        config = PaginationConfig(page_size=10, max_concurrency=3)
+
+        await AutoPaginator(client, config).collect("/issues", limit=15)
+
+        assert cancelled
+        assert sorted(cancelled) == [page for page in sorted(started) if page != 2]
+
+
 class TestPaginationResultDataclass:
     """Tests para el dataclass PaginationResult."""
 
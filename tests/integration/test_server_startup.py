@@ -8,13 +8,23 @@ Test 1.2.5: Test de integración: servidor inicia sin errores
 """
 
 import os
-from unittest.mock import patch
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
+import pytest
 from dependency_injector import providers
 from fastmcp import FastMCP
 
 from src.config import ServerConfig, TaigaConfig
+from src.infrastructure.adaptive_rate_limiter import get_rate_limiter
+from src.infrastructure.circuit_breaker import get_circuit_breakers
+from src.infrastructure.client_factory import get_global_cache
 from src.infrastructure.container import ApplicationContainer
+from src.infrastructure.disk_cache import TieredCache
+from src.infrastructure.hedging import get_hedging_policy
+from src.infrastructure.json_codec import get_json_codec
+from src.infrastructure.negative_cache import get_negative_cache
+from src.infrastructure.retry import get_retry_budget
 from src.server import TaigaMCPServer
 from src.taiga_client import TaigaAPIClient
 
@@ -146,6 +156,76 @@ class TestDependencyInjection:
         assert epic_tools.mcp is mcp
         assert project_tools.mcp is mcp
 
+    def test_all_tools_share_session_pool(self) -> None:
+        """Tools y resources deben compartir el pool de sesiones HTTP del container."""
+        container = ApplicationContainer()
+        pool = container.get_session_pool()
+
+        assert container.issue_tools().session_pool is pool
+        assert container.epic_tools().session_pool is pool
+        assert container.settings_tools().session_pool is pool
+        assert container.search_tools().session_pool is pool
+        assert container.taiga_resources().session_pool is pool
+
+    def test_container_exposes_session_pool_stats(self) -> None:
+        """El container debe exponer las métricas de conexiones del pool."""
+        container = ApplicationContainer()
+
+        stats = container.get_session_pool_stats()
+
+        assert stats["max_connections"] == 100
+        assert stats["pending_acquisitions"] == 0
+        assert stats["reuse_ratio"] == 0.0
+
+    def test_shared_services_are_built_from_config(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Los servicios compartidos se crean desde TaigaConfig y se registran como globales."""
+        monkeypatch.setenv("TAIGA_HTTP_RATE_LIMIT_RPS", "7")
+        monkeypatch.setenv("TAIGA_RETRY_BUDGET_RATIO", "0.25")
+        monkeypatch.setenv("TAIGA_CIRCUIT_FAILURE_THRESHOLD", "3")
+        monkeypatch.setenv("TAIGA_HEDGE_REQUESTS", "true")
+        monkeypatch.setenv("TAIGA_NEGATIVE_CACHE_TTL", "5")
+        monkeypatch.setenv("TAIGA_CACHE_SHARDS", "4")
+        monkeypatch.setenv("TAIGA_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("TAIGA_JSON_BACKEND", "stdlib")
+        container = ApplicationContainer()
+
+        container.register_shared_services()
+
+        assert get_rate_limiter() is container.rate_limiter()
+        assert get_rate_limiter().max_rate == 7
+        assert get_retry_budget() is container.retry_budget()
+        assert get_retry_budget().ratio == 0.25
+        assert get_circuit_breakers() is container.circuit_breakers()
+        assert get_circuit_breakers().failure_threshold == 3
+        assert get_hedging_policy() is container.hedging_policy()
+        assert get_hedging_policy().enabled is True
+        assert get_negative_cache() is container.negative_cache()
+        assert get_negative_cache().ttl == 5
+        assert get_json_codec() is container.json_codec()
+        assert get_json_codec().name == "stdlib"
+        assert get_global_cache() is container.memory_cache()
+        cache = get_global_cache()
+        assert isinstance(cache, TieredCache)
+        assert cache.disk.path == tmp_path / "taiga-cache.sqlite3"
+        assert getattr(cache.memory, "shards", 1) == 4
+        assert container.taiga_client()._rate_limiter is container.rate_limiter()
+
+    @pytest.mark.asyncio
+    async def test_lifespan_starts_and_warms_session_pool(self) -> None:
+        """El lifespan de FastMCP debe iniciar y precalentar el pool, y cerrarlo al salir."""
+        container = ApplicationContainer()
+        mcp = container.mcp()
+        pool = container.get_session_pool()
+
+        with patch.object(pool, "warm_up", new=AsyncMock(return_value=2)) as warm_up:
+            async with mcp._lifespan(mcp):
+                assert pool.is_started
+                warm_up.assert_awaited_once()
+
+        assert not pool.is_started
+
 
 class TestFastMCPConfiguration:
     """Test 1.2.3: Verificar que FastMCP se crea con configuración correcta."""
@@ -567,6 +567,38 @@ class TestAutomaticPagination:
                 # Should have only first page (10 items)
                 assert len(result) == 10
 
+    async def test_paginator_concurrent_uses_pagination_headers(self) -> None:
+        """Test concurrent pagination driven by x-pagination-count headers.
+
+        Verifies that:
+        - Remaining pages are computed from the first page headers
+        - Items are returned in page order
+        """
+        config = TaigaConfig(
+            taiga_api_url="https://api.taiga.io/api/v1",
+            taiga_auth_token="test-token",
+        )
+
+        mock_config = MockResponseConfig(
+            total_items=45,
+            page_size=10,
+        )
+
+        async with TaigaMockServer(config=mock_config):
+            async with TaigaAPIClient(config=config) as client:
+                paginator = AutoPaginator(
+                    client,
+                    config=PaginationConfig(page_size=10, max_concurrency=4),
+                )
+
+                result = await paginator.paginate_with_info("/projects")
+
+                assert result.total_items == 45
+                assert result.total_pages == 5
+                assert [item["id"] for item in result.items] == sorted(
+                    item["id"] for item in result.items
+                )
+
 
 # =============================================================================
 # Test 4.7.6: Timeout y reintentos
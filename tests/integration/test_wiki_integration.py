@@ -129,7 +129,7 @@ class TestWikiIntegration:
     @pytest.mark.integration
     @pytest.mark.wiki
     @pytest.mark.asyncio
-    async def test_wiki_attachments_workflow(self, mock_taiga_api, auth_token) -> None:
+    async def test_wiki_attachments_workflow(self, mock_taiga_api, auth_token, tmp_path) -> None:
         """
         Test de flujo completo de adjuntos en wiki:
         1. Crear adjunto
@@ -145,6 +145,8 @@ class TestWikiIntegration:
         project_id = 123
 
         # 1. Crear adjunto
+        diagram = tmp_path / "diagram.png"
+        diagram.write_bytes(b"\x89PNG")
         mock_taiga_api.post("https://api.taiga.io/api/v1/wiki/attachments").mock(
             return_value=httpx.Response(
                 201,
@@ -164,7 +166,7 @@ class TestWikiIntegration:
             auth_token=auth_token,
             wiki_page_id=wiki_id,
             project_id=project_id,
-            attached_file="path/to/diagram.png",
+            attached_file=str(diagram),
             description="Architecture diagram",
         )
 
@@ -311,6 +311,12 @@ def mock_taiga_client_for_tools() -> AsyncMock:
 
     client.get = AsyncMock(side_effect=mock_get)
 
+    async def mock_get_with_headers(path: str, *args, **kwargs) -> tuple:
+        """Mock GET returning (data, headers) for the concurrent paginator."""
+        return await client.get(path, *args, **kwargs), {}
+
+    client.get_with_headers = AsyncMock(side_effect=mock_get_with_headers)
+
     async def mock_post(path: str, *args, **kwargs) -> list | dict:
         """Mock HTTP POST with path-aware responses."""
         # Bulk operations return lists
@@ -345,29 +351,13 @@ def mcp_server_with_tools(mock_taiga_client_for_tools: AsyncMock) -> FastMCP:
     """
     mcp = FastMCP("Taiga MCP Test Server")
 
-    # Patch TaigaAPIClient in all tool modules
-    patches = []
-    tool_modules = [
-        "src.application.tools.auth_tools",
-        "src.application.tools.project_tools",
-        "src.application.tools.epic_tools",
-        "src.application.tools.userstory_tools",
-        "src.application.tools.task_tools",
-        "src.application.tools.issue_tools",
-        "src.application.tools.milestone_tools",
-        "src.application.tools.membership_tools",
-        "src.application.tools.webhook_tools",
-        "src.application.tools.wiki_tools",
-        "src.application.tools.user_tools",
-    ]
-
-    for module in tool_modules:
-        p = patch(f"{module}.TaigaAPIClient")
-        mock_cls = p.start()
-        mock_cls.return_value = mock_taiga_client_for_tools
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_taiga_client_for_tools)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=None)
-        patches.append(p)
+    # Patch TaigaAPIClient once in client_factory: every tool builds its
+    # clients with create_taiga_client
+    client_patch = patch("src.infrastructure.client_factory.TaigaAPIClient")
+    mock_cls = client_patch.start()
+    mock_cls.return_value = mock_taiga_client_for_tools
+    mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_taiga_client_for_tools)
+    mock_cls.return_value.__aexit__ = AsyncMock(return_value=None)
 
     # Register all tools
     auth_tools = AuthTools(mcp)
@@ -401,9 +391,7 @@ def mcp_server_with_tools(mock_taiga_client_for_tools: AsyncMock) -> FastMCP:
 
     yield mcp
 
-    # Stop all patches
-    for p in patches:
-        p.stop()
+    client_patch.stop()
 
 
 @pytest.fixture
@@ -0,0 +1,88 @@
+"""Benchmark: MemoryCache throughput with a full cache at 1k, 10k and 100k entries.
+
+Every ``set`` on a full cache evicts one entry. With the LRU OrderedDict and the
+expiry heap the cost per operation stays flat as the cache grows; the former
+``min()`` scan over all keys (reproduced by ``_ScanEvictionCache``) grows
+linearly with the number of entries.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from src.infrastructure.cache import MemoryCache
+
+
+SIZES = (1_000, 10_000, 100_000)
+OPERATIONS = 20_000
+SCAN_OPERATIONS = 200
+
+
+@dataclass
+class _ScanEvictionCache(MemoryCache):
+    """MemoryCache with the previous O(n) eviction, kept as a baseline."""
+
+    async def _evict_oldest_unlocked(self) -> bool:
+        if not self._cache:
+            return False
+        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].expires_at)
+        del self._cache[oldest_key]
+        self._metrics.evictions += 1
+        return True
+
+
+async def _fill(cache: MemoryCache, size: int) -> None:
+    for i in range(size):
+        await cache.set(f"warm:{i}", i)
+
+
+async def _set_throughput(cache: MemoryCache, operations: int) -> float:
+    start = time.perf_counter()
+    for i in range(operations):
+        await cache.set(f"new:{i}", i)
+    return operations / (time.perf_counter() - start)
+
+
+async def _get_throughput(cache: MemoryCache, size: int, operations: int) -> float:
+    start = time.perf_counter()
+    for i in range(operations):
+        await cache.get(f"new:{i % size}")
+    return operations / (time.perf_counter() - start)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestMemoryCacheBenchmark:
+    """Set/get throughput of a full MemoryCache as max_size grows."""
+
+    async def test_throughput_is_flat_across_sizes(self) -> None:
+        """Evicting sets and hits keep the same order of throughput from 1k to 100k."""
+        set_ops: dict[int, float] = {}
+        get_ops: dict[int, float] = {}
+        scan_ops: dict[int, float] = {}
+
+        for size in SIZES:
+            cache = MemoryCache(default_ttl=3600, max_size=size)
+            await _fill(cache, size)
+            set_ops[size] = await _set_throughput(cache, OPERATIONS)
+            get_ops[size] = await _get_throughput(cache, min(size, OPERATIONS), OPERATIONS)
+            assert await cache.size() == size
+
+            baseline = _ScanEvictionCache(default_ttl=3600, max_size=size)
+            await _fill(baseline, size)
+            scan_ops[size] = await _set_throughput(baseline, SCAN_OPERATIONS)
+
+        print("\nMemoryCache throughput with a full cache (ops/s)")
+        for size in SIZES:
+            print(
+                f"  {size:>7} entries: set={set_ops[size]:>10.0f} get={get_ops[size]:>10.0f} "
+                f"set(min-scan baseline)={scan_ops[size]:>10.0f}"
+            )
+
+        largest, smallest = SIZES[-1], SIZES[0]
+        assert set_ops[largest] > set_ops[smallest] / 4
+        assert get_ops[largest] > get_ops[smallest] / 4
+        assert set_ops[largest] > scan_ops[largest] * 10
@@ -0,0 +1,82 @@
+"""Benchmark: 200 concurrent GETs through HTTPSessionPool over HTTP/1.1 vs HTTP/2.
+
+Each request waits 50 ms on the server. Over HTTP/1.1 every concurrent
+request needs its own socket, so the pool opens up to ``max_connections``
+connections; over HTTP/2 (h2c against a local stub) the same burst is
+multiplexed as streams over a handful of connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from src.infrastructure.http_session_pool import HTTPSessionPool
+from tests.integration.mocks import StubHTTPServer, StubRequest, StubResponse
+
+
+pytest.importorskip("h2")
+
+from tests.integration.mocks.stub_h2_server import StubH2Server
+
+
+CONCURRENT_REQUESTS = 200
+SERVER_LATENCY = 0.05
+
+
+def _issue_handler(request: StubRequest) -> StubResponse:
+    issue_id = int(request.path.rstrip("/").rsplit("/", 1)[-1])
+    return StubResponse(body={"id": issue_id, "subject": f"Issue {issue_id}"})
+
+
+async def _burst(pool: HTTPSessionPool) -> tuple[float, dict[str, object]]:
+    client = await pool.get_client()
+    start = time.perf_counter()
+    responses = await asyncio.gather(
+        *(client.get(f"/issues/{i}") for i in range(1, CONCURRENT_REQUESTS + 1))
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    assert all(r.status_code == 200 for r in responses)
+    return elapsed_ms, pool.get_stats()
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestHTTP2Benchmark:
+    """Connection count and wall time of a concurrent burst per protocol."""
+
+    async def test_concurrent_burst_http1_vs_http2(self) -> None:
+        """HTTP/2 serves the burst over far fewer connections than HTTP/1.1."""
+        async with StubHTTPServer(_issue_handler, latency=SERVER_LATENCY) as server:
+            pool = HTTPSessionPool(base_url=server.base_url)
+            try:
+                http1_ms, http1_stats = await _burst(pool)
+            finally:
+                await pool.stop()
+            http1_connections = server.connection_count
+
+        async with StubH2Server(_issue_handler, latency=SERVER_LATENCY) as server:
+            pool = HTTPSessionPool(base_url=server.base_url, http2=True)
+            try:
+                http2_ms, http2_stats = await _burst(pool)
+            finally:
+                await pool.stop()
+            http2_connections = server.connection_count
+            http2_streams = server.peak_streams_per_connection
+
+        print(
+            f"\n{CONCURRENT_REQUESTS} concurrent GETs, {SERVER_LATENCY * 1000:.0f}ms server latency"
+            f"\n  HTTP/1.1: {http1_ms:.1f}ms connections={http1_connections} "
+            f"peak_streams_per_connection={http1_stats['peak_streams_per_connection']:.1f}"
+            f"\n  HTTP/2:   {http2_ms:.1f}ms connections={http2_connections} "
+            f"peak_streams_per_connection={http2_stats['peak_streams_per_connection']:.1f} "
+            f"(server saw {http2_streams})"
+        )
+
+        assert http1_stats["requests_by_http_version"] == {"HTTP/1.1": CONCURRENT_REQUESTS}
+        assert http2_stats["requests_by_http_version"] == {"HTTP/2": CONCURRENT_REQUESTS}
+        assert http1_connections >= 50
+        assert http2_connections <= 4
+        assert http2_stats["peak_streams_per_connection"] > 10
@@ -0,0 +1,120 @@
+"""Benchmark: decoding a 5,000-item ``/userstories`` payload with each JSON backend.
+
+The payload mirrors the shape of Taiga's user story list (nested
+``*_extra_info`` objects, tags, points and custom timestamps), which is what
+``TaigaAPIClient.get`` decodes for large list tools. Backends that are not
+installed are skipped.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+
+import pytest
+
+from src.infrastructure.json_codec import JSONCodec, MsgspecCodec, OrjsonCodec
+
+
+ITEMS = 5_000
+ROUNDS = 5
+
+
+def _user(user_id: int) -> dict[str, object]:
+    return {
+        "id": user_id,
+        "username": f"user{user_id}",
+        "full_name_display": f"User {user_id}",
+        "photo": None,
+        "big_photo": None,
+        "gravatar_id": "0" * 32,
+        "is_active": True,
+    }
+
+
+def _userstories(count: int) -> list[dict[str, object]]:
+    """User stories with the fields Taiga returns in ``GET /userstories``."""
+    return [
+        {
+            "id": i,
+            "ref": i + 1,
+            "version": 3,
+            "project": 1,
+            "milestone": i % 12 or None,
+            "subject": f"As a user I want feature number {i} so that it works — ñ",
+            "description": None,
+            "status": i % 6,
+            "status_extra_info": {"name": "In progress", "color": "#E47C40", "is_closed": False},
+            "assigned_to": i % 40,
+            "assigned_to_extra_info": _user(i % 40),
+            "owner": 7,
+            "owner_extra_info": _user(7),
+            "assigned_users": [i % 40, (i + 1) % 40],
+            "points": {"1": 3, "2": 5, "3": 1, "4": 2},
+            "total_points": 11.0,
+            "tags": [["backend", None], ["api", "#70728F"]],
+            "is_closed": i % 9 == 0,
+            "is_blocked": False,
+            "blocked_note": "",
+            "client_requirement": False,
+            "team_requirement": i % 2 == 0,
+            "created_date": "2025-01-10T08:15:30.123456Z",
+            "modified_date": "2025-02-01T17:45:00.000000Z",
+            "finish_date": None,
+            "due_date": "2025-03-01",
+            "total_voters": i % 5,
+            "total_watchers": i % 3,
+            "watchers": [7, 12],
+            "epics": [{"id": 3, "ref": 12, "subject": "Onboarding", "color": "#A8E440"}],
+        }
+        for i in range(count)
+    ]
+
+
+def _backends() -> list[JSONCodec]:
+    codecs: list[JSONCodec] = [JSONCodec()]
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        with contextlib.suppress(ImportError):
+            codecs.append(codec_class())
+    return codecs
+
+
+def _best_decode_time(codec: JSONCodec, body: bytes) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        codec.loads(body)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestJSONCodecBenchmark:
+    """Decode (and encode) time of a realistic user story list per backend."""
+
+    def test_decode_userstories_payload(self) -> None:
+        """Every backend decodes the same data; faster backends beat the stdlib."""
+        stories = _userstories(ITEMS)
+        body = JSONCodec().dumps(stories)
+        decode: dict[str, float] = {}
+        encode: dict[str, float] = {}
+
+        for codec in _backends():
+            assert codec.loads(body) == stories
+            decode[codec.name] = _best_decode_time(codec, body)
+            start = time.perf_counter()
+            codec.dumps(stories)
+            encode[codec.name] = time.perf_counter() - start
+
+        print(f"\nDecoding {ITEMS} user stories ({len(body) / 1e6:.1f} MB)")
+        for name, seconds in decode.items():
+            print(
+                f"  {name:>8}: decode={seconds * 1000:>7.1f} ms "
+                f"encode={encode[name] * 1000:>7.1f} ms "
+                f"speedup={decode['stdlib'] / seconds:>4.1f}x"
+            )
+
+        for name, seconds in decode.items():
+            if name != "stdlib":
+                assert seconds < decode["stdlib"]
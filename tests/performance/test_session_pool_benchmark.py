@@ -0,0 +1,103 @@
+"""Benchmark: pooled vs per-call HTTP clients in the tool layer.
+
+Runs 1,000 sequential ``taiga_get_issue`` calls against a local stub server
+and compares p50/p99 latency between the tools (routed through the shared
+HTTPSessionPool) and the former per-call ``TaigaAPIClient`` pattern, which
+built and tore down an ``httpx.AsyncClient`` on every call.
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from fastmcp import FastMCP
+
+from src.application.tools.issue_tools import IssueTools
+from src.config import TaigaConfig
+from src.infrastructure.http_session_pool import HTTPSessionPool
+from src.taiga_client import TaigaAPIClient
+from tests.integration.mocks import StubHTTPServer, StubRequest, StubResponse
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+SEQUENTIAL_CALLS = 1000
+
+
+def _issue_handler(request: StubRequest) -> StubResponse:
+    issue_id = int(request.path.rstrip("/").rsplit("/", 1)[-1])
+    return StubResponse(body={"id": issue_id, "ref": issue_id, "subject": f"Issue {issue_id}"})
+
+
+def _stub_config(server: StubHTTPServer) -> TaigaConfig:
+    return TaigaConfig(
+        TAIGA_API_URL=server.base_url,
+        TAIGA_USERNAME="bench@example.com",
+        TAIGA_PASSWORD="benchpassword",
+    )
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _measure(call: Callable[[int], Awaitable[object]]) -> list[float]:
+    latencies: list[float] = []
+    for i in range(SEQUENTIAL_CALLS):
+        start = time.perf_counter()
+        await call(i + 1)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestSessionPoolBenchmark:
+    """Pooled keep-alive connections vs a new client per tool call."""
+
+    async def test_get_issue_pooled_vs_per_call(self) -> None:
+        """Tools reuse one keep-alive connection and beat per-call clients."""
+        async with StubHTTPServer(_issue_handler) as server:
+            config = _stub_config(server)
+
+            pool = HTTPSessionPool(base_url=server.base_url, timeout=config.timeout)
+            tools = IssueTools(FastMCP("Bench"), session_pool=pool)
+            tools.config = config
+            tools.register_tools()
+            get_issue = (await tools.mcp.get_tool("taiga_get_issue")).fn
+
+            async def pooled_call(issue_id: int) -> object:
+                return await get_issue(auth_token="bench-token", issue_id=issue_id)
+
+            async def per_call(issue_id: int) -> object:
+                async with TaigaAPIClient(config) as client:
+                    client.auth_token = "bench-token"
+                    return await client.get_issue(issue_id)
+
+            try:
+                pooled = await _measure(pooled_call)
+            finally:
+                await pool.stop()
+            pooled_connections = server.connection_count
+
+            unpooled = await _measure(per_call)
+            unpooled_connections = server.connection_count - pooled_connections
+
+        print(
+            f"\n{SEQUENTIAL_CALLS} sequential taiga_get_issue calls"
+            f"\n  pooled:   p50={statistics.median(pooled):.3f}ms "
+            f"p99={_percentile(pooled, 0.99):.3f}ms connections={pooled_connections}"
+            f"\n  per-call: p50={statistics.median(unpooled):.3f}ms "
+            f"p99={_percentile(unpooled, 0.99):.3f}ms connections={unpooled_connections}"
+        )
+
+        assert server.request_count == SEQUENTIAL_CALLS * 2
+        assert pooled_connections == 1
+        assert unpooled_connections == SEQUENTIAL_CALLS
+        assert statistics.median(pooled) < statistics.median(unpooled)
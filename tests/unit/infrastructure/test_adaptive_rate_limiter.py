@@ -0,0 +1,235 @@
+"""Tests para el limitador HTTP adaptativo compartido."""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.domain.exceptions import RateLimitError
+from src.infrastructure.adaptive_rate_limiter import AdaptiveRateLimiter, parse_retry_after
+
+
+class FakeClock:
+    """Reloj monotónico controlado por el test."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Sustituye el reloj del módulo (no el de asyncio) por uno controlado."""
+    fake = FakeClock()
+    with patch("src.infrastructure.adaptive_rate_limiter.time", fake):
+        yield fake
+
+
+class TestAdaptiveRateLimiter:
+    """Tests para AdaptiveRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_unpaced_until_throttled(self) -> None:
+        """Test que sin 429 ni techo las peticiones no esperen."""
+        limiter = AdaptiveRateLimiter()
+
+        for _ in range(100):
+            await limiter.acquire()
+            limiter.on_response(200)
+
+        assert limiter.rate is None
+        assert limiter.get_metrics().delayed == 0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_all_traffic(self) -> None:
+        """Test que un Retry-After pause a todas las corrutinas a la vez."""
+        limiter = AdaptiveRateLimiter()
+        limiter.on_response(429, retry_after=0.2)
+
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+
+        assert time.monotonic() - start >= 0.19
+        assert limiter.get_metrics().pauses == 1
+        assert limiter.get_metrics().delayed == 5
+
+    def test_concurrent_429s_decrease_once(self, clock: FakeClock) -> None:
+        """Test que varios 429 en el mismo segundo reduzcan el ritmo una vez."""
+        limiter = AdaptiveRateLimiter(max_rate=10)
+
+        limiter.on_response(429)
+        clock.now += 0.5
+        limiter.on_response(429)
+        assert limiter.rate == 5
+
+        clock.now += 1.0
+        limiter.on_response(429)
+        assert limiter.rate == 2.5
+        assert limiter.get_metrics().decreases == 2
+        assert limiter.get_metrics().throttled == 3
+
+    def test_rate_never_drops_below_minimum(self, clock: FakeClock) -> None:
+        """Test que el ritmo no baje de min_rate."""
+        limiter = AdaptiveRateLimiter(max_rate=4, min_rate=1)
+
+        for _ in range(5):
+            limiter.on_response(429)
+            clock.now += 1.0
+
+        assert limiter.rate == 1
+
+    def test_additive_increase_capped_at_max_rate(self, clock: FakeClock) -> None:
+        """Test que cada segundo sin 429 sume increase req/s hasta el techo."""
+        limiter = AdaptiveRateLimiter(max_rate=10, increase=1.0)
+        limiter.on_response(429)
+
+        clock.now += 3.0
+        limiter.on_response(200)
+        assert limiter.rate == 8
+
+        clock.now += 30.0
+        limiter.on_response(200)
+        assert limiter.rate == 10
+
+    @pytest.mark.asyncio
+    async def test_first_429_paces_at_half_the_observed_rate(self, clock: FakeClock) -> None:
+        """Test que el primer 429 fije el ritmo a la mitad del observado y se recupere."""
+        limiter = AdaptiveRateLimiter(increase=1.0)
+        for _ in range(41):
+            await limiter.acquire()
+            clock.now += 0.025
+
+        limiter.on_response(429)
+        assert limiter.rate == pytest.approx(20)
+
+        clock.now += 10.0
+        limiter.on_response(200)
+        assert limiter.rate == pytest.approx(30)
+
+        # Recuperado el ritmo previo al 429, vuelve a no espaciar
+        clock.now += 11.0
+        limiter.on_response(200)
+        assert limiter.rate is None
+
+    def test_low_traffic_429_only_pauses(self, clock: FakeClock) -> None:
+        """Test que con poco tráfico un 429 no empiece a espaciar peticiones."""
+        limiter = AdaptiveRateLimiter(min_rate=1)
+
+        limiter.on_response(429, retry_after=2)
+
+        assert limiter.rate is None
+        assert limiter.get_stats()["paused_for"] == 2
+
+    def test_get_stats(self) -> None:
+        """Test que get_stats incluya ritmo, pausa y métricas."""
+        limiter = AdaptiveRateLimiter(max_rate=5)
+        limiter.on_response(429, retry_after=30)
+
+        stats = limiter.get_stats()
+
+        assert stats["rate"] == 2.5
+        assert stats["max_rate"] == 5
+        assert stats["paused_for"] > 29
+        assert stats["throttled"] == 1
+
+    def test_invalid_decrease_factor_raises_error(self) -> None:
+        """Test que un decrease_factor fuera de (0, 1) lance ValueError."""
+        with pytest.raises(ValueError, match="decrease_factor"):
+            AdaptiveRateLimiter(decrease_factor=1.5)
+
+
+class TestParseRetryAfter:
+    """Tests para la lectura de la cabecera Retry-After."""
+
+    def test_delta_seconds(self) -> None:
+        """Test que la forma en segundos se use tal cual."""
+        assert parse_retry_after("120") == 120
+        assert parse_retry_after(" 0 ") == 0
+
+    def test_http_date(self) -> None:
+        """Test que una fecha HTTP se convierta en los segundos que faltan."""
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+
+        assert 28 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+    def test_past_http_date_is_zero(self) -> None:
+        """Test que una fecha ya pasada no pause."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "-5", "1.5", "Wed, 99 Foo 2015"])
+    def test_missing_or_invalid_uses_default(self, value: str | None) -> None:
+        """Test que sin cabecera o con un valor no válido se use el default."""
+        assert parse_retry_after(value) == 5
+        assert parse_retry_after(value, default=1) == 1
+
+
+class TestClientSharesLimiter:
+    """Tests para el limitador compartido entre TaigaAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_429_on_one_client_pauses_the_others(self, make_api_client) -> None:
+        """Test que el Retry-After recibido por un cliente frene a los demás."""
+        limiter = AdaptiveRateLimiter()
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "1"})
+        ok = MagicMock(status_code=200, headers={})
+        first = make_api_client(
+            rate_limiter=limiter, http=MagicMock(get=AsyncMock(side_effect=[throttled, ok]))
+        )
+        second = make_api_client(
+            rate_limiter=limiter, http=MagicMock(get=AsyncMock(return_value=ok))
+        )
+
+        async def second_call() -> float:
+            await asyncio.sleep(0.05)  # Llega cuando el primero ya recibió el 429
+            start = time.monotonic()
+            await second._make_request("GET", "/issues")
+            return time.monotonic() - start
+
+        _, second_elapsed = await asyncio.gather(
+            first._make_request("GET", "/projects"), second_call()
+        )
+
+        assert first._client.get.await_count == 2
+        assert second_elapsed >= 0.9
+        assert limiter.get_metrics().pauses == 1
+        assert limiter.get_metrics().throttled == 1
+
+    @pytest.mark.asyncio
+    async def test_http_date_retry_after_pauses_the_limiter(self, make_api_client) -> None:
+        """Test que un 429 con Retry-After en forma de fecha pause en lugar de fallar."""
+        limiter = AdaptiveRateLimiter()
+        retry_at = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+        throttled = MagicMock(status_code=429, headers={"Retry-After": retry_at})
+        client = make_api_client(
+            max_retries=0,
+            rate_limiter=limiter,
+            http=MagicMock(get=AsyncMock(return_value=throttled)),
+        )
+
+        with pytest.raises(RateLimitError):
+            await client._make_request("GET", "/projects")
+
+        assert limiter.get_metrics().pauses == 1
+        assert limiter.get_stats()["paused_for"] > 28
+
+    @pytest.mark.asyncio
+    async def test_concurrent_clients_wait_for_the_same_pause(self, make_api_client) -> None:
+        """Test que las peticiones concurrentes esperen la pausa en lugar de enviar."""
+        limiter = AdaptiveRateLimiter()
+        ok = MagicMock(status_code=200, headers={})
+        clients = [
+            make_api_client(rate_limiter=limiter, http=MagicMock(get=AsyncMock(return_value=ok)))
+            for _ in range(3)
+        ]
+
+        start = time.monotonic()
+        limiter.on_response(429, retry_after=1)
+        await asyncio.gather(*(c._make_request("GET", "/projects") for c in clients))
+
+        assert time.monotonic() - start >= 0.99
+        assert limiter.get_metrics().delayed == 3
@@ -16,12 +16,23 @@ Tests implementados:
 
 import asyncio
 from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.infrastructure.cache import CacheEntry, CacheMetrics, MemoryCache
+from src.config import TaigaConfig
+from src.infrastructure.cache import (
+    CacheEntry,
+    CacheMetrics,
+    MemoryCache,
+    ShardedMemoryCache,
+    create_memory_cache,
+    estimate_size,
+)
 from src.infrastructure.cached_client import CachedTaigaClient, CacheKeyBuilder
+from src.infrastructure.client_factory import create_cached_client
+from src.taiga_client import TaigaAPIClient
 
 
 class TestCacheEntry:
@@ -439,6 +450,433 @@ class TestMemoryCache:
         assert metrics.misses == 0
 
 
+class TestMemoryCacheEviction:
+    """Tests para la evicción LRU y el heap de expiración de MemoryCache."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> list[datetime]:
+        """Reloj controlable para src.infrastructure.cache (clock[0] es 'ahora')."""
+        now = [datetime(2025, 1, 1, 12, 0, 0)]
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz: object = None) -> datetime:  # type: ignore[override]
+                return now[0]
+
+        monkeypatch.setattr("src.infrastructure.cache.datetime", FrozenDatetime)
+        return now
+
+    @pytest.mark.asyncio
+    async def test_get_refreshes_recency(self) -> None:
+        """Test que un get mueva la entrada al final del orden LRU."""
+        cache = MemoryCache(default_ttl=3600, max_size=2)
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+
+        await cache.get("key1")
+        await cache.set("key3", "value3")  # Debe expulsar key2, no key1
+
+        assert await cache.contains("key1") is True
+        assert await cache.contains("key2") is False
+        assert await cache.contains("key3") is True
+
+    @pytest.mark.asyncio
+    async def test_overwrite_refreshes_recency(self) -> None:
+        """Test que sobrescribir una clave la marque como usada recientemente."""
+        cache = MemoryCache(default_ttl=3600, max_size=2)
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+
+        await cache.set("key1", "value1b")
+        await cache.set("key3", "value3")
+
+        assert await cache.get("key1") == "value1b"
+        assert await cache.contains("key2") is False
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_evicted_before_lru(self, clock: list[datetime]) -> None:
+        """Test que al llenarse se expulsen primero las expiradas y no la LRU."""
+        cache = MemoryCache(default_ttl=3600, max_size=3)
+        await cache.set("lru", "value")
+        await cache.set("short", "value", ttl=10)
+        await cache.set("recent", "value")
+
+        clock[0] += timedelta(seconds=11)
+        await cache.set("new", "value")
+
+        assert await cache.contains("lru") is True
+        assert await cache.contains("short") is False
+        assert cache.get_metrics().evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_heap_entry_does_not_evict_overwritten_key(
+        self, clock: list[datetime]
+    ) -> None:
+        """Test que la expiración antigua de una clave sobrescrita se ignore."""
+        cache = MemoryCache(default_ttl=3600, max_size=100)
+        await cache.set("key", "old", ttl=10)
+        await cache.set("key", "new", ttl=3600)
+
+        clock[0] += timedelta(seconds=11)
+        evicted = await cache.evict_expired()
+
+        assert evicted == 0
+        assert await cache.get("key") == "new"
+
+    @pytest.mark.asyncio
+    async def test_evict_expired_only_pops_due_entries(self, clock: list[datetime]) -> None:
+        """Test que evict_expired solo extraiga del heap las entradas vencidas."""
+        cache = MemoryCache(default_ttl=3600, max_size=100)
+        for i in range(10):
+            await cache.set(f"key{i}", i, ttl=10 * (i + 1))
+
+        clock[0] += timedelta(seconds=35)
+        evicted = await cache.evict_expired()
+
+        assert evicted == 3
+        assert len(cache._expiry_heap) == 7
+        assert await cache.size() == 7
+
+    @pytest.mark.asyncio
+    async def test_expiry_heap_stays_bounded_under_overwrites(self) -> None:
+        """Test que el heap se compacte con sobrescrituras repetidas."""
+        cache = MemoryCache(default_ttl=3600, max_size=10)
+        for i in range(1000):
+            await cache.set(f"key{i % 5}", i)
+
+        assert await cache.size() == 5
+        assert len(cache._expiry_heap) <= 2 * 5 + 64 + 1
+
+    @pytest.mark.asyncio
+    async def test_clear_empties_expiry_heap(self) -> None:
+        """Test que clear vacíe también el heap de expiración."""
+        cache = MemoryCache(default_ttl=3600, max_size=10)
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+
+        await cache.clear()
+
+        assert cache._expiry_heap == []
+
+
+class TestMemoryCacheBytes:
+    """Tests para la contabilidad de memoria y el límite max_bytes."""
+
+    def test_estimate_size_grows_with_content(self) -> None:
+        """Test que la estimación crezca con el contenido y extrapole listas largas."""
+        small = [{"id": i, "name": f"module {i}"} for i in range(3)]
+        large = [{"id": i, "name": f"module {i}", "description": f"{i}" * 500} for i in range(3000)]
+
+        assert estimate_size(small) > 0
+        assert estimate_size(large) > 100 * estimate_size(small)
+        exact = sum(len(item["description"]) for item in large)
+        assert exact < estimate_size(large) < 4 * exact
+
+    @pytest.mark.asyncio
+    async def test_bytes_are_tracked_per_endpoint(self) -> None:
+        """Test que get_stats informe los bytes totales y por tipo de endpoint."""
+        cache = MemoryCache(default_ttl=60, max_size=10)
+        await cache.set("project_stats:project_id=1", {"data": "x" * 10_000})
+        await cache.set("project_modules:project_id=1", [{"id": 1}])
+        await cache.set("project_modules:project_id=2", [{"id": 2}])
+
+        stats = await cache.get_stats()
+
+        by_endpoint = stats["bytes_by_endpoint"]
+        assert list(by_endpoint) == ["project_stats", "project_modules"]
+        assert by_endpoint["project_stats"] > 10_000
+        assert stats["bytes"] == sum(by_endpoint.values())
+
+        await cache.delete("project_stats:project_id=1")
+        await cache.set("project_modules:project_id=1", [{"id": 1}, {"id": 3}])
+        stats = await cache.get_stats()
+        assert list(stats["bytes_by_endpoint"]) == ["project_modules"]
+        assert stats["bytes"] == sum(cache._cache[key].size for key in cache._cache)
+
+        await cache.clear()
+        assert (await cache.get_stats())["bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_evicts_least_recently_used(self) -> None:
+        """Test que superar max_bytes desaloje las entradas menos usadas."""
+        cache = MemoryCache(default_ttl=60, max_size=100, max_bytes=35_000)
+        for i in range(3):
+            await cache.set(f"userstory_filters:project_id={i}", "x" * 10_000)
+        assert await cache.get("userstory_filters:project_id=0") is not None
+
+        await cache.set("userstory_filters:project_id=3", "x" * 10_000)
+
+        assert [key[-1] for key in cache._cache] == ["2", "0", "3"]
+        assert (await cache.get_stats())["bytes"] <= 35_000
+        assert cache.get_metrics().size_evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_entry_larger_than_max_bytes_is_not_stored(self) -> None:
+        """Test que una entrada mayor que todo el límite no se guarde ni vacíe el caché."""
+        cache = MemoryCache(default_ttl=60, max_size=100, max_bytes=5_000)
+        await cache.set("project_modules:project_id=1", [1])
+        await cache.set("project_stats:project_id=1", "old")
+
+        await cache.set("project_stats:project_id=1", "x" * 10_000)
+
+        assert await cache.get("project_stats:project_id=1") is None
+        assert await cache.get("project_modules:project_id=1") == [1]
+        assert cache.get_metrics().size_evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_sharded_cache_aggregates_bytes(self) -> None:
+        """Test que el caché particionado agregue los bytes de sus segmentos."""
+        cache = create_memory_cache(default_ttl=60, max_size=100, shards=4)
+        for i in range(20):
+            await cache.set(f"project_stats:project_id={i}", "x" * 4_000)
+
+        stats = await cache.get_stats()
+
+        assert stats["max_bytes"] == 0
+        assert stats["bytes"] > 20 * 4_000
+        assert stats["bytes_by_endpoint"] == {"project_stats": stats["bytes"]}
+
+    def test_sharded_cache_rejects_max_bytes(self) -> None:
+        """Test que no se combine un caché particionado con límite de memoria."""
+        with pytest.raises(ValueError, match="max_bytes"):
+            create_memory_cache(shards=4, max_bytes=40_000)
+
+
+class TestMemoryCacheTags:
+    """Tests para la invalidación por tags y el índice secundario."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_is_exact(self) -> None:
+        """Test que project:1 no invalide entradas de project:12."""
+        cache = MemoryCache(default_ttl=3600, max_size=100)
+        await cache.set("issue_filters:project_id=1", "a", tags=["project:1"])
+        await cache.set("issue_filters:project_id=12", "b", tags=["project:12"])
+
+        assert await cache.invalidate_tags("project:1") == 1
+        assert await cache.get("issue_filters:project_id=1") is None
+        assert await cache.get("issue_filters:project_id=12") == "b"
+        assert cache.get_metrics().invalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_multiple_tags_counts_each_entry_once(self) -> None:
+        """Test que una entrada con varios tags se invalide una sola vez."""
+        cache = MemoryCache(default_ttl=3600, max_size=100)
+        await cache.set("k1", 1, tags=["project:1", "endpoint:issue_filters"])
+        await cache.set("k2", 2, tags=["endpoint:issue_filters"])
+        await cache.set("k3", 3, tags=["project:2"])
+
+        assert await cache.invalidate_tags("project:1", "endpoint:issue_filters") == 2
+        assert await cache.size() == 1
+        assert await cache.invalidate_tags("project:99") == 0
+
+    @pytest.mark.asyncio
+    async def test_index_follows_every_removal_path(self) -> None:
+        """Test que delete, invalidate, evicción LRU y clear limpien el índice."""
+        cache = MemoryCache(default_ttl=3600, max_size=2)
+        await cache.set("k1", 1, tags=["t1"])
+        await cache.set("k2", 2, tags=["t2"])
+        await cache.set("k3", 3, tags=["t3"])  # Expulsa k1
+
+        assert "t1" not in cache._tag_index
+        assert await cache.delete("k2") is True
+        assert "t2" not in cache._tag_index
+        assert await cache.invalidate("k3") == 1
+        assert cache._tag_index == {}
+
+        await cache.set("k4", 4, tags=["t4"])
+        await cache.clear()
+        assert cache._tag_index == {}
+
+    @pytest.mark.asyncio
+    async def test_overwrite_replaces_tags(self) -> None:
+        """Test que sobrescribir una clave reemplace sus tags."""
+        cache = MemoryCache(default_ttl=3600, max_size=10)
+        await cache.set("key", 1, tags=["old"])
+        await cache.set("key", 2, tags=["new"])
+
+        assert await cache.invalidate_tags("old") == 0
+        assert await cache.invalidate_tags("new") == 1
+        stats = await cache.get_stats()
+        assert stats["tags"] == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_leaves_index(self) -> None:
+        """Test que una entrada expirada salga del índice al leerse."""
+        cache = MemoryCache(default_ttl=3600, max_size=10)
+        await cache.set("key", 1, tags=["tag"])
+        cache._cache["key"].expires_at = datetime.now() - timedelta(seconds=1)
+
+        assert await cache.get("key") is None
+        assert cache._tag_index == {}
+
+    @pytest.mark.asyncio
+    async def test_sharded_invalidate_tags(self) -> None:
+        """Test que ShardedMemoryCache invalide tags en todos los segmentos."""
+        cache = ShardedMemoryCache(default_ttl=3600, max_size=100, shards=4)
+        for i in range(20):
+            await cache.set(f"key{i}", i, tags=[f"project:{i % 2}"])
+
+        assert await cache.invalidate_tags("project:0") == 10
+        assert await cache.size() == 10
+        assert (await cache.get_stats())["tags"] >= 1
+
+
+class TestMemoryCacheLocking:
+    """Tests para el camino de lectura sin lock y las métricas de espera."""
+
+    @pytest.mark.asyncio
+    async def test_hit_does_not_take_lock(self) -> None:
+        """Test que un acierto se sirva aunque el lock esté ocupado."""
+        cache = MemoryCache(default_ttl=3600, max_size=10)
+        await cache.set("key", "value")
+
+        async with cache._lock:
+            value = await asyncio.wait_for(cache.get("key"), timeout=1)
+            stats = await asyncio.wait_for(cache.get_stats(), timeout=1)
+
+        assert value == "value"
+        assert stats["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_removed_under_lock(self) -> None:
+        """Test que una entrada expirada se elimine y cuente como evicción."""
+        cache = MemoryCache(default_ttl=3600, max_size=10)
+        await cache.set("key", "value", ttl=1)
+        cache._cache["key"].expires_at = datetime.now() - timedelta(seconds=1)
+
+        assert await cache.get("key") is None
+        assert await cache.size() == 0
+        assert cache.get_metrics().evictions == 1
+        assert cache.get_metrics().misses == 1
+
+    @pytest.mark.asyncio
+    async def test_lock_wait_metrics_recorded(self) -> None:
+        """Test que se registren adquisiciones y espera del lock."""
+        cache = MemoryCache(default_ttl=3600, max_size=10)
+
+        async def hold_lock() -> None:
+            async with cache._lock:
+                await asyncio.sleep(0.02)
+
+        holder = asyncio.create_task(hold_lock())
+        await asyncio.sleep(0)
+        await cache.set("key", "value")
+        await holder
+
+        metrics = cache.get_metrics()
+        assert metrics.lock_acquisitions == 1
+        assert metrics.lock_wait_max >= 0.01
+        assert metrics.lock_wait_avg == metrics.lock_wait_total
+
+        stats = await cache.get_stats()
+        assert stats["metrics"]["lock_acquisitions"] == 1
+        assert stats["metrics"]["lock_wait_max_ms"] >= 10
+
+        cache.reset_metrics()
+        assert cache.get_metrics().lock_acquisitions == 0
+        assert cache.get_metrics().lock_wait_max == 0.0
+
+
+class TestShardedMemoryCache:
+    """Tests para ShardedMemoryCache y create_memory_cache."""
+
+    @pytest.mark.asyncio
+    async def test_stores_and_retrieves_across_shards(self) -> None:
+        """Test que las claves se repartan entre segmentos y se recuperen."""
+        cache = ShardedMemoryCache(default_ttl=3600, max_size=100, shards=4)
+        for i in range(40):
+            await cache.set(f"key{i}", i)
+
+        assert [await cache.get(f"key{i}") for i in range(40)] == list(range(40))
+        assert await cache.size() == 40
+        assert sum(1 for segment in cache._segments if segment._cache) > 1
+
+    @pytest.mark.asyncio
+    async def test_max_size_split_between_shards(self) -> None:
+        """Test que max_size se reparta y limite el total."""
+        cache = ShardedMemoryCache(default_ttl=3600, max_size=10, shards=4)
+
+        assert sum(segment.max_size for segment in cache._segments) == 10
+        for i in range(100):
+            await cache.set(f"key{i}", i)
+        assert await cache.size() <= 10
+
+    @pytest.mark.asyncio
+    async def test_invalidate_and_clear_span_all_shards(self) -> None:
+        """Test que invalidate y clear afecten a todos los segmentos."""
+        cache = ShardedMemoryCache(default_ttl=3600, max_size=100, shards=4)
+        for i in range(20):
+            await cache.set(f"project:{i % 2}:key{i}", i)
+
+        assert await cache.invalidate("project:0:") == 10
+        assert await cache.size() == 10
+        assert await cache.delete("project:1:key1") is True
+        assert await cache.clear() == 9
+        assert await cache.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_metrics_and_stats_are_aggregated(self) -> None:
+        """Test que métricas y estadísticas sumen los segmentos."""
+        cache = ShardedMemoryCache(default_ttl=3600, max_size=100, shards=4)
+        for i in range(8):
+            await cache.set(f"key{i}", i)
+            await cache.get(f"key{i}")
+        await cache.get("missing")
+
+        metrics = cache.get_metrics()
+        assert metrics.hits == 8
+        assert metrics.misses == 1
+        assert metrics.lock_acquisitions == 8
+
+        stats = await cache.get_stats()
+        assert stats["shards"] == 4
+        assert stats["size"] == sum(stats["shard_sizes"]) == 8
+        assert stats["metrics"]["hits"] == 8
+
+        cache.reset_metrics()
+        assert cache.get_metrics().hits == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_operations(self) -> None:
+        """Test de lecturas y escrituras concurrentes sobre varios segmentos."""
+        cache = ShardedMemoryCache(default_ttl=3600, max_size=1000, shards=8)
+
+        async def worker(n: int) -> None:
+            for i in range(20):
+                await cache.set(f"w{n}:k{i}", i)
+                assert await cache.get(f"w{n}:k{i}") == i
+
+        await asyncio.gather(*(worker(n) for n in range(20)))
+
+        assert await cache.size() == 400
+
+    def test_invalid_shards_raises(self) -> None:
+        """Test que shards <= 0 lance ValueError."""
+        with pytest.raises(ValueError, match="shards"):
+            ShardedMemoryCache(shards=0)
+
+    def test_create_memory_cache_shards(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test que create_memory_cache particione solo si se piden varios segmentos."""
+        monkeypatch.setenv("TAIGA_CACHE_SHARDS", "4")
+        assert type(create_memory_cache()) is MemoryCache
+
+        cache = create_memory_cache(default_ttl=60, max_size=200, shards=4)
+        assert isinstance(cache, ShardedMemoryCache)
+        assert cache.shards == 4
+        assert cache.default_ttl == 60
+
+    @pytest.mark.asyncio
+    async def test_wraps_a_tiered_cache(self, tmp_path: Path) -> None:
+        """Test que el caché particionado sirva de nivel en memoria de un TieredCache."""
+        cache = create_memory_cache(shards=4, directory=str(tmp_path))
+        await cache.set("key", "value")
+        await cache.flush()
+
+        assert isinstance(cache.memory, ShardedMemoryCache)
+        assert await cache.disk.get("key") is not None
+        await cache.disk.close()
+
+
 class TestCacheKeyBuilder:
     """Tests para la clase CacheKeyBuilder."""
 
@@ -463,6 +901,21 @@ class TestCacheKeyBuilder:
         key = CacheKeyBuilder.build("epic_filters", project_id=123, status=None)
         assert key == "epic_filters:project_id=123"
 
+    def test_tags_include_endpoint_and_project(self) -> None:
+        """Test que los tags incluyan el tipo de endpoint y el proyecto."""
+        tags = CacheKeyBuilder.tags("issue_filters", project_id=123)
+        assert tags == {
+            "endpoint:issue_filters",
+            "project:123",
+            "endpoint:issue_filters:project:123",
+        }
+
+    def test_tags_without_project(self) -> None:
+        """Test que sin project_id solo se añada el tag de endpoint."""
+        assert CacheKeyBuilder.tags("milestone_stats", milestone_id=5) == {
+            "endpoint:milestone_stats"
+        }
+
 
 class TestCachedTaigaClient:
     """Tests para la clase CachedTaigaClient."""
@@ -472,7 +925,7 @@ class TestCachedTaigaClient:
         """Fixture que crea un mock de TaigaAPIClient."""
         client = MagicMock()
         client.get_epic_filters = AsyncMock(return_value={"filters": "data"})
-        client.get_issue_filters_data = AsyncMock(return_value={"issue_filters": "data"})
+        client.get_issue_filters = AsyncMock(return_value={"issue_filters": "data"})
         client.get_task_filters = AsyncMock(return_value={"task_filters": "data"})
         client.list_epic_custom_attributes = AsyncMock(return_value=[{"id": 1, "name": "attr1"}])
         return client
@@ -525,8 +978,8 @@ class TestCachedTaigaClient:
     @pytest.mark.asyncio
     async def test_get_ttl_returns_configured_value(self, cached_client: CachedTaigaClient) -> None:
         """Test que get_ttl retorne el valor configurado."""
-        assert cached_client.get_ttl("epic_filters") == 3600
-        assert cached_client.get_ttl("project_modules") == 1800
+        assert cached_client.get_ttl("epic_filters") == 21600
+        assert cached_client.get_ttl("project_modules") == 21600
         assert cached_client.get_ttl("project_stats") == 600
 
     @pytest.mark.asyncio
@@ -569,6 +1022,74 @@ class TestCachedTaigaClient:
         # Assert
         assert count == 2
 
+    @pytest.mark.asyncio
+    async def test_invalidate_project_cache_is_exact(
+        self, cached_client: CachedTaigaClient, mock_client: MagicMock
+    ) -> None:
+        """Test que invalidar el proyecto 1 no afecte al proyecto 12."""
+        await cached_client.get_issue_filters(project_id=1)
+        await cached_client.get_issue_filters(project_id=12)
+
+        assert await cached_client.invalidate_project_cache(1) == 1
+
+        await cached_client.get_issue_filters(project_id=12)
+        assert mock_client.get_issue_filters.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_keys_are_scoped_per_principal(self, mock_client: MagicMock) -> None:
+        """Test que tokens distintos no compartan entradas pero sí la invalidación."""
+        cache = MemoryCache(default_ttl=3600, max_size=100)
+        mock_client.auth_token = "token-a"
+        await CachedTaigaClient(mock_client, cache=cache).get_epic_filters(project_id=1)
+        mock_client.auth_token = "token-b"
+        other = CachedTaigaClient(mock_client, cache=cache)
+        await other.get_epic_filters(project_id=1)
+        await other.get_epic_filters(project_id=1)
+
+        assert mock_client.get_epic_filters.call_count == 2
+        assert "token-a" not in "".join(cache._cache)
+        assert await other.invalidate_project_cache(1) == 2
+
+    @pytest.mark.asyncio
+    async def test_project_and_milestone_reads_are_cached(
+        self, cached_client: CachedTaigaClient, mock_client: MagicMock
+    ) -> None:
+        """Test que módulos, estadísticas y milestones se sirvan desde caché."""
+        mock_client.get = AsyncMock(return_value={"data": 1})
+        mock_client.get_milestone_stats = AsyncMock(return_value={"days": []})
+
+        for _ in range(2):
+            await cached_client.get_project_modules(project_id=7)
+            await cached_client.get_project_stats(project_id=7)
+            await cached_client.get_milestone_stats(milestone_id=3)
+
+        assert mock_client.get.call_count == 2
+        mock_client.get_milestone_stats.assert_awaited_once_with(milestone_id=3)
+
+    @pytest.mark.asyncio
+    async def test_list_project_settings(
+        self, cached_client: CachedTaigaClient, mock_client: MagicMock
+    ) -> None:
+        """Test que la configuración del proyecto se cachee por tipo y proyecto."""
+        mock_client.get = AsyncMock(return_value=[{"id": 1, "name": "New"}])
+
+        await cached_client.list_project_settings("issue_statuses", project_id=5)
+        result = await cached_client.list_project_settings("issue_statuses", project_id=5)
+        await cached_client.list_project_settings("priorities", project_id=5)
+
+        assert result == [{"id": 1, "name": "New"}]
+        assert mock_client.get.call_count == 2
+        mock_client.get.assert_any_await("/issue-statuses", params={"project": 5})
+        assert cached_client.get_ttl("issue_statuses") == 21600
+
+    @pytest.mark.asyncio
+    async def test_list_project_settings_rejects_unknown_type(
+        self, cached_client: CachedTaigaClient
+    ) -> None:
+        """Test que un tipo de configuración desconocido lance ValueError."""
+        with pytest.raises(ValueError, match="Unknown project settings endpoint"):
+            await cached_client.list_project_settings("webhooks", project_id=5)
+
     @pytest.mark.asyncio
     async def test_clear_cache_removes_all(
         self, cached_client: CachedTaigaClient, mock_client: MagicMock
@@ -642,3 +1163,317 @@ class TestCachedTaigaClient:
     async def test_cache_property(self, cached_client: CachedTaigaClient) -> None:
         """Test que la propiedad cache retorne el caché."""
         assert isinstance(cached_client.cache, MemoryCache)
+
+
+class TestStaleWhileRevalidate:
+    """Tests para la ventana de gracia y la revalidación en segundo plano."""
+
+    @staticmethod
+    def _age(cache: MemoryCache, key: str, fresh_for: float) -> None:
+        """Desplaza el TTL de una entrada para que le queden fresh_for segundos."""
+        entry = cache._cache[key]
+        grace = entry.expires_at - entry.stale_at
+        entry.fresh_until = datetime.now() + timedelta(seconds=fresh_for)
+        entry.expires_at = entry.fresh_until + grace
+
+    @staticmethod
+    async def _drain() -> None:
+        """Espera a que terminen las revalidaciones en vuelo."""
+        pending = list(CachedTaigaClient._refreshing.values())
+        if pending:
+            await asyncio.gather(*pending)
+
+    @pytest.mark.asyncio
+    async def test_grace_keeps_stale_entry_servable(self) -> None:
+        """Test que una entrada obsoleta siga disponible durante la gracia."""
+        cache = MemoryCache(default_ttl=60, max_size=10)
+        await cache.set("k", "v", grace=30)
+        self._age(cache, "k", fresh_for=-1)
+
+        entry = await cache.get_entry("k")
+
+        assert entry is not None and entry.is_stale()
+        assert entry.value == "v"
+        assert cache.get_metrics().stale_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_get_and_contains_ignore_stale_entry(self) -> None:
+        """Test que get() y contains() no traten como fresca una entrada en su gracia."""
+        cache = MemoryCache(default_ttl=60, max_size=10)
+        await cache.set("k", "v", grace=3600, validators={"ETag": '"abc"'})
+        assert await cache.get("k") == "v"
+        self._age(cache, "k", fresh_for=-1)
+
+        assert await cache.get("k") is None
+        assert await cache.contains("k") is False
+        assert (await cache.get_entry("k")).value == "v"
+        assert cache.get_metrics().misses == 1
+
+    @pytest.mark.asyncio
+    async def test_set_if_current_skips_invalidated_entry(self) -> None:
+        """Test que set_if_current no resucite una entrada invalidada."""
+        cache = MemoryCache(default_ttl=60, max_size=10)
+        await cache.set("k", "old", tags=["project:1"])
+        entry = await cache.get_entry("k")
+        assert entry is not None
+        await cache.invalidate_tags("project:1")
+
+        assert await cache.set_if_current("k", entry, "new") is False
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_and_refreshed_once(self) -> None:
+        """Test que se sirva el valor obsoleto y se revalide una sola vez."""
+        cache = MemoryCache(default_ttl=600, max_size=10)
+        api = MagicMock()
+        api.get = AsyncMock(side_effect=[{"v": 1}, {"v": 2}])
+        cached = CachedTaigaClient(api, cache=cache, stale_grace=60)
+        await cached.get_project_stats(project_id=1)
+        key = CacheKeyBuilder.build("project_stats", project_id=1)
+        self._age(cache, key, fresh_for=-1)
+
+        results = await asyncio.gather(*(cached.get_project_stats(project_id=1) for _ in range(3)))
+        await self._drain()
+
+        assert results == [{"v": 1}] * 3
+        assert api.get.await_count == 2
+        assert await cached.get_project_stats(project_id=1) == {"v": 2}
+        assert cache.get_metrics().refreshes == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_for_entries_near_expiry(self) -> None:
+        """Test que una clave leída cerca de expirar se refresque antes."""
+        cache = MemoryCache(default_ttl=600, max_size=10)
+        api = MagicMock()
+        api.get = AsyncMock(side_effect=[{"v": 1}, {"v": 2}])
+        cached = CachedTaigaClient(api, cache=cache, refresh_ahead=30)
+        await cached.get_project_stats(project_id=1)
+
+        await cached.get_project_stats(project_id=1)
+        assert api.get.await_count == 1  # Lejos de expirar: sin refresco
+
+        self._age(cache, CacheKeyBuilder.build("project_stats", project_id=1), fresh_for=10)
+        assert await cached.get_project_stats(project_id=1) == {"v": 1}
+        await self._drain()
+
+        assert api.get.await_count == 2
+        assert await cached.get_project_stats(project_id=1) == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self) -> None:
+        """Test que un fallo al revalidar mantenga la entrada obsoleta."""
+        cache = MemoryCache(default_ttl=600, max_size=10)
+        api = MagicMock()
+        api.get = AsyncMock(side_effect=[{"v": 1}, RuntimeError("down")])
+        cached = CachedTaigaClient(api, cache=cache, stale_grace=60)
+        await cached.get_project_stats(project_id=1)
+        self._age(cache, CacheKeyBuilder.build("project_stats", project_id=1), fresh_for=-1)
+
+        assert await cached.get_project_stats(project_id=1) == {"v": 1}
+        await self._drain()
+
+        stale = await cache.get_entry(CacheKeyBuilder.build("project_stats", project_id=1))
+        assert stale is not None and stale.is_stale()
+        assert cache.get_metrics().refreshes == 0
+
+    @pytest.mark.asyncio
+    async def test_refresh_runs_on_its_own_client(self) -> None:
+        """Test que la revalidación use un clon propio aunque la llamada ya cerrara su cliente."""
+        cache = MemoryCache(default_ttl=600, max_size=10)
+        api = ClosingAPI()
+        cached = CachedTaigaClient(api, cache=cache, stale_grace=60)
+        async with api:
+            await cached.get_project_stats(project_id=1)
+        self._age(cache, CacheKeyBuilder.build("project_stats", project_id=1), fresh_for=-1)
+
+        async with api:
+            assert await cached.get_project_stats(project_id=1) == {"v": 1}
+        await self._drain()
+
+        assert [clone.opened for clone in api.clones] == [False]
+        assert await cached.get_project_stats(project_id=1) == {"v": 2}
+        assert cache.get_metrics().refreshes == 1
+
+    def test_client_clone_shares_pool_services_and_token(self) -> None:
+        """Test que el clon de TaigaAPIClient comparta pool, servicios y token."""
+        pool = MagicMock()
+        config = MagicMock(
+            taiga_api_url="https://api.taiga.io/api/v1",
+            taiga_auth_token=None,
+            max_retries=3,
+            request_deadline=60.0,
+        )
+        client = TaigaAPIClient(config, session_pool=pool)
+        client.auth_token = "token"
+
+        clone = client.clone()
+
+        assert clone is not client
+        assert clone.auth_token == "token"
+        assert clone._session_pool is pool
+        assert clone._retry_config is client._retry_config
+        assert clone._circuit_breakers is client._circuit_breakers
+        assert clone._negative_cache is client._negative_cache
+
+    def test_settings_come_from_config(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test que la factory tome gracia, refresco anticipado y revalidación de TaigaConfig."""
+        monkeypatch.delenv("TAIGA_CACHE_STALE_GRACE", raising=False)
+        monkeypatch.setenv("TAIGA_CACHE_REFRESH_AHEAD", "45")
+        monkeypatch.setenv("TAIGA_CACHE_REVALIDATE_WINDOW", "120")
+
+        cached = create_cached_client(TaigaConfig(), MagicMock(), cache=MemoryCache())
+
+        assert cached._stale_grace == 0
+        assert cached._refresh_ahead == 45
+        assert cached._revalidate_window == 120
+        assert cached._conditional is True
+
+
+class ClosingAPI:
+    """Cliente que, como TaigaAPIClient, solo responde dentro de su async with."""
+
+    def __init__(self, calls: list[int] | None = None) -> None:
+        self.calls = calls if calls is not None else []
+        self.opened = False
+        self.clones: list[ClosingAPI] = []
+
+    async def __aenter__(self) -> "ClosingAPI":
+        self.opened = True
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.opened = False
+
+    def clone(self) -> "ClosingAPI":
+        clone = ClosingAPI(self.calls)
+        self.clones.append(clone)
+        return clone
+
+    async def get(self, endpoint: str) -> dict[str, int]:
+        if not self.opened:
+            raise RuntimeError("client is closed")
+        self.calls.append(1)
+        return {"v": len(self.calls)}
+
+
+class FakeConditionalAPI:
+    """Cliente mínimo que emite ETags y responde 304 si el ETag coincide."""
+
+    def __init__(self) -> None:
+        self.body: dict[str, int] = {"v": 1}
+        self.etag = '"v1"'
+        self.sent_validators: list[dict[str, str] | None] = []
+
+    async def get_conditional(
+        self,
+        endpoint: str,
+        params: dict[str, object] | None = None,
+        validators: dict[str, str] | None = None,
+    ) -> tuple[dict[str, int] | None, dict[str, str]]:
+        self.sent_validators.append(validators)
+        if validators and validators.get("ETag") == self.etag:
+            return None, {"ETag": self.etag}
+        return dict(self.body), {"ETag": self.etag}
+
+
+class TestConditionalRevalidation:
+    """Tests para la revalidación con ETag / If-None-Match."""
+
+    KEY = CacheKeyBuilder.build("project_stats", project_id=1)
+
+    @staticmethod
+    def _expire(cache: MemoryCache, key: str) -> None:
+        """Lleva una entrada al final de su TTL conservando la ventana de revalidación."""
+        entry = cache._cache[key]
+        window = entry.expires_at - entry.stale_at
+        entry.fresh_until = datetime.now() - timedelta(seconds=1)
+        entry.expires_at = entry.fresh_until + window
+
+    @pytest.mark.asyncio
+    async def test_validators_stored_and_entry_kept_for_revalidation(self) -> None:
+        """Test que la entrada guarde el ETag y se conserve tras el TTL."""
+        cache = MemoryCache(default_ttl=600, max_size=10)
+        cached = CachedTaigaClient(FakeConditionalAPI(), cache=cache, revalidate_window=120)
+
+        await cached.get_project_stats(project_id=1)
+
+        entry = cache._cache[self.KEY]
+        assert entry.validators == {"ETag": '"v1"'}
+        assert entry.expires_at - entry.stale_at == timedelta(seconds=120)
+
+    @pytest.mark.asyncio
+    async def test_not_modified_refreshes_ttl_and_keeps_value(self) -> None:
+        """Test que un 304 renueve el TTL sin reemplazar el valor parseado."""
+        cache = MemoryCache(default_ttl=600, max_size=10)
+        api = FakeConditionalAPI()
+        cached = CachedTaigaClient(api, cache=cache, revalidate_window=120)
+        first = await cached.get_project_stats(project_id=1)
+        self._expire(cache, self.KEY)
+
+        second = await cached.get_project_stats(project_id=1)
+
+        assert second is first
+        assert api.sent_validators == [None, {"ETag": '"v1"'}]
+        assert not cache._cache[self.KEY].is_stale()
+        metrics = cache.get_metrics()
+        assert (metrics.not_modified, metrics.revalidations) == (1, 0)
+
+        await cached.get_project_stats(project_id=1)
+        assert len(api.sent_validators) == 2  # Fresca de nuevo: sin petición
+
+    @pytest.mark.asyncio
+    async def test_changed_resource_replaces_entry(self) -> None:
+        """Test que un 200 a la petición condicional reemplace valor y ETag."""
+        cache = MemoryCache(default_ttl=600, max_size=10)
+        api = FakeConditionalAPI()
+        cached = CachedTaigaClient(api, cache=cache, revalidate_window=120)
+        await cached.get_project_stats(project_id=1)
+        self._expire(cache, self.KEY)
+        api.body, api.etag = {"v": 2}, '"v2"'
+
+        assert await cached.get_project_stats(project_id=1) == {"v": 2}
+
+        assert cache._cache[self.KEY].validators == {"ETag": '"v2"'}
+        metrics = cache.get_metrics()
+        assert (metrics.not_modified, metrics.revalidations) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_is_conditional(self) -> None:
+        """Test que la revalidación en segundo plano también use If-None-Match."""
+        cache = MemoryCache(default_ttl=600, max_size=10)
+        api = FakeConditionalAPI()
+        cached = CachedTaigaClient(api, cache=cache, stale_grace=60, revalidate_window=120)
+        await cached.get_project_stats(project_id=1)
+        self._expire(cache, self.KEY)
+
+        assert await cached.get_project_stats(project_id=1) == {"v": 1}
+        await TestStaleWhileRevalidate._drain()
+
+        assert api.sent_validators[-1] == {"ETag": '"v1"'}
+        assert cache.get_metrics().not_modified == 1
+        assert cache.get_metrics().refreshes == 1
+
+    @pytest.mark.asyncio
+    async def test_sharded_cache_aggregates_revalidation_counters(self) -> None:
+        """Test que los contadores 304/200 se agreguen en el caché particionado."""
+        cache = ShardedMemoryCache(default_ttl=600, max_size=16, shards=4)
+        cache.record_revalidation(not_modified=True)
+        cache.record_revalidation(not_modified=False)
+
+        stats = await cache.get_stats()
+
+        assert stats["metrics"]["not_modified"] == 1
+        assert stats["metrics"]["revalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_window_zero_disables_conditional_requests(self) -> None:
+        """Test que revalidate_window=0 mantenga el comportamiento sin validadores."""
+        cache = MemoryCache(default_ttl=600, max_size=10)
+        api = FakeConditionalAPI()
+        api.get = AsyncMock(return_value={"v": 1})  # type: ignore[attr-defined]
+        cached = CachedTaigaClient(api, cache=cache, revalidate_window=0)
+
+        await cached.get_project_stats(project_id=1)
+
+        assert api.sent_validators == []
+        assert cache._cache[self.KEY].validators is None
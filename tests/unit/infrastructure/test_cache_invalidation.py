@@ -0,0 +1,95 @@
+"""Tests para la invalidación automática del caché en escrituras."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.cache import MemoryCache
+from src.infrastructure.cache_invalidation import tags_for_mutation
+from src.infrastructure.cached_client import CachedTaigaClient, CacheKeyBuilder
+
+
+class TestTagsForMutation:
+    """Tests para el mapeo declarativo ruta -> tags."""
+
+    def test_get_requests_invalidate_nothing(self) -> None:
+        """Test que las lecturas no invaliden nada."""
+        assert tags_for_mutation("GET", "/issue-statuses", params={"project": 1}) == set()
+
+    def test_status_creation_is_scoped_to_project(self) -> None:
+        """Test que crear un estado invalide solo los filtros de su proyecto."""
+        tags = tags_for_mutation("POST", "/issue-statuses", data={"project": 5, "name": "New"})
+        assert tags == {
+            "endpoint:issue_statuses:project:5",
+            "endpoint:issue_filters:project:5",
+        }
+
+    def test_update_without_project_invalidates_endpoint_type(self) -> None:
+        """Test que sin proyecto se invalide el tipo de endpoint completo."""
+        tags = tags_for_mutation("PATCH", "/issue-statuses/7", data={"name": "Done"})
+        assert tags == {"endpoint:issue_statuses", "endpoint:issue_filters"}
+
+    def test_modules_update_takes_project_from_path(self) -> None:
+        """Test que actualizar módulos use el proyecto de la ruta."""
+        tags = tags_for_mutation("PATCH", "/projects/3/modules", data={"github": {}})
+        assert tags == {"endpoint:project_modules:project:3"}
+
+    def test_project_update_invalidates_whole_project(self) -> None:
+        """Test que modificar el proyecto invalide todas sus entradas."""
+        assert tags_for_mutation("DELETE", "/projects/3") == {"project:3"}
+        assert tags_for_mutation("POST", "/projects") == set()
+
+    def test_custom_attribute_creation(self) -> None:
+        """Test que crear un atributo invalide solo su tipo de atributos."""
+        tags = tags_for_mutation("POST", "/epic-custom-attributes", data={"project": 2})
+        assert tags == {"endpoint:epic_custom_attributes:project:2"}
+
+    def test_milestone_stats_is_never_scoped(self) -> None:
+        """Test que milestone_stats use siempre el tag global."""
+        tags = tags_for_mutation("POST", "/tasks", data={"project": 2, "subject": "T"})
+        assert tags == {
+            "endpoint:task_filters:project:2",
+            "endpoint:project_stats:project:2",
+            "endpoint:milestone_stats",
+        }
+
+    def test_unrelated_writes_invalidate_nothing(self) -> None:
+        """Test que escrituras sin metadatos cacheados no invaliden nada."""
+        assert tags_for_mutation("POST", "/issues/4/watch") == set()
+        assert tags_for_mutation("PATCH", "/wiki/1", data={"project": 1}) == set()
+
+
+class TestWriteThroughInvalidation:
+    """Tests para la invalidación disparada por TaigaAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_create_status_evicts_only_that_project(self, make_api_client) -> None:
+        """Test que crear un estado expulse los filtros cacheados del proyecto."""
+        cache = MemoryCache(default_ttl=3600, max_size=100)
+        api = MagicMock()
+        api.get_issue_filters = AsyncMock(return_value={"statuses": []})
+        cached = CachedTaigaClient(api, cache=cache)
+        await cached.get_issue_filters(project_id=1)
+        await cached.get_issue_filters(project_id=12)
+
+        created = MagicMock(status_code=201, content=b'{"id": 1}')
+        http = MagicMock(post=AsyncMock(return_value=created))
+        client = make_api_client(taiga_auth_token=None, cache=cache, http=http)
+        await client.post("/issue-statuses", data={"project": 1, "name": "Blocked"})
+
+        assert not await cache.contains(CacheKeyBuilder.build("issue_filters", project_id=1))
+        assert await cache.contains(CacheKeyBuilder.build("issue_filters", project_id=12))
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_invalidate(self, make_api_client) -> None:
+        """Test que las lecturas no toquen el caché."""
+        cache = MemoryCache(default_ttl=3600, max_size=100)
+        await cache.set("k", 1, tags=["endpoint:issue_filters"])
+
+        ok = MagicMock(status_code=200, content=b'{"id": 1}')
+        http = MagicMock(get=AsyncMock(return_value=ok))
+        client = make_api_client(taiga_auth_token=None, cache=cache, http=http)
+        await client.get("/issue-statuses", params={"project": 1})
+
+        assert await cache.contains("k")
+        assert cache.get_metrics().invalidations == 0
@@ -0,0 +1,313 @@
+"""Tests para los circuit breakers por familia de endpoints."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.domain.exceptions import (
+    CircuitOpenError,
+    RateLimitError,
+    ResourceNotFoundError,
+    TaigaAPIError,
+)
+from src.infrastructure.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    endpoint_family,
+    is_transient_error,
+)
+from src.infrastructure.retry import RetryConfig
+
+
+class FakeClock:
+    """Reloj monotónico controlado por el test."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Sustituye el reloj del módulo por uno controlado."""
+    fake = FakeClock()
+    with patch("src.infrastructure.circuit_breaker.time", fake):
+        yield fake
+
+
+class TestClassification:
+    """Tests para la clasificación de errores y familias."""
+
+    @pytest.mark.parametrize(
+        ("endpoint", "family"),
+        [
+            ("/search", "search"),
+            ("/search?project=1&text=x", "search"),
+            ("/timeline/project/4", "timeline"),
+            ("userstories/42/watch", "userstories"),
+            ("/", "/"),
+        ],
+    )
+    def test_endpoint_family(self, endpoint: str, family: str) -> None:
+        """Test que la familia sea el primer segmento de la ruta."""
+        assert endpoint_family(endpoint) == family
+
+    @pytest.mark.parametrize(
+        ("error", "transient"),
+        [
+            (httpx.ReadTimeout("read"), True),
+            (httpx.ConnectError("refused"), True),
+            (TaigaAPIError("HTTP error", status_code=503), True),
+            (TaigaAPIError("Request timeout after 3 retries"), True),
+            (TaigaAPIError("HTTP error", status_code=400), False),
+            (ResourceNotFoundError("Resource not found: /issues/1"), False),
+            (RateLimitError("Rate limit exceeded after 3 retries"), False),
+            (CircuitOpenError("search", 10.0), False),
+        ],
+    )
+    def test_is_transient_error(self, error: Exception, transient: bool) -> None:
+        """Test que solo timeouts, red y 502/503/504 sean transitorios."""
+        assert is_transient_error(error) is transient
+
+    def test_wrapped_timeout_is_transient(self) -> None:
+        """Test que un TaigaAPIError causado por un timeout cuente como transitorio."""
+        try:
+            try:
+                raise TimeoutError
+            except TimeoutError as e:
+                raise TaigaAPIError("Request deadline of 60s exceeded after 2 retries") from e
+        except TaigaAPIError as error:
+            assert is_transient_error(error)
+
+
+class TestCircuitBreaker:
+    """Tests para CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        """Test que el circuito se abra al llegar al umbral de fallos consecutivos."""
+        breaker = CircuitBreaker("search", failure_threshold=3)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.family == "search"
+        assert exc_info.value.retry_after == pytest.approx(30.0, abs=0.1)
+
+    def test_half_open_allows_a_single_probe(self, clock: FakeClock) -> None:
+        """Test que en half-open solo salga una petición de prueba."""
+        breaker = CircuitBreaker("timeline", failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+
+        clock.now += 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.before_request() is True
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success(probe=True)
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.before_request() is False
+
+    def test_failed_probe_reopens(self, clock: FakeClock) -> None:
+        """Test que si falla la prueba el circuito vuelva a abrirse otro plazo."""
+        breaker = CircuitBreaker("search", failure_threshold=5, recovery_timeout=10)
+        for _ in range(5):
+            breaker.record_failure()
+
+        clock.now += 10
+        probe = breaker.before_request()
+        breaker.record_failure(probe)
+
+        assert breaker.state is CircuitState.OPEN
+        clock.now += 9
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+        assert breaker.get_stats() == {
+            "state": "open",
+            "consecutive_failures": 6,
+            "times_opened": 2,
+            "rejected": 1,
+        }
+
+    def test_release_frees_the_probe(self, clock: FakeClock) -> None:
+        """Test que una prueba cancelada no deje el circuito bloqueado."""
+        breaker = CircuitBreaker("search", failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+        clock.now += 10
+        breaker.before_request()
+
+        breaker.release()
+
+        breaker.before_request()
+
+    def test_late_results_do_not_touch_the_probe(self, clock: FakeClock) -> None:
+        """Test que el resultado de una petición anterior a la apertura no decida por la prueba."""
+        breaker = CircuitBreaker("search", failure_threshold=1, recovery_timeout=10)
+        early = breaker.before_request()
+        breaker.record_failure()
+        clock.now += 10
+        assert breaker.before_request() is True
+
+        breaker.record_failure(early)
+        breaker.record_success(early)
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+        assert breaker.get_stats()["times_opened"] == 1
+
+    def test_invalid_threshold_raises_error(self) -> None:
+        """Test que un umbral menor que 1 lance ValueError."""
+        with pytest.raises(ValueError, match="failure_threshold"):
+            CircuitBreaker("search", failure_threshold=0)
+
+    def test_registry_shares_breaker_per_family(self) -> None:
+        """Test que los endpoints de una familia compartan breaker y las demás no."""
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+
+        registry.for_endpoint("/search?text=a").record_failure()
+
+        assert registry.for_endpoint("/search").state is CircuitState.OPEN
+        assert registry.for_endpoint("/userstories").state is CircuitState.CLOSED
+        assert set(registry.get_stats()) == {"search", "userstories"}
+
+
+class TestClientCircuitBreaker:
+    """Tests para el circuit breaker en TaigaAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_failing_family_fails_fast(self, make_api_client) -> None:
+        """Test que una familia caída falle sin llamar a la API y las demás sigan."""
+        registry = CircuitBreakerRegistry(failure_threshold=2)
+        ok = MagicMock(status_code=200, headers={})
+        get = AsyncMock(side_effect=httpx.ReadTimeout("slow search"))
+        client = make_api_client(
+            max_retries=0,
+            retry_config=RetryConfig(max_retries=0),
+            circuit_breakers=registry,
+            http=MagicMock(get=get),
+        )
+
+        for _ in range(2):
+            with pytest.raises(TaigaAPIError, match="timeout"):
+                await client._make_request("GET", "/search", params={"text": "x"})
+        with pytest.raises(CircuitOpenError):
+            await client._make_request("GET", "/search", params={"text": "y"})
+        assert get.await_count == 2
+
+        get.side_effect = None
+        get.return_value = ok
+        assert await client._make_request("GET", "/userstories") is ok
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_the_circuit(self, make_api_client) -> None:
+        """Test que 404 y 5xx no transitorios se distingan: solo los 5xx cuentan."""
+        registry = CircuitBreakerRegistry(failure_threshold=2)
+        not_found = MagicMock(status_code=404, headers={})
+        client = make_api_client(
+            max_retries=0,
+            retry_config=RetryConfig(max_retries=0),
+            circuit_breakers=registry,
+            http=MagicMock(get=AsyncMock(return_value=not_found)),
+        )
+
+        for _ in range(3):
+            with pytest.raises(ResourceNotFoundError):
+                await client._make_request("GET", "/issues/1")
+        assert registry.for_endpoint("/issues").state is CircuitState.CLOSED
+
+        request = httpx.Request("GET", "https://api.taiga.io/api/v1/issues")
+        server_error = httpx.Response(500, request=request)
+        client._client.get = AsyncMock(return_value=server_error)
+        for _ in range(2):
+            with pytest.raises(TaigaAPIError):
+                await client._make_request("GET", "/issues")
+        assert registry.for_endpoint("/issues").state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_is_released(self, make_api_client) -> None:
+        """Test que cancelar la petición de prueba libere el half-open."""
+        registry = CircuitBreakerRegistry(failure_threshold=1, recovery_timeout=0)
+        registry.for_endpoint("/timeline").record_failure()
+
+        async def hang(*args: object, **kwargs: object) -> None:
+            await asyncio.sleep(10)
+
+        client = make_api_client(
+            max_retries=0,
+            retry_config=RetryConfig(max_retries=0),
+            circuit_breakers=registry,
+            http=MagicMock(get=AsyncMock(side_effect=hang)),
+        )
+        task = asyncio.create_task(client._make_request("GET", "/timeline/project/1"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        ok = MagicMock(status_code=200, headers={})
+        client._client.get = AsyncMock(return_value=ok)
+        assert await client._make_request("GET", "/timeline/project/1") is ok
+        assert registry.for_endpoint("/timeline").state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_overlapping_calls_around_half_open(
+        self, clock: FakeClock, make_api_client
+    ) -> None:
+        """Test que una petición lenta que termina en half-open no libere la prueba."""
+        registry = CircuitBreakerRegistry(failure_threshold=2, recovery_timeout=10)
+        release_slow = asyncio.Event()
+        release_probe = asyncio.Event()
+        ok = MagicMock(status_code=200, headers={})
+
+        async def get(url: str, params: dict[str, str] | None = None, **kwargs: object) -> object:
+            text = (params or {}).get("text")
+            if text == "slow":
+                await release_slow.wait()
+                raise httpx.ReadTimeout("slow search")
+            if text == "probe":
+                await release_probe.wait()
+                return ok
+            raise httpx.ReadTimeout("search down")
+
+        client = make_api_client(
+            max_retries=0,
+            retry_config=RetryConfig(max_retries=0),
+            circuit_breakers=registry,
+            http=MagicMock(get=AsyncMock(side_effect=get)),
+        )
+        slow = asyncio.create_task(client._make_request("GET", "/search", params={"text": "slow"}))
+        await asyncio.sleep(0)
+        for _ in range(2):
+            with pytest.raises(TaigaAPIError):
+                await client._make_request("GET", "/search", params={"text": "x"})
+        clock.now += 10
+        probe = asyncio.create_task(
+            client._make_request("GET", "/search", params={"text": "probe"})
+        )
+        await asyncio.sleep(0)
+
+        release_slow.set()
+        with pytest.raises(TaigaAPIError):
+            await slow
+        breaker = registry.for_endpoint("/search")
+        assert breaker.state is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            await client._make_request("GET", "/search", params={"text": "y"})
+
+        release_probe.set()
+        assert await probe is ok
+        assert breaker.state is CircuitState.CLOSED
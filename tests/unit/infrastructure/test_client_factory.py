@@ -8,13 +8,19 @@ from src.infrastructure.cache import MemoryCache
 from src.infrastructure.cached_client import CachedTaigaClient
 from src.infrastructure.client_factory import (
     clear_all_cache,
+    create_taiga_client,
     get_cached_taiga_client,
     get_global_cache,
+    get_global_session_pool,
     get_taiga_client,
     invalidate_cache_by_pattern,
     invalidate_project_cache,
     reset_global_cache,
+    reset_global_session_pool,
+    set_global_cache,
+    set_global_session_pool,
 )
+from src.infrastructure.http_session_pool import HTTPSessionPool
 from src.taiga_client import TaigaAPIClient
 
 
@@ -50,6 +56,12 @@ class TestGetGlobalCache:
         cache = get_global_cache()
         assert cache.max_size == 1000
 
+    def test_returns_registered_cache(self):
+        """Should return the cache registered with set_global_cache."""
+        cache = MemoryCache(default_ttl=60, max_size=10)
+        set_global_cache(cache)
+        assert get_global_cache() is cache
+
 
 class TestResetGlobalCache:
     """Tests for reset_global_cache function."""
@@ -62,12 +74,58 @@ class TestResetGlobalCache:
         assert cache1 is not cache2
 
 
+class TestGetGlobalSessionPool:
+    """Tests for the global HTTP session pool accessors."""
+
+    def setup_method(self):
+        """Reset global session pool before each test."""
+        reset_global_session_pool()
+
+    def teardown_method(self):
+        """Reset global session pool after each test."""
+        reset_global_session_pool()
+
+    def test_returns_http_session_pool(self):
+        """Should return an HTTPSessionPool instance."""
+        pool = get_global_session_pool()
+        assert isinstance(pool, HTTPSessionPool)
+
+    def test_returns_same_instance(self):
+        """Should return the same instance on multiple calls."""
+        assert get_global_session_pool() is get_global_session_pool()
+
+    def test_uses_configured_api_url(self):
+        """Should point the pool at the configured Taiga API URL."""
+        from src.config import TaigaConfig
+
+        pool = get_global_session_pool()
+        assert pool.base_url == TaigaConfig().taiga_api_url
+
+    def test_set_global_session_pool_overrides_instance(self):
+        """Should return the pool registered with set_global_session_pool."""
+        pool = HTTPSessionPool(base_url="https://taiga.example.com/api/v1")
+        set_global_session_pool(pool)
+        assert get_global_session_pool() is pool
+
+    def test_reset_creates_new_instance(self):
+        """Should create a new instance after reset."""
+        pool1 = get_global_session_pool()
+        reset_global_session_pool()
+        pool2 = get_global_session_pool()
+        assert pool1 is not pool2
+
+
 class TestGetTaigaClient:
     """Tests for get_taiga_client function (without cache)."""
 
     def setup_method(self):
-        """Reset global cache before each test."""
+        """Reset global cache and session pool before each test."""
         reset_global_cache()
+        reset_global_session_pool()
+
+    def teardown_method(self):
+        """Reset global session pool after each test."""
+        reset_global_session_pool()
 
     @patch("src.infrastructure.client_factory.TaigaConfig")
     @patch("src.infrastructure.client_factory.TaigaAPIClient")
@@ -80,9 +138,21 @@ class TestGetTaigaClient:
 
         client = get_taiga_client()
 
-        mock_client_class.assert_called_once_with(mock_config)
+        mock_client_class.assert_called_once_with(
+            mock_config, session_pool=get_global_session_pool()
+        )
         assert client is mock_client
 
+    def test_clients_share_global_session_pool(self):
+        """Clients for different tokens should share the same session pool."""
+        client1 = get_taiga_client(auth_token="token-a")
+        client2 = get_taiga_client(auth_token="token-b")
+
+        assert client1._session_pool is get_global_session_pool()
+        assert client2._session_pool is client1._session_pool
+        assert client1.auth_token == "token-a"
+        assert client2.auth_token == "token-b"
+
     @patch("src.infrastructure.client_factory.TaigaConfig")
     @patch("src.infrastructure.client_factory.TaigaAPIClient")
     def test_sets_auth_token_when_provided(self, mock_client_class, mock_config_class):
@@ -112,22 +182,61 @@ class TestGetTaigaClient:
         assert mock_client.auth_token is None
 
 
+class TestCreateTaigaClient:
+    """Tests for create_taiga_client function."""
+
+    def setup_method(self):
+        """Reset global session pool before each test."""
+        reset_global_session_pool()
+
+    def teardown_method(self):
+        """Reset global session pool after each test."""
+        reset_global_session_pool()
+
+    def test_uses_given_config_pool_and_token(self):
+        """Should build the client on the given pool with the given token."""
+        config = MagicMock(
+            taiga_api_url="https://api.taiga.io/api/v1", max_retries=3, request_deadline=60.0
+        )
+        pool = HTTPSessionPool(base_url="https://api.taiga.io/api/v1")
+
+        client = create_taiga_client(config, "token-a", session_pool=pool)
+
+        assert client.config is config
+        assert client._session_pool is pool
+        assert client.auth_token == "token-a"
+
+    def test_defaults_to_global_session_pool(self):
+        """Should use the global session pool when none is given."""
+        config = MagicMock(
+            taiga_api_url="https://api.taiga.io/api/v1", max_retries=3, request_deadline=60.0
+        )
+
+        client = create_taiga_client(config)
+
+        assert client._session_pool is get_global_session_pool()
+
+
 class TestGetCachedTaigaClient:
     """Tests for get_cached_taiga_client function."""
 
     def setup_method(self):
-        """Reset global cache before each test."""
+        """Reset global cache and session pool before each test."""
         reset_global_cache()
+        reset_global_session_pool()
 
     def teardown_method(self):
-        """Reset global cache after each test."""
+        """Reset global cache and session pool after each test."""
         reset_global_cache()
+        reset_global_session_pool()
 
     @patch("src.infrastructure.client_factory.TaigaConfig")
     @patch("src.infrastructure.client_factory.TaigaAPIClient")
     def test_returns_cached_taiga_client(self, mock_client_class, mock_config_class):
         """Should return a CachedTaigaClient instance."""
-        mock_config = MagicMock()
+        mock_config = MagicMock(
+            cache_stale_grace=0, cache_refresh_ahead=0, cache_revalidate_window=0
+        )
         mock_config_class.return_value = mock_config
         mock_client = MagicMock(spec=TaigaAPIClient)
         mock_client_class.return_value = mock_client
@@ -140,7 +249,9 @@ class TestGetCachedTaigaClient:
     @patch("src.infrastructure.client_factory.TaigaAPIClient")
     def test_uses_global_cache(self, mock_client_class, mock_config_class):
         """Should use the global cache instance."""
-        mock_config = MagicMock()
+        mock_config = MagicMock(
+            cache_stale_grace=0, cache_refresh_ahead=0, cache_revalidate_window=0
+        )
         mock_config_class.return_value = mock_config
         mock_client = MagicMock(spec=TaigaAPIClient)
         mock_client_class.return_value = mock_client
@@ -154,7 +265,9 @@ class TestGetCachedTaigaClient:
     @patch("src.infrastructure.client_factory.TaigaAPIClient")
     def test_sets_auth_token_when_provided(self, mock_client_class, mock_config_class):
         """Should set auth_token on underlying client."""
-        mock_config = MagicMock()
+        mock_config = MagicMock(
+            cache_stale_grace=0, cache_refresh_ahead=0, cache_revalidate_window=0
+        )
         mock_config_class.return_value = mock_config
         mock_client = MagicMock(spec=TaigaAPIClient)
         mock_client_class.return_value = mock_client
@@ -167,7 +280,9 @@ class TestGetCachedTaigaClient:
     @patch("src.infrastructure.client_factory.TaigaAPIClient")
     def test_multiple_clients_share_same_cache(self, mock_client_class, mock_config_class):
         """Multiple cached clients should share the same cache."""
-        mock_config = MagicMock()
+        mock_config = MagicMock(
+            cache_stale_grace=0, cache_refresh_ahead=0, cache_revalidate_window=0
+        )
         mock_config_class.return_value = mock_config
         mock_client = MagicMock(spec=TaigaAPIClient)
         mock_client_class.return_value = mock_client
@@ -193,9 +308,9 @@ class TestInvalidateProjectCache:
     async def test_invalidates_project_entries(self):
         """Should invalidate cache entries for the project."""
         cache = get_global_cache()
-        await cache.set("epic_filters:project_id=123", {"filters": []})
-        await cache.set("issue_filters:project_id=123", {"filters": []})
-        await cache.set("epic_filters:project_id=456", {"filters": []})
+        await cache.set("epic_filters:project_id=123", {"filters": []}, tags=["project:123"])
+        await cache.set("issue_filters:project_id=123", {"filters": []}, tags=["project:123"])
+        await cache.set("epic_filters:project_id=456", {"filters": []}, tags=["project:456"])
 
         count = await invalidate_project_cache(123)
 
@@ -204,6 +319,18 @@ class TestInvalidateProjectCache:
         assert await cache.get("issue_filters:project_id=123") is None
         assert await cache.get("epic_filters:project_id=456") is not None
 
+    @pytest.mark.asyncio
+    async def test_does_not_invalidate_projects_sharing_a_prefix(self):
+        """Should match the project id exactly (1 must not invalidate 12)."""
+        cache = get_global_cache()
+        await cache.set("issue_filters:project_id=1", {"filters": []}, tags=["project:1"])
+        await cache.set("issue_filters:project_id=12", {"filters": []}, tags=["project:12"])
+
+        count = await invalidate_project_cache(1)
+
+        assert count == 1
+        assert await cache.get("issue_filters:project_id=12") is not None
+
     @pytest.mark.asyncio
     async def test_returns_zero_when_no_entries_match(self):
         """Should return 0 when no entries match."""
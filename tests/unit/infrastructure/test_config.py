@@ -22,6 +22,7 @@ def clean_env() -> None:
         "TAIGA_AUTH_TOKEN",
         "TAIGA_TIMEOUT",
         "TAIGA_MAX_RETRIES",
+        "TAIGA_HTTP2",
         "MCP_SERVER_NAME",
         "MCP_TRANSPORT",
         "MCP_HOST",
@@ -71,6 +72,7 @@ class TestTaigaConfig:
         assert config.auth_token is None
         assert config.timeout == 30.0
         assert config.max_retries == 3
+        assert config.http2 is False
         assert config.server_name == "taiga-mcp-server"
         assert config.transport == "stdio"
         assert config.host == "127.0.0.1"
@@ -88,6 +90,7 @@ class TestTaigaConfig:
                 "TAIGA_AUTH_TOKEN": "test_token",
                 "TAIGA_TIMEOUT": "60.0",
                 "TAIGA_MAX_RETRIES": "5",
+                "TAIGA_HTTP2": "true",
                 "MCP_SERVER_NAME": "custom-server",
                 "MCP_TRANSPORT": "http",
                 "MCP_HOST": "0.0.0.0",
@@ -103,6 +106,7 @@ class TestTaigaConfig:
             assert config.auth_token == "test_token"
             assert config.timeout == 60.0
             assert config.max_retries == 5
+            assert config.http2 is True
             assert config.server_name == "custom-server"
             assert config.transport == "http"
             assert config.host == "0.0.0.0"
@@ -0,0 +1,194 @@
+"""Tests para el nivel de caché persistente en disco."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.cache import CacheEntry, MemoryCache, create_memory_cache
+from src.infrastructure.disk_cache import DiskCache, TieredCache
+
+
+def _tiered(directory: Path, max_size: int = 100, disk_max_size: int = 100) -> TieredCache:
+    """Caché de dos niveles con persistencia inmediata."""
+    disk = DiskCache(directory, max_size=disk_max_size, flush_delay=0.01)
+    return TieredCache(MemoryCache(default_ttl=60, max_size=max_size), disk)
+
+
+def _entry(value: object, seconds: int = 60) -> CacheEntry:
+    """Entrada que expira dentro de ``seconds`` segundos."""
+    return CacheEntry(value=value, expires_at=datetime.now() + timedelta(seconds=seconds))
+
+
+class TestTieredCache:
+    """Tests para TieredCache (memoria + disco)."""
+
+    @pytest.mark.asyncio
+    async def test_restarted_process_serves_warm_entries(self, tmp_path: Path) -> None:
+        """Test que un caché nuevo sobre el mismo directorio sirva las entradas al instante."""
+        cache = _tiered(tmp_path)
+        await cache.set(
+            "issue_filters:project_id=1",
+            {"statuses": [{"id": 1, "name": "New"}]},
+            ttl=300,
+            tags=["project:1"],
+            grace=60,
+            validators={"ETag": '"abc"'},
+        )
+        original = cache.peek("issue_filters:project_id=1")
+        await cache.disk.close()
+
+        restarted = _tiered(tmp_path)
+        start = time.perf_counter()
+        entry = await restarted.get_entry("issue_filters:project_id=1")
+        elapsed = time.perf_counter() - start
+
+        assert entry is not None
+        assert entry.value == {"statuses": [{"id": 1, "name": "New"}]}
+        assert entry.tags == frozenset({"project:1"})
+        assert entry.validators == {"ETag": '"abc"'}
+        assert entry.fresh_until == original.fresh_until
+        assert entry.expires_at == original.expires_at
+        assert elapsed < 0.05
+        # La entrada se promociona a memoria con sus tags indexados
+        assert restarted.peek("issue_filters:project_id=1") is entry
+        assert await restarted.memory.invalidate_tags("project:1") == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_disk_entry_is_not_served_as_fresh(self, tmp_path: Path) -> None:
+        """Test que una entrada obsoleta leída del disco solo se devuelva con get_entry()."""
+        cache = _tiered(tmp_path)
+        now = datetime.now()
+        stale = CacheEntry(
+            value="v",
+            expires_at=now + timedelta(seconds=3600),
+            fresh_until=now - timedelta(seconds=1),
+            validators={"ETag": '"abc"'},
+        )
+        cache.disk.put("k", stale)
+        await cache.disk.flush()
+
+        assert await cache.contains("k") is False
+        assert await cache.get("k") is None
+        assert (await cache.get_entry("k")).value == "v"
+
+    @pytest.mark.asyncio
+    async def test_writes_are_persisted_behind(self, tmp_path: Path) -> None:
+        """Test que set() no escriba en disco hasta que venza el retardo del lote."""
+        cache = _tiered(tmp_path)
+        cache.disk.flush_delay = 0.05
+
+        await cache.set("project_modules:project_id=1", [1, 2])
+
+        stats = (await cache.get_stats())["disk"]
+        assert stats["pending_writes"] == 1
+        assert stats["size"] == 0
+
+        await asyncio.sleep(0.2)
+        stats = (await cache.get_stats())["disk"]
+        assert stats["pending_writes"] == 0
+        assert stats["size"] == 1
+        assert stats["writes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_miss_reads_pending_write(self, tmp_path: Path) -> None:
+        """Test que una entrada desalojada de memoria se lea del buffer aún sin persistir."""
+        cache = _tiered(tmp_path, max_size=1)
+        cache.disk.flush_delay = 10
+
+        await cache.set("a", "value-a")
+        await cache.set("b", "value-b")
+
+        assert cache.peek("a") is None
+        assert await cache.get("a") == "value-a"
+        assert cache.disk.get_metrics().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_not_served(self, tmp_path: Path) -> None:
+        """Test que una entrada expirada en disco no se sirva y se elimine."""
+        disk = DiskCache(tmp_path)
+        disk.put("statuses", _entry(["New"], seconds=-1))
+        disk.put("priorities", _entry(["High"]))
+        await disk.flush()
+
+        assert await disk.get("statuses") is None
+        assert (await disk.get("priorities")).value == ["High"]
+        stats = await disk.get_stats()
+        assert stats["size"] == 1
+        assert stats["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_size_limit_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Test que el disco respete max_size eliminando las entradas de acceso más antiguo."""
+        disk = DiskCache(tmp_path, max_size=3)
+        for key in ("k0", "k1", "k2"):
+            disk.put(key, _entry(key))
+        await disk.flush()
+        assert await disk.get("k0") is not None
+
+        disk.put("k3", _entry("k3"))
+        disk.put("k4", _entry("k4"))
+        await disk.flush()
+
+        assert [key for key in ("k0", "k1", "k2", "k3", "k4") if await disk.contains(key)] == [
+            "k0",
+            "k3",
+            "k4",
+        ]
+        assert disk.get_metrics().evictions == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidations_reach_the_disk(self, tmp_path: Path) -> None:
+        """Test que delete, invalidate_tags e invalidate se apliquen también al disco."""
+        cache = _tiered(tmp_path)
+        await cache.set("project_stats:project_id=1", {"total": 1}, tags=["project:1"])
+        await cache.set("project_stats:project_id=12", {"total": 2}, tags=["project:12"])
+        await cache.set("userstory_filters:project_id=12", {}, tags=["project:12"])
+        await cache.set("issue_types:project_id=5", [], tags=["project:5"])
+        await cache.flush()
+
+        restarted = _tiered(tmp_path)
+        assert await restarted.invalidate_tags("project:12") == 2
+        assert await restarted.invalidate("issue_types") == 1
+        assert await restarted.delete("project_stats:project_id=1") is True
+        await restarted.flush()
+
+        assert (await restarted.get_stats())["disk"]["size"] == 0
+        assert await _tiered(tmp_path).get("project_stats:project_id=12") is None
+
+    @pytest.mark.asyncio
+    async def test_unserializable_values_stay_in_memory(self, tmp_path: Path) -> None:
+        """Test que un valor no serializable a JSON se sirva de memoria sin persistirse."""
+        cache = _tiered(tmp_path)
+        value = object()
+
+        await cache.set("custom", value)
+        await cache.flush()
+
+        assert await cache.get("custom") is value
+        stats = (await cache.get_stats())["disk"]
+        assert stats["skipped"] == 1
+        assert stats["size"] == 0
+
+
+class TestCreateMemoryCacheDisk:
+    """Tests para la configuración del nivel en disco."""
+
+    def test_cache_dir_enables_disk_tier(self, tmp_path: Path) -> None:
+        """Test que un directorio active el nivel en disco con su límite."""
+        cache = create_memory_cache(
+            default_ttl=60, max_size=10, directory=str(tmp_path), disk_max_size=500
+        )
+
+        assert isinstance(cache, TieredCache)
+        assert cache.disk.path == tmp_path / "taiga-cache.sqlite3"
+        assert cache.disk.max_size == 500
+        assert cache.memory.max_size == 10
+
+    def test_disk_tier_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test que sin directorio el caché sea solo en memoria, aunque haya TAIGA_CACHE_DIR."""
+        monkeypatch.setenv("TAIGA_CACHE_DIR", "/tmp")
+
+        assert not isinstance(create_memory_cache(), TieredCache)
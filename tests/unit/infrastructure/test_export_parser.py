@@ -0,0 +1,88 @@
+"""Tests para la lectura incremental de exports de proyecto."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.export_parser import iter_export, summarize_export
+
+
+EXPORT = {
+    "name": "Proyecto",
+    "slug": "proyecto",
+    "total_story_points": 12.5,
+    "user_stories": [{"ref": i, "subject": f"Historia {i}", "tags": ["a", "b"]} for i in range(20)],
+    "issues": [],
+    "tasks": [1, -2.75, 3e4, True, None, 'texto con "comillas" y ]}'],
+    "is_private": False,
+}
+
+
+def _expected_pairs() -> list[tuple[str, object]]:
+    pairs: list[tuple[str, object]] = []
+    for key, value in EXPORT.items():
+        if isinstance(value, list):
+            pairs.extend((key, item) for item in value)
+        else:
+            pairs.append((key, value))
+    return pairs
+
+
+class TestIterExport:
+    """Tests para iter_export()."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 65536])
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_matches_json_load_for_any_chunk_size(
+        self, tmp_path: Path, chunk_size: int, indent: int | None
+    ) -> None:
+        """Test que el recorrido por bloques coincida con json.load."""
+        path = tmp_path / "export.json"
+        path.write_text(json.dumps(EXPORT, indent=indent), encoding="utf-8")
+
+        assert list(iter_export(path, chunk_size=chunk_size)) == _expected_pairs()
+
+    def test_reads_gzip_exports(self, tmp_path: Path) -> None:
+        """Test que los exports comprimidos con gzip se lean igual."""
+        path = tmp_path / "export.json.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(EXPORT, f)
+
+        assert list(iter_export(path, chunk_size=16)) == _expected_pairs()
+
+    def test_empty_object(self, tmp_path: Path) -> None:
+        """Test que un objeto vacío no produzca pares."""
+        path = tmp_path / "export.json"
+        path.write_text(" {} ")
+
+        assert list(iter_export(path)) == []
+
+    @pytest.mark.parametrize("content", ['{"a": [1,', '["no", "objeto"]', '{"a" 1}'])
+    def test_invalid_json_raises(self, tmp_path: Path, content: str) -> None:
+        """Test que un export truncado o mal formado lance ValueError."""
+        path = tmp_path / "export.json"
+        path.write_text(content)
+
+        with pytest.raises(ValueError):
+            list(iter_export(path))
+
+
+class TestSummarizeExport:
+    """Tests para summarize_export()."""
+
+    def test_counts_sections_and_keeps_descriptive_fields(self, tmp_path: Path) -> None:
+        """Test que el resumen cuente elementos, incluidas las secciones vacías."""
+        path = tmp_path / "export.json"
+        path.write_text(json.dumps(EXPORT))
+
+        summary = summarize_export(path, chunk_size=8)
+
+        assert summary == {
+            "name": "Proyecto",
+            "slug": "proyecto",
+            "is_private": False,
+            "counts": {"user_stories": 20, "issues": 0, "tasks": 6},
+            "size_bytes": path.stat().st_size,
+        }
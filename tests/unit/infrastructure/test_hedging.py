@@ -0,0 +1,212 @@
+"""Tests para la cobertura de GETs lentas (hedged requests)."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.hedging import HedgingPolicy, endpoint_template
+from src.infrastructure.logging.performance import EndpointMetricsStore
+
+
+class FrozenStore(EndpointMetricsStore):
+    """Almacén cuyas latencias no cambian con las peticiones del test."""
+
+    def record(self, endpoint: str, duration_ms: float, success: bool) -> None:
+        if not self._metrics.get(endpoint) or len(self._metrics[endpoint].recent_durations_ms) < 20:
+            super().record(endpoint, duration_ms, success)
+
+
+def _store(endpoint: str = "/userstories/{id}", duration_ms: float = 10.0) -> EndpointMetricsStore:
+    """Almacén con latencias suficientes para que el endpoint tenga p95."""
+    store = EndpointMetricsStore()
+    for _ in range(20):
+        store.record(f"GET {endpoint}", duration_ms, success=True)
+    return store
+
+
+class SlowThenFast:
+    """send() cuya primera llamada tarda ``first`` segundos y las demás responden al instante."""
+
+    def __init__(self, first: float, error: Exception | None = None) -> None:
+        self.first = first
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        call = self.calls
+        if call == 1:
+            try:
+                await asyncio.sleep(self.first)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            if self.error is not None:
+                raise self.error
+        return f"response-{call}"
+
+
+class TestEndpointTemplate:
+    """Tests para endpoint_template()."""
+
+    @pytest.mark.parametrize(
+        ("endpoint", "template"),
+        [
+            ("/userstories/42", "/userstories/{id}"),
+            ("/userstories/by_ref?ref=3&project=1", "/userstories/by_ref"),
+            ("/projects/7/modules", "/projects/{id}/modules"),
+            ("/issues", "/issues"),
+        ],
+    )
+    def test_ids_are_normalized(self, endpoint: str, template: str) -> None:
+        """Test que los IDs numéricos se sustituyan y se descarte la query."""
+        assert endpoint_template(endpoint) == template
+
+
+class TestHedgingPolicy:
+    """Tests para HedgingPolicy.run()."""
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_latency_samples(self) -> None:
+        """Test que sin p95 conocido no se cubra la petición y se registre su latencia."""
+        store = EndpointMetricsStore()
+        policy = HedgingPolicy(enabled=True, metrics_store=store)
+        send = SlowThenFast(first=0.05)
+
+        assert await policy.run("/userstories/1", send) == "response-1"
+
+        assert send.calls == 1
+        assert store.get_metrics("GET /userstories/{id}").total_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_request_is_hedged_and_loser_cancelled(self) -> None:
+        """Test que una GET más lenta que el p95 se cubra y gane la cobertura."""
+        policy = HedgingPolicy(enabled=True, metrics_store=_store())
+        send = SlowThenFast(first=5.0)
+
+        start = time.monotonic()
+        result = await policy.run("/userstories/42", send)
+
+        assert result == "response-2"
+        assert time.monotonic() - start < 1.0
+        await asyncio.sleep(0)  # Deja que la original procese su cancelación
+        assert send.cancelled == 1
+        assert policy.get_metrics().hedged == 1
+        assert policy.get_metrics().hedge_wins == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_request_is_not_hedged(self) -> None:
+        """Test que una GET que responde antes del p95 no se duplique."""
+        policy = HedgingPolicy(enabled=True, metrics_store=_store(duration_ms=500.0))
+        send = SlowThenFast(first=0.01)
+
+        assert await policy.run("/userstories/42", send) == "response-1"
+        assert send.calls == 1
+        assert policy.get_metrics().hedged == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_primary_falls_back_to_hedge(self) -> None:
+        """Test que si la original falla tras cubrirla se use la cobertura."""
+        policy = HedgingPolicy(enabled=True, metrics_store=_store())
+        send = SlowThenFast(first=0.1, error=RuntimeError("worker died"))
+
+        assert await policy.run("/userstories/42", send) == "response-2"
+
+    @pytest.mark.asyncio
+    async def test_error_before_delay_is_raised(self) -> None:
+        """Test que un error antes del retardo se propague sin cubrir."""
+        policy = HedgingPolicy(enabled=True, metrics_store=_store(duration_ms=1000.0))
+        send = SlowThenFast(first=0.0, error=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await policy.run("/userstories/42", send)
+        assert send.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_extra_requests(self) -> None:
+        """Test que el presupuesto limite las coberturas a budget_ratio de las peticiones."""
+        store = FrozenStore()
+        for _ in range(20):
+            store.record("GET /userstories/{id}", 5.0, success=True)
+        policy = HedgingPolicy(
+            enabled=True, metrics_store=store, budget_ratio=0.05, budget_reserve=1
+        )
+
+        for _ in range(60):
+            await policy.run("/userstories/42", SlowThenFast(first=0.02))
+
+        metrics = policy.get_metrics()
+        # Una cobertura de reserva y, después, una por cada 20 peticiones
+        assert 2 <= metrics.hedged <= 4
+        assert metrics.hedged + metrics.rejected == 60
+
+    @pytest.mark.asyncio
+    async def test_outer_cancellation_cancels_both_requests(self) -> None:
+        """Test que cancelar la llamada cancele la original y la cobertura."""
+        policy = HedgingPolicy(enabled=True, metrics_store=_store())
+        started: list[asyncio.Event] = []
+
+        async def hang() -> str:
+            started.append(asyncio.Event())
+            await asyncio.sleep(10)
+            return "never"
+
+        task = asyncio.create_task(policy.run("/userstories/42", hang))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert len(started) == 2
+        assert [t for t in asyncio.all_tasks() if t.get_coro().__name__ == "hang"] == []
+
+    def test_invalid_quantile_raises_error(self) -> None:
+        """Test que un percentil fuera de (0, 100) lance ValueError."""
+        with pytest.raises(ValueError, match="quantile"):
+            HedgingPolicy(quantile=100)
+
+
+class TestClientHedging:
+    """Tests para la cobertura en TaigaAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_slow_get_is_answered_by_the_hedge(self, make_api_client) -> None:
+        """Test que una GET lenta la responda la petición de cobertura."""
+        policy = HedgingPolicy(enabled=True, metrics_store=_store())
+        client = make_api_client(max_retries=0, hedging=policy)
+        fast = MagicMock(status_code=200, headers={})
+        calls = 0
+
+        async def get(*args: object, **kwargs: object) -> MagicMock:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(5)
+            return fast
+
+        client._client = MagicMock()
+        client._client.get = get
+
+        assert await client._make_request("GET", "/userstories/42") is fast
+        assert calls == 2
+        assert policy.get_metrics().hedge_wins == 1
+
+    @pytest.mark.asyncio
+    async def test_hedging_disabled_by_default(self, make_api_client) -> None:
+        """Test que sin activarla no se registren ni cubran peticiones."""
+        policy = HedgingPolicy(metrics_store=_store())
+        client = make_api_client(max_retries=0, hedging=policy)
+        ok = MagicMock(status_code=200, headers={})
+        client._client = MagicMock()
+
+        async def get(*args: object, **kwargs: object) -> MagicMock:
+            await asyncio.sleep(0.05)
+            return ok
+
+        client._client.get = get
+
+        assert await client._make_request("GET", "/userstories/42") is ok
+        assert policy.get_metrics().requests == 0
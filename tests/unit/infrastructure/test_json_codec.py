@@ -0,0 +1,148 @@
+"""Tests para el codec JSON intercambiable."""
+
+import contextlib
+import logging
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from src.infrastructure.json_codec import (
+    JSONCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    create_json_codec,
+    get_json_codec,
+    serialize_tool_result,
+    set_json_codec,
+)
+
+
+def _backends() -> list[JSONCodec]:
+    """Codecs de los backends instalados."""
+    codecs: list[JSONCodec] = [JSONCodec()]
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        with contextlib.suppress(ImportError):
+            codecs.append(codec_class())
+    return codecs
+
+
+@pytest.fixture(params=_backends(), ids=lambda codec: codec.name)
+def codec(request: pytest.FixtureRequest) -> JSONCodec:
+    """Cada backend instalado."""
+    return request.param
+
+
+class Story(BaseModel):
+    """Modelo de ejemplo para los resultados de los tools."""
+
+    id: int
+    subject: str
+
+
+class TestBackends:
+    """Tests comunes a todos los backends."""
+
+    def test_round_trip(self, codec: JSONCodec) -> None:
+        """Test que bytes y str se decodifiquen igual y la codificación sea compacta."""
+        payload = {"id": 1, "subject": "Añadir login", "tags": ["a", "b"], "points": None}
+
+        encoded = codec.dumps(payload)
+
+        assert (
+            encoded == '{"id":1,"subject":"Añadir login","tags":["a","b"],"points":null}'.encode()
+        )
+        assert codec.loads(encoded) == payload
+        assert codec.loads(encoded.decode()) == payload
+
+    def test_invalid_json_raises_value_error(self, codec: JSONCodec) -> None:
+        """Test que un documento inválido lance ValueError en todos los backends."""
+        with pytest.raises(ValueError):
+            codec.loads(b'{"id": ')
+
+    def test_default_converts_unsupported_types(self, codec: JSONCodec) -> None:
+        """Test que ``default`` convierta los tipos que el backend no admite."""
+        encoded = codec.dumps({"ids": {3}}, default=sorted)
+
+        assert codec.loads(encoded) == {"ids": [3]}
+
+
+class TestCodecSelection:
+    """Tests para la elección del backend."""
+
+    def test_auto_prefers_orjson(self) -> None:
+        """Test que ``auto`` use orjson si está instalado."""
+        pytest.importorskip("orjson")
+
+        assert create_json_codec("auto").name == "orjson"
+
+    def test_missing_backend_falls_back(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test que un backend no instalado avise y use el siguiente disponible."""
+        with (
+            patch("importlib.import_module", side_effect=ImportError),
+            caplog.at_level(logging.WARNING),
+        ):
+            codec = create_json_codec("orjson")
+
+        assert codec.name == "stdlib"
+        assert "not installed" in caplog.text
+
+    def test_unknown_backend_raises_error(self) -> None:
+        """Test que un backend desconocido lance ValueError."""
+        with pytest.raises(ValueError, match="backend"):
+            create_json_codec("ujson")
+
+    def test_registered_codec_is_the_singleton(self) -> None:
+        """Test que el codec registrado con set_json_codec sea el del proceso."""
+        codec = create_json_codec("stdlib")
+
+        set_json_codec(codec)
+
+        assert get_json_codec() is codec
+        assert get_json_codec() is get_json_codec()
+
+
+class TestSerializeToolResult:
+    """Tests para el serializador de resultados de tools."""
+
+    def test_models_and_dates_are_serialized(self) -> None:
+        """Test que modelos pydantic y fechas se serialicen como en FastMCP."""
+        result = serialize_tool_result(
+            {"stories": [Story(id=1, subject="Login")], "due": date(2025, 1, 31)}
+        )
+
+        assert get_json_codec().loads(result) == {
+            "stories": [{"id": 1, "subject": "Login"}],
+            "due": "2025-01-31",
+        }
+
+
+class TestClientCodec:
+    """Tests para el uso del codec en TaigaAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_responses_are_decoded_with_the_codec(
+        self, codec: JSONCodec, make_api_client
+    ) -> None:
+        """Test que el cuerpo de las respuestas se decodifique con el codec configurado."""
+        response = MagicMock(status_code=200, headers={}, content=b'[{"id": 1}, {"id": 2}]')
+        http = MagicMock(get=AsyncMock(return_value=response))
+        client = make_api_client(max_retries=0, json_codec=codec, http=http)
+
+        assert await client.get("/userstories", params={"project": 1}) == [{"id": 1}, {"id": 2}]
+
+    @pytest.mark.asyncio
+    async def test_request_bodies_are_encoded_with_the_codec(
+        self, codec: JSONCodec, make_api_client
+    ) -> None:
+        """Test que el cuerpo de las escrituras se codifique con el codec configurado."""
+        response = MagicMock(status_code=200, headers={}, content=b'{"id": 1, "version": 2}')
+        http = MagicMock(patch=AsyncMock(return_value=response))
+        client = make_api_client(max_retries=0, json_codec=codec, http=http)
+
+        result = await client.patch("/userstories/1", data={"subject": "Ñandú", "version": 1})
+
+        assert result == {"id": 1, "version": 2}
+        body = http.patch.await_args.kwargs["content"]
+        assert codec.loads(body) == {"subject": "Ñandú", "version": 1}
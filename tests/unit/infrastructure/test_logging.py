@@ -131,6 +131,18 @@ class TestEndpointMetricsStore:
         assert metrics.max_duration_ms == 150.0
         assert metrics.total_duration_ms == 300.0
 
+    def test_percentile(self) -> None:
+        """Test percentil de las duraciones recientes de operaciones exitosas."""
+        store = EndpointMetricsStore()
+        for duration in range(1, 101):
+            store.record("/api/test", float(duration), success=True)
+        store.record("/api/test", 5000.0, success=False)
+
+        assert store.percentile("/api/test", 95) == pytest.approx(95.0, abs=1.0)
+        assert store.percentile("/api/test", 95, min_samples=101) is None
+        assert store.percentile("/api/other", 95) is None
+        assert "/api/other" not in store.get_all_metrics()
+
     def test_get_all_metrics(self) -> None:
         """Test obtener todas las métricas."""
         store = EndpointMetricsStore()
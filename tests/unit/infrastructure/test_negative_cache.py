@@ -0,0 +1,204 @@
+"""Tests para el caché negativo de respuestas 404 y 403."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.exceptions import PermissionDeniedError, ResourceNotFoundError, TaigaAPIError
+from src.infrastructure.negative_cache import (
+    NegativeCache,
+    get_negative_cache,
+    project_of,
+    resource_of,
+    set_negative_cache,
+)
+
+
+class TestNegativeCache:
+    """Tests para NegativeCache."""
+
+    def test_remembers_not_found_and_forbidden(self) -> None:
+        """Test que un 404 o 403 guardado se devuelva como una excepción nueva del mismo tipo."""
+        negative = NegativeCache(ttl=30)
+        missing = ResourceNotFoundError("Resource not found: /issues/by_ref?ref=9")
+        negative.store("missing", "/issues/by_ref?ref=9&project=1", missing)
+        negative.store("forbidden", "/wiki/by_slug?project=1&slug=x", PermissionDeniedError("no"))
+
+        error = negative.lookup("missing")
+
+        assert isinstance(error, ResourceNotFoundError)
+        assert error is not missing
+        assert str(error) == str(missing)
+        assert isinstance(negative.lookup("forbidden"), PermissionDeniedError)
+        assert negative.lookup("other") is None
+        assert negative.get_metrics().saved_calls == 2
+
+    def test_other_errors_are_not_stored(self) -> None:
+        """Test que errores transitorios o de servidor no se recuerden."""
+        negative = NegativeCache(ttl=30)
+
+        assert negative.store("k", "/issues/1", TaigaAPIError("boom", status_code=500)) is False
+        assert negative.lookup("k") is None
+
+    def test_expired_entries_are_not_served(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test que una entrada deje de servirse al vencer su TTL."""
+        clock = [100.0]
+        monkeypatch.setattr("src.infrastructure.negative_cache.time.monotonic", lambda: clock[0])
+        negative = NegativeCache(ttl=5)
+        negative.store("k", "/issues/1", ResourceNotFoundError("gone"))
+
+        clock[0] = 104.0
+        assert negative.lookup("k") is not None
+        clock[0] = 105.0
+        assert negative.lookup("k") is None
+        assert negative.size() == 0
+
+    def test_invalidate_drops_the_resource_for_every_principal(self) -> None:
+        """Test que una escritura elimine las entradas de su recurso de todos los principales."""
+        negative = NegativeCache(ttl=30)
+        negative.store(("alice", 1), "/issues/by_ref?ref=9&project=1", ResourceNotFoundError("a"))
+        negative.store(("bob", 1), "/issues/by_ref?ref=9&project=1", ResourceNotFoundError("b"))
+        negative.store(("alice", 2), "/wiki/by_slug?project=1&slug=x", ResourceNotFoundError("c"))
+
+        assert negative.invalidate("/issues") == 2
+        assert negative.lookup(("alice", 1)) is None
+        assert negative.lookup(("alice", 2)) is not None
+        assert negative.get_metrics().invalidations == 2
+
+    def test_invalidate_is_scoped_to_the_project(self) -> None:
+        """Test que una escritura en un proyecto no elimine los 404 de otros proyectos."""
+        negative = NegativeCache(ttl=30)
+        negative.store("p1", "/issues/by_ref?ref=9&project=1", ResourceNotFoundError("a"))
+        negative.store("p2", "/issues/by_ref?ref=9&project=2", ResourceNotFoundError("b"))
+        negative.store("epic", "/epics/by_ref", ResourceNotFoundError("c"), project="2")
+        negative.store("id", "/issues/42", ResourceNotFoundError("d"))
+
+        assert negative.invalidate("/issues", project="2") == 2
+        assert negative.lookup("p1") is not None
+        assert negative.lookup("p2") is None
+        assert negative.lookup("id") is None
+        assert negative.lookup("epic") is not None
+        assert negative.invalidate("/issues/attachments?project=1") == 1
+        assert negative.invalidate("/wiki", project="1") == 0
+
+    def test_max_size_drops_oldest(self) -> None:
+        """Test que al superar max_size se descarten las entradas más antiguas."""
+        negative = NegativeCache(ttl=30, max_size=2)
+        for key in ("a", "b", "c"):
+            negative.store(key, f"/issues/{key}", ResourceNotFoundError(key))
+
+        assert [key for key in ("a", "b", "c") if negative.lookup(key)] == ["b", "c"]
+        assert negative.get_metrics().evictions == 1
+        assert negative.invalidate("/issues") == 2
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        """Test que ttl=0 desactive el caché."""
+        negative = NegativeCache(ttl=0)
+
+        assert negative.store("k", "/issues/1", ResourceNotFoundError("gone")) is False
+        assert negative.get_stats()["enabled"] is False
+
+    def test_resource_of(self) -> None:
+        """Test que el recurso sea el primer segmento de la ruta, sin query string."""
+        assert resource_of("/issues/by_ref?ref=12&project=1") == "/issues"
+        assert resource_of("/wiki") == "/wiki"
+        assert resource_of("/userstories/42/") == "/userstories"
+
+    def test_project_of(self) -> None:
+        """Test que el proyecto salga del cuerpo, de los parámetros o de la query string."""
+        assert project_of("/issues/by_ref?ref=12&project=1") == "1"
+        assert project_of("/issues", {"subject": "Bug"}, {"project": 3}) == "3"
+        assert project_of("/issues/attachments", {"project": "4", "object_id": "7"}) == "4"
+        assert project_of("/issues/42", None) is None
+
+    def test_process_cache_can_be_registered(self) -> None:
+        """Test que el caché del proceso sea el registrado o, si no hay, uno por defecto."""
+        default = get_negative_cache()
+        assert default is get_negative_cache()
+        assert default.ttl == 30.0
+
+        negative = NegativeCache(ttl=5, max_size=10)
+        set_negative_cache(negative)
+
+        assert get_negative_cache() is negative
+
+
+class TestNegativeCacheClient:
+    """Tests para el caché negativo en TaigaAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_missing_ref_skips_the_api(self, make_api_client) -> None:
+        """Test que repetir un by_ref inexistente no vuelva a llamar a la API."""
+        negative = NegativeCache(ttl=30)
+        client = make_api_client(negative_cache=negative)
+        client._make_request = AsyncMock(side_effect=ResourceNotFoundError("not found"))
+
+        for _ in range(3):
+            with pytest.raises(ResourceNotFoundError):
+                await client.get_issue_by_ref(ref=99, project=1)
+
+        assert client._make_request.await_count == 1
+        assert negative.get_stats()["saved_calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_principals_do_not_share_results(self, make_api_client) -> None:
+        """Test que un 403 de un token no afecte a otro."""
+        negative = NegativeCache(ttl=30)
+        alice = make_api_client(taiga_auth_token="alice", negative_cache=negative)
+        bob = make_api_client(taiga_auth_token="bob", negative_cache=negative)
+        alice._make_request = AsyncMock(side_effect=PermissionDeniedError("denied"))
+        bob._make_request = AsyncMock(
+            return_value=MagicMock(status_code=200, content=b'{"slug": "home"}')
+        )
+
+        with pytest.raises(PermissionDeniedError):
+            await alice.get_wiki_page_by_slug(project=1, slug="home")
+
+        assert await bob.get_wiki_page_by_slug(project=1, slug="home") == {"slug": "home"}
+
+    @pytest.mark.asyncio
+    async def test_create_on_the_same_resource_invalidates(self, make_api_client) -> None:
+        """Test que un POST exitoso a /wiki haga que el slug se vuelva a pedir."""
+        negative = NegativeCache(ttl=30)
+        client = make_api_client(negative_cache=negative)
+        client._send = AsyncMock(
+            side_effect=[
+                MagicMock(status_code=404, headers={}),
+                MagicMock(status_code=201, headers={}, content=b'{"id": 1, "slug": "home"}'),
+                MagicMock(status_code=200, headers={}, content=b'{"id": 1, "slug": "home"}'),
+            ]
+        )
+        client._invalidate_cache = AsyncMock()
+
+        with pytest.raises(ResourceNotFoundError):
+            await client.get_wiki_page_by_slug(project=1, slug="home")
+        await client.post("/wiki", data={"project": 1, "slug": "home", "content": ""})
+
+        assert await client.get_wiki_page_by_slug(project=1, slug="home") == {
+            "id": 1,
+            "slug": "home",
+        }
+        assert negative.get_metrics().invalidations == 1
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_upload_invalidates_its_project(self, tmp_path: Path, make_api_client) -> None:
+        """Test que un adjunto subido con post_multipart invalide los 404 de su proyecto."""
+        negative = NegativeCache(ttl=30)
+        negative.store("p1", "/issues/by_ref?ref=9&project=1", ResourceNotFoundError("a"))
+        negative.store("p2", "/issues/by_ref?ref=9&project=2", ResourceNotFoundError("b"))
+        client = make_api_client(negative_cache=negative)
+        client._client = MagicMock()
+        client._client.post = AsyncMock(
+            return_value=MagicMock(status_code=201, headers={}, content=b'{"id": 5}')
+        )
+        upload = tmp_path / "log.txt"
+        upload.write_text("boom")
+
+        await client.post_multipart(
+            "/issues/attachments", data={"project": "1", "object_id": "7"}, file_path=str(upload)
+        )
+
+        assert negative.lookup("p1") is None
+        assert negative.lookup("p2") is not None
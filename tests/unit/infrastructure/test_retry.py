@@ -10,19 +10,25 @@ Tests incluidos:
 - Test 3.6.4: Backoff exponencial correcto
 - Test 3.6.5: Jitter añade variabilidad
 - Test 3.6.6: Éxito en segundo intento
+- Presupuesto de reintentos y deadline por llamada en TaigaAPIClient
 """
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
+from src.domain.exceptions import RateLimitError, TaigaAPIError
 from src.infrastructure.retry import (
     RetryableHTTPClient,
+    RetryBudget,
     RetryConfig,
     calculate_delay,
     with_retry,
 )
+from src.taiga_client import TaigaAPIClient
 
 
 class TestRetryConfig:
@@ -75,6 +81,11 @@ class TestRetryConfig:
         with pytest.raises(ValueError, match="max_delay debe ser >= base_delay"):
             RetryConfig(base_delay=10.0, max_delay=5.0)
 
+    def test_invalid_deadline_raises_error(self) -> None:
+        """Test que deadline <= 0 lance ValueError."""
+        with pytest.raises(ValueError, match="deadline"):
+            RetryConfig(deadline=0)
+
     def test_invalid_exponential_base_raises_error(self) -> None:
         """Test que exponential_base < 1 lanza ValueError."""
         with pytest.raises(ValueError, match="exponential_base debe ser >= 1"):
@@ -546,3 +557,205 @@ class TestEdgeCases:
 
         assert result == "ok"
         assert call_count == 2
+
+
+class TestRetryBudget:
+    """Tests para el presupuesto de reintentos."""
+
+    def test_reserve_allows_initial_retries(self) -> None:
+        """Test que la reserva permita reintentar sin tráfico previo."""
+        budget = RetryBudget(ratio=0.1, reserve=2)
+
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is False
+        assert budget.get_metrics().rejected == 1
+
+    def test_sustained_retries_capped_at_ratio(self) -> None:
+        """Test que, agotada la reserva, los reintentos no pasen del ratio."""
+        budget = RetryBudget(ratio=0.1, reserve=10)
+        granted = 0
+        for _ in range(1000):
+            budget.record_request()
+            if budget.try_acquire():
+                granted += 1
+
+        assert granted <= 10 + 100
+        assert budget.get_stats()["requests"] == 1000
+
+    def test_balance_never_exceeds_reserve(self) -> None:
+        """Test que el saldo no acumule más fichas que la reserva."""
+        budget = RetryBudget(ratio=1.0, reserve=3)
+        for _ in range(100):
+            budget.record_request()
+
+        assert budget.get_stats()["tokens"] == 3
+
+    def test_invalid_ratio_raises_error(self) -> None:
+        """Test que un ratio negativo lance ValueError."""
+        with pytest.raises(ValueError, match="ratio"):
+            RetryBudget(ratio=-0.1)
+
+
+class TestTaigaClientRetryLoop:
+    """Tests para el bucle de reintentos de TaigaAPIClient._make_request."""
+
+    @pytest.fixture
+    def make_client(
+        self, make_api_client: Callable[..., TaigaAPIClient]
+    ) -> Callable[..., TaigaAPIClient]:
+        """Cliente sin espera entre reintentos, con el presupuesto y el deadline indicados."""
+
+        def _make(
+            budget: RetryBudget | None = None, deadline: float | None = None, max_retries: int = 3
+        ) -> TaigaAPIClient:
+            return make_api_client(
+                max_retries=max_retries,
+                retry_config=RetryConfig(
+                    max_retries=max_retries, base_delay=0.0, jitter=False, deadline=deadline
+                ),
+                retry_budget=budget or RetryBudget(),
+                http=MagicMock(),
+            )
+
+        return _make
+
+    @staticmethod
+    def _response(status: int, retry_after: int | str = 0) -> MagicMock:
+        response = MagicMock(status_code=status, headers={"Retry-After": str(retry_after)})
+        if status >= 400:
+            response.raise_for_status.side_effect = httpx.HTTPStatusError(
+                "error", request=MagicMock(), response=response
+            )
+        return response
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retries_in_a_loop(self, make_client) -> None:
+        """Test que los 429 se reintenten sin recursión y cuenten en el presupuesto."""
+        budget = RetryBudget()
+        client = make_client(budget)
+        client._send = AsyncMock(
+            side_effect=[self._response(429), self._response(429), self._response(200)]
+        )
+
+        with patch.object(TaigaAPIClient, "_make_request", wraps=client._make_request) as spy:
+            response = await client._make_request("GET", "/projects")
+
+        assert response.status_code == 200
+        assert client._send.await_count == 3
+        assert spy.call_count == 1
+        assert budget.get_metrics().retries == 2
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_stops_retries(self, make_client) -> None:
+        """Test que sin presupuesto el 429 falle en el primer intento."""
+        client = make_client(RetryBudget(ratio=0.0, reserve=0))
+        client._send = AsyncMock(return_value=self._response(429))
+
+        with pytest.raises(RateLimitError):
+            await client._make_request("GET", "/projects")
+
+        assert client._send.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_retry_respects_budget(self, make_client) -> None:
+        """Test que los timeouts también consuman presupuesto."""
+        budget = RetryBudget(ratio=0.0, reserve=1)
+        client = make_client(budget)
+        client._send = AsyncMock(side_effect=httpx.ReadTimeout("slow"))
+
+        with pytest.raises(TaigaAPIError, match="timeout after 1 retries"):
+            await client._make_request("GET", "/projects")
+
+        assert client._send.await_count == 2
+        assert budget.get_metrics().rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after_beyond_deadline_is_not_awaited(self, make_client) -> None:
+        """Test que no se espere un Retry-After que sobrepasa el deadline."""
+        client = make_client(deadline=1.0)
+        client._send = AsyncMock(return_value=self._response(429, retry_after=30))
+
+        with (
+            patch("src.taiga_client.asyncio.sleep", new=AsyncMock()) as sleep,
+            pytest.raises(RateLimitError),
+        ):
+            await client._make_request("GET", "/projects")
+
+        sleep.assert_not_awaited()
+        assert client._send.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_http_date_retry_after_is_retried(self, make_client) -> None:
+        """Test que un Retry-After en forma de fecha HTTP se reintente sin ValueError."""
+        client = make_client()
+        client._send = AsyncMock(
+            side_effect=[
+                self._response(429, retry_after="Wed, 21 Oct 2015 07:28:00 GMT"),
+                self._response(200),
+            ]
+        )
+
+        response = await client._make_request("GET", "/projects")
+
+        assert response.status_code == 200
+        assert client._send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_retry_after_uses_default_wait(self, make_client) -> None:
+        """Test que un Retry-After no válido cuente como la espera por defecto (5 s)."""
+        client = make_client(deadline=1.0)
+        client._send = AsyncMock(return_value=self._response(429, retry_after="soon"))
+
+        with pytest.raises(RateLimitError):
+            await client._make_request("GET", "/projects")
+
+        assert client._send.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_deadline_cuts_a_slow_attempt(self, make_client) -> None:
+        """Test que el deadline corte una petición en curso."""
+        client = make_client(deadline=0.05)
+
+        async def hang(*args: object) -> MagicMock:
+            await asyncio.sleep(5)
+            return self._response(200)
+
+        client._send = AsyncMock(side_effect=hang)
+
+        with pytest.raises(TaigaAPIError, match=r"deadline of 0\.05s exceeded"):
+            await client._make_request("GET", "/projects")
+
+    @pytest.mark.asyncio
+    async def test_token_refresh_rebuilds_headers(self, make_client) -> None:
+        """Test que el reintento tras 401 use el token renovado y no gaste presupuesto."""
+        budget = RetryBudget()
+        client = make_client(budget)
+        client.refresh_token = "refresh"
+
+        async def refresh() -> None:
+            client.auth_token = "new-token"
+
+        client.refresh_auth_token = AsyncMock(side_effect=refresh)
+        client._send = AsyncMock(side_effect=[self._response(401), self._response(200)])
+
+        await client._make_request("GET", "/projects")
+
+        sent_headers = [call.args[4] for call in client._send.await_args_list]
+        assert sent_headers[0]["Authorization"] == "Bearer token"
+        assert sent_headers[1]["Authorization"] == "Bearer new-token"
+        assert budget.get_metrics().retries == 0
+
+    @pytest.mark.asyncio
+    async def test_brownout_adds_at_most_ratio_of_load(self, make_client) -> None:
+        """Test que con Taiga devolviendo 429 la carga extra quede acotada."""
+        budget = RetryBudget(ratio=0.1, reserve=10)
+        client = make_client(budget)
+        client._send = AsyncMock(return_value=self._response(429))
+
+        for _ in range(200):
+            with pytest.raises(RateLimitError):
+                await client._make_request("GET", "/projects")
+
+        # Sin presupuesto serían 200 * (1 + max_retries) = 800 peticiones
+        assert client._send.await_count <= 200 + 10 + 20
@@ -0,0 +1,143 @@
+"""Tests para el caché compartido entre procesos."""
+
+import asyncio
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.cache import MemoryCache, create_memory_cache
+from src.infrastructure.disk_cache import DiskCache
+from src.infrastructure.shared_cache import SharedCache
+
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+def _worker(directory: Path, sync_interval: float = 60.0, flush_delay: float = 0.01) -> SharedCache:
+    """Caché de un proceso del servidor sobre el directorio compartido."""
+    disk = DiskCache(directory, flush_delay=flush_delay)
+    return SharedCache(MemoryCache(default_ttl=60), disk, sync_interval=sync_interval)
+
+
+class TestSharedCache:
+    """Tests para SharedCache (cada instancia simula un proceso)."""
+
+    @pytest.mark.asyncio
+    async def test_entries_are_shared_between_workers(self, tmp_path: Path) -> None:
+        """Test que lo que guarda un proceso lo lea otro sin pedirlo a la API."""
+        first, second = _worker(tmp_path), _worker(tmp_path)
+
+        await first.set("issue_statuses:project_id=1", [{"id": 1}], tags=["project:1"])
+        await first.flush()
+
+        assert await second.get("issue_statuses:project_id=1") == [{"id": 1}]
+        assert second.disk.get_metrics().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reaches_other_workers(self, tmp_path: Path) -> None:
+        """Test que invalidar un proyecto en un proceso lo elimine de la memoria del resto."""
+        first, second = _worker(tmp_path), _worker(tmp_path)
+        await first.set("project_stats:project_id=1", {"total": 1}, tags=["project:1"])
+        await first.set("project_stats:project_id=2", {"total": 2}, tags=["project:2"])
+        await first.flush()
+        assert await second.get("project_stats:project_id=1") == {"total": 1}
+        assert await second.get("project_stats:project_id=2") == {"total": 2}
+
+        assert await first.invalidate_tags("project:1") == 1
+
+        assert second.peek("project_stats:project_id=1") is not None
+        assert await second.sync() == 1
+        assert second.peek("project_stats:project_id=1") is None
+        assert await second.get("project_stats:project_id=1") is None
+        assert await second.get("project_stats:project_id=2") == {"total": 2}
+        # Las invalidaciones propias no se vuelven a aplicar
+        assert await first.sync() == 0
+
+    @pytest.mark.asyncio
+    async def test_every_invalidation_kind_is_broadcast(self, tmp_path: Path) -> None:
+        """Test que delete, invalidate y clear también se propaguen."""
+        first, second = _worker(tmp_path), _worker(tmp_path)
+        for key in ("a:1", "b:1", "c:1"):
+            await second.set(key, key)
+
+        await first.delete("a:1")
+        await first.invalidate("b:")
+        await second.sync()
+        assert [key for key in ("a:1", "b:1", "c:1") if second.peek(key)] == ["c:1"]
+
+        await first.clear()
+        await second.sync()
+        assert await second.size() == 0
+        assert (await second.get_stats())["sync"]["remote_invalidations"] == 3
+
+    @pytest.mark.asyncio
+    async def test_pending_write_invalidated_elsewhere_is_discarded(self, tmp_path: Path) -> None:
+        """Test que una escritura pendiente invalidada por otro proceso no llegue al disco."""
+        first = _worker(tmp_path)
+        second = _worker(tmp_path, flush_delay=60)
+        await second.set("userstory_filters:project_id=1", {"old": True}, tags=["project:1"])
+
+        await first.invalidate_tags("project:1")
+        await second.flush()
+
+        assert (await second.get_stats())["disk"]["size"] == 0
+        assert await second.sync() == 1
+        assert await second.get("userstory_filters:project_id=1") is None
+
+    @pytest.mark.asyncio
+    async def test_background_sync(self, tmp_path: Path) -> None:
+        """Test que la sincronización periódica aplique las invalidaciones sin llamar a sync()."""
+        first = _worker(tmp_path)
+        second = _worker(tmp_path, sync_interval=0.01)
+        await second.set("project_modules:project_id=1", [1], tags=["project:1"])
+        assert await second.get("project_modules:project_id=1") == [1]
+
+        await first.invalidate_tags("project:1")
+        await asyncio.sleep(0.2)
+
+        assert second.peek("project_modules:project_id=1") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidation_from_another_process(self, tmp_path: Path) -> None:
+        """Test que una invalidación hecha en otro proceso real llegue a este."""
+        cache = _worker(tmp_path)
+        await cache.set("issue_types:project_id=7", ["Bug"], tags=["project:7"])
+        await cache.flush()
+
+        script = textwrap.dedent(
+            f"""
+            import asyncio
+            from src.infrastructure.cache import create_memory_cache
+
+            async def main():
+                cache = create_memory_cache(directory={str(tmp_path)!r}, shared=True)
+                assert await cache.get("issue_types:project_id=7") == ["Bug"]
+                assert await cache.invalidate_tags("project:7") == 1
+
+            asyncio.run(main())
+            """
+        )
+        subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True, timeout=60)
+
+        assert await cache.sync() == 1
+        assert await cache.get("issue_types:project_id=7") is None
+
+
+class TestCreateSharedCache:
+    """Tests para la configuración del caché compartido."""
+
+    def test_shared_creates_shared_cache(self, tmp_path: Path) -> None:
+        """Test que shared=True cree un SharedCache con su intervalo."""
+        cache = create_memory_cache(directory=str(tmp_path), shared=True, sync_interval=2)
+
+        assert isinstance(cache, SharedCache)
+        assert cache.disk.broadcast is True
+        assert cache.sync_interval == 2.0
+
+    def test_shared_without_directory_raises_error(self) -> None:
+        """Test que pedir un caché compartido sin directorio lance ValueError."""
+        with pytest.raises(ValueError, match="directorio"):
+            create_memory_cache(shared=True)
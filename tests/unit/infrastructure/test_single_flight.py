@@ -0,0 +1,192 @@
+"""Tests para la coalescencia de peticiones idénticas concurrentes."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests para SingleFlight.do()."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        """Test que las llamadas concurrentes con la misma clave ejecuten fn una vez."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch() -> dict[str, int]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"id": 1}
+
+        results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+
+        assert calls == 1
+        assert results == [{"id": 1}] * 5
+        assert flight.get_metrics().executed == 1
+        assert flight.get_metrics().coalesced == 4
+        assert flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_independently(self) -> None:
+        """Test que claves distintas no se coalescen."""
+        flight = SingleFlight()
+        fetch = AsyncMock(side_effect=[1, 2])
+
+        results = await asyncio.gather(flight.do("a", fetch), flight.do("b", fetch))
+
+        assert results == [1, 2]
+        assert flight.get_metrics().coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_cached(self) -> None:
+        """Test que una llamada posterior vuelva a ejecutar fn."""
+        flight = SingleFlight()
+        fetch = AsyncMock(return_value=1)
+
+        await flight.do("k", fetch)
+        await flight.do("k", fetch)
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_followers_receive_the_same_exception(self) -> None:
+        """Test que todos los llamadores reciban la excepción compartida."""
+        flight = SingleFlight()
+
+        async def fetch() -> None:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fetch), flight.do("k", fetch), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.get_metrics().coalesced == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelling_leader_does_not_cancel_followers(self) -> None:
+        """Test que cancelar al primer llamador no afecte a los demás."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            return "ok"
+
+        leader = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        release.set()
+
+        assert await follower == "ok"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+
+class TestCoalescedGet:
+    """Tests para la coalescencia en TaigaAPIClient.get()."""
+
+    @staticmethod
+    def _response() -> MagicMock:
+        return MagicMock(status_code=200, content=b'{"id": 7, "subject": "Issue"}')
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_share_one_request(self, make_api_client) -> None:
+        """Test que GETs idénticos de distintos clientes hagan una sola petición."""
+        flight = SingleFlight()
+        response = self._response()
+
+        async def slow_request(*args: object, **kwargs: object) -> MagicMock:
+            await asyncio.sleep(0.01)
+            return response
+
+        clients = [make_api_client(single_flight=flight) for _ in range(3)]
+        for client in clients:
+            client._make_request = AsyncMock(side_effect=slow_request)
+
+        results = await asyncio.gather(*(c.get("/issues/7") for c in clients))
+
+        assert sum(c._make_request.await_count for c in clients) == 1
+        assert results == [{"id": 7, "subject": "Issue"}] * 3
+        # Cada llamador parsea su propia copia del JSON
+        assert results[0] is not results[1]
+        assert flight.get_metrics().coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_different_principals_are_not_coalesced(self, make_api_client) -> None:
+        """Test que tokens distintos no compartan respuesta."""
+        flight = SingleFlight()
+        response = self._response()
+        alice = make_api_client(taiga_auth_token="alice", single_flight=flight)
+        bob = make_api_client(taiga_auth_token="bob", single_flight=flight)
+        for client in (alice, bob):
+            client._make_request = AsyncMock(return_value=response)
+
+        await asyncio.gather(alice.get("/issues/7"), bob.get("/issues/7"))
+
+        assert alice._make_request.await_count == 1
+        assert bob._make_request.await_count == 1
+        assert flight.get_metrics().coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_not_coalesced(self, make_api_client) -> None:
+        """Test que parámetros distintos generen peticiones distintas."""
+        flight = SingleFlight()
+        client = make_api_client(single_flight=flight)
+        client._make_request = AsyncMock(return_value=self._response())
+
+        await asyncio.gather(
+            client.get("/issues", params={"project": 1}),
+            client.get("/issues", params={"project": 2}),
+        )
+
+        assert client._make_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_keeps_its_connection_for_followers(
+        self, make_api_client
+    ) -> None:
+        """Test que cancelar al líder no cierre la conexión de la petición compartida."""
+        flight = SingleFlight()
+        leader = make_api_client(single_flight=flight)
+        follower = make_api_client(single_flight=flight)
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def send(*args: object) -> MagicMock:
+            started.set()
+            await release.wait()
+            # El _send real falla si la conexión del líder se cerró
+            assert leader._client is not None
+            assert not leader._client.is_closed
+            return self._response()
+
+        leader._send = AsyncMock(side_effect=send)
+
+        async def leader_call() -> None:
+            async with leader:
+                await leader.get("/issues/7")
+
+        leader_task = asyncio.create_task(leader_call())
+        await started.wait()
+        follower_task = asyncio.create_task(follower.get("/issues/7"))
+        await asyncio.sleep(0)
+        leader_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader_task
+
+        release.set()
+
+        assert await follower_task == {"id": 7, "subject": "Issue"}
+        assert flight.get_metrics().coalesced == 1
+        # El cierre aplazado se hace al terminar la petición compartida
+        assert leader._client is None
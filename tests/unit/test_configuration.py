@@ -778,3 +778,149 @@ class TestTaigaConfigAdvancedValidations:
             pytest.raises(ValidationError),
         ):
             TaigaConfig()
+
+    @pytest.mark.unit
+    def test_taiga_request_deadline_invalid(self) -> None:
+        """
+        Verifica que un TAIGA_REQUEST_DEADLINE negativo o no numérico se rechace al cargar
+        la configuración en lugar de fallar en cada llamada a la API.
+        """
+        for value, message in (("-1", "must be non-negative"), ("soon", "valid number")):
+            with (
+                patch.dict(
+                    os.environ,
+                    {
+                        "TAIGA_API_URL": "https://api.taiga.io",
+                        "TAIGA_USERNAME": "user@example.com",
+                        "TAIGA_PASSWORD": "password123",
+                        "TAIGA_REQUEST_DEADLINE": value,
+                    },
+                ),
+                pytest.raises(ValidationError, match=message),
+            ):
+                TaigaConfig()
+
+    @pytest.mark.unit
+    def test_taiga_request_deadline_zero_disables_deadline(self) -> None:
+        """
+        Verifica que TAIGA_REQUEST_DEADLINE=0 deje al cliente sin deadline por llamada.
+        """
+        from src.taiga_client import TaigaAPIClient
+
+        with patch.dict(
+            os.environ,
+            {
+                "TAIGA_API_URL": "https://api.taiga.io",
+                "TAIGA_USERNAME": "user@example.com",
+                "TAIGA_PASSWORD": "password123",
+                "TAIGA_REQUEST_DEADLINE": "0",
+            },
+        ):
+            config = TaigaConfig()
+
+        assert config.request_deadline == 0
+        assert TaigaAPIClient(config)._retry_config.deadline is None
+
+    @pytest.mark.unit
+    def test_taiga_circuit_settings_must_be_positive(self) -> None:
+        """
+        Verifica que el umbral y el plazo del circuit breaker se validen en TaigaConfig.
+        """
+        for name in ("TAIGA_CIRCUIT_FAILURE_THRESHOLD", "TAIGA_CIRCUIT_RECOVERY_TIMEOUT"):
+            with (
+                patch.dict(
+                    os.environ,
+                    {
+                        "TAIGA_API_URL": "https://api.taiga.io",
+                        "TAIGA_USERNAME": "user@example.com",
+                        "TAIGA_PASSWORD": "password123",
+                        name: "0",
+                    },
+                ),
+                pytest.raises(ValidationError, match="must be positive"),
+            ):
+                TaigaConfig()
+
+    @pytest.mark.unit
+    def test_taiga_cache_refresh_windows_invalid(self) -> None:
+        """
+        Verifica que la gracia stale-while-revalidate, el refresco anticipado y la ventana
+        de revalidación se validen al cargar la configuración en lugar de fallar en cada
+        lectura cacheada.
+        """
+        for name in (
+            "TAIGA_CACHE_STALE_GRACE",
+            "TAIGA_CACHE_REFRESH_AHEAD",
+            "TAIGA_CACHE_REVALIDATE_WINDOW",
+        ):
+            for value, message in (("-1", "must be non-negative"), ("soon", "valid integer")):
+                with (
+                    patch.dict(
+                        os.environ,
+                        {
+                            "TAIGA_API_URL": "https://api.taiga.io",
+                            "TAIGA_USERNAME": "user@example.com",
+                            "TAIGA_PASSWORD": "password123",
+                            name: value,
+                        },
+                    ),
+                    pytest.raises(ValidationError, match=message),
+                ):
+                    TaigaConfig()
+
+    @pytest.mark.unit
+    def test_taiga_cache_shards_reject_max_bytes(self) -> None:
+        """
+        Verifica que un caché particionado con límite de memoria se rechace al cargar la
+        configuración en lugar de repartir el límite entre segmentos.
+        """
+        env = {
+            "TAIGA_API_URL": "https://api.taiga.io",
+            "TAIGA_USERNAME": "user@example.com",
+            "TAIGA_PASSWORD": "password123",
+            "TAIGA_CACHE_SHARDS": "4",
+        }
+        with patch.dict(os.environ, env):
+            assert TaigaConfig().cache_shards == 4
+
+        with (
+            patch.dict(os.environ, {**env, "TAIGA_CACHE_MAX_BYTES": "40000"}),
+            pytest.raises(ValidationError, match="cannot be combined with TAIGA_CACHE_MAX_BYTES"),
+        ):
+            TaigaConfig()
+
+    @pytest.mark.unit
+    def test_taiga_json_backend(self) -> None:
+        """
+        Verifica que TAIGA_JSON_BACKEND se normalice y que un backend desconocido se
+        rechace al cargar la configuración.
+        """
+        env = {
+            "TAIGA_API_URL": "https://api.taiga.io",
+            "TAIGA_USERNAME": "user@example.com",
+            "TAIGA_PASSWORD": "password123",
+        }
+        with patch.dict(os.environ, {**env, "TAIGA_JSON_BACKEND": "STDLIB"}):
+            assert TaigaConfig().json_backend == "stdlib"
+
+        with (
+            patch.dict(os.environ, {**env, "TAIGA_JSON_BACKEND": "ujson"}),
+            pytest.raises(ValidationError, match="Invalid JSON backend"),
+        ):
+            TaigaConfig()
+
+    def test_taiga_shared_cache_requires_directory(self) -> None:
+        """
+        Verifica que TAIGA_CACHE_SHARED sin TAIGA_CACHE_DIR se rechace al cargar la config.
+        """
+        env = {
+            "TAIGA_API_URL": "https://api.taiga.io",
+            "TAIGA_USERNAME": "user@example.com",
+            "TAIGA_PASSWORD": "password123",
+            "TAIGA_CACHE_SHARED": "true",
+        }
+        with patch.dict(os.environ, env), pytest.raises(ValidationError, match="TAIGA_CACHE_DIR"):
+            TaigaConfig()
+
+        with patch.dict(os.environ, {**env, "TAIGA_CACHE_DIR": "/var/cache/taiga-mcp"}):
+            assert TaigaConfig().cache_shared is True
@@ -49,7 +49,7 @@ class TestAuthTools:
             "refresh": "refresh_token",
         }
 
-        with patch("src.application.tools.auth_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.authenticate = AsyncMock(return_value=expected_result)
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -95,7 +95,7 @@ class TestAuthTools:
             "refresh": "config_refresh",
         }
 
-        with patch("src.application.tools.auth_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.authenticate = AsyncMock(return_value=expected_result)
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -130,7 +130,7 @@ class TestAuthTools:
     async def test_authenticate_with_authentication_error(self, auth_tools) -> None:
         """Verifica manejo de error de autenticación."""
         # Setup
-        with patch("src.application.tools.auth_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.authenticate = AsyncMock(
                 side_effect=AuthenticationError("Invalid credentials")
@@ -149,7 +149,7 @@ class TestAuthTools:
     async def test_authenticate_with_api_error(self, auth_tools) -> None:
         """Verifica manejo de error de API."""
         # Setup
-        with patch("src.application.tools.auth_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.authenticate = AsyncMock(side_effect=TaigaAPIError("Server error"))
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -166,7 +166,7 @@ class TestAuthTools:
     async def test_authenticate_with_unexpected_error(self, auth_tools) -> None:
         """Verifica manejo de error inesperado."""
         # Setup
-        with patch("src.application.tools.auth_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.authenticate = AsyncMock(side_effect=Exception("Unexpected error"))
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -187,7 +187,7 @@ class TestAuthTools:
 
         expected_result = {"auth_token": "new_auth_token", "refresh": "new_refresh_token"}
 
-        with patch("src.application.tools.auth_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.refresh_auth_token = AsyncMock(return_value=expected_result)
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -239,7 +239,7 @@ class TestAuthTools:
             "total_public_projects": 10,
         }
 
-        with patch("src.application.tools.auth_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.get = AsyncMock(return_value=expected_user)
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -746,7 +746,7 @@ class TestAuthToolsAdditionalCoverage:
         mock_client.refresh_auth_token = AsyncMock(side_effect=RuntimeError("Unexpected error"))
 
         with (
-            patch("src.application.tools.auth_tools.TaigaAPIClient", return_value=mock_client),
+            patch("src.infrastructure.client_factory.TaigaAPIClient", return_value=mock_client),
             pytest.raises(ToolError, match="Unexpected error"),
         ):
             await auth_tools.refresh_token()
@@ -828,7 +828,7 @@ class TestAuthToolsAdditionalCoverage:
             }
         )
 
-        with patch("src.application.tools.auth_tools.TaigaAPIClient", return_value=mock_client):
+        with patch("src.infrastructure.client_factory.TaigaAPIClient", return_value=mock_client):
             result = await auth_tools.authenticate("user", "pass")
 
         assert result["auth_token"] == "production_token"
@@ -873,7 +873,7 @@ class TestAuthToolsAdditionalCoverage:
         mock_client.authenticate = AsyncMock(side_effect=ValueError("Connection failed"))
 
         with (
-            patch("src.application.tools.auth_tools.TaigaAPIClient", return_value=mock_client),
+            patch("src.infrastructure.client_factory.TaigaAPIClient", return_value=mock_client),
             pytest.raises(ValueError, match="Connection failed"),
         ):
             await auth_tools.authenticate("user", "pass")
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.application.tools.cache_tools import CacheTools
+from src.infrastructure.http_session_pool import HTTPSessionPool
 
 
 class TestCacheTools:
@@ -82,9 +83,11 @@ class TestCacheStatsExecution:
         self.cache_tools.register_tools()
 
     @pytest.mark.asyncio
+    @patch("src.application.tools.cache_tools.get_global_session_pool")
     @patch("src.application.tools.cache_tools.get_global_cache")
-    async def test_returns_cache_stats(self, mock_get_cache):
+    async def test_returns_cache_stats(self, mock_get_cache, mock_get_pool):
         """Should return cache statistics."""
+        mock_get_pool.return_value = HTTPSessionPool(base_url="https://api.example.com")
         mock_cache = MagicMock()
         mock_cache.get_stats = AsyncMock(
             return_value={
@@ -105,6 +108,13 @@ class TestCacheStatsExecution:
 
         assert result["size"] == 10
         assert result["metrics"]["hits"] == 100
+        assert "coalesced" in result["single_flight"]
+        assert "throttled" in result["rate_limiter"]
+        assert result["circuit_breakers"] == {}
+        assert result["hedging"]["enabled"] is False
+        assert result["negative_cache"]["saved_calls"] == 0
+        assert result["session_pool"]["pending_acquisitions"] == 0
+        assert result["session_pool"]["acquisition_wait_ms"]["count"] == 0
         mock_cache.get_stats.assert_called_once()
 
 
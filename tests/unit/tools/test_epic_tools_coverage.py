@@ -24,7 +24,7 @@ def epic_tools_instance():
     """Crea una instancia de EpicTools con mocks."""
     mcp = FastMCP("Test")
 
-    with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_client_cls:
+    with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_cls:
         mock_client = MagicMock()
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -40,10 +40,20 @@ def epic_tools_instance():
 class TestListEpicsErrorHandling:
     """Tests para manejo de errores en list_epics."""
 
+    @pytest.mark.asyncio
+    async def test_list_epics_rejects_limit_below_one(self, epic_tools_instance):
+        """Test que list_epics rechace limit < 1 sin llamar a la API."""
+        with pytest.raises(ToolError, match="limit must be greater than 0"):
+            await epic_tools_instance.list_epics(
+                auth_token="token", auto_paginate=False, limit=0, project=123
+            )
+
+        epic_tools_instance._mock_client_cls.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_list_epics_authentication_error(self, epic_tools_instance):
         """Test que list_epics maneja AuthenticationError correctamente."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -53,7 +63,7 @@ class TestListEpicsErrorHandling:
             from src.infrastructure.pagination import AutoPaginator
 
             with patch.object(
-                AutoPaginator, "paginate", side_effect=AuthenticationError("Invalid token")
+                AutoPaginator, "collect", side_effect=AuthenticationError("Invalid token")
             ):
                 with pytest.raises(ToolError) as exc_info:
                     await epic_tools_instance.list_epics(auth_token="invalid", project=123)
@@ -62,7 +72,7 @@ class TestListEpicsErrorHandling:
     @pytest.mark.asyncio
     async def test_list_epics_permission_denied_error(self, epic_tools_instance):
         """Test que list_epics maneja PermissionDeniedError correctamente."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -71,7 +81,7 @@ class TestListEpicsErrorHandling:
             from src.infrastructure.pagination import AutoPaginator
 
             with patch.object(
-                AutoPaginator, "paginate", side_effect=PermissionDeniedError("No access")
+                AutoPaginator, "collect", side_effect=PermissionDeniedError("No access")
             ):
                 with pytest.raises(ToolError) as exc_info:
                     await epic_tools_instance.list_epics(auth_token="token", project=123)
@@ -80,7 +90,7 @@ class TestListEpicsErrorHandling:
     @pytest.mark.asyncio
     async def test_list_epics_resource_not_found_error(self, epic_tools_instance):
         """Test que list_epics maneja ResourceNotFoundError correctamente."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -89,7 +99,7 @@ class TestListEpicsErrorHandling:
             from src.infrastructure.pagination import AutoPaginator
 
             with patch.object(
-                AutoPaginator, "paginate", side_effect=ResourceNotFoundError("Not found")
+                AutoPaginator, "collect", side_effect=ResourceNotFoundError("Not found")
             ):
                 with pytest.raises(ToolError) as exc_info:
                     await epic_tools_instance.list_epics(auth_token="token", project=999)
@@ -98,7 +108,7 @@ class TestListEpicsErrorHandling:
     @pytest.mark.asyncio
     async def test_list_epics_generic_error(self, epic_tools_instance):
         """Test que list_epics maneja excepciones genéricas."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -106,7 +116,7 @@ class TestListEpicsErrorHandling:
 
             from src.infrastructure.pagination import AutoPaginator
 
-            with patch.object(AutoPaginator, "paginate", side_effect=Exception("Network error")):
+            with patch.object(AutoPaginator, "collect", side_effect=Exception("Network error")):
                 with pytest.raises(ToolError) as exc_info:
                     await epic_tools_instance.list_epics(auth_token="token", project=123)
                 assert "Error listing epics" in str(exc_info.value)
@@ -114,7 +124,7 @@ class TestListEpicsErrorHandling:
     @pytest.mark.asyncio
     async def test_list_epics_without_auto_paginate(self, epic_tools_instance):
         """Test list_epics con auto_paginate=False."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -136,7 +146,7 @@ class TestListEpicsErrorHandling:
     @pytest.mark.asyncio
     async def test_list_epics_with_all_filters(self, epic_tools_instance):
         """Test list_epics con todos los filtros activos."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -146,7 +156,7 @@ class TestListEpicsErrorHandling:
 
             with patch.object(
                 AutoPaginator,
-                "paginate",
+                "collect",
                 return_value=[
                     {
                         "id": 1,
@@ -200,7 +210,7 @@ class TestCreateEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_create_epic_with_all_parameters(self, epic_tools_instance):
         """Test create_epic con todos los parámetros opcionales."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -246,7 +256,7 @@ class TestGetEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_get_epic_authentication_error(self, epic_tools_instance):
         """Test que get_epic maneja AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -260,7 +270,7 @@ class TestGetEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_get_epic_permission_denied(self, epic_tools_instance):
         """Test que get_epic maneja PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -274,7 +284,7 @@ class TestGetEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_get_epic_not_found(self, epic_tools_instance):
         """Test que get_epic maneja ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -288,7 +298,7 @@ class TestGetEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_get_epic_concurrency_error(self, epic_tools_instance):
         """Test que get_epic maneja ConcurrencyError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -302,7 +312,7 @@ class TestGetEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_get_epic_generic_error(self, epic_tools_instance):
         """Test que get_epic maneja excepciones genéricas."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -320,7 +330,7 @@ class TestGetEpicByRefErrorHandling:
     @pytest.mark.asyncio
     async def test_get_epic_by_ref_authentication_error(self, epic_tools_instance):
         """Test que get_epic_by_ref maneja AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -334,7 +344,7 @@ class TestGetEpicByRefErrorHandling:
     @pytest.mark.asyncio
     async def test_get_epic_by_ref_permission_denied(self, epic_tools_instance):
         """Test que get_epic_by_ref maneja PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -348,7 +358,7 @@ class TestGetEpicByRefErrorHandling:
     @pytest.mark.asyncio
     async def test_get_epic_by_ref_not_found(self, epic_tools_instance):
         """Test que get_epic_by_ref maneja ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -364,7 +374,7 @@ class TestGetEpicByRefErrorHandling:
     @pytest.mark.asyncio
     async def test_get_epic_by_ref_generic_error(self, epic_tools_instance):
         """Test que get_epic_by_ref maneja excepciones genéricas."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -398,7 +408,7 @@ class TestUpdateEpicFullErrorHandling:
     @pytest.mark.asyncio
     async def test_update_epic_full_concurrency_error(self, epic_tools_instance):
         """Test que update_epic_full maneja ConcurrencyError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -414,7 +424,7 @@ class TestUpdateEpicFullErrorHandling:
     @pytest.mark.asyncio
     async def test_update_epic_full_authentication_error(self, epic_tools_instance):
         """Test que update_epic_full maneja AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -430,7 +440,7 @@ class TestUpdateEpicFullErrorHandling:
     @pytest.mark.asyncio
     async def test_update_epic_full_permission_denied(self, epic_tools_instance):
         """Test que update_epic_full maneja PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -446,7 +456,7 @@ class TestUpdateEpicFullErrorHandling:
     @pytest.mark.asyncio
     async def test_update_epic_full_not_found(self, epic_tools_instance):
         """Test que update_epic_full maneja ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -473,7 +483,7 @@ class TestUpdateEpicFullErrorHandling:
     @pytest.mark.asyncio
     async def test_update_epic_full_generic_error(self, epic_tools_instance):
         """Test que update_epic_full maneja excepciones genéricas."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -493,7 +503,7 @@ class TestUpdateEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_update_epic_partial_mode(self, epic_tools_instance):
         """Test que update_epic usa modo parcial sin subject/project/version."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -520,7 +530,7 @@ class TestUpdateEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_update_epic_full_mode(self, epic_tools_instance):
         """Test que update_epic usa modo full con subject/project/version."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -545,7 +555,7 @@ class TestUpdateEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_update_epic_concurrency_error(self, epic_tools_instance):
         """Test que update_epic maneja ConcurrencyError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -559,7 +569,7 @@ class TestUpdateEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_update_epic_authentication_error(self, epic_tools_instance):
         """Test que update_epic maneja AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -573,7 +583,7 @@ class TestUpdateEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_update_epic_permission_denied(self, epic_tools_instance):
         """Test que update_epic maneja PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -587,7 +597,7 @@ class TestUpdateEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_update_epic_not_found(self, epic_tools_instance):
         """Test que update_epic maneja ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -612,7 +622,7 @@ class TestUpdateEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_update_epic_generic_error(self, epic_tools_instance):
         """Test que update_epic maneja excepciones genéricas."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -658,7 +668,7 @@ class TestDeleteEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_delete_epic_authentication_error(self, epic_tools_instance):
         """Test que delete_epic maneja AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -672,7 +682,7 @@ class TestDeleteEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_delete_epic_permission_denied(self, epic_tools_instance):
         """Test que delete_epic maneja PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -686,7 +696,7 @@ class TestDeleteEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_delete_epic_not_found(self, epic_tools_instance):
         """Test que delete_epic maneja ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -700,7 +710,7 @@ class TestDeleteEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_delete_epic_generic_error(self, epic_tools_instance):
         """Test que delete_epic maneja excepciones genéricas."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -714,7 +724,7 @@ class TestDeleteEpicErrorHandling:
     @pytest.mark.asyncio
     async def test_delete_epic_success(self, epic_tools_instance):
         """Test delete_epic exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -795,7 +805,7 @@ class TestCreateEpicRelatedUserstory:
     @pytest.mark.asyncio
     async def test_create_epic_related_userstory_success(self, epic_tools_instance):
         """Test create_epic_related_userstory exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -883,7 +893,7 @@ class TestGetEpicRelatedUserstory:
     @pytest.mark.asyncio
     async def test_get_epic_related_userstory_success(self, epic_tools_instance):
         """Test get_epic_related_userstory exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -906,7 +916,7 @@ class TestUpdateEpicRelatedUserstory:
     @pytest.mark.asyncio
     async def test_update_epic_related_userstory_success(self, epic_tools_instance):
         """Test update_epic_related_userstory exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -928,7 +938,7 @@ class TestDeleteEpicRelatedUserstory:
     @pytest.mark.asyncio
     async def test_delete_epic_related_userstory_success(self, epic_tools_instance):
         """Test delete_epic_related_userstory exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -953,7 +963,7 @@ class TestBulkCreateEpics:
     @pytest.mark.asyncio
     async def test_bulk_create_epics_with_bulk_epics_success(self, epic_tools_instance):
         """Test bulk_create_epics con bulk_epics string exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -977,7 +987,7 @@ class TestBulkCreateEpics:
     @pytest.mark.asyncio
     async def test_bulk_create_epics_with_epics_data_success(self, epic_tools_instance):
         """Test bulk_create_epics con epics_data list exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -998,7 +1008,7 @@ class TestBulkCreateEpics:
     @pytest.mark.asyncio
     async def test_bulk_create_epics_auth_error(self, epic_tools_instance):
         """Test bulk_create_epics con AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1014,7 +1024,7 @@ class TestBulkCreateEpics:
     @pytest.mark.asyncio
     async def test_bulk_create_epics_permission_error(self, epic_tools_instance):
         """Test bulk_create_epics con PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1032,7 +1042,7 @@ class TestBulkCreateEpics:
     @pytest.mark.asyncio
     async def test_bulk_create_epics_generic_error(self, epic_tools_instance):
         """Test bulk_create_epics con error genérico."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1052,7 +1062,7 @@ class TestBulkCreateRelatedUserstories:
     @pytest.mark.asyncio
     async def test_bulk_create_related_userstories_with_bulk_userstories(self, epic_tools_instance):
         """Test bulk_create_related_userstories con bulk_userstories."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1072,7 +1082,7 @@ class TestBulkCreateRelatedUserstories:
     @pytest.mark.asyncio
     async def test_bulk_create_related_userstories_with_userstories_data(self, epic_tools_instance):
         """Test bulk_create_related_userstories con userstories_data."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1090,7 +1100,7 @@ class TestBulkCreateRelatedUserstories:
     @pytest.mark.asyncio
     async def test_bulk_create_related_userstories_fallback(self, epic_tools_instance):
         """Test bulk_create_related_userstories con fallback a bulk_create_epic_related_userstories."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1113,7 +1123,7 @@ class TestBulkCreateRelatedUserstories:
         self, epic_tools_instance
     ):
         """Test bulk_create_related_userstories fallback con userstories_data."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1133,7 +1143,7 @@ class TestBulkCreateRelatedUserstories:
     @pytest.mark.asyncio
     async def test_bulk_create_related_userstories_auth_error(self, epic_tools_instance):
         """Test bulk_create_related_userstories con AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1151,7 +1161,7 @@ class TestBulkCreateRelatedUserstories:
     @pytest.mark.asyncio
     async def test_bulk_create_related_userstories_permission_error(self, epic_tools_instance):
         """Test bulk_create_related_userstories con PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1169,7 +1179,7 @@ class TestBulkCreateRelatedUserstories:
     @pytest.mark.asyncio
     async def test_bulk_create_related_userstories_not_found(self, epic_tools_instance):
         """Test bulk_create_related_userstories con ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1187,7 +1197,7 @@ class TestBulkCreateRelatedUserstories:
     @pytest.mark.asyncio
     async def test_bulk_create_related_userstories_generic_error(self, epic_tools_instance):
         """Test bulk_create_related_userstories con error genérico."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1229,7 +1239,7 @@ class TestGetEpicFilters:
     @pytest.mark.asyncio
     async def test_get_epic_filters_success(self, epic_tools_instance):
         """Test get_epic_filters exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1249,7 +1259,7 @@ class TestGetEpicFilters:
     @pytest.mark.asyncio
     async def test_get_epic_filters_auth_error(self, epic_tools_instance):
         """Test get_epic_filters con AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1263,7 +1273,7 @@ class TestGetEpicFilters:
     @pytest.mark.asyncio
     async def test_get_epic_filters_permission_error(self, epic_tools_instance):
         """Test get_epic_filters con PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1277,7 +1287,7 @@ class TestGetEpicFilters:
     @pytest.mark.asyncio
     async def test_get_epic_filters_not_found(self, epic_tools_instance):
         """Test get_epic_filters con ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1291,7 +1301,7 @@ class TestGetEpicFilters:
     @pytest.mark.asyncio
     async def test_get_epic_filters_generic_error(self, epic_tools_instance):
         """Test get_epic_filters con error genérico."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1314,7 +1324,7 @@ class TestUpvoteEpic:
     @pytest.mark.asyncio
     async def test_upvote_epic_success(self, epic_tools_instance):
         """Test upvote_epic exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1328,7 +1338,7 @@ class TestUpvoteEpic:
     @pytest.mark.asyncio
     async def test_upvote_epic_auth_error(self, epic_tools_instance):
         """Test upvote_epic con AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1342,7 +1352,7 @@ class TestUpvoteEpic:
     @pytest.mark.asyncio
     async def test_upvote_epic_permission_error(self, epic_tools_instance):
         """Test upvote_epic con PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1356,7 +1366,7 @@ class TestUpvoteEpic:
     @pytest.mark.asyncio
     async def test_upvote_epic_not_found(self, epic_tools_instance):
         """Test upvote_epic con ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1370,7 +1380,7 @@ class TestUpvoteEpic:
     @pytest.mark.asyncio
     async def test_upvote_epic_generic_error(self, epic_tools_instance):
         """Test upvote_epic con error genérico."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1388,7 +1398,7 @@ class TestDownvoteEpic:
     @pytest.mark.asyncio
     async def test_downvote_epic_success(self, epic_tools_instance):
         """Test downvote_epic exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1402,7 +1412,7 @@ class TestDownvoteEpic:
     @pytest.mark.asyncio
     async def test_downvote_epic_auth_error(self, epic_tools_instance):
         """Test downvote_epic con AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1416,7 +1426,7 @@ class TestDownvoteEpic:
     @pytest.mark.asyncio
     async def test_downvote_epic_permission_error(self, epic_tools_instance):
         """Test downvote_epic con PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1430,7 +1440,7 @@ class TestDownvoteEpic:
     @pytest.mark.asyncio
     async def test_downvote_epic_not_found(self, epic_tools_instance):
         """Test downvote_epic con ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1444,7 +1454,7 @@ class TestDownvoteEpic:
     @pytest.mark.asyncio
     async def test_downvote_epic_generic_error(self, epic_tools_instance):
         """Test downvote_epic con error genérico."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1462,7 +1472,7 @@ class TestGetEpicVoters:
     @pytest.mark.asyncio
     async def test_get_epic_voters_success(self, epic_tools_instance):
         """Test get_epic_voters exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1478,7 +1488,7 @@ class TestGetEpicVoters:
     @pytest.mark.asyncio
     async def test_get_epic_voters_auth_error(self, epic_tools_instance):
         """Test get_epic_voters con AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1492,7 +1502,7 @@ class TestGetEpicVoters:
     @pytest.mark.asyncio
     async def test_get_epic_voters_permission_error(self, epic_tools_instance):
         """Test get_epic_voters con PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1506,7 +1516,7 @@ class TestGetEpicVoters:
     @pytest.mark.asyncio
     async def test_get_epic_voters_not_found(self, epic_tools_instance):
         """Test get_epic_voters con ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1520,7 +1530,7 @@ class TestGetEpicVoters:
     @pytest.mark.asyncio
     async def test_get_epic_voters_generic_error(self, epic_tools_instance):
         """Test get_epic_voters con error genérico."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1543,7 +1553,7 @@ class TestWatchEpic:
     @pytest.mark.asyncio
     async def test_watch_epic_success(self, epic_tools_instance):
         """Test watch_epic exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1557,7 +1567,7 @@ class TestWatchEpic:
     @pytest.mark.asyncio
     async def test_watch_epic_auth_error(self, epic_tools_instance):
         """Test watch_epic con AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1571,7 +1581,7 @@ class TestWatchEpic:
     @pytest.mark.asyncio
     async def test_watch_epic_permission_error(self, epic_tools_instance):
         """Test watch_epic con PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1585,7 +1595,7 @@ class TestWatchEpic:
     @pytest.mark.asyncio
     async def test_watch_epic_not_found(self, epic_tools_instance):
         """Test watch_epic con ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1599,7 +1609,7 @@ class TestWatchEpic:
     @pytest.mark.asyncio
     async def test_watch_epic_generic_error(self, epic_tools_instance):
         """Test watch_epic con error genérico."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1617,7 +1627,7 @@ class TestUnwatchEpic:
     @pytest.mark.asyncio
     async def test_unwatch_epic_success(self, epic_tools_instance):
         """Test unwatch_epic exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1631,7 +1641,7 @@ class TestUnwatchEpic:
     @pytest.mark.asyncio
     async def test_unwatch_epic_auth_error(self, epic_tools_instance):
         """Test unwatch_epic con AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1645,7 +1655,7 @@ class TestUnwatchEpic:
     @pytest.mark.asyncio
     async def test_unwatch_epic_permission_error(self, epic_tools_instance):
         """Test unwatch_epic con PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1659,7 +1669,7 @@ class TestUnwatchEpic:
     @pytest.mark.asyncio
     async def test_unwatch_epic_not_found(self, epic_tools_instance):
         """Test unwatch_epic con ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1673,7 +1683,7 @@ class TestUnwatchEpic:
     @pytest.mark.asyncio
     async def test_unwatch_epic_generic_error(self, epic_tools_instance):
         """Test unwatch_epic con error genérico."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1691,7 +1701,7 @@ class TestGetEpicWatchers:
     @pytest.mark.asyncio
     async def test_get_epic_watchers_success(self, epic_tools_instance):
         """Test get_epic_watchers exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1707,7 +1717,7 @@ class TestGetEpicWatchers:
     @pytest.mark.asyncio
     async def test_get_epic_watchers_auth_error(self, epic_tools_instance):
         """Test get_epic_watchers con AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1721,7 +1731,7 @@ class TestGetEpicWatchers:
     @pytest.mark.asyncio
     async def test_get_epic_watchers_permission_error(self, epic_tools_instance):
         """Test get_epic_watchers con PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1737,7 +1747,7 @@ class TestGetEpicWatchers:
     @pytest.mark.asyncio
     async def test_get_epic_watchers_not_found(self, epic_tools_instance):
         """Test get_epic_watchers con ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1753,7 +1763,7 @@ class TestGetEpicWatchers:
     @pytest.mark.asyncio
     async def test_get_epic_watchers_generic_error(self, epic_tools_instance):
         """Test get_epic_watchers con error genérico."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1776,7 +1786,7 @@ class TestListEpicAttachments:
     @pytest.mark.asyncio
     async def test_list_epic_attachments_success(self, epic_tools_instance):
         """Test list_epic_attachments exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1796,7 +1806,7 @@ class TestListEpicAttachments:
     @pytest.mark.asyncio
     async def test_list_epic_attachments_auth_error(self, epic_tools_instance):
         """Test list_epic_attachments con AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1812,7 +1822,7 @@ class TestListEpicAttachments:
     @pytest.mark.asyncio
     async def test_list_epic_attachments_permission_error(self, epic_tools_instance):
         """Test list_epic_attachments con PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1828,7 +1838,7 @@ class TestListEpicAttachments:
     @pytest.mark.asyncio
     async def test_list_epic_attachments_not_found(self, epic_tools_instance):
         """Test list_epic_attachments con ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1844,7 +1854,7 @@ class TestListEpicAttachments:
     @pytest.mark.asyncio
     async def test_list_epic_attachments_generic_error(self, epic_tools_instance):
         """Test list_epic_attachments con error genérico."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1862,7 +1872,7 @@ class TestCreateEpicAttachment:
     @pytest.mark.asyncio
     async def test_create_epic_attachment_success(self, epic_tools_instance):
         """Test create_epic_attachment exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1881,7 +1891,7 @@ class TestCreateEpicAttachment:
     @pytest.mark.asyncio
     async def test_create_epic_attachment_with_object_id(self, epic_tools_instance):
         """Test create_epic_attachment usando object_id en lugar de epic_id."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1891,15 +1901,18 @@ class TestCreateEpicAttachment:
             mock_cls.return_value = mock_client
 
             result = await epic_tools_instance.create_epic_attachment(
-                auth_token="token", object_id=5, attached_file="/path/to/file.pdf"
+                auth_token="token", object_id=5, project=3, attached_file="/path/to/file.pdf"
             )
 
             assert result["id"] == 2
+            mock_client.create_epic_attachment.assert_awaited_once_with(
+                epic_id=5, project_id=3, attached_file="/path/to/file.pdf"
+            )
 
     @pytest.mark.asyncio
     async def test_create_epic_attachment_auth_error(self, epic_tools_instance):
         """Test create_epic_attachment con AuthenticationError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1917,7 +1930,7 @@ class TestCreateEpicAttachment:
     @pytest.mark.asyncio
     async def test_create_epic_attachment_permission_error(self, epic_tools_instance):
         """Test create_epic_attachment con PermissionDeniedError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1935,7 +1948,7 @@ class TestCreateEpicAttachment:
     @pytest.mark.asyncio
     async def test_create_epic_attachment_not_found(self, epic_tools_instance):
         """Test create_epic_attachment con ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1953,7 +1966,7 @@ class TestCreateEpicAttachment:
     @pytest.mark.asyncio
     async def test_create_epic_attachment_generic_error(self, epic_tools_instance):
         """Test create_epic_attachment con error genérico."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1973,7 +1986,7 @@ class TestGetEpicAttachment:
     @pytest.mark.asyncio
     async def test_get_epic_attachment_success(self, epic_tools_instance):
         """Test get_epic_attachment exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1996,7 +2009,7 @@ class TestUpdateEpicAttachment:
     @pytest.mark.asyncio
     async def test_update_epic_attachment_success(self, epic_tools_instance):
         """Test update_epic_attachment exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2024,7 +2037,7 @@ class TestDeleteEpicAttachment:
     @pytest.mark.asyncio
     async def test_delete_epic_attachment_success(self, epic_tools_instance):
         """Test delete_epic_attachment exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2050,7 +2063,7 @@ class TestListEpicCustomAttributes:
     @pytest.mark.asyncio
     async def test_list_epic_custom_attributes_success(self, epic_tools_instance):
         """Test list_epic_custom_attributes exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2076,7 +2089,7 @@ class TestCreateEpicCustomAttribute:
     @pytest.mark.asyncio
     async def test_create_epic_custom_attribute_success(self, epic_tools_instance):
         """Test create_epic_custom_attribute exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2099,7 +2112,7 @@ class TestGetEpicCustomAttributeValues:
     @pytest.mark.asyncio
     async def test_get_epic_custom_attribute_values_success(self, epic_tools_instance):
         """Test get_epic_custom_attribute_values exitoso."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2133,7 +2146,7 @@ class TestMCPToolFunctionsWithOptionalParams:
         """Test taiga_list_epics con parámetros opcionales."""
         mcp = FastMCP("Test")
 
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2144,7 +2157,7 @@ class TestMCPToolFunctionsWithOptionalParams:
             # Mock pagination
             from src.infrastructure.pagination import AutoPaginator
 
-            with patch.object(AutoPaginator, "paginate", new_callable=AsyncMock) as mock_paginate:
+            with patch.object(AutoPaginator, "collect", new_callable=AsyncMock) as mock_paginate:
                 mock_paginate.return_value = [{"id": 1, "subject": "Epic", "ref": 1}]
 
                 # Acceder al tool registrado
@@ -2169,7 +2182,7 @@ class TestMCPToolFunctionsWithOptionalParams:
         """Test taiga_create_epic con todos los parámetros opcionales."""
         mcp = FastMCP("Test")
 
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2205,7 +2218,7 @@ class TestMCPToolFunctionsWithOptionalParams:
         """Test taiga_update_epic con todos los parámetros opcionales."""
         mcp = FastMCP("Test")
 
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2247,7 +2260,7 @@ class TestMCPToolFunctionsWithOptionalParams:
         """Test taiga_update_epic_partial con todos los parámetros opcionales."""
         mcp = FastMCP("Test")
 
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2296,7 +2309,7 @@ class TestSuccessPaths:
     @pytest.mark.asyncio
     async def test_get_epic_success_path(self, epic_tools_instance):
         """Test get_epic path de éxito completo."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2313,7 +2326,7 @@ class TestSuccessPaths:
     @pytest.mark.asyncio
     async def test_get_epic_by_ref_success_path(self, epic_tools_instance):
         """Test get_epic_by_ref path de éxito completo."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2332,7 +2345,7 @@ class TestSuccessPaths:
     @pytest.mark.asyncio
     async def test_list_epic_related_userstories_success(self, epic_tools_instance):
         """Test list_epic_related_userstories path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2354,7 +2367,7 @@ class TestSuccessPaths:
     @pytest.mark.asyncio
     async def test_create_epic_success_path(self, epic_tools_instance):
         """Test create_epic path de éxito completo."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2373,7 +2386,7 @@ class TestSuccessPaths:
     @pytest.mark.asyncio
     async def test_create_epic_generic_exception(self, epic_tools_instance):
         """Test create_epic con excepción genérica."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2393,7 +2406,7 @@ class TestListRelatedUserstoriesSuccessPaths:
     @pytest.mark.asyncio
     async def test_list_related_userstories_success(self, epic_tools_instance):
         """Test list_related_userstories path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2411,7 +2424,7 @@ class TestListRelatedUserstoriesSuccessPaths:
     @pytest.mark.asyncio
     async def test_list_related_userstories_not_found(self, epic_tools_instance):
         """Test list_related_userstories con ResourceNotFoundError."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2431,7 +2444,7 @@ class TestMoreSuccessPaths:
     @pytest.mark.asyncio
     async def test_update_epic_full_success(self, epic_tools_instance):
         """Test update_epic_full path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2458,7 +2471,7 @@ class TestMoreSuccessPaths:
     @pytest.mark.asyncio
     async def test_update_epic_partial_success(self, epic_tools_instance):
         """Test update_epic_partial path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2482,7 +2495,7 @@ class TestMoreSuccessPaths:
     @pytest.mark.asyncio
     async def test_delete_epic_success(self, epic_tools_instance):
         """Test delete_epic path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2496,7 +2509,7 @@ class TestMoreSuccessPaths:
     @pytest.mark.asyncio
     async def test_create_related_userstory_success(self, epic_tools_instance):
         """Test create_related_userstory path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2514,7 +2527,7 @@ class TestMoreSuccessPaths:
     @pytest.mark.asyncio
     async def test_bulk_create_epics_success(self, epic_tools_instance):
         """Test bulk_create_epics path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2535,7 +2548,7 @@ class TestMoreSuccessPaths:
     @pytest.mark.asyncio
     async def test_get_epic_filters_success(self, epic_tools_instance):
         """Test get_epic_filters path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2554,7 +2567,7 @@ class TestMoreSuccessPaths:
     @pytest.mark.asyncio
     async def test_upvote_epic_success(self, epic_tools_instance):
         """Test upvote_epic path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2568,7 +2581,7 @@ class TestMoreSuccessPaths:
     @pytest.mark.asyncio
     async def test_downvote_epic_success(self, epic_tools_instance):
         """Test downvote_epic path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2582,7 +2595,7 @@ class TestMoreSuccessPaths:
     @pytest.mark.asyncio
     async def test_get_epic_voters_success(self, epic_tools_instance):
         """Test get_epic_voters path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2596,7 +2609,7 @@ class TestMoreSuccessPaths:
     @pytest.mark.asyncio
     async def test_watch_epic_success(self, epic_tools_instance):
         """Test watch_epic path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2610,7 +2623,7 @@ class TestMoreSuccessPaths:
     @pytest.mark.asyncio
     async def test_unwatch_epic_success(self, epic_tools_instance):
         """Test unwatch_epic path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2624,7 +2637,7 @@ class TestMoreSuccessPaths:
     @pytest.mark.asyncio
     async def test_get_epic_watchers_success(self, epic_tools_instance):
         """Test get_epic_watchers path de éxito."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2689,7 +2702,7 @@ class TestMCPToolWrappersWithOptionalParams:
     @pytest.mark.asyncio
     async def test_create_epic_related_userstory_tool_with_order(self, epic_tools_instance):
         """Test create_epic_related_userstory_tool con parámetro order."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2745,7 +2758,7 @@ class TestMCPToolWrappersWithOptionalParams:
     @pytest.mark.asyncio
     async def test_create_epic_attachment_tool_with_description(self, epic_tools_instance):
         """Test create_epic_attachment_tool con parámetro description."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2762,15 +2775,25 @@ class TestMCPToolWrappersWithOptionalParams:
 
             tool = await epic_tools_instance.mcp.get_tool("taiga_create_epic_attachment")
             result = await tool.fn(
-                auth_token="token", epic_id=10, file="base64_content", description="Important doc"
+                auth_token="token",
+                epic_id=10,
+                project_id=5,
+                attached_file="/path/to/file.pdf",
+                description="Important doc",
             )
 
             assert result["description"] == "Important doc"
+            mock_client.create_epic_attachment.assert_awaited_once_with(
+                epic_id=10,
+                project_id=5,
+                attached_file="/path/to/file.pdf",
+                description="Important doc",
+            )
 
     @pytest.mark.asyncio
     async def test_update_epic_attachment_tool_with_description(self, epic_tools_instance):
         """Test update_epic_attachment_tool con parámetro description."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2787,7 +2810,7 @@ class TestMCPToolWrappersWithOptionalParams:
     @pytest.mark.asyncio
     async def test_create_epic_custom_attribute_tool_with_all_params(self, epic_tools_instance):
         """Test create_epic_custom_attribute_tool con todos los parámetros."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2817,7 +2840,7 @@ class TestMCPToolWrappersWithOptionalParams:
     @pytest.mark.asyncio
     async def test_get_epic_tool_wrapper(self, epic_tools_instance):
         """Test get_epic_tool wrapper (line 245)."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2834,7 +2857,7 @@ class TestMCPToolWrappersWithOptionalParams:
     @pytest.mark.asyncio
     async def test_get_epic_by_ref_tool_wrapper(self, epic_tools_instance):
         """Test get_epic_by_ref_tool wrapper (line 295)."""
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2861,7 +2884,7 @@ class TestValidationErrorHandling:
         """
         from src.domain.exceptions import ValidationError as DomainValidationError
 
-        with patch("src.application.tools.epic_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -8,6 +8,7 @@ Cubre:
 - Exception handlers en métodos directos
 """
 
+import inspect
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -16,13 +17,14 @@ from fastmcp.exceptions import ToolError
 
 from src.application.tools.issue_tools import IssueTools
 from src.domain.exceptions import ValidationError
+from src.taiga_client import TaigaAPIClient
 
 
 @pytest.fixture
 def issue_tools_instance():
     """Fixture que crea una instancia de IssueTools con mock del cliente."""
     mcp = FastMCP("Test")
-    with patch("src.application.tools.issue_tools.TaigaAPIClient") as mock_client_cls:
+    with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_cls:
         mock_client = MagicMock()
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -43,7 +45,7 @@ class TestListIssuesRegisteredTool:
     async def test_list_issues_registered_tool_success(self, issue_tools_instance):
         """Verifica list_issues registrada con auto_paginate=True."""
         paginator_mock = MagicMock()
-        paginator_mock.paginate = AsyncMock(
+        paginator_mock.collect = AsyncMock(
             return_value=[
                 {"id": 1, "ref": 1, "subject": "Test Issue"},
                 {"id": 2, "ref": 2, "subject": "Another Issue"},
@@ -58,7 +60,7 @@ class TestListIssuesRegisteredTool:
             result = await list_issues_tool.fn(auth_token="token", project_id=123)
 
             assert len(result) == 2
-            paginator_mock.paginate.assert_called_once()
+            paginator_mock.collect.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_list_issues_registered_auto_paginate_false(self, issue_tools_instance):
@@ -83,7 +85,7 @@ class TestListIssuesRegisteredTool:
     async def test_list_issues_with_all_filters(self, issue_tools_instance):
         """Verifica list_issues con todos los filtros posibles."""
         paginator_mock = MagicMock()
-        paginator_mock.paginate = AsyncMock(return_value=[])
+        paginator_mock.collect = AsyncMock(return_value=[])
 
         with patch("src.application.tools.issue_tools.AutoPaginator", return_value=paginator_mock):
             tools = await issue_tools_instance.mcp.get_tools()
@@ -107,7 +109,38 @@ class TestListIssuesRegisteredTool:
                 exclude_tags=["wontfix"],
             )
 
-            paginator_mock.paginate.assert_called_once()
+            paginator_mock.collect.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_list_issues_passes_limit_to_stream(self, issue_tools_instance):
+        """Verifica que limit se pasa al pipeline para cortar la paginación."""
+        paginator_mock = MagicMock()
+        paginator_mock.collect = AsyncMock(return_value=[{"id": 1}])
+
+        with patch("src.application.tools.issue_tools.AutoPaginator", return_value=paginator_mock):
+            tools = await issue_tools_instance.mcp.get_tools()
+            list_issues_tool = tools["taiga_list_issues"]
+
+            await list_issues_tool.fn(auth_token="token", project_id=123, limit=5)
+
+            call_kwargs = paginator_mock.collect.call_args.kwargs
+            assert call_kwargs["limit"] == 5
+            assert "limit" not in call_kwargs["params"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("auto_paginate", [True, False])
+    async def test_list_issues_rejects_limit_below_one(self, issue_tools_instance, auto_paginate):
+        """Verifica que limit < 1 se rechace antes de llamar a la API."""
+        with patch("src.application.tools.issue_tools.AutoPaginator") as paginator_cls:
+            tools = await issue_tools_instance.mcp.get_tools()
+            list_issues_tool = tools["taiga_list_issues"]
+
+            with pytest.raises(ToolError, match="limit must be greater than 0"):
+                await list_issues_tool.fn(
+                    auth_token="token", project_id=123, auto_paginate=auto_paginate, limit=-1
+                )
+
+            paginator_cls.assert_not_called()
 
 
 class TestCreateIssueRegisteredTool:
@@ -494,12 +527,30 @@ class TestIssueAttachmentsRegisteredTools:
         result = await tool.fn(
             auth_token="token",
             issue_id=456,
-            file=b"content",
-            filename="file.pdf",
+            project_id=123,
+            attached_file="/tmp/file.pdf",
             description="Test file",
         )
 
         assert result["name"] == "file.pdf"
+        issue_tools_instance._mock_client.create_issue_attachment.assert_awaited_once_with(
+            object_id=456, project=123, attached_file="/tmp/file.pdf", description="Test file"
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_issue_attachment_matches_client_signature(self, issue_tools_instance):
+        """Verifica que la herramienta llame al cliente con argumentos que este acepta."""
+        issue_tools_instance._mock_client.create_issue_attachment = AsyncMock(
+            return_value={"id": 1}
+        )
+
+        tools = await issue_tools_instance.mcp.get_tools()
+        await tools["taiga_create_issue_attachment"].fn(
+            auth_token="token", issue_id=456, project_id=123, attached_file="/tmp/file.pdf"
+        )
+
+        call = issue_tools_instance._mock_client.create_issue_attachment.await_args
+        inspect.signature(TaigaAPIClient.create_issue_attachment).bind(None, **call.kwargs)
 
     @pytest.mark.asyncio
     async def test_get_issue_attachment_registered(self, issue_tools_instance):
@@ -911,7 +962,7 @@ class TestAttachmentMethodsExceptionHandlers:
 
         with pytest.raises(RuntimeError, match="Create attachment failed"):
             await issue_tools_instance.create_issue_attachment(
-                auth_token="token", issue_id=456, file=b"content", filename="test.txt"
+                auth_token="token", issue_id=456, project_id=123, attached_file="/tmp/test.txt"
             )
 
     @pytest.mark.asyncio
@@ -725,9 +725,7 @@ class TestMembershipToolsExceptionHandlers:
         )
 
         with (
-            patch(
-                "src.application.tools.membership_tools.TaigaAPIClient", return_value=mock_client
-            ),
+            patch("src.infrastructure.client_factory.TaigaAPIClient", return_value=mock_client),
             pytest.raises(ToolError, match="already a member"),
         ):
             await membership_tools.create_membership(
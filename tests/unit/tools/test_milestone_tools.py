@@ -577,9 +577,7 @@ class TestMilestoneToolsCoverage:
         mock_client.__aexit__ = AsyncMock(return_value=None)
         mock_client.delete_milestone = AsyncMock(return_value=None)
 
-        with patch(
-            "src.application.tools.milestone_tools.TaigaAPIClient", return_value=mock_client
-        ):
+        with patch("src.infrastructure.client_factory.TaigaAPIClient", return_value=mock_client):
             result = await milestone_tools.delete_milestone(auth_token="token", milestone_id=123)
 
         assert "success" in result
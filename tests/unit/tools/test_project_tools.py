@@ -924,7 +924,7 @@ class TestProjectToolsExceptionHandling:
         project_tools.register_tools()
 
         # Mock TaigaAPIClient para lanzar AuthenticationError
-        with patch("src.application.tools.project_tools.TaigaAPIClient") as MockClient:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
             mock_instance = AsyncMock()
             MockClient.return_value.__aenter__.return_value = mock_instance
             mock_instance.get.side_effect = AuthenticationError("Invalid token")
@@ -949,7 +949,7 @@ class TestProjectToolsExceptionHandling:
         project_tools.register_tools()
 
         # Mock TaigaAPIClient para lanzar TaigaAPIError
-        with patch("src.application.tools.project_tools.TaigaAPIClient") as MockClient:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
             mock_instance = AsyncMock()
             MockClient.return_value.__aenter__.return_value = mock_instance
             mock_instance.get.side_effect = TaigaAPIError("API rate limit exceeded")
@@ -972,7 +972,7 @@ class TestProjectToolsExceptionHandling:
         project_tools.register_tools()
 
         # Mock TaigaAPIClient para lanzar excepción genérica
-        with patch("src.application.tools.project_tools.TaigaAPIClient") as MockClient:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
             mock_instance = AsyncMock()
             MockClient.return_value.__aenter__.return_value = mock_instance
             mock_instance.get.side_effect = RuntimeError("Network connection lost")
@@ -995,7 +995,7 @@ class TestProjectToolsExceptionHandling:
         project_tools = ProjectTools(mcp)
         project_tools.register_tools()
 
-        with patch("src.application.tools.project_tools.TaigaAPIClient") as MockClient:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
             mock_instance = AsyncMock()
             MockClient.return_value.__aenter__.return_value = mock_instance
             mock_instance.post.side_effect = AuthenticationError("Token expired")
@@ -1018,7 +1018,7 @@ class TestProjectToolsExceptionHandling:
         project_tools = ProjectTools(mcp)
         project_tools.register_tools()
 
-        with patch("src.application.tools.project_tools.TaigaAPIClient") as MockClient:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
             mock_instance = AsyncMock()
             MockClient.return_value.__aenter__.return_value = mock_instance
             mock_instance.patch.side_effect = PermissionDeniedError("No permission to update")
@@ -1043,7 +1043,7 @@ class TestProjectToolsExceptionHandling:
         project_tools = ProjectTools(mcp)
         project_tools.register_tools()
 
-        with patch("src.application.tools.project_tools.TaigaAPIClient") as MockClient:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
             mock_instance = AsyncMock()
             MockClient.return_value.__aenter__.return_value = mock_instance
             mock_instance.delete.side_effect = ResourceNotFoundError("Project not found")
@@ -1066,7 +1066,7 @@ class TestProjectToolsExceptionHandling:
         project_tools = ProjectTools(mcp)
         project_tools.register_tools()
 
-        with patch("src.application.tools.project_tools.TaigaAPIClient") as MockClient:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
             mock_instance = AsyncMock()
             MockClient.return_value.__aenter__.return_value = mock_instance
             mock_instance.get.side_effect = TaigaAPIError("Server error")
@@ -1089,7 +1089,7 @@ class TestProjectToolsExceptionHandling:
         project_tools = ProjectTools(mcp)
         project_tools.register_tools()
 
-        with patch("src.application.tools.project_tools.TaigaAPIClient") as MockClient:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
             mock_instance = AsyncMock()
             MockClient.return_value.__aenter__.return_value = mock_instance
             mock_instance.post.side_effect = PermissionDeniedError("Cannot duplicate project")
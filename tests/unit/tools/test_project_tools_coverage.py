@@ -3,6 +3,8 @@ Tests adicionales para cobertura completa de project_tools.py.
 Cubre funciones, métodos sincrónicos, herramientas MCP y manejadores de excepciones.
 """
 
+from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -24,7 +26,7 @@ from src.infrastructure.client_factory import get_taiga_client
 def project_tools_instance():
     """Fixture que crea una instancia de ProjectTools con mocks."""
     mcp = FastMCP("Test")
-    with patch("src.application.tools.project_tools.TaigaAPIClient") as mock_client_cls:
+    with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_cls:
         mock_client = MagicMock()
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1161,6 +1163,82 @@ class TestExportProjectExceptionHandlers:
 
         assert result == b'{"project": "data"}'
 
+    @pytest.mark.unit
+    @pytest.mark.projects
+    @pytest.mark.asyncio
+    async def test_export_project_to_file(self, project_tools_instance, tmp_path):
+        """Verifica el modo streaming con output_path y resumen incremental."""
+        project_tools_instance.config.export_dir = str(tmp_path)
+        target = tmp_path.resolve() / "export.json"
+
+        async def download(endpoint: str, path: str) -> dict[str, Any]:
+            Path(path).write_text('{"name": "Demo", "user_stories": [{"ref": 1}], "issues": []}')
+            return {"path": path, "size_bytes": 60, "sha256": "abc"}
+
+        project_tools_instance._mock_client.download = AsyncMock(side_effect=download)
+        project_tools_instance._mock_client.get_raw = AsyncMock()
+
+        tools = await project_tools_instance.mcp.get_tools()
+        tool = tools["taiga_export_project"]
+
+        result = await tool.fn(
+            auth_token="token", project_id=123, output_path="export.json", summarize=True
+        )
+
+        project_tools_instance._mock_client.download.assert_awaited_once_with(
+            "/exporter/123", str(target)
+        )
+        project_tools_instance._mock_client.get_raw.assert_not_awaited()
+        assert result["sha256"] == "abc"
+        assert result["summary"]["name"] == "Demo"
+        assert result["summary"]["counts"] == {"user_stories": 1, "issues": 0}
+
+    @pytest.mark.unit
+    @pytest.mark.projects
+    @pytest.mark.asyncio
+    async def test_export_project_to_file_requires_export_dir(self, project_tools_instance):
+        """Verifica que sin TAIGA_EXPORT_DIR no se escriba nada en disco."""
+        project_tools_instance.config.export_dir = ""
+        project_tools_instance._mock_client.download = AsyncMock()
+
+        tools = await project_tools_instance.mcp.get_tools()
+        tool = tools["taiga_export_project"]
+
+        with pytest.raises(ToolError, match="TAIGA_EXPORT_DIR"):
+            await tool.fn(auth_token="token", project_id=123, output_path="/tmp/export.json")
+        project_tools_instance._mock_client.download.assert_not_awaited()
+
+    @pytest.mark.unit
+    @pytest.mark.projects
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("output_path", "message"),
+        [
+            ("../outside.json", "inside"),
+            ("/etc/cron.d/job", "inside"),
+            (".", "inside"),
+            ("existing.json", "already exists"),
+            ("link/escaped.json", "inside"),
+        ],
+    )
+    async def test_export_project_to_file_rejects_unsafe_paths(
+        self, project_tools_instance, tmp_path, output_path, message
+    ):
+        """Verifica que se rechacen rutas fuera del directorio de exports y ficheros existentes."""
+        export_dir = tmp_path / "exports"
+        export_dir.mkdir()
+        (export_dir / "existing.json").write_text("{}")
+        (export_dir / "link").symlink_to(tmp_path)
+        project_tools_instance.config.export_dir = str(export_dir)
+        project_tools_instance._mock_client.download = AsyncMock()
+
+        tools = await project_tools_instance.mcp.get_tools()
+        tool = tools["taiga_export_project"]
+
+        with pytest.raises(ToolError, match=message):
+            await tool.fn(auth_token="token", project_id=123, output_path=output_path)
+        project_tools_instance._mock_client.download.assert_not_awaited()
+
 
 class TestBulkUpdateProjectsOrderExceptionHandlers:
     """Tests para manejadores de excepciones en bulk_update_projects_order."""
@@ -10,12 +10,13 @@ Tests for project configuration tools including:
 - Roles
 """
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastmcp import FastMCP
 
 from src.application.tools.settings_tools import SettingsTools
+from src.infrastructure.cache import MemoryCache
 
 
 @pytest.fixture
@@ -564,3 +565,46 @@ class TestMakeRequest:
         )
 
         mock_client.delete.assert_called_once()
+
+
+class TestCachedSettingsLists:
+    """Tests for the cached production path of the settings list tools."""
+
+    @pytest.mark.asyncio
+    async def test_list_is_served_from_cache_per_token(self, mock_mcp):
+        """Repeated listings hit the API once per project and auth token."""
+        tools = SettingsTools(mock_mcp, cache=MemoryCache())
+
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
+            # Like TaigaAPIClient, the client returns itself on enter
+            mock_instance = MockClient.return_value
+            mock_instance.__aenter__.return_value = mock_instance
+            mock_instance.get = AsyncMock(return_value=[{"id": 1, "name": "Low"}])
+
+            first = await tools._list_project_settings("priorities", "token-a", 123)
+            second = await tools._list_project_settings("priorities", "token-a", 123)
+            await tools._list_project_settings("priorities", "token-b", 123)
+
+        assert first == second == [{"id": 1, "name": "Low"}]
+        assert mock_instance.get.await_count == 2
+        mock_instance.get.assert_any_await("/priorities", params={"project": 123})
+
+    @pytest.mark.asyncio
+    async def test_list_uses_conditional_get_when_configured(self, mock_mcp, monkeypatch):
+        """With TAIGA_CACHE_REVALIDATE_WINDOW set, listings are fetched with get_conditional."""
+        monkeypatch.setenv("TAIGA_CACHE_REVALIDATE_WINDOW", "600")
+        tools = SettingsTools(mock_mcp, cache=MemoryCache())
+
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
+            mock_instance = MockClient.return_value
+            mock_instance.__aenter__.return_value = mock_instance
+            mock_instance.get_conditional = AsyncMock(
+                return_value=([{"id": 1, "name": "Low"}], {"ETag": '"p1"'})
+            )
+
+            result = await tools._list_project_settings("priorities", "token-a", 123)
+
+        assert result == [{"id": 1, "name": "Low"}]
+        mock_instance.get_conditional.assert_awaited_once_with(
+            "/priorities", params={"project": 123}, validators=None
+        )
@@ -17,7 +17,7 @@ from src.domain.exceptions import ValidationError
 def task_tools_instance():
     """Fixture que crea una instancia de TaskTools con mocks."""
     mcp = FastMCP("Test")
-    with patch("src.application.tools.task_tools.TaigaAPIClient") as mock_client_cls:
+    with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_cls:
         mock_client = MagicMock()
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -35,7 +35,7 @@ class TestListTasksRegisteredTool:
     async def test_list_tasks_registered_tool_success(self, task_tools_instance):
         """Verifica list_tasks registrada con éxito."""
         paginator_mock = MagicMock()
-        paginator_mock.paginate = AsyncMock(return_value=[{"id": 1}, {"id": 2}])
+        paginator_mock.collect = AsyncMock(return_value=[{"id": 1}, {"id": 2}])
 
         with patch(
             "src.application.tools.task_tools.AutoPaginator",
@@ -70,11 +70,23 @@ class TestListTasksRegisteredTool:
             assert len(result) == 1
             paginator_mock.paginate_first_page.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_list_tasks_rejects_limit_below_one(self, task_tools_instance):
+        """Verifica que limit < 1 se rechace antes de llamar a la API."""
+        with patch("src.application.tools.task_tools.AutoPaginator") as paginator_cls:
+            tools = await task_tools_instance.mcp.get_tools()
+            tool = tools["taiga_list_tasks"]
+
+            with pytest.raises(ToolError, match="limit must be greater than 0"):
+                await tool.fn(auth_token="token", project_id=123, auto_paginate=False, limit=0)
+
+            paginator_cls.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_list_tasks_with_all_filters(self, task_tools_instance):
         """Verifica list_tasks con todos los filtros."""
         paginator_mock = MagicMock()
-        paginator_mock.paginate = AsyncMock(return_value=[])
+        paginator_mock.collect = AsyncMock(return_value=[])
 
         with patch(
             "src.application.tools.task_tools.AutoPaginator",
@@ -689,7 +701,7 @@ class TestDirectMethodsExceptionHandlers:
     async def test_list_tasks_direct_exception(self, task_tools_instance):
         """Verifica manejo de excepciones en list_tasks."""
         with patch("src.application.tools.task_tools.AutoPaginator") as paginator_mock:
-            paginator_mock.return_value.paginate = AsyncMock(side_effect=Exception("API Error"))
+            paginator_mock.return_value.collect = AsyncMock(side_effect=Exception("API Error"))
 
             with pytest.raises(Exception, match="API Error"):
                 await task_tools_instance.list_tasks(auth_token="token", project=123)
@@ -275,7 +275,7 @@ class TestUserToolsExceptionHandling:
         user_tools.register_tools()
 
         # Mock TaigaAPIClient para lanzar AuthenticationError
-        with patch("src.application.tools.user_tools.TaigaAPIClient") as MockClient:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
             mock_instance = AsyncMock()
             MockClient.return_value.__aenter__.return_value = mock_instance
             mock_instance.get.side_effect = AuthenticationError("Invalid token")
@@ -299,7 +299,7 @@ class TestUserToolsExceptionHandling:
         user_tools.register_tools()
 
         # Mock TaigaAPIClient para lanzar TaigaAPIError
-        with patch("src.application.tools.user_tools.TaigaAPIClient") as MockClient:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
             mock_instance = AsyncMock()
             MockClient.return_value.__aenter__.return_value = mock_instance
             mock_instance.get.side_effect = TaigaAPIError("API rate limit exceeded")
@@ -321,7 +321,7 @@ class TestUserToolsExceptionHandling:
         user_tools.register_tools()
 
         # Mock TaigaAPIClient para lanzar excepción genérica
-        with patch("src.application.tools.user_tools.TaigaAPIClient") as MockClient:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as MockClient:
             mock_instance = AsyncMock()
             MockClient.return_value.__aenter__.return_value = mock_instance
             mock_instance.get.side_effect = RuntimeError("Unexpected server error")
@@ -17,7 +17,7 @@ from src.domain.exceptions import AuthenticationError, TaigaAPIError
 def user_tools_instance():
     """Fixture que crea una instancia de UserTools con mocks."""
     mcp = FastMCP("Test")
-    with patch("src.application.tools.user_tools.TaigaAPIClient") as mock_client_cls:
+    with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_cls:
         mock_client = MagicMock()
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
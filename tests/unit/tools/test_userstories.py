@@ -40,6 +40,17 @@ def mock_config() -> None:
         yield config
 
 
+def _list_client_mock() -> AsyncMock:
+    """Create a client mock whose get_with_headers delegates to get (no pagination headers)."""
+    client = AsyncMock()
+
+    async def get_with_headers(*args, **kwargs):
+        return await client.get(*args, **kwargs), {}
+
+    client.get_with_headers.side_effect = get_with_headers
+    return client
+
+
 @pytest.fixture
 def userstory_tools(mock_mcp, mock_config) -> None:
     """Create a UserStoryTools instance with mocked dependencies."""
@@ -128,8 +139,8 @@ class TestListUserStories:
             },
         ]
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
-            mock_client = AsyncMock()
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
+            mock_client = _list_client_mock()
             mock_client.__aenter__.return_value = mock_client
             # AutoPaginator calls client.get and returns list directly
             mock_client.get.return_value = mock_stories
@@ -157,8 +168,8 @@ class TestListUserStories:
     @pytest.mark.asyncio
     async def test_list_userstories_no_filters(self, userstory_tools) -> None:
         """Test listing user stories without filters."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
-            mock_client = AsyncMock()
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
+            mock_client = _list_client_mock()
             mock_client.__aenter__.return_value = mock_client
             # AutoPaginator calls client.get and returns list directly
             mock_client.get.return_value = []
@@ -173,8 +184,8 @@ class TestListUserStories:
     @pytest.mark.asyncio
     async def test_list_userstories_authentication_error(self, userstory_tools) -> None:
         """Test list_userstories with authentication error."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
-            mock_client = AsyncMock()
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
+            mock_client = _list_client_mock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.get.side_effect = AuthenticationError("Invalid token")
             mock_client_class.return_value = mock_client
@@ -185,8 +196,8 @@ class TestListUserStories:
     @pytest.mark.asyncio
     async def test_list_userstories_api_error(self, userstory_tools) -> None:
         """Test list_userstories with API error."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
-            mock_client = AsyncMock()
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
+            mock_client = _list_client_mock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.get.side_effect = TaigaAPIError("Server error")
             mock_client_class.return_value = mock_client
@@ -197,8 +208,8 @@ class TestListUserStories:
     @pytest.mark.asyncio
     async def test_list_userstories_unexpected_error(self, userstory_tools) -> None:
         """Test list_userstories with unexpected error."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
-            mock_client = AsyncMock()
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
+            mock_client = _list_client_mock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.get.side_effect = Exception("Unexpected")
             mock_client_class.return_value = mock_client
@@ -226,7 +237,7 @@ class TestCreateUserStory:
             "attachments": [],
         }
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.return_value = mock_response
@@ -269,7 +280,7 @@ class TestCreateUserStory:
             "attachments": [{"id": 1}],
         }
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.return_value = mock_response
@@ -316,7 +327,7 @@ class TestCreateUserStory:
     @pytest.mark.asyncio
     async def test_create_userstory_auth_error(self, userstory_tools) -> None:
         """Test create_userstory with authentication error."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.side_effect = AuthenticationError("Invalid token")
@@ -330,7 +341,7 @@ class TestCreateUserStory:
     @pytest.mark.asyncio
     async def test_create_userstory_api_error(self, userstory_tools) -> None:
         """Test create_userstory with API error."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.side_effect = TaigaAPIError("Validation error")
@@ -375,7 +386,7 @@ class TestGetUserStory:
             "modified_date": "2024-01-02",
         }
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.get.return_value = mock_response
@@ -394,7 +405,7 @@ class TestGetUserStory:
         """Test getting a user story by reference."""
         mock_response = {"id": 2, "ref": 102, "subject": "Story by Ref"}
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.get.return_value = mock_response
@@ -414,7 +425,7 @@ class TestGetUserStory:
     @pytest.mark.asyncio
     async def test_get_userstory_missing_params(self, userstory_tools) -> None:
         """Test get_userstory with missing parameters."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client_class.return_value = mock_client
@@ -425,7 +436,7 @@ class TestGetUserStory:
     @pytest.mark.asyncio
     async def test_get_userstory_not_found(self, userstory_tools) -> None:
         """Test get_userstory with non-existent story."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.get.side_effect = ResourceNotFoundError("Not found")
@@ -437,7 +448,7 @@ class TestGetUserStory:
     @pytest.mark.asyncio
     async def test_get_userstory_permission_denied(self, userstory_tools) -> None:
         """Test get_userstory with permission denied."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.get.side_effect = PermissionDeniedError("No access")
@@ -468,7 +479,7 @@ class TestUpdateUserStory:
             "version": 2,
         }
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.patch.return_value = mock_response
@@ -503,7 +514,7 @@ class TestUpdateUserStory:
             "version": 3,
         }
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.patch.return_value = mock_response
@@ -551,7 +562,7 @@ class TestUpdateUserStory:
     @pytest.mark.asyncio
     async def test_update_userstory_not_found(self, userstory_tools) -> None:
         """Test update_userstory with non-existent story."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.patch.side_effect = ResourceNotFoundError("Not found")
@@ -565,7 +576,7 @@ class TestUpdateUserStory:
     @pytest.mark.asyncio
     async def test_update_userstory_permission_denied(self, userstory_tools) -> None:
         """Test update_userstory with permission denied."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.patch.side_effect = PermissionDeniedError("No access")
@@ -583,7 +594,7 @@ class TestDeleteUserStory:
     @pytest.mark.asyncio
     async def test_delete_userstory_success(self, userstory_tools) -> None:
         """Test successful user story deletion."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.delete.return_value = True
@@ -597,7 +608,7 @@ class TestDeleteUserStory:
     @pytest.mark.asyncio
     async def test_delete_userstory_not_found(self, userstory_tools) -> None:
         """Test delete_userstory with non-existent story."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.delete.side_effect = ResourceNotFoundError("Not found")
@@ -609,7 +620,7 @@ class TestDeleteUserStory:
     @pytest.mark.asyncio
     async def test_delete_userstory_permission_denied(self, userstory_tools) -> None:
         """Test delete_userstory with permission denied."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.delete.side_effect = PermissionDeniedError("No access")
@@ -630,7 +641,7 @@ class TestBulkOperations:
             {"id": 2, "ref": 102, "subject": "Story 2", "status": 1, "milestone": 1},
         ]
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.return_value = mock_response
@@ -660,7 +671,7 @@ class TestBulkOperations:
     @pytest.mark.asyncio
     async def test_bulk_create_userstories_empty_response(self, userstory_tools) -> None:
         """Test bulk_create with non-list response."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.return_value = {}  # Non-list response
@@ -694,7 +705,7 @@ class TestBulkOperations:
             },
         ]
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.return_value = mock_response
@@ -722,7 +733,7 @@ class TestBulkOperations:
         """Test bulk update with only some fields."""
         mock_response = [{"id": 1, "status": 3}]
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.return_value = mock_response
@@ -739,7 +750,7 @@ class TestBulkOperations:
     @pytest.mark.asyncio
     async def test_bulk_delete_userstories(self, userstory_tools) -> None:
         """Test bulk deleting user stories."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.return_value = None
@@ -758,7 +769,7 @@ class TestBulkOperations:
     @pytest.mark.asyncio
     async def test_bulk_operations_auth_error(self, userstory_tools) -> None:
         """Test bulk operations with authentication error."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.side_effect = AuthenticationError("Invalid token")
@@ -794,7 +805,7 @@ class TestMoveToMilestone:
             "milestone_name": "Sprint 2",
         }
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.patch.return_value = mock_response
@@ -813,7 +824,7 @@ class TestMoveToMilestone:
     @pytest.mark.asyncio
     async def test_move_to_milestone_not_found(self, userstory_tools) -> None:
         """Test move_to_milestone with non-existent story."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.patch.side_effect = ResourceNotFoundError("Not found")
@@ -852,7 +863,7 @@ class TestUserStoryHistory:
             },
         ]
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.get.return_value = mock_response
@@ -871,7 +882,7 @@ class TestUserStoryHistory:
     @pytest.mark.asyncio
     async def test_get_userstory_history_not_found(self, userstory_tools) -> None:
         """Test get_userstory_history with non-existent story."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.get.side_effect = ResourceNotFoundError("Not found")
@@ -891,7 +902,7 @@ class TestWatchOperations:
         """Test watching a user story."""
         mock_response = {"is_watcher": True, "total_watchers": 5}
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.return_value = mock_response
@@ -910,7 +921,7 @@ class TestWatchOperations:
         """Test unwatching a user story."""
         mock_response = {"is_watcher": False, "total_watchers": 4}
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.return_value = mock_response
@@ -929,7 +940,7 @@ class TestWatchOperations:
     @pytest.mark.asyncio
     async def test_watch_operations_not_found(self, userstory_tools) -> None:
         """Test watch operations with non-existent story."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.side_effect = ResourceNotFoundError("Not found")
@@ -950,7 +961,7 @@ class TestVoteOperations:
         """Test upvoting a user story."""
         mock_response = {"is_voter": True, "total_voters": 10}
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.return_value = mock_response
@@ -969,7 +980,7 @@ class TestVoteOperations:
         """Test downvoting (removing upvote) from a user story."""
         mock_response = {"is_voter": False, "total_voters": 9}
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.return_value = mock_response
@@ -1003,7 +1014,7 @@ class TestVoteOperations:
             },
         ]
 
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.get.return_value = mock_response
@@ -1023,7 +1034,7 @@ class TestVoteOperations:
     @pytest.mark.asyncio
     async def test_get_userstory_voters_empty(self, userstory_tools) -> None:
         """Test get_userstory_voters with no voters."""
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.get.return_value = {}  # Non-list response
@@ -1039,7 +1050,7 @@ class TestVoteOperations:
     async def test_vote_operations_errors(self, userstory_tools) -> None:
         """Test vote operations with various errors."""
         # Not found error
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.side_effect = ResourceNotFoundError("Not found")
@@ -1049,7 +1060,7 @@ class TestVoteOperations:
                 await userstory_tools.upvote_userstory(auth_token="test-token", userstory_id=999)
 
         # Authentication error
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.post.side_effect = AuthenticationError("Invalid token")
@@ -1059,7 +1070,7 @@ class TestVoteOperations:
                 await userstory_tools.downvote_userstory(auth_token="invalid-token", userstory_id=1)
 
         # API error for voters
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_class:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.__aenter__.return_value = mock_client
             mock_client.get.side_effect = TaigaAPIError("Server error")
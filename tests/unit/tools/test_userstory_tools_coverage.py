@@ -24,10 +24,16 @@ from src.infrastructure.client_factory import get_taiga_client
 def userstory_tools_instance():
     """Fixture que crea una instancia de UserStoryTools con mocks."""
     mcp = FastMCP("Test")
-    with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_client_cls:
+    with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_cls:
         mock_client = MagicMock()
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
+
+        # El paginador concurrente lee la primera página con sus cabeceras
+        async def get_with_headers(*args, **kwargs):
+            return await mock_client.get(*args, **kwargs), {}
+
+        mock_client.get_with_headers = AsyncMock(side_effect=get_with_headers)
         mock_client_cls.return_value = mock_client
         tools = UserStoryTools(mcp)
         tools.register_tools()
@@ -223,7 +229,7 @@ class TestListUserstoriesExceptionHandlers:
     async def test_list_userstories_authentication_error(self):
         """Verifica manejo de AuthenticationError en list_userstories sin cliente."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -231,7 +237,7 @@ class TestListUserstoriesExceptionHandlers:
 
             with patch("src.application.tools.userstory_tools.AutoPaginator") as mock_paginator_cls:
                 mock_paginator = MagicMock()
-                mock_paginator.paginate = AsyncMock(side_effect=AuthenticationError("Auth failed"))
+                mock_paginator.collect = AsyncMock(side_effect=AuthenticationError("Auth failed"))
                 mock_paginator_cls.return_value = mock_paginator
 
                 tools = UserStoryTools(mcp)
@@ -248,7 +254,7 @@ class TestListUserstoriesExceptionHandlers:
     async def test_list_userstories_taiga_api_error(self):
         """Verifica manejo de TaigaAPIError en list_userstories sin cliente."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -256,7 +262,7 @@ class TestListUserstoriesExceptionHandlers:
 
             with patch("src.application.tools.userstory_tools.AutoPaginator") as mock_paginator_cls:
                 mock_paginator = MagicMock()
-                mock_paginator.paginate = AsyncMock(side_effect=TaigaAPIError("API failed"))
+                mock_paginator.collect = AsyncMock(side_effect=TaigaAPIError("API failed"))
                 mock_paginator_cls.return_value = mock_paginator
 
                 tools = UserStoryTools(mcp)
@@ -1410,7 +1416,7 @@ class TestAttachmentMethods:
     async def test_list_userstory_attachments_without_client(self):
         """Verifica list_userstory_attachments sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1427,7 +1433,7 @@ class TestAttachmentMethods:
     async def test_list_userstory_attachments_empty_result(self):
         """Verifica list_userstory_attachments con resultado no-lista."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1458,7 +1464,7 @@ class TestAttachmentMethods:
     async def test_create_userstory_attachment_without_client(self):
         """Verifica create_userstory_attachment sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1491,7 +1497,7 @@ class TestAttachmentMethods:
     async def test_get_userstory_attachment_without_client(self):
         """Verifica get_userstory_attachment sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1522,7 +1528,7 @@ class TestAttachmentMethods:
     async def test_update_userstory_attachment_without_client(self):
         """Verifica update_userstory_attachment sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1555,7 +1561,7 @@ class TestAttachmentMethods:
     async def test_delete_userstory_attachment_without_client(self):
         """Verifica delete_userstory_attachment sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1615,7 +1621,7 @@ class TestCommentMethods:
     async def test_get_userstory_history_without_client(self):
         """Verifica get_userstory_history sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1632,7 +1638,7 @@ class TestCommentMethods:
     async def test_get_userstory_history_empty_result(self):
         """Verifica get_userstory_history con resultado vacio."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1677,7 +1683,7 @@ class TestCommentMethods:
     async def test_get_userstory_comment_versions_without_client(self):
         """Verifica get_userstory_comment_versions sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1696,7 +1702,7 @@ class TestCommentMethods:
     async def test_get_userstory_comment_versions_empty(self):
         """Verifica get_userstory_comment_versions con resultado vacio."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1747,7 +1753,7 @@ class TestCommentMethods:
     async def test_edit_userstory_comment_without_client(self):
         """Verifica edit_userstory_comment sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1794,7 +1800,7 @@ class TestCommentMethods:
     async def test_delete_userstory_comment_without_client(self):
         """Verifica delete_userstory_comment sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1841,7 +1847,7 @@ class TestCommentMethods:
     async def test_undelete_userstory_comment_without_client(self):
         """Verifica undelete_userstory_comment sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1892,7 +1898,7 @@ class TestOtherMethods:
     async def test_get_userstory_by_ref_without_client(self):
         """Verifica get_userstory_by_ref sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1923,7 +1929,7 @@ class TestOtherMethods:
     async def test_update_userstory_full_without_client(self):
         """Verifica update_userstory_full sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1954,7 +1960,7 @@ class TestOtherMethods:
     async def test_bulk_update_backlog_order_without_client(self):
         """Verifica bulk_update_backlog_order sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2001,7 +2007,7 @@ class TestOtherMethods:
     async def test_bulk_update_kanban_order_without_client(self):
         """Verifica bulk_update_kanban_order sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2036,7 +2042,7 @@ class TestOtherMethods:
     async def test_bulk_update_sprint_order_without_client(self):
         """Verifica bulk_update_sprint_order sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2083,7 +2089,7 @@ class TestOtherMethods:
     async def test_get_userstory_filters_without_client(self):
         """Verifica get_userstory_filters sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2114,7 +2120,7 @@ class TestOtherMethods:
     async def test_get_userstory_watchers_without_client(self):
         """Verifica get_userstory_watchers sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2131,7 +2137,7 @@ class TestOtherMethods:
     async def test_get_userstory_watchers_empty(self):
         """Verifica get_userstory_watchers con resultado vacio."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2180,7 +2186,7 @@ class TestCustomAttributeMethods:
     async def test_list_userstory_custom_attributes_without_client(self):
         """Verifica list_userstory_custom_attributes sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2197,7 +2203,7 @@ class TestCustomAttributeMethods:
     async def test_list_userstory_custom_attributes_empty(self):
         """Verifica list_userstory_custom_attributes con resultado vacio."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2228,7 +2234,7 @@ class TestCustomAttributeMethods:
     async def test_create_userstory_custom_attribute_without_client(self):
         """Verifica create_userstory_custom_attribute sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2259,7 +2265,7 @@ class TestCustomAttributeMethods:
     async def test_get_userstory_custom_attribute_without_client(self):
         """Verifica get_userstory_custom_attribute sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2290,7 +2296,7 @@ class TestCustomAttributeMethods:
     async def test_update_userstory_custom_attribute_without_client(self):
         """Verifica update_userstory_custom_attribute sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2323,7 +2329,7 @@ class TestCustomAttributeMethods:
     async def test_delete_userstory_custom_attribute_without_client(self):
         """Verifica delete_userstory_custom_attribute sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2356,7 +2362,7 @@ class TestCustomAttributeMethods:
     async def test_update_userstory_custom_attribute_full_without_client(self):
         """Verifica update_userstory_custom_attribute_full sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2389,7 +2395,7 @@ class TestCustomAttributeMethods:
     async def test_update_userstory_custom_attribute_partial_without_client(self):
         """Verifica update_userstory_custom_attribute_partial sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2421,7 +2427,7 @@ class TestCustomAttributeMethods:
     async def test_set_custom_attribute_values_without_client(self):
         """Verifica set_custom_attribute_values sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2483,7 +2489,7 @@ class TestUpdateUserstoryMethod:
     async def test_update_userstory_method_without_client(self):
         """Verifica update_userstory metodo sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2681,7 +2687,7 @@ class TestListUserstoriesOptionalParams:
     async def test_list_userstories_without_client_no_paginate(self):
         """Verifica list_userstories sin cliente y sin auto_paginate."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2706,7 +2712,7 @@ class TestListUserstoriesOptionalParams:
     async def test_list_userstories_without_client_with_paginate(self):
         """Verifica list_userstories sin cliente con auto_paginate=True."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2714,7 +2720,7 @@ class TestListUserstoriesOptionalParams:
 
             with patch("src.application.tools.userstory_tools.AutoPaginator") as mock_paginator_cls:
                 mock_paginator = MagicMock()
-                mock_paginator.paginate = AsyncMock(return_value=[{"id": 1}, {"id": 2}])
+                mock_paginator.collect = AsyncMock(return_value=[{"id": 1}, {"id": 2}])
                 mock_paginator_cls.return_value = mock_paginator
 
                 tools = UserStoryTools(mcp)
@@ -2725,6 +2731,38 @@ class TestListUserstoriesOptionalParams:
                 result = await tool.fn(auth_token="token", project_id=1, auto_paginate=True)
                 assert len(result) == 2
 
+    @pytest.mark.unit
+    @pytest.mark.userstories
+    @pytest.mark.asyncio
+    async def test_list_userstories_streams_with_limit(self, userstory_tools_instance):
+        """Verifica que list_userstories reduce cada historia y corta en limit."""
+        raw_page = [{"id": i, "subject": f"US {i}", "extra": "x" * 100} for i in range(10)]
+        userstory_tools_instance._mock_client.get = AsyncMock(return_value=raw_page)
+
+        tools = await userstory_tools_instance.mcp.get_tools()
+        tool = tools["taiga_list_userstories"]
+
+        result = await tool.fn(auth_token="token", project_id=1, limit=3)
+
+        assert [story["id"] for story in result] == [0, 1, 2]
+        assert "extra" not in result[0]
+        assert result[0]["tags"] == []
+
+    @pytest.mark.unit
+    @pytest.mark.userstories
+    @pytest.mark.asyncio
+    async def test_list_userstories_rejects_limit_below_one(self, userstory_tools_instance):
+        """Verifica que limit < 1 se rechace antes de llamar a la API."""
+        userstory_tools_instance._mock_client.get = AsyncMock(return_value=[{"id": 1}])
+
+        tools = await userstory_tools_instance.mcp.get_tools()
+        tool = tools["taiga_list_userstories"]
+
+        with pytest.raises(ToolError, match="limit must be greater than 0"):
+            await tool.fn(auth_token="token", project_id=1, limit=-2)
+
+        userstory_tools_instance._mock_client.get.assert_not_called()
+
     @pytest.mark.unit
     @pytest.mark.userstories
     @pytest.mark.asyncio
@@ -2777,7 +2815,7 @@ class TestCreateUserstoryOptionalParams:
     async def test_create_userstory_without_client(self):
         """Verifica create_userstory sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2806,7 +2844,7 @@ class TestGetUserstoryOptionalParams:
     async def test_get_userstory_without_client(self):
         """Verifica get_userstory sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2861,7 +2899,7 @@ class TestUpdateUserstoryOptionalParams:
     async def test_update_userstory_without_client(self):
         """Verifica update_userstory sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2890,7 +2928,7 @@ class TestDeleteUserstoryOptionalParams:
     async def test_delete_userstory_without_client(self):
         """Verifica delete_userstory sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2915,7 +2953,7 @@ class TestBulkOperationsWithoutClient:
     async def test_bulk_create_without_client(self):
         """Verifica bulk_create_userstories sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2940,7 +2978,7 @@ class TestBulkOperationsWithoutClient:
     async def test_bulk_update_without_client(self):
         """Verifica bulk_update_userstories sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2964,7 +3002,7 @@ class TestBulkOperationsWithoutClient:
     async def test_bulk_delete_without_client(self):
         """Verifica bulk_delete_userstories sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -2992,7 +3030,7 @@ class TestMoveAndWatchWithoutClient:
     async def test_move_to_milestone_without_client(self):
         """Verifica move_to_milestone sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -3015,7 +3053,7 @@ class TestMoveAndWatchWithoutClient:
     async def test_watch_userstory_without_client(self):
         """Verifica watch_userstory sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -3036,7 +3074,7 @@ class TestMoveAndWatchWithoutClient:
     async def test_unwatch_userstory_without_client(self):
         """Verifica unwatch_userstory sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -3057,7 +3095,7 @@ class TestMoveAndWatchWithoutClient:
     async def test_upvote_userstory_without_client(self):
         """Verifica upvote_userstory sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -3078,7 +3116,7 @@ class TestMoveAndWatchWithoutClient:
     async def test_downvote_userstory_without_client(self):
         """Verifica downvote_userstory sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -3103,7 +3141,7 @@ class TestHistoryAndVotersWithoutClient:
     async def test_get_userstory_history_tool_without_client(self):
         """Verifica get_userstory_history tool sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -3124,7 +3162,7 @@ class TestHistoryAndVotersWithoutClient:
     async def test_get_userstory_voters_tool_without_client(self):
         """Verifica get_userstory_voters tool sin cliente mock."""
         mcp = FastMCP("Test")
-        with patch("src.application.tools.userstory_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
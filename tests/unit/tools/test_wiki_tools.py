@@ -641,11 +641,13 @@ class TestWikiAttachmentTools:
     @pytest.mark.unit
     @pytest.mark.wiki
     @pytest.mark.asyncio
-    async def test_create_wiki_attachment(self, mock_taiga_api) -> None:
+    async def test_create_wiki_attachment(self, mock_taiga_api, tmp_path) -> None:
         """
         Verifica que crea adjunto de wiki correctamente.
         """
         # Arrange
+        attached_file = tmp_path / "new-file.txt"
+        attached_file.write_text("contenido")
         mcp = FastMCP("Test")
         wiki_tools = WikiTools(mcp)
         wiki_tools.register_tools()
@@ -670,7 +672,7 @@ class TestWikiAttachmentTools:
             auth_token="valid_token",
             wiki_page_id=10,
             project_id=123,
-            attached_file="path/to/file.txt",
+            attached_file=str(attached_file),
             description="New attachment",
         )
 
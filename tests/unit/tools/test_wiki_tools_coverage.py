@@ -23,7 +23,7 @@ from src.domain.exceptions import (
 def wiki_tools_instance():
     """Crea una instancia de WikiTools con mocks."""
     mcp = FastMCP("Test")
-    with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_client_cls:
+    with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_client_cls:
         mock_client = MagicMock()
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -55,7 +55,7 @@ class TestListWikiPagesExceptionHandlers:
     @pytest.mark.asyncio
     async def test_list_wiki_pages_auto_paginate_false(self, wiki_tools_instance):
         """Test list_wiki_pages con auto_paginate=False (line 112)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -78,7 +78,7 @@ class TestListWikiPagesExceptionHandlers:
     @pytest.mark.asyncio
     async def test_list_wiki_pages_authentication_error(self, wiki_tools_instance):
         """Test list_wiki_pages con AuthenticationError (lines 138-142)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -95,7 +95,7 @@ class TestListWikiPagesExceptionHandlers:
     @pytest.mark.asyncio
     async def test_list_wiki_pages_taiga_api_error(self, wiki_tools_instance):
         """Test list_wiki_pages con TaigaAPIError (lines 143-147)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -112,7 +112,7 @@ class TestListWikiPagesExceptionHandlers:
     @pytest.mark.asyncio
     async def test_list_wiki_pages_unexpected_error(self, wiki_tools_instance):
         """Test list_wiki_pages con Exception genérica (lines 148-152)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -133,7 +133,7 @@ class TestCreateWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_create_wiki_page_with_watchers(self, wiki_tools_instance):
         """Test create_wiki_page con watchers (line 224)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -172,7 +172,7 @@ class TestCreateWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_create_wiki_page_authentication_error(self, wiki_tools_instance):
         """Test create_wiki_page con AuthenticationError (lines 249-253)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -187,7 +187,7 @@ class TestCreateWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_create_wiki_page_slug_already_exists(self, wiki_tools_instance):
         """Test create_wiki_page con slug duplicado (lines 254-259)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -202,7 +202,7 @@ class TestCreateWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_create_wiki_page_taiga_api_error(self, wiki_tools_instance):
         """Test create_wiki_page con TaigaAPIError genérico (lines 260-263)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -217,7 +217,7 @@ class TestCreateWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_create_wiki_page_unexpected_error(self, wiki_tools_instance):
         """Test create_wiki_page con Exception genérica (lines 264-268)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -236,7 +236,7 @@ class TestGetWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_get_wiki_page_authentication_error(self, wiki_tools_instance):
         """Test get_wiki_page con AuthenticationError (lines 351-353)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -249,7 +249,7 @@ class TestGetWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_get_wiki_page_taiga_api_error(self, wiki_tools_instance):
         """Test get_wiki_page con TaigaAPIError (lines 354-356)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -262,7 +262,7 @@ class TestGetWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_get_wiki_page_unexpected_error(self, wiki_tools_instance):
         """Test get_wiki_page con Exception genérica (lines 357-361)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -279,7 +279,7 @@ class TestGetWikiPageBySlugExceptionHandlers:
     @pytest.mark.asyncio
     async def test_get_wiki_page_by_slug_not_found(self, wiki_tools_instance):
         """Test get_wiki_page_by_slug con ResourceNotFoundError (lines 439-443)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -294,7 +294,7 @@ class TestGetWikiPageBySlugExceptionHandlers:
     @pytest.mark.asyncio
     async def test_get_wiki_page_by_slug_authentication_error(self, wiki_tools_instance):
         """Test get_wiki_page_by_slug con AuthenticationError (lines 444-448)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -309,7 +309,7 @@ class TestGetWikiPageBySlugExceptionHandlers:
     @pytest.mark.asyncio
     async def test_get_wiki_page_by_slug_taiga_api_error(self, wiki_tools_instance):
         """Test get_wiki_page_by_slug con TaigaAPIError (lines 449-453)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -324,7 +324,7 @@ class TestGetWikiPageBySlugExceptionHandlers:
     @pytest.mark.asyncio
     async def test_get_wiki_page_by_slug_unexpected_error(self, wiki_tools_instance):
         """Test get_wiki_page_by_slug con Exception genérica (lines 454-458)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -343,7 +343,7 @@ class TestUpdateWikiPageBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_page_with_slug(self, wiki_tools_instance):
         """Test update_wiki_page con solo slug (line 526)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -372,7 +372,7 @@ class TestUpdateWikiPageBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_page_not_found(self, wiki_tools_instance):
         """Test update_wiki_page con ResourceNotFoundError (lines 555-557)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -387,7 +387,7 @@ class TestUpdateWikiPageBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_page_permission_denied(self, wiki_tools_instance):
         """Test update_wiki_page con PermissionDeniedError (lines 558-560)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -402,7 +402,7 @@ class TestUpdateWikiPageBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_page_authentication_error(self, wiki_tools_instance):
         """Test update_wiki_page con AuthenticationError (lines 561-563)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -417,7 +417,7 @@ class TestUpdateWikiPageBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_page_version_conflict(self, wiki_tools_instance):
         """Test update_wiki_page con version conflict (lines 565-567)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -432,7 +432,7 @@ class TestUpdateWikiPageBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_page_taiga_api_error(self, wiki_tools_instance):
         """Test update_wiki_page con TaigaAPIError genérico (lines 568-569)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -447,7 +447,7 @@ class TestUpdateWikiPageBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_page_unexpected_error(self, wiki_tools_instance):
         """Test update_wiki_page con Exception genérica (lines 570-574)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -466,7 +466,7 @@ class TestDeleteWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_delete_wiki_page_permission_denied(self, wiki_tools_instance):
         """Test delete_wiki_page con PermissionDeniedError (lines 620-622)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -479,7 +479,7 @@ class TestDeleteWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_delete_wiki_page_authentication_error(self, wiki_tools_instance):
         """Test delete_wiki_page con AuthenticationError (lines 623-625)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -492,7 +492,7 @@ class TestDeleteWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_delete_wiki_page_taiga_api_error(self, wiki_tools_instance):
         """Test delete_wiki_page con TaigaAPIError (lines 626-628)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -505,7 +505,7 @@ class TestDeleteWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_delete_wiki_page_unexpected_error(self, wiki_tools_instance):
         """Test delete_wiki_page con Exception genérica (lines 629-633)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -522,7 +522,7 @@ class TestRestoreWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_restore_wiki_page_not_found(self, wiki_tools_instance):
         """Test restore_wiki_page con ResourceNotFoundError (lines 702-704)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -535,7 +535,7 @@ class TestRestoreWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_restore_wiki_page_permission_denied(self, wiki_tools_instance):
         """Test restore_wiki_page con PermissionDeniedError (lines 705-707)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -548,7 +548,7 @@ class TestRestoreWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_restore_wiki_page_authentication_error(self, wiki_tools_instance):
         """Test restore_wiki_page con AuthenticationError (lines 708-710)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -561,7 +561,7 @@ class TestRestoreWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_restore_wiki_page_taiga_api_error(self, wiki_tools_instance):
         """Test restore_wiki_page con TaigaAPIError (lines 711-715)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -574,7 +574,7 @@ class TestRestoreWikiPageExceptionHandlers:
     @pytest.mark.asyncio
     async def test_restore_wiki_page_unexpected_error(self, wiki_tools_instance):
         """Test restore_wiki_page con Exception genérica (lines 716-720)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -591,7 +591,7 @@ class TestListWikiAttachmentsExceptionHandlers:
     @pytest.mark.asyncio
     async def test_list_wiki_attachments_auto_paginate_false(self, wiki_tools_instance):
         """Test list_wiki_attachments con auto_paginate=False (line 788)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -614,7 +614,7 @@ class TestListWikiAttachmentsExceptionHandlers:
     @pytest.mark.asyncio
     async def test_list_wiki_attachments_not_found(self, wiki_tools_instance):
         """Test list_wiki_attachments con ResourceNotFoundError (lines 814-818)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -633,7 +633,7 @@ class TestListWikiAttachmentsExceptionHandlers:
     @pytest.mark.asyncio
     async def test_list_wiki_attachments_authentication_error(self, wiki_tools_instance):
         """Test list_wiki_attachments con AuthenticationError (lines 819-823)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -652,7 +652,7 @@ class TestListWikiAttachmentsExceptionHandlers:
     @pytest.mark.asyncio
     async def test_list_wiki_attachments_taiga_api_error(self, wiki_tools_instance):
         """Test list_wiki_attachments con TaigaAPIError (lines 824-828)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -671,7 +671,7 @@ class TestListWikiAttachmentsExceptionHandlers:
     @pytest.mark.asyncio
     async def test_list_wiki_attachments_unexpected_error(self, wiki_tools_instance):
         """Test list_wiki_attachments con Exception genérica (lines 829-833)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -694,7 +694,7 @@ class TestWatchWikiPageTools:
     @pytest.mark.asyncio
     async def test_watch_wiki_page_success(self, wiki_tools_instance):
         """Test watch_wiki_page exitoso."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -709,7 +709,7 @@ class TestWatchWikiPageTools:
     @pytest.mark.asyncio
     async def test_watch_wiki_page_not_found(self, wiki_tools_instance):
         """Test watch_wiki_page con ResourceNotFoundError (lines 887-889)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -722,7 +722,7 @@ class TestWatchWikiPageTools:
     @pytest.mark.asyncio
     async def test_watch_wiki_page_authentication_error(self, wiki_tools_instance):
         """Test watch_wiki_page con AuthenticationError (lines 890-892)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -735,7 +735,7 @@ class TestWatchWikiPageTools:
     @pytest.mark.asyncio
     async def test_watch_wiki_page_taiga_api_error(self, wiki_tools_instance):
         """Test watch_wiki_page con TaigaAPIError (lines 893-895)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -748,7 +748,7 @@ class TestWatchWikiPageTools:
     @pytest.mark.asyncio
     async def test_watch_wiki_page_unexpected_error(self, wiki_tools_instance):
         """Test watch_wiki_page con Exception genérica (lines 896-900)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -761,7 +761,7 @@ class TestWatchWikiPageTools:
     @pytest.mark.asyncio
     async def test_unwatch_wiki_page_success(self, wiki_tools_instance):
         """Test unwatch_wiki_page exitoso."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -776,7 +776,7 @@ class TestWatchWikiPageTools:
     @pytest.mark.asyncio
     async def test_unwatch_wiki_page_not_found(self, wiki_tools_instance):
         """Test unwatch_wiki_page con ResourceNotFoundError (lines 950-952)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -789,7 +789,7 @@ class TestWatchWikiPageTools:
     @pytest.mark.asyncio
     async def test_unwatch_wiki_page_authentication_error(self, wiki_tools_instance):
         """Test unwatch_wiki_page con AuthenticationError (lines 953-955)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -802,7 +802,7 @@ class TestWatchWikiPageTools:
     @pytest.mark.asyncio
     async def test_unwatch_wiki_page_taiga_api_error(self, wiki_tools_instance):
         """Test unwatch_wiki_page con TaigaAPIError (lines 956-960)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -815,7 +815,7 @@ class TestWatchWikiPageTools:
     @pytest.mark.asyncio
     async def test_unwatch_wiki_page_unexpected_error(self, wiki_tools_instance):
         """Test unwatch_wiki_page con Exception genérica (lines 961-965)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -832,7 +832,7 @@ class TestCreateWikiLinkTool:
     @pytest.mark.asyncio
     async def test_create_wiki_link_success(self, wiki_tools_instance):
         """Test create_wiki_link exitoso."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -851,7 +851,7 @@ class TestCreateWikiLinkTool:
     @pytest.mark.asyncio
     async def test_create_wiki_link_authentication_error(self, wiki_tools_instance):
         """Test create_wiki_link con AuthenticationError (lines 1034-1038)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -866,7 +866,7 @@ class TestCreateWikiLinkTool:
     @pytest.mark.asyncio
     async def test_create_wiki_link_taiga_api_error(self, wiki_tools_instance):
         """Test create_wiki_link con TaigaAPIError (lines 1039-1043)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -881,7 +881,7 @@ class TestCreateWikiLinkTool:
     @pytest.mark.asyncio
     async def test_create_wiki_link_unexpected_error(self, wiki_tools_instance):
         """Test create_wiki_link con Exception genérica (lines 1044-1048)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -900,11 +900,11 @@ class TestCreateWikiAttachmentExceptionHandlers:
     @pytest.mark.asyncio
     async def test_create_wiki_attachment_not_found(self, wiki_tools_instance):
         """Test create_wiki_attachment con ResourceNotFoundError (lines 1136-1140)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client.post = AsyncMock(side_effect=ResourceNotFoundError("Not found"))
+            mock_client.post_multipart = AsyncMock(side_effect=ResourceNotFoundError("Not found"))
             mock_cls.return_value = mock_client
 
             with pytest.raises(ToolError, match="not found"):
@@ -915,11 +915,11 @@ class TestCreateWikiAttachmentExceptionHandlers:
     @pytest.mark.asyncio
     async def test_create_wiki_attachment_authentication_error(self, wiki_tools_instance):
         """Test create_wiki_attachment con AuthenticationError (lines 1141-1145)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client.post = AsyncMock(side_effect=AuthenticationError("Auth failed"))
+            mock_client.post_multipart = AsyncMock(side_effect=AuthenticationError("Auth failed"))
             mock_cls.return_value = mock_client
 
             with pytest.raises(ToolError, match="Authentication failed"):
@@ -930,11 +930,11 @@ class TestCreateWikiAttachmentExceptionHandlers:
     @pytest.mark.asyncio
     async def test_create_wiki_attachment_taiga_api_error(self, wiki_tools_instance):
         """Test create_wiki_attachment con TaigaAPIError (lines 1146-1150)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client.post = AsyncMock(side_effect=TaigaAPIError("API error"))
+            mock_client.post_multipart = AsyncMock(side_effect=TaigaAPIError("API error"))
             mock_cls.return_value = mock_client
 
             with pytest.raises(ToolError, match="Failed to create attachment"):
@@ -945,11 +945,11 @@ class TestCreateWikiAttachmentExceptionHandlers:
     @pytest.mark.asyncio
     async def test_create_wiki_attachment_unexpected_error(self, wiki_tools_instance):
         """Test create_wiki_attachment con Exception genérica (lines 1151-1155)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client.post = AsyncMock(side_effect=RuntimeError("Unexpected"))
+            mock_client.post_multipart = AsyncMock(side_effect=RuntimeError("Unexpected"))
             mock_cls.return_value = mock_client
 
             with pytest.raises(ToolError, match="Unexpected error"):
@@ -964,7 +964,7 @@ class TestUpdateWikiAttachmentBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_attachment_with_is_deprecated(self, wiki_tools_instance):
         """Test update_wiki_attachment con is_deprecated (line 1216)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -982,7 +982,7 @@ class TestUpdateWikiAttachmentBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_attachment_not_found(self, wiki_tools_instance):
         """Test update_wiki_attachment con ResourceNotFoundError (lines 1239-1243)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -997,7 +997,7 @@ class TestUpdateWikiAttachmentBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_attachment_permission_denied(self, wiki_tools_instance):
         """Test update_wiki_attachment con PermissionDeniedError (lines 1244-1248)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1012,7 +1012,7 @@ class TestUpdateWikiAttachmentBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_attachment_authentication_error(self, wiki_tools_instance):
         """Test update_wiki_attachment con AuthenticationError (lines 1249-1253)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1027,7 +1027,7 @@ class TestUpdateWikiAttachmentBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_attachment_taiga_api_error(self, wiki_tools_instance):
         """Test update_wiki_attachment con TaigaAPIError (lines 1254-1258)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1042,7 +1042,7 @@ class TestUpdateWikiAttachmentBranches:
     @pytest.mark.asyncio
     async def test_update_wiki_attachment_unexpected_error(self, wiki_tools_instance):
         """Test update_wiki_attachment con Exception genérica (lines 1259-1263)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1061,7 +1061,7 @@ class TestDeleteWikiAttachmentExceptionHandlers:
     @pytest.mark.asyncio
     async def test_delete_wiki_attachment_not_found(self, wiki_tools_instance):
         """Test delete_wiki_attachment con ResourceNotFoundError (lines 1312-1316)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1076,7 +1076,7 @@ class TestDeleteWikiAttachmentExceptionHandlers:
     @pytest.mark.asyncio
     async def test_delete_wiki_attachment_permission_denied(self, wiki_tools_instance):
         """Test delete_wiki_attachment con PermissionDeniedError (lines 1317-1321)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1091,7 +1091,7 @@ class TestDeleteWikiAttachmentExceptionHandlers:
     @pytest.mark.asyncio
     async def test_delete_wiki_attachment_authentication_error(self, wiki_tools_instance):
         """Test delete_wiki_attachment con AuthenticationError (lines 1322-1326)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1106,7 +1106,7 @@ class TestDeleteWikiAttachmentExceptionHandlers:
     @pytest.mark.asyncio
     async def test_delete_wiki_attachment_taiga_api_error(self, wiki_tools_instance):
         """Test delete_wiki_attachment con TaigaAPIError (lines 1327-1331)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -1121,7 +1121,7 @@ class TestDeleteWikiAttachmentExceptionHandlers:
     @pytest.mark.asyncio
     async def test_delete_wiki_attachment_unexpected_error(self, wiki_tools_instance):
         """Test delete_wiki_attachment con Exception genérica (lines 1332-1336)."""
-        with patch("src.application.tools.wiki_tools.TaigaAPIClient") as mock_cls:
+        with patch("src.infrastructure.client_factory.TaigaAPIClient") as mock_cls:
             mock_client = MagicMock()
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)